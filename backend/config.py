@@ -4,6 +4,8 @@ from pydantic_settings import BaseSettings
 class Settings(BaseSettings):
     themes_path: str = "/data/themes"
     image_cache_path: str = "/data/cache/images"
+    metadata_cache_path: str = "/data/cache/metadata"
+    log_cache_path: str = "/data/cache/logs"
     arm_url: str = "http://localhost:8080"
     transcoder_url: str = "http://localhost:5000"
     transcoder_api_key: str = ""
@@ -11,6 +13,10 @@ class Settings(BaseSettings):
     transcoder_webhook_secret: str = ""
     port: int = 8888
     demo_mode: bool = False
+    job_mirror_enabled: bool = True
+    metadata_search_debounce_ms: int = 0
+    system_history_interval: float = 5.0
+    system_history_path: str = ""
 
     model_config = {"env_prefix": "ARM_UI_"}
 
@@ -30,15 +30,25 @@ from backend.routers import (
     themes,
     transcoder,
 )
+from backend.config import settings as app_settings
 from backend.services import arm_client, transcoder_client
-from backend.services import image_cache, system_cache
+from backend.services import image_cache, job_mirror, log_index, metadata_disk_cache, retranscode_queue, system_cache, system_history
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     await system_cache.refresh()
     image_cache.startup_scan()
+    metadata_disk_cache.startup_scan()
+    log_index.startup_scan()
+    if app_settings.job_mirror_enabled:
+        job_mirror.start()
+    if app_settings.system_history_interval > 0:
+        system_history.start()
     yield
+    await job_mirror.stop()
+    await system_history.stop()
+    await retranscode_queue.stop()
     await arm_client.close_client()
     await transcoder_client.close_client()
 
@@ -13,7 +13,7 @@ from __future__ import annotations
 
 import json
 import logging
-from typing import Any
+from typing import Any, Literal
 
 from arm_contracts import Job as _JobContract
 from arm_contracts import Track as TrackSchema
@@ -127,3 +127,59 @@ class JobListResponse(BaseModel):
     page: int
     per_page: int
     pages: int
+
+
+class JobSearchHit(BaseModel):
+    job: JobSchema
+    # None when the hit came from arm-neu's unranked substring search.
+    score: float | None = None
+
+
+class JobSearchResponse(BaseModel):
+    query: str
+    hits: list[JobSearchHit]
+    # True when ranked by the BFF trigram index, False for the upstream fallback.
+    indexed: bool
+
+
+class JobBundleSectionError(BaseModel):
+    status: int
+    detail: str
+
+
+class JobBundleResponse(BaseModel):
+    """Everything the job detail page loads, fetched concurrently.
+
+    A section that failed or missed its deadline is None and has an entry
+    in ``errors`` keyed by section name. ``transcoder`` is also None (with
+    no error) when the transcoder is disabled.
+    """
+    job_id: int
+    detail: JobDetailSchema | None = None
+    progress: dict[str, Any] | None = None
+    transcoder: dict[str, Any] | None = None
+    metadata: dict[str, Any] | None = None
+    naming_preview: dict[str, Any] | None = None
+    crc: dict[str, Any] | None = None
+    errors: dict[str, JobBundleSectionError] = {}
+
+
+class RetranscodeBatchJob(BaseModel):
+    job_id: int
+    status: Literal["queued", "submitted", "failed", "cancelled"]
+    error: str | None = None
+
+
+class RetranscodeBatchResponse(BaseModel):
+    """Progress of a bulk re-transcode. ``done`` once nothing is left queued;
+    ``error`` is set while queued jobs are held up by an unreachable transcoder."""
+    batch_id: str
+    created_at: float
+    total: int
+    queued: int
+    submitted: int
+    failed: int
+    cancelled: int
+    done: bool
+    error: str | None = None
+    jobs: list[RetranscodeBatchJob]
@@ -13,10 +13,32 @@ class LogFileSchema(BaseModel):
     modified: datetime
 
 
+class LogCatalogEntry(LogFileSchema):
+    service: str
+
+
+class LogCatalogResponse(BaseModel):
+    total: int
+    offset: int
+    limit: int
+    files: list[LogCatalogEntry]
+    unavailable: list[str]
+
+
 class LogContentResponse(BaseModel):
     filename: str
     content: str
     lines: int
+    # Set on cursor reads (see log_cursor).
+    cursor: str | None = None
+    reset: bool = False
+
+
+class LogWindowResponse(BaseModel):
+    filename: str
+    offset: int
+    total_lines: int
+    lines: list[str]
 
 
 class LogEntrySchema(BaseModel):
@@ -29,7 +51,21 @@ class LogEntrySchema(BaseModel):
     raw: str
 
 
+class LogLevelBucket(BaseModel):
+    start: str
+    counts: dict[str, int]
+
+
+class LogLevelSummaryResponse(BaseModel):
+    filename: str
+    total: int
+    counts: dict[str, int]
+    histogram: list[LogLevelBucket]
+
+
 class StructuredLogResponse(BaseModel):
     filename: str
     entries: list[LogEntrySchema]
     lines: int
+    cursor: str | None = None
+    reset: bool = False
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import Any
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class SearchResultSchema(BaseModel):
@@ -98,6 +98,35 @@ class TrackTitleUpdateRequest(BaseModel):
     poster_url: str | None = None
 
 
+class TrackBatchUpdate(BaseModel):
+    """One track's share of a batched edit.
+
+    ``fields`` goes to the per-track PATCH (enabled, filename, episode
+    fields, ...); ``title`` sets and ``clear_title`` reverts the per-track
+    title override. A track may carry any combination.
+    """
+    track_id: int
+    fields: dict[str, Any] | None = None
+    title: TrackTitleUpdateRequest | None = None
+    clear_title: bool = False
+
+
+class TrackBatchUpdateRequest(BaseModel):
+    updates: list[TrackBatchUpdate] = Field(max_length=500)
+
+
+class TrackBatchResult(BaseModel):
+    track_id: int
+    success: bool
+    error: str | None = None
+
+
+class TrackBatchResponse(BaseModel):
+    updated: int
+    failed: int
+    results: list[TrackBatchResult]
+
+
 class JobConfigUpdateRequest(BaseModel):
     RIPMETHOD: str | None = None
     DISCTYPE: str | None = None
@@ -115,3 +144,9 @@ class NamingPreviewRequest(BaseModel):
 
 class NamingPreviewResponse(BaseModel):
     rendered: str
+
+
+class JobNamingPreviewRequest(BaseModel):
+    """Draft patterns to render against a job; None keeps the job's own."""
+    title_pattern: str | None = None
+    folder_pattern: str | None = None
@@ -41,9 +41,14 @@ from backend.models.job import (
     JobTranscodeOverridesUpdate,
 )
 from backend.models.logs import (
+    LogCatalogEntry,
+    LogCatalogResponse,
     LogContentResponse,
     LogEntrySchema,
     LogFileSchema,
+    LogLevelBucket,
+    LogLevelSummaryResponse,
+    LogWindowResponse,
     StructuredLogResponse,
 )
 from backend.models.maintenance import (
@@ -60,6 +65,7 @@ from backend.models.maintenance import (
 )
 from backend.models.metadata import (
     JobConfigUpdateRequest,
+    JobNamingPreviewRequest,
     MediaDetailSchema,
     MusicDetailSchema,
     MusicSearchResponse,
@@ -69,6 +75,10 @@ from backend.models.metadata import (
     SearchResponse,
     SearchResultSchema,
     TitleUpdateRequest,
+    TrackBatchResponse,
+    TrackBatchResult,
+    TrackBatchUpdate,
+    TrackBatchUpdateRequest,
     TrackTitleUpdateRequest,
 )
 from backend.models.notification import NotificationSchema
@@ -95,6 +105,7 @@ from backend.models.system import (
     RestartResponse,
     RippingEnabledResponse,
     StoragePathSchema,
+    SystemHistoryResponse,
     SystemInfoSchema,
     SystemStatsSchema,
 )
@@ -135,13 +146,19 @@ __all__ = [
     "JobConfigUpdateRequest",
     "JobDetailSchema",
     "JobListResponse",
+    "JobNamingPreviewRequest",
     "JobSchema",
     "JobStatsResponse",
     "JobTranscodeOverridesUpdate",
     "JobSummary",
+    "LogCatalogEntry",
+    "LogCatalogResponse",
     "LogContentResponse",
     "LogEntrySchema",
     "LogFileSchema",
+    "LogLevelBucket",
+    "LogLevelSummaryResponse",
+    "LogWindowResponse",
     "MaintenanceSummary",
     "MediaDetailSchema",
     "MusicSearchResponse",
@@ -174,9 +191,14 @@ __all__ = [
     "SetupStatus",
     "StoragePathSchema",
     "StructuredLogResponse",
+    "SystemHistoryResponse",
     "SystemInfoSchema",
     "SystemStatsSchema",
     "TitleUpdateRequest",
+    "TrackBatchResponse",
+    "TrackBatchResult",
+    "TrackBatchUpdate",
+    "TrackBatchUpdateRequest",
     "TrackCountsSchema",
     "TrackTitleUpdateRequest",
     "TrackSchema",
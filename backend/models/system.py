@@ -93,3 +93,15 @@ class RippingEnabledResponse(BaseModel):
 
     success: bool = True
     ripping_enabled: bool | None = None
+
+
+class SystemHistoryResponse(BaseModel):
+    """A metric's sampled history; ``values[i]`` is the mean over the
+    ``step`` seconds starting at ``timestamps[i]`` (Unix seconds)."""
+
+    metric: str
+    step: int
+    start: int
+    end: int
+    timestamps: list[int] = []
+    values: list[float] = []
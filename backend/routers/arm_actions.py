@@ -1,3 +1,4 @@
+from collections.abc import Callable
 from typing import Any
 
 from fastapi import APIRouter, HTTPException
@@ -7,7 +8,7 @@ from backend.models.files import OperationResult
 from backend.models.metadata import NamingPreviewResponse
 from backend.models.schemas import JobConfigUpdateRequest, NamingPreviewRequest, TitleUpdateRequest
 from backend.models.system import RippingEnabledResponse
-from backend.services import arm_client
+from backend.services import arm_client, job_detail_cache, job_mirror, metadata_cache, naming
 
 _502_503_ARM = {502: {"description": "ARM action failed"}, 503: {"description": "ARM web UI is unreachable"}}
 
@@ -24,12 +25,27 @@ def _check_result(result: dict[str, Any] | None) -> dict[str, Any]:
     return result
 
 
-def _proxy_post(path: str, method_name: str, *, http_method: str = "post") -> None:
-    """Register a simple ARM proxy endpoint that forwards only job_id."""
+def _proxy_post(
+    path: str,
+    method_name: str,
+    *,
+    http_method: str = "post",
+    on_success: Callable[[int], None] | None = None,
+) -> None:
+    """Register a simple ARM proxy endpoint that forwards only job_id.
+
+    Every action changes the job, so once ARM accepts it the cached detail
+    is dropped and the mirrored summary re-read. ``on_success`` runs with
+    the job_id in between for any further BFF-side bookkeeping.
+    """
 
     async def _endpoint(job_id: int) -> dict[str, Any]:
-        result = await getattr(arm_client, method_name)(job_id)
-        return _check_result(result)
+        result = _check_result(await getattr(arm_client, method_name)(job_id))
+        job_detail_cache.invalidate(job_id)
+        if on_success is not None:
+            on_success(job_id)
+        await job_mirror.refetch(job_id)
+        return result
 
     _endpoint.__name__ = method_name
     _endpoint.__qualname__ = method_name
@@ -48,8 +64,7 @@ _proxy_post("fix-permissions", "fix_permissions")
 _proxy_post("skip-and-finalize", "skip_and_finalize")
 _proxy_post("force-complete", "force_complete")
 _proxy_post("start", "start_waiting_job")
-_proxy_post("crc-submit", "send_to_crc_db")
-_proxy_post("", "delete_job", http_method="delete")
+_proxy_post("", "delete_job", http_method="delete", on_success=job_mirror.discard)
 
 
 # --- Endpoints with extra parameters (kept as regular functions) ---
@@ -58,26 +73,56 @@ _proxy_post("", "delete_job", http_method="delete")
 @router.put("/{job_id}/title", response_model=OperationResult, responses=_502_503_ARM)
 async def update_title(job_id: int, body: TitleUpdateRequest) -> dict[str, Any]:
     """Update a job's title metadata (proxies to ARM)."""
-    return _check_result(await arm_client.update_title(job_id, body.model_dump(exclude_none=True)))
+    result = _check_result(await arm_client.update_title(job_id, body.model_dump(exclude_none=True)))
+    job_detail_cache.invalidate(job_id)
+    await job_mirror.refetch(job_id)
+    return result
 
 
 @router.patch("/{job_id}/config", response_model=OperationResult, responses=_502_503_ARM)
 async def update_job_config(job_id: int, body: JobConfigUpdateRequest) -> dict[str, Any]:
     """Update a job's rip parameters (proxies to ARM)."""
-    return _check_result(await arm_client.update_job_config(job_id, body.model_dump(exclude_none=True)))
+    result = _check_result(await arm_client.update_job_config(job_id, body.model_dump(exclude_none=True)))
+    job_detail_cache.invalidate(job_id)
+    await job_mirror.refetch(job_id)
+    return result
 
 
 @router.post("/{job_id}/pause", response_model=OperationResult, responses=_502_503_ARM)
 async def pause_waiting_job(job_id: int, body: dict[str, Any] | None = None) -> dict[str, Any]:
     """Set or toggle per-job pause for a waiting job (proxies to ARM)."""
     paused = body.get("paused") if body else None
-    return _check_result(await arm_client.pause_waiting_job(job_id, paused=paused))
+    result = _check_result(await arm_client.pause_waiting_job(job_id, paused=paused))
+    job_detail_cache.invalidate(job_id)
+    await job_mirror.refetch(job_id)
+    return result
+
+
+@router.post("/{job_id}/crc-submit", response_model=OperationResult, responses=_502_503_ARM)
+async def send_to_crc_db(job_id: int) -> dict[str, Any]:
+    """Submit a job's disc to the CRC64 database (proxies to ARM)."""
+    # Read the hash before the detail is invalidated, so the cached
+    # lookup for it (most likely a miss) can be dropped as well.
+    crc_id = ((job_detail_cache.peek(job_id) or {}).get("job") or {}).get("crc_id")
+    if not crc_id and job_mirror.is_warm():
+        crc_id = (job_mirror.get(job_id) or {}).get("crc_id")
+    if not crc_id:
+        crc_id = ((await job_detail_cache.get(job_id) or {}).get("job") or {}).get("crc_id")
+    result = _check_result(await arm_client.send_to_crc_db(job_id))
+    job_detail_cache.invalidate(job_id)
+    await job_mirror.refetch(job_id)
+    if crc_id:
+        metadata_cache.forget_crc(crc_id)
+    return result
 
 
 @router.put("/{job_id}/tracks", response_model=OperationResult, responses=_502_503_ARM)
 async def set_job_tracks(job_id: int, body: list[dict]) -> dict[str, Any]:
     """Replace a job's tracks with MusicBrainz data (proxies to ARM)."""
-    return _check_result(await arm_client.set_job_tracks(job_id, body))
+    result = _check_result(await arm_client.set_job_tracks(job_id, body))
+    job_detail_cache.invalidate(job_id)
+    await job_mirror.refetch(job_id)
+    return result
 
 
 # --- Naming preview (separate prefix) ---
@@ -85,10 +130,20 @@ async def set_job_tracks(job_id: int, body: list[dict]) -> dict[str, Any]:
 naming_router = APIRouter(prefix="/api", tags=["naming"])
 
 
-@naming_router.post("/naming/preview", response_model=NamingPreviewResponse, responses=_502_503_ARM)
+@naming_router.post(
+    "/naming/preview",
+    response_model=NamingPreviewResponse,
+    responses={400: {"description": "Unknown pattern variables"}},
+)
 async def naming_preview(body: NamingPreviewRequest) -> dict[str, Any]:
-    """Preview a naming pattern with given variables (proxies to ARM)."""
-    return _check_result(await arm_client.naming_preview(body.pattern, body.variables))
+    """Preview a naming pattern with given variables (rendered locally)."""
+    check = naming.validate(body.pattern)
+    if not check["valid"]:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid variables in pattern: {check['invalid_vars']}",
+        )
+    return {"success": True, "rendered": naming.render(body.pattern, values=body.variables)}
 
 
 # --- System-level actions (separate prefix) ---
@@ -5,7 +5,7 @@ from fastapi import APIRouter
 from backend.config import settings as app_settings
 from backend.models.schemas import DashboardResponse, HardwareInfoSchema, JobSchema, SystemStatsSchema
 from backend.models.transcoder import TranscoderJob, TranscoderStatsSummary
-from backend.services import arm_client, transcoder_client, system_cache
+from backend.services import arm_client, transcoder_client, system_cache, system_history
 
 router = APIRouter(prefix="/api", tags=["dashboard"])
 
@@ -75,6 +75,7 @@ async def _fetch_transcoder_system_stats() -> SystemStatsSchema | None:
     if not app_settings.transcoder_enabled:
         return None
     data = await transcoder_client.get_system_stats()
+    system_history.record("transcoder", data)
     return SystemStatsSchema(**data) if data else None
 
 
@@ -91,6 +92,7 @@ async def get_dashboard():
 
     system_stats: SystemStatsSchema | None = None
     stats_data = await stats_task
+    system_history.record("arm", stats_data)
     if stats_data:
         system_stats = SystemStatsSchema(**stats_data)
 
@@ -1,8 +1,13 @@
+import asyncio
+import csv
+import io
+import json
 import logging
 import time
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
 
 from backend.dependencies import require_transcoder_enabled
 from pydantic import BaseModel
@@ -10,6 +15,7 @@ from pydantic import BaseModel
 from backend.models.schemas import (
     JobDetailSchema,
     JobListResponse,
+    JobNamingPreviewRequest,
     JobSchema,
     JobTranscodeOverridesUpdate,
     MediaDetailSchema,
@@ -18,12 +24,33 @@ from backend.models.schemas import (
     MusicSearchResultSchema,
     OperationResult,
     SearchResultSchema,
+    TrackBatchResponse,
+    TrackBatchResult,
+    TrackBatchUpdate,
+    TrackBatchUpdateRequest,
     TrackSchema,
     TrackTitleUpdateRequest,
 )
+from backend.models.job import JobBundleResponse, JobSearchHit, JobSearchResponse, RetranscodeBatchResponse
 import httpx
 
-from backend.services import arm_client, transcoder_client
+from backend.config import settings as app_settings
+from backend.routers.transcoder import get_transcoder_job_for_arm
+
+from backend.services import (
+    arm_client,
+    job_detail_cache,
+    job_mirror,
+    job_search,
+    log_archive,
+    log_timeline,
+    metadata_cache,
+    naming,
+    progress_feed,
+    retranscode_queue,
+    search_sessions,
+    transcoder_client,
+)
 
 log = logging.getLogger(__name__)
 
@@ -49,11 +76,18 @@ async def list_jobs(
     sort_by: str | None = None,
     sort_dir: str | None = Query(None, pattern="^(asc|desc)$"),
 ):
-    data = await arm_client.get_jobs_paginated(
+    # Answer from the local mirror when warm; otherwise ask arm-neu.
+    data = job_mirror.query(
         page=page, per_page=per_page, status=status, search=search,
         video_type=video_type, disctype=disctype, days=days,
         sort_by=sort_by, sort_dir=sort_dir,
     )
+    if data is None:
+        data = await arm_client.get_jobs_paginated(
+            page=page, per_page=per_page, status=status, search=search,
+            video_type=video_type, disctype=disctype, days=days,
+            sort_by=sort_by, sort_dir=sort_dir,
+        )
     if data is None:
         raise HTTPException(status_code=502, detail=_ARM_UNREACHABLE)
     return JobListResponse(
@@ -72,14 +106,154 @@ async def get_job_stats(
     disctype: str | None = None,
     days: int | None = Query(None, ge=1),
 ):
-    data = await arm_client.get_jobs_stats(
+    data = job_mirror.stats(
         search=search, video_type=video_type, disctype=disctype, days=days,
     )
+    if data is None:
+        data = await arm_client.get_jobs_stats(
+            search=search, video_type=video_type, disctype=disctype, days=days,
+        )
     if data is None:
         return {"total": 0, "active": 0, "success": 0, "fail": 0, "waiting": 0}
     return data
 
 
+@router.get("/jobs/search", response_model=JobSearchResponse, responses=_502_ARM)
+async def search_jobs(
+    q: Annotated[str, Query(min_length=1)],
+    limit: Annotated[int, Query(ge=1, le=100)] = 20,
+):
+    """Ranked fuzzy/prefix search over job title, label, year and IMDb id.
+
+    Served from the BFF trigram index while the job mirror is warm; falls
+    back to arm-neu's substring search (unranked) when it is cold.
+    """
+    if job_mirror.is_warm():
+        hits = []
+        for job_id, score in job_search.search(q, limit=limit):
+            job = job_mirror.get(job_id)
+            if job is not None:
+                hits.append(JobSearchHit(job=JobSchema.model_validate(job), score=score))
+        return JobSearchResponse(query=q, hits=hits, indexed=True)
+
+    data = await arm_client.get_jobs_paginated(page=1, per_page=limit, search=q)
+    if data is None:
+        raise HTTPException(status_code=502, detail=_ARM_UNREACHABLE)
+    return JobSearchResponse(
+        query=q,
+        hits=[JobSearchHit(job=JobSchema.model_validate(j)) for j in data.get("jobs") or []],
+        indexed=False,
+    )
+
+
+# Upstream caps per_page at 100 (Query(le=100) on /jobs/paginated).
+_EXPORT_PAGE_SIZE = 100
+_EXPORT_CSV_COLUMNS = (
+    "job_id", "title", "year", "video_type", "disctype", "status", "label",
+    "imdb_id", "devpath", "start_time", "stop_time", "job_length", "path",
+    "crc_id", "logfile",
+)
+_EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+
+class _ExportInterrupted(Exception):
+    """ARM stopped answering partway through an export."""
+
+    def __init__(self, page: int):
+        super().__init__(f"{_ARM_UNREACHABLE} at page {page}; export incomplete")
+        self.page = page
+
+
+async def _iter_export_pages(first: dict, **filters):
+    """Yield job lists page by page, fetching page N+1 while N is streamed.
+
+    At most two pages are held at once, so memory stays flat no matter how
+    long the history is. A mid-stream upstream failure raises
+    ``_ExportInterrupted`` (the status line has already gone out).
+    """
+    page, data = 1, first
+    while True:
+        jobs = data.get("jobs") or []
+        last = len(jobs) < _EXPORT_PAGE_SIZE or page >= (data.get("pages") or page)
+        next_page = None
+        if not last:
+            next_page = asyncio.create_task(arm_client.get_jobs_paginated(
+                page=page + 1, per_page=_EXPORT_PAGE_SIZE, **filters,
+            ))
+        try:
+            yield jobs
+        except BaseException:
+            if next_page is not None:
+                next_page.cancel()
+            raise
+        if next_page is None:
+            return
+        data = await next_page
+        page += 1
+        if not data or data.get("success") is False:
+            log.warning("Job export stopped at page %d: ARM unavailable", page)
+            raise _ExportInterrupted(page)
+
+
+def _csv_line(values) -> str:
+    buf = io.StringIO()
+    csv.writer(buf).writerow(values)
+    return buf.getvalue()
+
+
+@router.get(
+    "/jobs/export",
+    responses={200: {"content": {t: {} for t in _EXPORT_MEDIA_TYPES.values()}}, **_502_ARM},
+)
+async def export_jobs(
+    format: Annotated[str, Query(pattern="^(ndjson|csv)$")] = "ndjson",
+    status: str | None = None,
+    search: str | None = None,
+    video_type: str | None = None,
+    disctype: str | None = None,
+    days: int | None = Query(None, ge=1),
+    sort_by: str | None = None,
+    sort_dir: str | None = Query(None, pattern="^(asc|desc)$"),
+):
+    """Stream the full (filtered) job history as NDJSON or CSV.
+
+    Accepts the same filters as GET /jobs. Rows are written as each
+    upstream page arrives, with the next page prefetched in the background.
+    If ARM fails partway through, the export ends with an error record: an
+    NDJSON ``{"type": "error", ...}`` line, or a CSV row starting ``#``.
+    """
+    filters = {
+        "status": status, "search": search, "video_type": video_type,
+        "disctype": disctype, "days": days, "sort_by": sort_by, "sort_dir": sort_dir,
+    }
+    first = await arm_client.get_jobs_paginated(page=1, per_page=_EXPORT_PAGE_SIZE, **filters)
+    if first is None or first.get("success") is False:
+        raise HTTPException(status_code=502, detail=_ARM_UNREACHABLE)
+
+    async def rows():
+        if format == "csv":
+            yield _csv_line(_EXPORT_CSV_COLUMNS)
+        try:
+            async for jobs in _iter_export_pages(first, **filters):
+                for job in jobs:
+                    if format == "csv":
+                        yield _csv_line(job.get(col) for col in _EXPORT_CSV_COLUMNS)
+                    else:
+                        yield json.dumps(job, default=str) + "\n"
+        except _ExportInterrupted as exc:
+            # Too late for an error status, so the file itself says it's short.
+            if format == "csv":
+                yield _csv_line([f"# {exc}"])
+            else:
+                yield json.dumps({"type": "error", "error": str(exc), "page": exc.page}) + "\n"
+
+    return StreamingResponse(
+        rows(),
+        media_type=_EXPORT_MEDIA_TYPES[format],
+        headers={"content-disposition": f'attachment; filename="arm-jobs.{format}"'},
+    )
+
+
 class BulkJobRequest(BaseModel):
     job_ids: list[int] | None = None
     status: str | None = None
@@ -99,6 +273,8 @@ async def bulk_delete_jobs(req: BulkJobRequest):
         elif result.get("success") is False:
             errors.append(f"Job {job_id}: {result.get('error', 'delete failed')}")
         else:
+            job_mirror.discard(job_id)
+            job_detail_cache.invalidate(job_id)
             deleted += 1
 
     return {"deleted": deleted, "errors": errors}
@@ -117,7 +293,7 @@ async def bulk_purge_jobs(req: BulkJobRequest):
 
     for job_id in job_ids:
         # Read job (via the detail endpoint) to get all file paths before deleting the record.
-        detail = await arm_client.get_job_detail(job_id)
+        detail = await job_detail_cache.get(job_id)
         job = (detail or {}).get("job") or {}
         logfile = job.get("logfile")
         raw_path = job.get("raw_path")
@@ -132,6 +308,8 @@ async def bulk_purge_jobs(req: BulkJobRequest):
         if result.get("success") is False:
             errors.append(f"Job {job_id}: {result.get('error', 'delete failed')}")
             continue
+        job_mirror.discard(job_id)
+        job_detail_cache.invalidate(job_id)
 
         # Best-effort: delete all associated files
         if logfile:
@@ -145,6 +323,42 @@ async def bulk_purge_jobs(req: BulkJobRequest):
     return {"purged": purged, "errors": errors}
 
 
+_BATCH_NOT_FOUND = "Re-transcode batch not found"
+
+
+@router.post("/jobs/bulk-retranscode", response_model=RetranscodeBatchResponse,
+             dependencies=[Depends(require_transcoder_enabled)])
+async def bulk_retranscode_jobs(req: BulkJobRequest):
+    """Queue jobs (by ID list or by status) to be re-sent to the transcoder.
+
+    Webhooks are released only as transcoder workers free up; poll the
+    returned batch for progress.
+    """
+    job_ids = await _resolve_job_ids(req)
+    if not job_ids:
+        raise HTTPException(status_code=400, detail="No jobs to re-transcode")
+    return retranscode_queue.enqueue(job_ids)
+
+
+@router.get("/jobs/bulk-retranscode/{batch_id}", response_model=RetranscodeBatchResponse,
+            responses={404: {"description": _BATCH_NOT_FOUND}})
+async def get_bulk_retranscode(batch_id: str):
+    batch = retranscode_queue.progress(batch_id)
+    if batch is None:
+        raise HTTPException(status_code=404, detail=_BATCH_NOT_FOUND)
+    return batch
+
+
+@router.delete("/jobs/bulk-retranscode/{batch_id}", response_model=RetranscodeBatchResponse,
+               responses={404: {"description": _BATCH_NOT_FOUND}})
+async def cancel_bulk_retranscode(batch_id: str):
+    """Drop the batch's jobs that haven't been sent yet."""
+    batch = retranscode_queue.cancel(batch_id)
+    if batch is None:
+        raise HTTPException(status_code=404, detail=_BATCH_NOT_FOUND)
+    return batch
+
+
 async def _resolve_job_ids(req: BulkJobRequest) -> list[int]:
     """Resolve a bulk request to a list of job IDs (explicit IDs or by-status query).
 
@@ -181,7 +395,7 @@ async def _resolve_job_ids(req: BulkJobRequest) -> list[int]:
 
 @router.get("/jobs/{job_id}", response_model=JobDetailSchema, responses=_404_JOB)
 async def get_job(job_id: int):
-    detail = await arm_client.get_job_detail(job_id)
+    detail = await job_detail_cache.get(job_id)
     if detail is None:
         raise HTTPException(status_code=502, detail=_ARM_UNREACHABLE)
     if detail.get("success") is False:
@@ -221,36 +435,121 @@ async def get_job_progress(job_id: int):
         raise HTTPException(status_code=502, detail=_ARM_UNREACHABLE)
     if state.get("success") is False:
         raise HTTPException(status_code=404, detail=_JOB_NOT_FOUND)
+    return progress_feed.shape_rip_progress(state)
 
-    counts_raw = state.get("track_counts") or {}
-    # Ripper returns {total, ripped}; UI's progress shape uses tracks_total/tracks_ripped.
-    counts = {
-        "tracks_total": counts_raw.get("total", 0),
-        "tracks_ripped": counts_raw.get("ripped", 0),
-    }
-    if state.get("disctype") == "music":
-        progress_value = state.get("music_progress")
-        stage_value = state.get("music_stage")
-        realtime_ripped = state.get("tracks_ripped_realtime")
-    else:
-        progress_value = state.get("rip_progress")
-        stage_value = state.get("rip_stage")
-        realtime_ripped = state.get("tracks_ripped_realtime")
-
-    # Merge DB counts with the real-time ripped count from PRGC/encoding
-    # messages. During ripping the realtime count leads; after
-    # completion the DB count is authoritative, so take the max.
-    db_ripped = counts["tracks_ripped"] or 0
-    realtime = realtime_ripped or 0
-    return {
-        "progress": progress_value,
-        "stage": stage_value,
-        "tracks_total": counts["tracks_total"],
-        "tracks_ripped": max(realtime, db_ripped),
-        "no_of_titles": state.get("no_of_titles"),
-        "copy_progress": state.get("copy_progress"),
-        "copy_stage": state.get("copy_stage"),
-    }
+
+# Comment frames keep proxies (nginx, Traefik) from idling out the stream
+# between progress changes.
+_SSE_HEARTBEAT = 15.0
+_SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+
+@router.get("/jobs/{job_id}/progress/stream")
+async def stream_job_progress(job_id: int):
+    """Server-sent events carrying merged rip + transcoder progress.
+
+    Backed by progress_feed's shared per-job poller, so any number of
+    open job pages cost one upstream poll per interval. An event is only
+    sent when the merged snapshot changes.
+    """
+
+    async def events():
+        async for snap in progress_feed.subscribe(job_id, heartbeat=_SSE_HEARTBEAT):
+            if snap is None:
+                yield ": keepalive\n\n"
+            else:
+                yield f"data: {json.dumps(snap)}\n\n"
+
+    return StreamingResponse(events(), media_type="text/event-stream", headers=_SSE_HEADERS)
+
+
+@router.get(
+    "/jobs/{job_id}/timeline",
+    responses={200: {"content": {"application/x-ndjson": {}}}, **_404_502_ARM},
+)
+async def get_job_timeline(
+    job_id: int,
+    level: str | None = None,
+    offset: Annotated[int, Query(ge=0)] = 0,
+    limit: Annotated[int, Query(ge=1, le=5000)] = 500,
+):
+    """A job's ARM and transcoder log entries interleaved by time, as NDJSON.
+
+    Each ``entry`` line carries its ``source``; the closing ``done`` line
+    gives ``next_offset`` for the following page (null at the end).
+    """
+    detail = await job_detail_cache.get(job_id)
+    if detail is None:
+        raise HTTPException(status_code=502, detail=_ARM_UNREACHABLE)
+    if detail.get("success") is False or not detail.get("job"):
+        raise HTTPException(status_code=404, detail=_JOB_NOT_FOUND)
+    logfile = detail["job"].get("logfile")
+    if not logfile:
+        raise HTTPException(status_code=404, detail="Job has no log file")
+    tc_logfile = None
+    if app_settings.transcoder_enabled:
+        tc_logfile = (await get_transcoder_job_for_arm(job_id)).get("logfile")
+    arm, transcoder = await log_timeline.read_sources(logfile, tc_logfile, level)
+    if arm is None:
+        raise HTTPException(status_code=502, detail=_ARM_UNREACHABLE)
+    if arm.get("success") is False:
+        raise HTTPException(status_code=404, detail=arm.get("error", "Log file not found"))
+    sources = {"arm": arm.get("entries") or []}
+    # A transcoder that is offline or hasn't written the log yet just
+    # leaves the timeline ARM-only.
+    if transcoder and transcoder.get("success") is not False:
+        sources["transcoder"] = transcoder.get("entries") or []
+
+    def lines():
+        for event in log_timeline.page(sources, offset, limit):
+            yield json.dumps(event, default=str) + "\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
+@router.get(
+    "/jobs/{job_id}/support-bundle.zip",
+    responses={200: {"content": {"application/zip": {}}}, **_404_502_ARM},
+)
+async def get_job_support_bundle(job_id: int):
+    """Everything needed to report a failed rip, as one ZIP streamed while
+    it's built: the job, its config and metadata, and its ARM and
+    transcoder logs. Parts that can't be fetched are listed in
+    ``MISSING.txt`` inside the archive.
+    """
+    detail = await job_detail_cache.get(job_id)
+    if detail is None:
+        raise HTTPException(status_code=502, detail=_ARM_UNREACHABLE)
+    if detail.get("success") is False or not detail.get("job"):
+        raise HTTPException(status_code=404, detail=_JOB_NOT_FOUND)
+    logfile = detail["job"].get("logfile")
+    tc_logfile = None
+    if app_settings.transcoder_enabled:
+        tc_logfile = (await get_transcoder_job_for_arm(job_id)).get("logfile")
+
+    async def job_json():
+        return (await get_job(job_id)).model_dump(mode="json", exclude={"config"})
+
+    async def config_json():
+        return detail.get("config")
+
+    async def metadata_json():
+        return await arm_client.get_job_metadata(job_id)
+
+    members = [
+        ("job.json", log_archive.json_member(job_json)),
+        ("config.json", log_archive.json_member(config_json)),
+        ("metadata.json", log_archive.json_member(metadata_json)),
+    ]
+    if logfile:
+        members.append((log_archive.entry_name("logs/arm", logfile), log_archive.arm_log(logfile)))
+    if tc_logfile:
+        members.append((log_archive.entry_name("logs/transcoder", tc_logfile),
+                        log_archive.transcoder_log(tc_logfile)))
+    return StreamingResponse(
+        log_archive.stream(members), media_type="application/zip",
+        headers={"content-disposition": f'attachment; filename="job-{job_id}-support-bundle.zip"'},
+    )
 
 
 @router.get("/jobs/{job_id}/metadata", responses=_404_502_ARM)
@@ -264,20 +563,31 @@ async def get_job_metadata(job_id: int):
     return data
 
 
-@router.get("/jobs/{job_id}/crc-lookup", responses=_404_502_ARM)
-async def crc_lookup_endpoint(job_id: int):
-    """Look up a job's CRC64 hash in the community database."""
-    detail = await arm_client.get_job_detail(job_id)
+async def _job_crc_id(job_id: int) -> str | None:
+    """A job's crc_id, from the cached detail or a warm mirror summary if
+    either has it; the detail is only fetched when neither does."""
+    detail = job_detail_cache.peek(job_id)
+    if detail is None:
+        # A summary without a hash may predate it, so only trust a set one.
+        summary = job_mirror.get(job_id) if job_mirror.is_warm() else None
+        if summary and summary.get("crc_id"):
+            return summary["crc_id"]
+        detail = await job_detail_cache.get(job_id)
     if detail is None:
         raise HTTPException(status_code=502, detail=_ARM_UNREACHABLE)
     if detail.get("success") is False:
         raise HTTPException(status_code=404, detail=_JOB_NOT_FOUND)
-    job = detail.get("job") or {}
-    crc_id = job.get("crc_id")
+    return (detail.get("job") or {}).get("crc_id")
+
+
+@router.get("/jobs/{job_id}/crc-lookup", responses=_404_502_ARM)
+async def crc_lookup_endpoint(job_id: int):
+    """Look up a job's CRC64 hash in the community database."""
+    crc_id = await _job_crc_id(job_id)
     if not crc_id:
         return {"no_crc": True, "found": False, "results": [], "has_api_key": False}
     try:
-        return await arm_client.lookup_crc(crc_id)
+        return await metadata_cache.lookup_crc(crc_id)
     except httpx.HTTPStatusError as exc:
         log.warning("CRC lookup for job %d failed: %d", job_id, exc.response.status_code)
         raise HTTPException(status_code=exc.response.status_code, detail="CRC lookup failed")
@@ -286,15 +596,106 @@ async def crc_lookup_endpoint(job_id: int):
         raise HTTPException(status_code=502, detail=_ARM_UNREACHABLE)
 
 
+# Per-section deadlines for /jobs/{id}/bundle. Metadata and CRC lookups
+# fan out to third-party APIs behind ARM and get the most headroom.
+_BUNDLE_DEADLINES = {
+    "detail": 5.0,
+    "progress": 3.0,
+    "transcoder": 3.0,
+    "metadata": 8.0,
+    "naming_preview": 5.0,
+    "crc": 8.0,
+}
+
+
+async def _bundle_section(name: str, coro) -> tuple[str, object, dict | None]:
+    """Run one bundle section under its deadline; never raises."""
+    try:
+        value = await asyncio.wait_for(coro, timeout=_BUNDLE_DEADLINES[name])
+    except HTTPException as exc:
+        return name, None, {"status": exc.status_code, "detail": str(exc.detail)}
+    except TimeoutError:
+        return name, None, {"status": 504, "detail": "Timed out"}
+    except Exception:
+        log.exception("Job bundle section %s failed", name)
+        return name, None, {"status": 500, "detail": "Internal error"}
+    if isinstance(value, BaseModel):
+        value = value.model_dump(mode="json")
+    return name, value, None
+
+
+@router.get("/jobs/{job_id}/bundle", response_model=JobBundleResponse, responses=_404_502_ARM)
+async def get_job_bundle(job_id: int):
+    """Everything the job detail page needs, in one round trip.
+
+    Runs the detail, progress, transcoder, metadata, naming-preview and
+    CRC lookups concurrently, each under its own deadline, so the page
+    waits for the slowest upstream rather than the sum of them. Sections
+    that fail come back as None with an entry in ``errors``; only a
+    missing job fails the whole request. Detail and CRC share one
+    upstream detail fetch through job_detail_cache.
+    """
+    sections = {
+        "detail": get_job(job_id),
+        "progress": get_job_progress(job_id),
+        "metadata": get_job_metadata(job_id),
+        "naming_preview": naming_preview_for_job(job_id),
+        "crc": crc_lookup_endpoint(job_id),
+    }
+    if app_settings.transcoder_enabled:
+        sections["transcoder"] = get_transcoder_job_for_arm(job_id)
+    results = await asyncio.gather(
+        *(_bundle_section(name, coro) for name, coro in sections.items())
+    )
+
+    bundle: dict = {"job_id": job_id, "errors": {}}
+    for name, value, error in results:
+        bundle[name] = value
+        if error is not None:
+            bundle["errors"][name] = error
+    if bundle["errors"].get("detail", {}).get("status") == 404:
+        raise HTTPException(status_code=404, detail=_JOB_NOT_FOUND)
+    return bundle
+
+
+# Typeahead searches from one browser tab carry this id so a newer query
+# can cancel the one still outstanding (see search_sessions).
+_SEARCH_SESSION_HEADER = "X-Search-Session"
+# nginx's "client closed request": the tab has already moved on.
+_SEARCH_SUPERSEDED = 499
+
+
+async def _client_disconnected(request: Request) -> None:
+    while (await request.receive())["type"] != "http.disconnect":
+        pass
+
+
+async def _typeahead(request: Request, kind: str, fetch):
+    """Run a metadata search under per-tab supersede/disconnect cancellation."""
+    try:
+        return await search_sessions.run(
+            fetch,
+            kind=kind,
+            session=request.headers.get(_SEARCH_SESSION_HEADER),
+            debounce=app_settings.metadata_search_debounce_ms / 1000,
+            disconnected=lambda: _client_disconnected(request),
+        )
+    except search_sessions.SearchSuperseded:
+        raise HTTPException(status_code=_SEARCH_SUPERSEDED, detail="Search superseded")
+
+
 @router.get("/metadata/search", response_model=list[SearchResultSchema], responses=_502_ARM)
 async def search_metadata(
+    request: Request,
     q: Annotated[str, Query(min_length=1)],
     year: Annotated[str | None, Query()] = None,
     page: Annotated[int, Query(ge=1)] = 1,
 ):
     """Search OMDb/TMDb for titles matching the query (proxied through ARM)."""
     try:
-        return await arm_client.search_metadata(q, year, page=page)
+        return await _typeahead(
+            request, "title", lambda: metadata_cache.search(q, year, page=page),
+        )
     except httpx.HTTPStatusError as exc:
         log.warning("Metadata search failed for q=%r: %d", q, exc.response.status_code)
         # Pass through ARM's detail message (e.g. missing API key guidance)
@@ -315,7 +716,7 @@ async def search_metadata(
 async def get_media_detail(imdb_id: str):
     """Fetch full details for a title by IMDb ID (proxied through ARM)."""
     try:
-        result = await arm_client.get_media_detail(imdb_id)
+        result = await metadata_cache.get_media_detail(imdb_id)
     except httpx.HTTPStatusError as exc:
         log.warning("Metadata detail failed: %d", exc.response.status_code)
         upstream_detail = "Metadata detail failed"
@@ -336,6 +737,7 @@ async def get_media_detail(imdb_id: str):
 
 @router.get("/metadata/music/search", response_model=MusicSearchResponse, responses=_502_ARM)
 async def search_music_metadata(
+    request: Request,
     q: str = Query(..., min_length=1),
     artist: str | None = None,
     release_type: str | None = None,
@@ -347,10 +749,10 @@ async def search_music_metadata(
 ):
     """Search MusicBrainz for releases (proxied through ARM)."""
     try:
-        return await arm_client.search_music_metadata(
+        return await _typeahead(request, "music", lambda: arm_client.search_music_metadata(
             q, artist=artist, release_type=release_type, format=format,
             country=country, status=status, tracks=tracks, offset=offset,
-        )
+        ))
     except httpx.HTTPStatusError as exc:
         log.warning("Music search failed: %d", exc.response.status_code)
         raise HTTPException(status_code=exc.response.status_code, detail="Music search failed")
@@ -363,7 +765,7 @@ async def search_music_metadata(
 async def get_music_detail(release_id: str):
     """Fetch full release details from MusicBrainz (proxied through ARM)."""
     try:
-        result = await arm_client.get_music_detail(release_id)
+        result = await metadata_cache.get_music_detail(release_id)
     except httpx.HTTPStatusError as exc:
         log.warning("Music detail failed: %d", exc.response.status_code)
         raise HTTPException(status_code=exc.response.status_code, detail="Music detail failed")
@@ -385,9 +787,63 @@ async def toggle_multi_title(job_id: int, request: Request):
     if not result.get("success"):
         status = 404 if "not found" in result.get("error", "").lower() else 400
         raise HTTPException(status_code=status, detail=result.get("error", "Failed"))
+    job_detail_cache.invalidate(job_id)
+    await job_mirror.refetch(job_id)
     return result
 
 
+# Upper bound on concurrent ARM calls for one batched track edit; ARM
+# serialises its SQLite writes anyway, so more only queues up there.
+_TRACK_BATCH_CONCURRENCY = 4
+
+
+def _track_call_error(result: dict | None) -> str | None:
+    if result is None:
+        return _ARM_UNREACHABLE
+    if isinstance(result, dict) and result.get("success") is False:
+        return result.get("error") or result.get("detail") or "Failed"
+    return None
+
+
+async def _apply_track_update(job_id: int, update: TrackBatchUpdate, limit: asyncio.Semaphore) -> TrackBatchResult:
+    # A track's own calls run in order (fields, then title) so a failure
+    # stops the rest of that track; different tracks run concurrently.
+    async with limit:
+        calls = []
+        if update.fields:
+            calls.append(lambda: arm_client.update_track_fields(job_id, update.track_id, update.fields))
+        if update.clear_title:
+            calls.append(lambda: arm_client.clear_track_title(job_id, update.track_id))
+        elif update.title is not None:
+            payload = update.title.model_dump(exclude_none=True)
+            calls.append(lambda: arm_client.update_track_title(job_id, update.track_id, payload))
+        for call in calls:
+            error = _track_call_error(await call())
+            if error:
+                return TrackBatchResult(track_id=update.track_id, success=False, error=error)
+    return TrackBatchResult(track_id=update.track_id, success=True)
+
+
+@router.post("/jobs/{job_id}/tracks/batch", response_model=TrackBatchResponse, responses={502: {}})
+async def batch_update_tracks(job_id: int, body: TrackBatchUpdateRequest):
+    """Apply field and title edits to many tracks of one job.
+
+    Each update is applied upstream through the same per-track ARM calls
+    as the single-track routes, a few at a time. Failures are reported
+    per track rather than aborting the batch, and the job's cached detail
+    is invalidated once at the end.
+    """
+    limit = asyncio.Semaphore(_TRACK_BATCH_CONCURRENCY)
+    results = await asyncio.gather(*(_apply_track_update(job_id, u, limit) for u in body.updates))
+    updated = sum(r.success for r in results)
+    if results and not updated and all(r.error == _ARM_UNREACHABLE for r in results):
+        raise HTTPException(status_code=502, detail=_ARM_UNREACHABLE)
+    if body.updates:
+        job_detail_cache.invalidate(job_id)
+        await job_mirror.refetch(job_id)
+    return TrackBatchResponse(updated=updated, failed=len(results) - updated, results=list(results))
+
+
 @router.put(
     "/jobs/{job_id}/tracks/{track_id}/title",
     response_model=OperationResult,
@@ -402,6 +858,8 @@ async def update_track_title(job_id: int, track_id: int, body: TrackTitleUpdateR
     if not result.get("success"):
         status = 404 if "not found" in result.get("error", "").lower() else 400
         raise HTTPException(status_code=status, detail=result.get("error", "Failed"))
+    job_detail_cache.invalidate(job_id)
+    await job_mirror.refetch(job_id)
     return result
 
 
@@ -418,6 +876,8 @@ async def clear_track_title(job_id: int, track_id: int):
     if not result.get("success"):
         status = 404 if "not found" in result.get("error", "").lower() else 400
         raise HTTPException(status_code=status, detail=result.get("error", "Failed"))
+    job_detail_cache.invalidate(job_id)
+    await job_mirror.refetch(job_id)
     return result
 
 
@@ -431,13 +891,15 @@ async def tvdb_match(job_id: int, request: Request):
     if not result.get("success"):
         status = 404 if "not found" in result.get("error", "").lower() else 400
         raise HTTPException(status_code=status, detail=result.get("error", "Failed"))
+    job_detail_cache.invalidate(job_id)
+    await job_mirror.refetch(job_id)
     return result
 
 
 @router.get("/jobs/{job_id}/tvdb-episodes", responses=_404_502_ARM)
 async def tvdb_episodes(job_id: int, season: int = Query(1, ge=1)):
     """Fetch TVDB episodes for a job's series (proxied to ARM)."""
-    result = await arm_client.tvdb_episodes(job_id, season)
+    result = await metadata_cache.tvdb_episodes(job_id, season)
     if result is None:
         raise HTTPException(status_code=502, detail=_ARM_UNREACHABLE)
     if not result.get("success", True):
@@ -458,6 +920,22 @@ async def naming_preview_for_job(job_id: int):
     return result
 
 
+@router.post("/jobs/{job_id}/naming-preview", responses=_404_502_ARM)
+async def render_naming_preview_for_job(job_id: int, body: JobNamingPreviewRequest):
+    """Render draft naming patterns against a job's tracks, locally.
+
+    Same response shape as the GET (plus ``invalid_vars``), but uses the
+    patterns being edited and never calls ARM beyond the (cached) job
+    detail, so the pattern editor can preview on every keystroke.
+    """
+    detail = await job_detail_cache.get(job_id)
+    if detail is None:
+        raise HTTPException(status_code=502, detail=_ARM_UNREACHABLE)
+    if detail.get("success") is False or not detail.get("job"):
+        raise HTTPException(status_code=404, detail=_JOB_NOT_FOUND)
+    return naming.preview_job(detail, body.title_pattern, body.folder_pattern)
+
+
 @router.patch("/jobs/{job_id}/naming", responses={400: {"description": "Invalid pattern"}, 404: {"description": _JOB_NOT_FOUND}, 502: {}, 503: {}})
 async def update_job_naming(job_id: int, request: Request):
     """Update per-job naming pattern overrides (proxied to ARM)."""
@@ -471,18 +949,20 @@ async def update_job_naming(job_id: int, request: Request):
         detail = result.get("error") or "Action failed"
         status = 400 if result.get("invalid_vars") else (404 if "not found" in detail.lower() else 502)
         raise HTTPException(status_code=status, detail=detail)
+    job_detail_cache.invalidate(job_id)
+    await job_mirror.refetch(job_id)
     return result
 
 
 @router.post("/naming/validate")
 async def validate_naming_pattern(request: Request):
-    """Validate a naming pattern against known variables (proxied to ARM)."""
+    """Validate a naming pattern against the contract's token vocabulary.
+
+    Answered locally (same shape as ARM's validator); saving a pattern
+    still goes through ARM, which re-validates it.
+    """
     body = await request.json()
-    pattern = body.get("pattern", "")
-    result = await arm_client.validate_naming_pattern(pattern)
-    if result is None:
-        raise HTTPException(status_code=503, detail="ARM web UI is unreachable")
-    return result
+    return naming.validate(str(body.get("pattern", "")))
 
 
 @router.get("/naming/variables")
@@ -509,6 +989,8 @@ async def update_transcode_config(job_id: int, body: JobTranscodeOverridesUpdate
         detail = result.get("error") or result.get("detail") or "Action failed"
         status = 404 if "not found" in detail.lower() else 502
         raise HTTPException(status_code=status, detail=detail)
+    job_detail_cache.invalidate(job_id)
+    await job_mirror.refetch(job_id)
     return result
 
 
@@ -525,6 +1007,8 @@ async def update_track_fields(job_id: int, track_id: int, request: Request):
         detail = result.get("error") or result.get("detail") or "Action failed"
         status = 404 if "not found" in detail.lower() else 502
         raise HTTPException(status_code=status, detail=detail)
+    job_detail_cache.invalidate(job_id)
+    await job_mirror.refetch(job_id)
     return result
 
 
@@ -4,13 +4,32 @@ Keeps the public BFF route shape unchanged so the frontend doesn't need
 to be touched. Filesystem reads moved to arm-neu in v17.3.0; this
 container no longer needs the LOGPATH bind mount.
 """
+import json
+from datetime import datetime
 from typing import Annotated
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Request
 from fastapi.responses import StreamingResponse
 
-from backend.models.schemas import LogContentResponse, LogFileSchema, StructuredLogResponse
-from backend.services import arm_client
+from backend.models.schemas import (
+    LogCatalogResponse,
+    LogContentResponse,
+    LogFileSchema,
+    LogLevelSummaryResponse,
+    LogWindowResponse,
+    StructuredLogResponse,
+)
+from backend.services import (
+    arm_client,
+    log_archive,
+    log_catalog,
+    log_cursor,
+    log_download,
+    log_entries,
+    log_follow,
+    log_index,
+    log_search,
+)
 
 router = APIRouter(prefix="/api", tags=["logs"])
 
@@ -20,6 +39,10 @@ _NOT_FOUND = "Log file not found"
 _404 = {404: {"description": _NOT_FOUND}}
 _502 = {502: {"description": _ARM_UNREACHABLE}}
 _404_502 = {**_404, **_502}
+_CURSOR_FILTERS = "level/search can't be combined with a cursor"
+
+_SSE_HEARTBEAT = 15.0
+_SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
 
 
 def _check_or_404(result):
@@ -39,42 +62,215 @@ async def list_logs():
     return result
 
 
-@router.get("/logs/{filename}/download", responses=_404_502)
-async def download_log(filename: str):
-    """Stream the upstream raw log download to the client."""
-    resp = await arm_client.stream_log_download(filename)
+# /logs/catalog, /logs/archive and /logs/search are declared before
+# /logs/{filename} so they aren't taken for filenames.
+@router.get("/logs/catalog", response_model=LogCatalogResponse)
+async def log_catalog_page(
+    q: str | None = None,
+    service: Annotated[str | None, Query(pattern="^(arm|transcoder)$")] = None,
+    offset: Annotated[int, Query(ge=0)] = 0,
+    limit: Annotated[int, Query(ge=1, le=log_catalog.MAX_PAGE)] = 50,
+):
+    """ARM and transcoder logs as one list, newest first, one page at a
+    time. ``q`` filters on the filename; services that couldn't be listed
+    are named in ``unavailable``."""
+    return await log_catalog.page(q=q, service=service, offset=offset, limit=limit)
+
+
+@router.get(
+    "/logs/archive",
+    responses={200: {"content": {"application/zip": {}}}, 400: {"description": "No logs selected"}},
+)
+async def archive_logs(
+    arm: Annotated[list[str] | None, Query()] = None,
+    transcoder: Annotated[list[str] | None, Query()] = None,
+):
+    """A ZIP of the selected ARM and transcoder logs, streamed as it's built.
+
+    Repeat ``arm=`` / ``transcoder=`` once per log; a log named twice is
+    included once. Logs that can't be read are listed in ``MISSING.txt``
+    inside the archive.
+    """
+    members = [(log_archive.entry_name("arm", name), log_archive.arm_log(name))
+               for name in dict.fromkeys(arm or [])]
+    members += [(log_archive.entry_name("transcoder", name), log_archive.transcoder_log(name))
+                for name in dict.fromkeys(transcoder or [])]
+    if not members:
+        raise HTTPException(status_code=400, detail="No logs selected")
+    if len(members) > log_archive.MAX_MEMBERS:
+        raise HTTPException(status_code=400, detail=f"At most {log_archive.MAX_MEMBERS} logs per archive")
+    name = f"logs-{datetime.now():%Y%m%d-%H%M%S}.zip"
+    return StreamingResponse(
+        log_archive.stream(members), media_type="application/zip",
+        headers={"content-disposition": f'attachment; filename="{name}"'},
+    )
+
+
+@router.get("/logs/search", responses={200: {"content": {"application/x-ndjson": {}}}})
+async def search_logs(
+    q: Annotated[str, Query(min_length=1)],
+    level: str | None = None,
+    since: datetime | None = None,
+    limit: Annotated[int, Query(ge=1, le=log_search.MAX_RESULTS)] = 200,
+):
+    """Search all ARM and transcoder logs, streaming NDJSON as each log
+    finishes: ``match`` lines (the entry plus service and filename),
+    ``error`` for logs that couldn't be read, then one ``done`` line."""
+
+    async def lines():
+        async for event in log_search.search(q, level=level, since=since, limit=limit):
+            yield json.dumps(event, default=str) + "\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
+# Upstream download headers relayed as-is for the uncompressed body.
+_DOWNLOAD_HEADERS = ("content-disposition", "content-length", "content-range", "etag", "last-modified")
+_416 = {416: {"description": "Requested range not satisfiable"}}
+
+
+def _range_not_satisfiable(total: int | str) -> HTTPException:
+    return HTTPException(
+        status_code=416, detail="Requested range not satisfiable",
+        headers={"Content-Range": f"bytes */{total}"},
+    )
+
+
+@router.get("/logs/{filename}/download", responses={**_404_502, **_416})
+async def download_log(filename: str, request: Request, gzip: bool = False):
+    """Stream the upstream raw log download to the client.
+
+    ``?gzip=1`` downloads a ``.log.gz``; otherwise the body is gzip
+    content-encoded when the client accepts it. ``Range`` requests (resumed
+    downloads) get the uncompressed bytes: upstream's partial response when
+    it honours the range, or the range cut from the full stream here.
+    """
+    range_header = None if gzip else request.headers.get("range")
+    encode = gzip or (range_header is None and log_download.accepts_gzip(request.headers.get("accept-encoding")))
+    forward = {}
+    if range_header:
+        forward["Range"] = range_header
+        if "if-range" in request.headers:
+            forward["If-Range"] = request.headers["if-range"]
+
+    resp = await arm_client.stream_log_download(filename, forward)
     if resp is None:
         raise HTTPException(status_code=502, detail=_ARM_UNREACHABLE)
     if resp.status_code == 404:
         await resp.aclose()
         raise HTTPException(status_code=404, detail=_NOT_FOUND)
-    if resp.status_code != 200:
+    if resp.status_code == 416:
+        await resp.aclose()
+        raise _range_not_satisfiable(resp.headers.get("content-range", "bytes */*").rpartition("/")[2])
+    if resp.status_code not in (200, 206):
         await resp.aclose()
         raise HTTPException(status_code=502, detail=_ARM_UNREACHABLE)
 
+    chunks = resp.aiter_bytes()
+    status_code = resp.status_code
+    headers = {name: resp.headers[name] for name in _DOWNLOAD_HEADERS if name in resp.headers}
+    # Upstream sent the whole log despite the Range: slice it here, unless
+    # If-Range says the client's partial copy is of an older version.
+    if_range = forward.get("If-Range")
+    if (range_header and status_code == 200 and "content-length" in headers
+            and (if_range is None or if_range in (headers.get("etag"), headers.get("last-modified")))):
+        total = int(headers["content-length"])
+        try:
+            byte_range = log_download.parse_range(range_header, total)
+        except log_download.RangeNotSatisfiable:
+            await resp.aclose()
+            raise _range_not_satisfiable(total) from None
+        if byte_range is not None:
+            chunks = log_download.sliced(chunks, byte_range)
+            status_code = 206
+            headers["content-range"] = byte_range.content_range(total)
+            headers["content-length"] = str(byte_range.length)
+
+    media_type = resp.headers.get("content-type", "text/plain")
+    if encode:
+        chunks = log_download.gzipped(chunks)
+        for name in ("content-length", "content-range", "etag"):
+            headers.pop(name, None)
+        if gzip:
+            media_type = "application/gzip"
+            name = filename.rpartition("/")[2].replace('"', "")
+            headers["content-disposition"] = f'attachment; filename="{name}.gz"'
+        else:
+            headers["content-encoding"] = "gzip"
+    else:
+        headers["accept-ranges"] = "bytes"
+    headers["vary"] = "Accept-Encoding"
+
     async def body():
         try:
-            async for chunk in resp.aiter_bytes():
+            async for chunk in chunks:
                 yield chunk
         finally:
             await resp.aclose()
 
-    headers = {}
-    if "content-disposition" in resp.headers:
-        headers["content-disposition"] = resp.headers["content-disposition"]
-    return StreamingResponse(
-        body(),
-        media_type=resp.headers.get("content-type", "text/plain"),
-        headers=headers,
-    )
+    return StreamingResponse(body(), status_code=status_code, media_type=media_type, headers=headers)
+
+
+def follow_response(service: str, filename: str, structured: bool, lines: int) -> StreamingResponse:
+    """SSE stream of a log's tail and then its appended lines.
+
+    Shared with the transcoder router; see log_follow for the event shapes.
+    """
+
+    async def events():
+        async for event in log_follow.subscribe(
+            service, filename, structured=structured, lines=lines, heartbeat=_SSE_HEARTBEAT,
+        ):
+            if event is None:
+                yield ": keepalive\n\n"
+            else:
+                yield f"event: {event['type']}\ndata: {json.dumps(event)}\n\n"
+
+    return StreamingResponse(events(), media_type="text/event-stream", headers=_SSE_HEADERS)
+
+
+@router.get("/logs/{filename}/follow")
+async def follow_log(
+    filename: str,
+    structured: bool = False,
+    lines: Annotated[int, Query(ge=1, le=log_follow.WINDOW)] = 200,
+):
+    """Follow a log (tail -f) over server-sent events.
+
+    One upstream follower per file serves every open viewer; only newly
+    appended lines are sent after the initial tail.
+    """
+    return follow_response("arm", filename, structured, lines)
+
+
+@router.get("/logs/{filename}/window", response_model=LogWindowResponse, responses=_404_502)
+async def read_log_window(
+    filename: str,
+    offset: Annotated[int, Query(ge=0)] = 0,
+    limit: Annotated[int, Query(ge=1, le=log_index.MAX_WINDOW)] = 500,
+):
+    """Read ``limit`` lines starting at line ``offset`` (0-based), with the
+    file's total line count, for virtual scrolling of large logs."""
+    result = await log_index.read_window("arm", filename, offset, limit)
+    return _check_or_404(result)
 
 
 @router.delete("/logs/{filename}", responses=_404_502)
 async def delete_log(filename: str):
     result = await arm_client.delete_log(filename)
+    log_cursor.forget("arm", filename)
+    log_index.forget("arm", filename)
+    log_entries.forget("arm", filename)
+    log_catalog.invalidate("arm")
     return _check_or_404(result)
 
 
+@router.get("/logs/{filename}/levels", response_model=LogLevelSummaryResponse, responses=_404_502)
+async def get_log_levels(filename: str):
+    """Entry counts per level, overall and over the log's time span."""
+    return _check_or_404(await log_entries.summary("arm", filename))
+
+
 @router.get(
     "/logs/{filename}/structured",
     response_model=StructuredLogResponse,
@@ -86,7 +282,24 @@ async def get_structured_log(
     lines: Annotated[int, Query(ge=1, le=10000)] = 100,
     level: Annotated[str | None, Query()] = None,
     search: Annotated[str | None, Query()] = None,
+    cursor: Annotated[str | None, Query()] = None,
 ):
+    """Read parsed log entries. With ``cursor`` (empty to start), only
+    entries after it are returned, along with the next cursor; see
+    get_log.
+
+    Filtered and full reads are answered from log_entries' cached parse of
+    the whole log, so ``level``/``search`` then match across all of it and
+    ``tail`` keeps the last ``lines`` matches.
+    """
+    if cursor is not None:
+        if level or search:
+            raise HTTPException(status_code=400, detail=_CURSOR_FILTERS)
+        result = await log_cursor.read("arm", filename, structured=True, lines=lines, cursor=cursor)
+        return _check_or_404(result)
+    if level or search or mode == "full":
+        result = await log_entries.read("arm", filename, mode=mode, lines=lines, level=level, search=search)
+        return _check_or_404(result)
     result = await arm_client.read_log_structured(
         filename, mode=mode, lines=lines, level=level, search=search,
     )
@@ -102,6 +315,17 @@ async def get_log(
     filename: str,
     mode: Annotated[str, Query(pattern="^(tail|full)$")] = "tail",
     lines: Annotated[int, Query(ge=1, le=10000)] = 100,
+    cursor: Annotated[str | None, Query()] = None,
 ):
+    """Read a log's tail or full content.
+
+    Pass ``cursor`` (empty on the first read) to page forward: the reply
+    carries only the lines written since that cursor plus a new one to
+    send next time. ``reset`` means the file was rotated or truncated and
+    the reply is a fresh tail of ``lines`` lines; ``mode`` is ignored.
+    """
+    if cursor is not None:
+        result = await log_cursor.read("arm", filename, lines=lines, cursor=cursor)
+        return _check_or_404(result)
     result = await arm_client.read_log(filename, mode=mode, lines=lines)
     return _check_or_404(result)
@@ -19,7 +19,7 @@ from backend.models.maintenance import (
     OrphanFolderList,
     OrphanLogList,
 )
-from backend.services import arm_client, image_cache, transcoder_client
+from backend.services import arm_client, image_cache, log_catalog, metadata_disk_cache, transcoder_client
 
 log = logging.getLogger(__name__)
 
@@ -87,7 +87,9 @@ async def get_orphan_folders():
 
 @router.post("/maintenance/delete-log", response_model=MaintenanceDeleteResult)
 async def delete_log(req: PathRequest):
-    return _check_arm(await arm_client.delete_orphan_log(req.path))
+    result = _check_arm(await arm_client.delete_orphan_log(req.path))
+    log_catalog.invalidate("arm")
+    return result
 
 
 @router.post("/maintenance/delete-folder", response_model=MaintenanceDeleteResult)
@@ -97,7 +99,9 @@ async def delete_folder(req: PathRequest):
 
 @router.post("/maintenance/bulk-delete-logs", response_model=MaintenanceBulkDeleteResult)
 async def bulk_delete_logs(req: BulkPathRequest):
-    return _check_arm(await arm_client.bulk_delete_logs(req.paths))
+    result = _check_arm(await arm_client.bulk_delete_logs(req.paths))
+    log_catalog.invalidate("arm")
+    return result
 
 
 @router.post("/maintenance/bulk-delete-folders", response_model=MaintenanceBulkDeleteResult)
@@ -160,3 +164,15 @@ def get_image_cache_stats():
 def clear_image_cache():
     """Clear all cached images."""
     return image_cache.clear()
+
+
+@router.get("/maintenance/metadata-cache-stats", response_model=ImageCacheStats)
+def get_metadata_cache_stats():
+    """Return metadata detail cache statistics (same shape as the image cache)."""
+    return metadata_disk_cache.stats()
+
+
+@router.post("/maintenance/clear-metadata-cache", response_model=ImageCacheStats)
+def clear_metadata_cache():
+    """Clear all cached title and music release details."""
+    return metadata_disk_cache.clear()
@@ -1,15 +1,16 @@
 """System management proxy endpoints."""
 from typing import Any
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
 
 from backend.models.system import (
     JobStatsResponse,
     PreflightFixResult,
     PreflightResult,
     RestartResponse,
+    SystemHistoryResponse,
 )
-from backend.services import arm_client, transcoder_client
+from backend.services import arm_client, system_history, transcoder_client
 
 router = APIRouter(prefix="/api", tags=["system"])
 
@@ -23,6 +24,19 @@ async def get_job_stats() -> dict[str, Any]:
     return result
 
 
+@router.get("/system/history", response_model=SystemHistoryResponse)
+async def get_system_history(
+    metric: str = Query(..., description="e.g. arm.cpu_percent, transcoder.gpu_percent"),
+    range_: str = Query("1h", alias="range", description="How far back, e.g. 15m, 6h, 7d (at most 30d)"),
+) -> dict[str, Any]:
+    """Sampled CPU, memory, storage and GPU history, served from the
+    BFF's own buffers without calling ARM or the transcoder."""
+    try:
+        return system_history.history(metric, system_history.parse_range(range_))
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+
 @router.post("/system/restart", response_model=RestartResponse)
 async def restart_arm() -> dict[str, Any]:
     """Restart the ARM service (proxies to ARM backend)."""
@@ -4,7 +4,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 
 from backend.dependencies import require_transcoder_enabled
 from backend.models.files import OperationResult
-from backend.models.schemas import LogContentResponse, LogFileSchema, StructuredLogResponse, TranscoderJobListResponse, TranscoderStatsResponse
+from backend.models.schemas import LogContentResponse, LogFileSchema, LogLevelSummaryResponse, LogWindowResponse, StructuredLogResponse, TranscoderJobListResponse, TranscoderStatsResponse
 from backend.models.transcoder import (
     DeleteResult,
     RetranscodeResult,
@@ -12,7 +12,8 @@ from backend.models.transcoder import (
     TranscoderJobForArmResponse,
     WorkersResponse,
 )
-from backend.services import transcoder_client
+from backend.routers.logs import follow_response
+from backend.services import log_cursor, log_entries, log_follow, log_index, transcoder_client
 
 router = APIRouter(
     prefix="/api/transcoder",
@@ -86,6 +87,38 @@ async def list_logs():
     return data
 
 
+@router.get("/logs/{filename}/follow")
+async def follow_log(
+    filename: str,
+    structured: bool = False,
+    lines: int = Query(200, ge=1, le=log_follow.WINDOW),
+):
+    """Follow a transcoder log over server-sent events (see /api/logs/{filename}/follow)."""
+    return follow_response("transcoder", filename, structured, lines)
+
+
+@router.get("/logs/{filename}/window", response_model=LogWindowResponse, responses={404: {"description": "Log not found or transcoder offline"}})
+async def read_log_window(
+    filename: str,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(500, ge=1, le=log_index.MAX_WINDOW),
+):
+    """Read a window of a transcoder log (see /api/logs/{filename}/window)."""
+    data = await log_index.read_window("transcoder", filename, offset, limit)
+    if data is None or data.get("success") is False:
+        raise HTTPException(status_code=404, detail="Log not found or transcoder offline")
+    return data
+
+
+@router.get("/logs/{filename}/levels", response_model=LogLevelSummaryResponse, responses={404: {"description": "Log not found or transcoder offline"}})
+async def get_log_levels(filename: str):
+    """Entry counts per level for a transcoder log (see /api/logs/{filename}/levels)."""
+    data = await log_entries.summary("transcoder", filename)
+    if data is None or data.get("success") is False:
+        raise HTTPException(status_code=404, detail="Log not found or transcoder offline")
+    return data
+
+
 @router.get("/logs/{filename}/structured", response_model=StructuredLogResponse, responses={404: {"description": "Log not found or transcoder offline"}})
 async def get_structured_log(
     filename: str,
@@ -93,11 +126,19 @@ async def get_structured_log(
     lines: int = Query(100, ge=1, le=10000),
     level: str | None = Query(None),
     search: str | None = Query(None),
+    cursor: str | None = Query(None),
 ):
-    data = await transcoder_client.read_structured_log(
-        filename, mode=mode, lines=lines, level=level, search=search
-    )
-    if data is None:
+    if cursor is not None:
+        if level or search:
+            raise HTTPException(status_code=400, detail="level/search can't be combined with a cursor")
+        data = await log_cursor.read("transcoder", filename, structured=True, lines=lines, cursor=cursor)
+    elif level or search or mode == "full":
+        data = await log_entries.read("transcoder", filename, mode=mode, lines=lines, level=level, search=search)
+    else:
+        data = await transcoder_client.read_structured_log(
+            filename, mode=mode, lines=lines, level=level, search=search
+        )
+    if data is None or data.get("success") is False:
         raise HTTPException(status_code=404, detail="Log not found or transcoder offline")
     return data
 
@@ -107,9 +148,14 @@ async def get_log(
     filename: str,
     mode: str = Query("tail", pattern="^(tail|full)$"),
     lines: int = Query(100, ge=1, le=10000),
+    cursor: str | None = Query(None),
 ):
-    data = await transcoder_client.read_log(filename, mode=mode, lines=lines)
-    if data is None:
+    """Read a transcoder log; ``cursor`` works as on /api/logs/{filename}."""
+    if cursor is not None:
+        data = await log_cursor.read("transcoder", filename, lines=lines, cursor=cursor)
+    else:
+        data = await transcoder_client.read_log(filename, mode=mode, lines=lines)
+    if data is None or data.get("success") is False:
         raise HTTPException(status_code=404, detail="Log not found or transcoder offline")
     return data
 
@@ -694,17 +694,20 @@ async def delete_log(filename: str) -> dict[str, Any] | None:
     return await _request("DELETE", f"/api/v1/logs/{_quote_log_name(filename)}")
 
 
-async def stream_log_download(filename: str):
+async def stream_log_download(filename: str, headers: dict[str, str] | None = None):
     """Async-iterate the upstream download bytes for the logs/{name}/download endpoint.
 
     Yields (status_code, headers, async-byte-iterator). The caller is
     responsible for relaying the status + content-type + bytes to the user.
+    ``headers`` (e.g. Range/If-Range) are forwarded. The body is requested
+    uncompressed so byte ranges and Content-Length refer to the log itself.
     Returns None if the upstream is unreachable.
     """
     try:
         client = get_client()
         req = client.build_request(
-            "GET", f"/api/v1/logs/{_quote_log_name(filename)}/download"
+            "GET", f"/api/v1/logs/{_quote_log_name(filename)}/download",
+            headers={**(headers or {}), "Accept-Encoding": "identity"},
         )
         resp = await client.send(req, stream=True)
         return resp
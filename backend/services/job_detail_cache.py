@@ -0,0 +1,93 @@
+"""Keyed cache for ripper job detail payloads (/api/v1/jobs/{id}/detail).
+
+The job detail page, CRC lookup and bulk purge each read the same detail
+payload, and the page re-reads it after every edit. Entries live briefly
+for jobs still in flight (their status and track list move on their own)
+and much longer once a job is terminal. Every BFF route that mutates a
+job calls ``invalidate()`` after ARM accepts the change, so a read that
+follows a write always goes upstream.
+
+Concurrent misses for the same job share one upstream request.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any
+
+from backend.services import arm_client
+
+_ACTIVE_TTL = 2.0
+_TERMINAL_TTL = 300.0
+_TERMINAL_STATUSES = frozenset({"success", "fail"})
+_MAX_ENTRIES = 500
+
+# job_id -> (expires_at, detail)
+_cache: dict[int, tuple[float, dict[str, Any]]] = {}
+# invalidate() drops a job's entry here too, so a fetch that started
+# before a write sees it's no longer current and doesn't repopulate the
+# cache with the pre-write payload.
+_inflight: dict[int, asyncio.Future[dict[str, Any] | None]] = {}
+
+
+def _ttl(detail: dict[str, Any]) -> float:
+    status = str((detail.get("job") or {}).get("status") or "").lower()
+    return _TERMINAL_TTL if status in _TERMINAL_STATUSES else _ACTIVE_TTL
+
+
+def peek(job_id: int) -> dict[str, Any] | None:
+    """Return a fresh cached detail without going upstream."""
+    entry = _cache.get(job_id)
+    if entry is None:
+        return None
+    if time.monotonic() >= entry[0]:
+        del _cache[job_id]
+        return None
+    return entry[1]
+
+
+async def _fetch(job_id: int) -> dict[str, Any] | None:
+    detail = await arm_client.get_job_detail(job_id)
+    # Only cache real payloads: None (unreachable) and error dicts must be
+    # retried on the next read rather than pinned for a TTL.
+    if (
+        isinstance(detail, dict)
+        and detail.get("success") is not False
+        and detail.get("job")
+        and _inflight.get(job_id) is asyncio.current_task()
+    ):
+        if len(_cache) >= _MAX_ENTRIES:
+            del _cache[min(_cache, key=lambda k: _cache[k][0])]
+        _cache[job_id] = (time.monotonic() + _ttl(detail), detail)
+    return detail
+
+
+async def get(job_id: int) -> dict[str, Any] | None:
+    """Cached equivalent of ``arm_client.get_job_detail``."""
+    cached = peek(job_id)
+    if cached is not None:
+        return cached
+    task = _inflight.get(job_id)
+    if task is None:
+        task = asyncio.ensure_future(_fetch(job_id))
+        _inflight[job_id] = task
+        task.add_done_callback(lambda t: _forget_inflight(job_id, t))
+    # shield: one caller disconnecting mustn't cancel the fetch others await.
+    return await asyncio.shield(task)
+
+
+def _forget_inflight(job_id: int, task: asyncio.Future[Any]) -> None:
+    if _inflight.get(job_id) is task:
+        del _inflight[job_id]
+
+
+def invalidate(job_id: int) -> None:
+    """Drop a job's entry after a mutation so the next read goes upstream."""
+    _cache.pop(job_id, None)
+    _inflight.pop(job_id, None)
+
+
+def clear() -> None:
+    _cache.clear()
+    _inflight.clear()
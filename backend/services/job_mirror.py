@@ -0,0 +1,374 @@
+"""In-memory mirror of ripper job summaries for the jobs page.
+
+The jobs page re-queries on every page flip, sort click, filter change
+and debounced keystroke, and /jobs/stats repeats the same filters. Once
+warm, this mirror answers both locally from secondary indexes (status,
+video_type, disctype, start_time) instead of round-tripping to arm-neu.
+
+Sync model:
+- A full sync pages through /api/v1/jobs/paginated at the 100-row cap
+  and swaps the result in atomically.
+- Between full syncs, an incremental refresh diffs the most recent page
+  plus /api/v1/jobs/active against the mirror and upserts only what
+  changed, so in-flight status transitions show up within one interval.
+- Deletes issued through the BFF are applied immediately via
+  ``discard()``, and other BFF edits re-read the job via ``refetch()``;
+  changes made elsewhere are caught by the next refresh or full sync.
+
+Every insert/remove is mirrored into job_search's trigram index.
+
+Callers treat a ``None`` answer as "mirror cold or query unsupported" and
+fall back to the upstream endpoint.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+import logging
+import math
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from backend.services import arm_client, job_detail_cache, job_search
+
+log = logging.getLogger(__name__)
+
+_PAGE_SIZE = 100
+_REFRESH_INTERVAL = 5.0
+_FULL_SYNC_INTERVAL = 600.0
+# A mirror that hasn't synced for this long is no better than a guess;
+# fall back to upstream until the next successful refresh.
+_STALE_AFTER = 30.0
+
+# Filter-bar status buckets (see JobFilterBar.svelte). Anything that isn't
+# terminal or waiting counts as active, matching the dashboard's notion.
+_WAITING_STATUSES = frozenset({"waiting", "manual_paused", "makemkv_throttled"})
+_SUCCESS_STATUSES = frozenset({"success"})
+_FAIL_STATUSES = frozenset({"fail"})
+_STATUS_BUCKETS = ("active", "success", "fail", "waiting")
+
+_SORT_FIELDS = frozenset({
+    "title", "year", "status", "video_type", "disctype", "devpath", "start_time",
+})
+
+_jobs: dict[int, dict[str, Any]] = {}
+_by_status: dict[str, set[int]] = {}
+_by_video_type: dict[str, set[int]] = {}
+_by_disctype: dict[str, set[int]] = {}
+# (start_timestamp, job_id), kept sorted for bisect-based `days` cutoffs.
+_by_date: list[tuple[float, int]] = []
+_sort_cache: dict[tuple[str, str], list[int]] = {}
+
+_synced_at: float = 0.0
+_full_synced_at: float = 0.0
+_task: asyncio.Task[None] | None = None
+
+
+def _bucket(status: str | None) -> str:
+    s = (status or "").lower()
+    if s in _SUCCESS_STATUSES:
+        return "success"
+    if s in _FAIL_STATUSES:
+        return "fail"
+    if s in _WAITING_STATUSES:
+        return "waiting"
+    return "active"
+
+
+def _start_ts(job: dict[str, Any]) -> float:
+    raw = job.get("start_time")
+    if not raw:
+        return 0.0
+    try:
+        dt = datetime.fromisoformat(str(raw))
+    except ValueError:
+        return 0.0
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+
+def _index_add(index: dict[str, set[int]], key: Any, job_id: int) -> None:
+    index.setdefault(str(key or "").lower(), set()).add(job_id)
+
+
+def _index_remove(index: dict[str, set[int]], key: Any, job_id: int) -> None:
+    k = str(key or "").lower()
+    ids = index.get(k)
+    if ids is not None:
+        ids.discard(job_id)
+        if not ids:
+            del index[k]
+
+
+def _insert(job: dict[str, Any]) -> None:
+    job_id = job["job_id"]
+    _jobs[job_id] = job
+    _index_add(_by_status, job.get("status"), job_id)
+    _index_add(_by_video_type, job.get("video_type"), job_id)
+    _index_add(_by_disctype, job.get("disctype"), job_id)
+    bisect.insort(_by_date, (_start_ts(job), job_id))
+    job_search.add(job)
+
+
+def _remove(job_id: int) -> bool:
+    job = _jobs.pop(job_id, None)
+    if job is None:
+        return False
+    _index_remove(_by_status, job.get("status"), job_id)
+    _index_remove(_by_video_type, job.get("video_type"), job_id)
+    _index_remove(_by_disctype, job.get("disctype"), job_id)
+    key = (_start_ts(job), job_id)
+    pos = bisect.bisect_left(_by_date, key)
+    if pos < len(_by_date) and _by_date[pos] == key:
+        del _by_date[pos]
+    job_search.discard(job_id)
+    return True
+
+
+def _upsert(job: dict[str, Any]) -> bool:
+    """Insert or replace one summary. Returns True if the mirror changed."""
+    job_id = job.get("job_id")
+    if job_id is None:
+        return False
+    if _jobs.get(job_id) == job:
+        return False
+    _remove(job_id)
+    _insert(job)
+    return True
+
+
+def _clear() -> None:
+    _jobs.clear()
+    _by_status.clear()
+    _by_video_type.clear()
+    _by_disctype.clear()
+    _by_date.clear()
+    _sort_cache.clear()
+    job_search.clear()
+
+
+def reset() -> None:
+    """Drop all mirrored state and mark the mirror cold."""
+    global _synced_at, _full_synced_at
+    _clear()
+    _synced_at = 0.0
+    _full_synced_at = 0.0
+
+
+def discard(job_id: int) -> None:
+    """Forget a job the BFF just deleted upstream."""
+    if _remove(job_id):
+        _sort_cache.clear()
+
+
+async def refetch(job_id: int) -> None:
+    """Re-read a mirrored job the BFF just edited upstream.
+
+    Only the summary's own fields are taken from the detail payload, so
+    the mirrored row keeps the shape the paginated list gives it. The
+    read goes through job_detail_cache, which the caller has already
+    invalidated, so the page's own re-read right after is a cache hit.
+    """
+    current = _jobs.get(job_id)
+    if current is None:
+        return
+    detail = await job_detail_cache.get(job_id)
+    if not detail or detail.get("success") is False or not detail.get("job"):
+        return
+    job = detail["job"]
+    if _upsert({**current, **{key: job[key] for key in current if key in job}}):
+        _sort_cache.clear()
+
+
+def get(job_id: int) -> dict[str, Any] | None:
+    """Mirrored summary for one job, if present."""
+    return _jobs.get(job_id)
+
+
+def is_warm() -> bool:
+    return _full_synced_at > 0 and time.monotonic() - _synced_at < _STALE_AFTER
+
+
+async def _fetch_all() -> list[dict[str, Any]] | None:
+    jobs: list[dict[str, Any]] = []
+    page = 1
+    while True:
+        data = await arm_client.get_jobs_paginated(page=page, per_page=_PAGE_SIZE)
+        if not data or data.get("success") is False:
+            return None
+        page_jobs = data.get("jobs") or []
+        jobs.extend(page_jobs)
+        if len(page_jobs) < _PAGE_SIZE or page >= (data.get("pages") or page):
+            return jobs
+        page += 1
+
+
+async def full_sync() -> bool:
+    """Rebuild the mirror from every upstream page. Returns False on failure."""
+    global _synced_at, _full_synced_at
+    jobs = await _fetch_all()
+    if jobs is None:
+        return False
+    _clear()
+    # A job can shift pages between fetches and appear twice; the last
+    # row seen wins.
+    for job in jobs:
+        _upsert(job)
+    _synced_at = _full_synced_at = time.monotonic()
+    log.debug("Job mirror full sync: %d jobs", len(_jobs))
+    return True
+
+
+async def refresh() -> bool:
+    """Diff the newest page and the active set into the mirror."""
+    global _synced_at
+    recent, active = await asyncio.gather(
+        arm_client.get_jobs_paginated(
+            page=1, per_page=_PAGE_SIZE, sort_by="start_time", sort_dir="desc",
+        ),
+        arm_client.get_active_jobs(),
+    )
+    if not recent or recent.get("success") is False or active is None:
+        return False
+    changed = False
+    for job in (recent.get("jobs") or []) + (active.get("jobs") or []):
+        changed |= _upsert(job)
+    if changed:
+        _sort_cache.clear()
+    _synced_at = time.monotonic()
+    return True
+
+
+async def _run() -> None:
+    while True:
+        try:
+            if time.monotonic() - _full_synced_at >= _FULL_SYNC_INTERVAL or not _full_synced_at:
+                await full_sync()
+            else:
+                await refresh()
+        except Exception:
+            log.exception("Job mirror sync failed")
+        await asyncio.sleep(_REFRESH_INTERVAL)
+
+
+def start() -> None:
+    """Start the background sync loop (idempotent)."""
+    global _task
+    if _task is None or _task.done():
+        _task = asyncio.create_task(_run())
+
+
+async def stop() -> None:
+    global _task
+    if _task is not None:
+        _task.cancel()
+        try:
+            await _task
+        except asyncio.CancelledError:
+            pass
+        _task = None
+
+
+# --- Queries ---
+
+
+def _filtered_ids(
+    status: str | None = None,
+    search: str | None = None,
+    video_type: str | None = None,
+    disctype: str | None = None,
+    days: int | None = None,
+) -> set[int]:
+    ids = set(_jobs)
+    if status:
+        s = status.lower()
+        if s in _STATUS_BUCKETS:
+            ids &= {j for key, js in _by_status.items() if _bucket(key) == s for j in js}
+        else:
+            ids &= _by_status.get(s, set())
+    if video_type:
+        ids &= _by_video_type.get(video_type.lower(), set())
+    if disctype:
+        ids &= _by_disctype.get(disctype.lower(), set())
+    if days:
+        cutoff = (datetime.now(timezone.utc) - timedelta(days=days)).timestamp()
+        pos = bisect.bisect_left(_by_date, (cutoff, -1))
+        ids &= {job_id for _, job_id in _by_date[pos:]}
+    if search:
+        needle = search.lower()
+        ids = {
+            j for j in ids
+            if needle in str(_jobs[j].get("title") or "").lower()
+            or needle in str(_jobs[j].get("label") or "").lower()
+        }
+    return ids
+
+
+def _sorted_ids(sort_by: str, sort_dir: str) -> list[int]:
+    key = (sort_by, sort_dir)
+    order = _sort_cache.get(key)
+    if order is None:
+        if sort_by == "start_time":
+            order = [job_id for _, job_id in _by_date]
+        else:
+            # Nulls sort first ascending / last descending, like SQL on arm-neu.
+            order = sorted(
+                _jobs,
+                key=lambda j: (
+                    _jobs[j].get(sort_by) is not None,
+                    str(_jobs[j].get(sort_by) or "").lower(),
+                    j,
+                ),
+            )
+        if sort_dir == "desc":
+            order = order[::-1]
+        _sort_cache[key] = order
+    return order
+
+
+def query(
+    page: int = 1,
+    per_page: int = 25,
+    status: str | None = None,
+    search: str | None = None,
+    video_type: str | None = None,
+    disctype: str | None = None,
+    days: int | None = None,
+    sort_by: str | None = None,
+    sort_dir: str | None = None,
+) -> dict[str, Any] | None:
+    """Answer a paginated jobs query locally, or None to defer upstream."""
+    sort_by = sort_by or "start_time"
+    sort_dir = sort_dir or "desc"
+    if not is_warm() or sort_by not in _SORT_FIELDS:
+        return None
+    ids = _filtered_ids(status, search, video_type, disctype, days)
+    matched = [j for j in _sorted_ids(sort_by, sort_dir) if j in ids]
+    total = len(matched)
+    start = (page - 1) * per_page
+    return {
+        "jobs": [_jobs[j] for j in matched[start:start + per_page]],
+        "total": total,
+        "page": page,
+        "per_page": per_page,
+        "pages": max(1, math.ceil(total / per_page)),
+    }
+
+
+def stats(
+    search: str | None = None,
+    video_type: str | None = None,
+    disctype: str | None = None,
+    days: int | None = None,
+) -> dict[str, int] | None:
+    """Bucketed counts for the filter set, or None to defer upstream."""
+    if not is_warm():
+        return None
+    ids = _filtered_ids(None, search, video_type, disctype, days)
+    counts = dict.fromkeys(_STATUS_BUCKETS, 0)
+    for job_id in ids:
+        counts[_bucket(_jobs[job_id].get("status"))] += 1
+    return {"total": len(ids), **counts}
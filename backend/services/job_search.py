@@ -0,0 +1,162 @@
+"""Trigram index over job title, label, year and IMDb id.
+
+Fed by job_mirror as summaries are inserted and removed, so it always
+covers exactly the jobs the mirror holds. Words are padded pg_trgm-style
+("  word ") before splitting into trigrams, which makes leading
+characters count extra and gives prefix matches a natural head start.
+A sorted vocabulary backs exact word-prefix typeahead for short inputs.
+
+Scoring is mostly query coverage (the share of the query's trigrams the
+job contains, so a long label or IMDb id doesn't dilute a good title
+hit), a little Jaccard similarity to prefer tighter matches, plus
+bonuses for word-prefix hits and a whole-query substring hit.
+"""
+
+from __future__ import annotations
+
+import bisect
+import heapq
+import math
+import re
+from typing import Any
+
+_FIELDS = ("title", "label", "year", "imdb_id")
+_WORD_RE = re.compile(r"[a-z0-9]+")
+_MIN_COVERAGE = 0.3
+_MIN_TRIGRAM_WORD = 3
+_COVERAGE_WEIGHT = 0.75
+_JACCARD_WEIGHT = 0.25
+_PREFIX_WEIGHT = 0.5
+_SUBSTRING_WEIGHT = 0.25
+
+_postings: dict[str, set[int]] = {}
+# word -> job ids, plus a lazily sorted vocabulary for prefix range scans.
+_word_postings: dict[str, set[int]] = {}
+_vocab: list[str] | None = None
+# job_id -> (normalized text, trigram set, word set)
+_docs: dict[int, tuple[str, frozenset[str], frozenset[str]]] = {}
+
+
+def _words(text: str) -> list[str]:
+    return _WORD_RE.findall(text.lower())
+
+
+def _trigrams(words: list[str] | tuple[str, ...]) -> set[str]:
+    grams: set[str] = set()
+    for word in words:
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def _post(index: dict[str, set[int]], keys: frozenset[str], job_id: int) -> None:
+    for key in keys:
+        index.setdefault(key, set()).add(job_id)
+
+
+def _unpost(index: dict[str, set[int]], keys: frozenset[str], job_id: int) -> None:
+    for key in keys:
+        ids = index.get(key)
+        if ids is not None:
+            ids.discard(job_id)
+            if not ids:
+                del index[key]
+
+
+def add(job: dict[str, Any]) -> None:
+    """Index (or re-index) one job summary."""
+    global _vocab
+    job_id = job.get("job_id")
+    if job_id is None:
+        return
+    discard(job_id)
+    words = [w for f in _FIELDS for w in _words(str(job.get(f) or ""))]
+    grams = frozenset(_trigrams(words))
+    word_set = frozenset(words)
+    _docs[job_id] = (" ".join(words), grams, word_set)
+    _post(_postings, grams, job_id)
+    _post(_word_postings, word_set, job_id)
+    _vocab = None
+
+
+def discard(job_id: int) -> None:
+    global _vocab
+    doc = _docs.pop(job_id, None)
+    if doc is None:
+        return
+    _unpost(_postings, doc[1], job_id)
+    _unpost(_word_postings, doc[2], job_id)
+    _vocab = None
+
+
+def clear() -> None:
+    global _vocab
+    _postings.clear()
+    _word_postings.clear()
+    _docs.clear()
+    _vocab = None
+
+
+def size() -> int:
+    return len(_docs)
+
+
+def _prefix_hits(prefix: str) -> set[int]:
+    # The vocabulary is re-sorted lazily: a full mirror sync adds thousands
+    # of docs at once, and one sort on the next query beats per-add insort.
+    global _vocab
+    if _vocab is None:
+        _vocab = sorted(_word_postings)
+    hits: set[int] = set()
+    pos = bisect.bisect_left(_vocab, prefix)
+    while pos < len(_vocab) and _vocab[pos].startswith(prefix):
+        hits |= _word_postings[_vocab[pos]]
+        pos += 1
+    return hits
+
+
+def search(query: str, limit: int = 20) -> list[tuple[int, float]]:
+    """Return up to ``limit`` (job_id, score) pairs, best first."""
+    q_words = _words(query)
+    if not q_words:
+        return []
+    q_grams = frozenset(_trigrams(q_words))
+    q_text = " ".join(q_words)
+
+    # A job needs at least `need` of the query's trigrams to pass the
+    # coverage floor, so it must appear in one of the (n - need + 1) rarest
+    # posting lists. Scanning only those keeps common grams like "  t" from
+    # dragging every job into the candidate set. Inputs made only of one-
+    # and two-letter words are typeahead; their grams are mostly padding
+    # and would match everything, so those go prefix-only.
+    candidates: set[int] = set()
+    if any(len(w) >= _MIN_TRIGRAM_WORD for w in q_words):
+        need = max(1, math.ceil(_MIN_COVERAGE * len(q_grams)))
+        by_rarity = sorted((_postings.get(g, set()) for g in q_grams), key=len)
+        candidates = set().union(*by_rarity[:len(q_grams) - need + 1])
+
+    prefix_counts: dict[int, int] = {}
+    for word in q_words:
+        for job_id in _prefix_hits(word):
+            prefix_counts[job_id] = prefix_counts.get(job_id, 0) + 1
+    candidates |= prefix_counts.keys()
+
+    scored: list[tuple[float, int]] = []
+    for job_id in candidates:
+        text, grams, _ = _docs[job_id]
+        common = len(q_grams & grams)
+        coverage = common / len(q_grams)
+        prefix_ratio = prefix_counts.get(job_id, 0) / len(q_words)
+        if coverage < _MIN_COVERAGE and not prefix_ratio:
+            continue
+        jaccard = common / (len(q_grams) + len(grams) - common)
+        score = (
+            _COVERAGE_WEIGHT * coverage
+            + _JACCARD_WEIGHT * jaccard
+            + _PREFIX_WEIGHT * prefix_ratio
+        )
+        if q_text in text:
+            score += _SUBSTRING_WEIGHT
+        scored.append((score, job_id))
+
+    return [(job_id, round(score, 4)) for score, job_id in heapq.nlargest(limit, scored)]
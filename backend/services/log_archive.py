@@ -0,0 +1,193 @@
+"""ZIP archives of logs, written while they stream.
+
+Support bundles used to mean downloading the job log, the transcoder
+log, and the job's config and metadata one by one. ``stream`` builds the
+ZIP on the fly from a list of members: each member's source is opened
+ahead of time (up to ``_PREFETCH`` at once, so upstream latency
+overlaps), but bodies are read one at a time and each chunk is deflated
+into the archive and handed to the response as soon as it's written. The
+ZIP writer is given a non-seekable sink, so it emits data descriptors
+after each entry instead of seeking back; nothing is spooled to disk and
+only the current chunk is held.
+
+Members whose source is unavailable are left out and listed in a final
+``MISSING.txt``, so one offline service doesn't fail the whole download.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import zipfile
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import Any, NamedTuple
+
+import httpx
+
+from backend.services import arm_client, transcoder_client
+
+log = logging.getLogger(__name__)
+
+# Sources opened ahead of the one being written.
+_PREFETCH = 4
+MAX_MEMBERS = 200
+
+
+class Body(NamedTuple):
+    chunks: AsyncIterator[bytes]
+    close: Callable[[], Awaitable[None]]
+
+
+# Opens a member's source; None when it's unavailable.
+Source = Callable[[], Awaitable[Body | None]]
+
+
+async def _nothing() -> None:
+    return None
+
+
+async def _once(data: bytes) -> AsyncIterator[bytes]:
+    yield data
+
+
+def _bytes_body(data: bytes) -> Body:
+    return Body(_once(data), _nothing)
+
+
+def arm_log(filename: str) -> Source:
+    """An ARM log, streamed from the raw download."""
+
+    async def open_() -> Body | None:
+        resp = await arm_client.stream_log_download(filename)
+        if resp is None:
+            return None
+        if resp.status_code != 200:
+            await resp.aclose()
+            return None
+        return Body(resp.aiter_bytes(), resp.aclose)
+
+    return open_
+
+
+def transcoder_log(filename: str) -> Source:
+    """A transcoder log. The transcoder has no raw download, so the full
+    read arrives as one body."""
+
+    async def open_() -> Body | None:
+        result = await transcoder_client.read_log(filename, mode="full")
+        if result is None or result.get("success") is False or "content" not in result:
+            return None
+        return _bytes_body((result.get("content") or "").encode())
+
+    return open_
+
+
+def json_member(fetch: Callable[[], Awaitable[Any]]) -> Source:
+    """Pretty-printed JSON of whatever ``fetch`` returns (None: missing)."""
+
+    async def open_() -> Body | None:
+        data = await fetch()
+        if data is None:
+            return None
+        return _bytes_body(json.dumps(data, indent=2, default=str).encode())
+
+    return open_
+
+
+def entry_name(folder: str, filename: str) -> str:
+    """``folder/<basename>``: upstream names never become archive paths."""
+    return f"{folder}/{filename.replace(chr(92), '/').rpartition('/')[2]}"
+
+
+def _unique(name: str, used: set[str]) -> str:
+    """``name``, or ``stem (2).ext`` and so on if it's already taken."""
+    if name not in used:
+        used.add(name)
+        return name
+    folder, slash, base = name.rpartition("/")
+    stem, dot, ext = base.rpartition(".")
+    if not stem:
+        stem, dot, ext = base, "", ""
+    n = 2
+    while (candidate := f"{folder}{slash}{stem} ({n}){dot}{ext}") in used:
+        n += 1
+    used.add(candidate)
+    return candidate
+
+
+class _Sink:
+    """Write-only, tell-less file: ZipFile falls back to streaming mode."""
+
+    def __init__(self) -> None:
+        self._buf = bytearray()
+
+    def write(self, data: bytes) -> int:
+        self._buf += data
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def take(self) -> bytes:
+        data = bytes(self._buf)
+        self._buf.clear()
+        return data
+
+
+async def _open(source: Source) -> Body | None:
+    try:
+        return await source()
+    except Exception as exc:
+        # Any failure, including an HTTPException from a route helper: the
+        # response has already started, so a source can only be left out.
+        log.debug("Archive source unavailable: %r", exc)
+        return None
+
+
+async def stream(members: list[tuple[str, Source]]) -> AsyncIterator[bytes]:
+    """Yield a ZIP of ``members`` (archive name, source) as it's built.
+
+    Names that repeat (two logs with one basename) get a `` (2)``-style
+    suffix rather than a duplicate entry.
+    """
+    sink = _Sink()
+    archive = zipfile.ZipFile(sink, "w", compression=zipfile.ZIP_DEFLATED)
+    tasks: list[asyncio.Task[Body | None]] = []
+    missing: list[str] = []
+    used: set[str] = set()
+    current = -1
+    try:
+        for current, (name, _source) in enumerate(members):
+            name = _unique(name, used)
+            while len(tasks) < min(len(members), current + _PREFETCH):
+                tasks.append(asyncio.create_task(_open(members[len(tasks)][1])))
+            body = await tasks[current]
+            if body is None:
+                missing.append(name)
+                continue
+            try:
+                with archive.open(name, "w", force_zip64=True) as entry:
+                    async for chunk in body.chunks:
+                        entry.write(chunk)
+                        if data := sink.take():
+                            yield data
+            except httpx.HTTPError as exc:
+                log.debug("Archive source %s failed mid-stream: %s", name, exc)
+                missing.append(f"{name} (truncated)")
+            finally:
+                await body.close()
+            if data := sink.take():
+                yield data
+        if missing:
+            archive.writestr(_unique("MISSING.txt", used), "Unavailable when this archive was built:\n"
+                             + "".join(f"{name}\n" for name in missing))
+        archive.close()
+        yield sink.take()
+    finally:
+        # Sources opened ahead but never written (the client went away).
+        for index, task in enumerate(tasks):
+            if not task.done():
+                task.cancel()
+            elif index > current and not task.cancelled() and task.exception() is None and (body := task.result()):
+                await body.close()
@@ -0,0 +1,133 @@
+"""One merged, paged listing of ARM and transcoder logs.
+
+The logs page fetched both services' full listings and sorted them in
+the browser; with years of job logs that is thousands of entries per
+visit. Here both listings are fetched concurrently and cached for
+``_TTL`` seconds per service, and each request gets one page of the
+merged list, newest first, optionally narrowed by a filename substring.
+
+Concurrent misses for the same service share one upstream request.
+Deleting a log calls ``invalidate()`` so the next page reflects it; a
+listing fetched before the delete can't repopulate the cache.
+
+The cached listings also answer ``lookup()``, which the windowed,
+cached-parse and incremental log reads use to check one log's size and
+mtime. Those accept a listing at most ``_LOOKUP_MAX_AGE`` old, so every
+viewer and follower of any log shares one upstream listing per second
+instead of each listing the whole directory per request.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from datetime import datetime
+from typing import Any
+
+from backend.config import settings
+from backend.services import arm_client, transcoder_client
+from backend.services.log_search import parse_time
+
+_TTL = 10.0
+_LOOKUP_MAX_AGE = 1.0
+MAX_PAGE = 500
+
+NOT_FOUND = {"success": False, "error": "Log file not found"}
+
+
+class LogUnavailable(Exception):
+    """A log couldn't be listed or read; ``result`` is what to hand the
+    caller (None when the service is unreachable)."""
+
+    def __init__(self, result: dict[str, Any] | None):
+        super().__init__("log unavailable")
+        self.result = result
+
+
+# service -> (fetched_at, listing)
+_cache: dict[str, tuple[float, list[dict[str, Any]]]] = {}
+_inflight: dict[str, asyncio.Future[list[dict[str, Any]] | None]] = {}
+_generation: dict[str, int] = {}
+
+
+async def _fetch(service: str, generation: int) -> list[dict[str, Any]] | None:
+    client = transcoder_client if service == "transcoder" else arm_client
+    listing = await client.list_logs()
+    # Only cache real listings; an unreachable service is retried next time.
+    if isinstance(listing, list) and _generation.get(service, 0) == generation:
+        _cache[service] = (time.monotonic(), listing)
+    return listing if isinstance(listing, list) else None
+
+
+async def listing(service: str, max_age: float = _TTL) -> list[dict[str, Any]] | None:
+    """Cached ``list_logs()`` for ``service``, no older than ``max_age``
+    seconds; None if it's unreachable."""
+    entry = _cache.get(service)
+    if entry is not None and time.monotonic() - entry[0] < max_age:
+        return entry[1]
+    task = _inflight.get(service)
+    if task is None:
+        task = asyncio.ensure_future(_fetch(service, _generation.get(service, 0)))
+        _inflight[service] = task
+        task.add_done_callback(lambda t: _forget_inflight(service, t))
+    # shield: one caller disconnecting mustn't cancel the fetch others await.
+    return await asyncio.shield(task)
+
+
+async def lookup(service: str, filename: str) -> dict[str, Any]:
+    """A log's listing entry (size, modified) from a recent listing.
+
+    Raises ``LogUnavailable`` with None if the service is unreachable, or
+    with ``NOT_FOUND`` if the log isn't listed.
+    """
+    entries = await listing(service, max_age=_LOOKUP_MAX_AGE)
+    if entries is None:
+        raise LogUnavailable(None)
+    for entry in entries:
+        if entry.get("filename") == filename:
+            return entry
+    raise LogUnavailable(dict(NOT_FOUND))
+
+
+def _forget_inflight(service: str, task: asyncio.Future[Any]) -> None:
+    if _inflight.get(service) is task:
+        del _inflight[service]
+
+
+async def page(
+    *, q: str | None = None, service: str | None = None, offset: int = 0, limit: int = 50,
+) -> dict[str, Any]:
+    """``limit`` logs from ``offset`` of the merged list, newest first.
+
+    ``total`` counts the logs matching ``q`` (case-insensitive substring of
+    the filename); services that couldn't be listed are in ``unavailable``.
+    """
+    services = ["arm", "transcoder"] if settings.transcoder_enabled else ["arm"]
+    if service is not None:
+        services = [s for s in services if s == service]
+    listings = await asyncio.gather(*(listing(s) for s in services))
+    needle = q.lower() if q else None
+    files: list[dict[str, Any]] = []
+    unavailable: list[str] = []
+    for svc, entries in zip(services, listings):
+        if entries is None:
+            unavailable.append(svc)
+            continue
+        files.extend({**entry, "service": svc} for entry in entries
+                     if needle is None or needle in str(entry.get("filename", "")).lower())
+    files.sort(key=lambda f: (parse_time(f.get("modified")) or datetime.min, f.get("filename", "")), reverse=True)
+    return {"total": len(files), "offset": offset, "limit": limit,
+            "files": files[offset:offset + limit], "unavailable": unavailable}
+
+
+def invalidate(service: str) -> None:
+    """Drop a service's listing after a log was deleted."""
+    _cache.pop(service, None)
+    _inflight.pop(service, None)
+    _generation[service] = _generation.get(service, 0) + 1
+
+
+def clear() -> None:
+    _cache.clear()
+    _inflight.clear()
+    _generation.clear()
@@ -0,0 +1,241 @@
+"""Opaque cursors for incremental log reads.
+
+ARM and the transcoder only serve a log's last N lines or the whole
+file, so "what's new since my last read" meant re-fetching a window and
+diffing it. A cursor records the file's byte size at the time of a read
+plus a short hash of the last line delivered. On the next read the log
+listing says how many bytes were appended; the BFF reads a tail just big
+enough to cover them (sized from the average line length it has seen
+for that file), finds the cursor's line in it and returns what follows.
+
+A file that shrank was truncated or rotated, and one whose cursor line
+can't be found in the tail was rotated or grew past the read cap; either
+way the read comes back as a fresh tail with ``reset`` set. The last
+window read per file is cached, so an unchanged file is answered from
+the listing alone.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections import OrderedDict
+from typing import Any, NamedTuple
+
+from backend.services import arm_client, log_catalog, transcoder_client
+from backend.services.log_catalog import LogUnavailable
+from backend.services.log_search import MAX_READ_LINES
+
+# Lines cached per file, and files cached.
+WINDOW = 1000
+_MAX_FILES = 64
+# Line length assumed until a file's own lines have been seen.
+_DEFAULT_LINE_BYTES = 120
+
+_Key = tuple[str, str, bool]  # (service, filename, structured)
+
+
+class Read(NamedTuple):
+    items: list[Any]  # raw lines, or structured entries
+    cursor: str
+    reset: bool
+
+
+class _Window(NamedTuple):
+    size: int
+    items: list[Any]
+    whole: bool  # items are the entire file
+
+
+class _ReadFailed(Exception):
+    """An upstream read failed; ``result`` is what the client returned."""
+
+    def __init__(self, result: dict[str, Any] | None):
+        super().__init__("log read failed")
+        self.result = result
+
+
+_windows: OrderedDict[_Key, _Window] = OrderedDict()
+
+
+def _identity(item: Any) -> str:
+    # Structured entries keep their source line in "raw".
+    return str(item.get("raw") if isinstance(item, dict) else item)
+
+
+def _line_bytes(item: Any) -> int:
+    return len(_identity(item).encode()) + 1
+
+
+def _fingerprint(item: Any) -> str:
+    return hashlib.blake2s(_identity(item).encode(), digest_size=6).hexdigest()
+
+
+def encode_cursor(size: int, fingerprint: str) -> str:
+    return f"{size:x}.{fingerprint}"
+
+
+def decode_cursor(cursor: str) -> tuple[int, str] | None:
+    """(size, fingerprint), or None if the cursor isn't one of ours."""
+    size, sep, fingerprint = cursor.partition(".")
+    try:
+        value = int(size, 16)
+    except ValueError:
+        return None
+    if not sep or value < 0:
+        return None
+    return value, fingerprint
+
+
+async def _fetch(key: _Key, lines: int) -> list[Any]:
+    service, filename, structured = key
+    if service == "transcoder":
+        if structured:
+            result = await transcoder_client.read_structured_log(filename, mode="tail", lines=lines)
+        else:
+            result = await transcoder_client.read_log(filename, mode="tail", lines=lines)
+    elif structured:
+        result = await arm_client.read_log_structured(filename, mode="tail", lines=lines)
+    else:
+        result = await arm_client.read_log(filename, mode="tail", lines=lines)
+    if result is None or result.get("success") is False:
+        raise _ReadFailed(result)
+    if structured:
+        return list(result.get("entries") or [])
+    return (result.get("content") or "").splitlines()
+
+
+def _remember(key: _Key, window: _Window) -> None:
+    if len(window.items) > WINDOW:
+        window = _Window(window.size, window.items[-WINDOW:], False)
+    _windows[key] = window
+    _windows.move_to_end(key)
+    while len(_windows) > _MAX_FILES:
+        _windows.popitem(last=False)
+
+
+def _locate(items: list[Any], fingerprint: str, delta: int) -> int | None:
+    """Index of the first item after the cursor line, or None.
+
+    The line we want is the one followed by about ``delta`` bytes, which
+    tells a repeated line apart from the cursor's. One byte of slack per
+    line covers CRLF endings; lines the structured parser dropped make
+    the count come up short, so the closest match wins rather than an
+    exact one.
+    """
+    best: tuple[int, int] | None = None
+    after = 0
+    for i in range(len(items) - 1, -1, -1):
+        if _fingerprint(items[i]) == fingerprint:
+            miss = abs(after - delta)
+            if best is None or miss < best[0]:
+                best = (miss, i + 1)
+        after += _line_bytes(items[i])
+        if after > delta + len(items) - i:
+            break
+    return best[1] if best is not None else None
+
+
+async def _since(key: _Key, since: int, fingerprint: str, size: int) -> list[Any] | None:
+    """Items appended after the cursor line, or None if it can't be found."""
+    delta = size - since
+    cached = _windows.get(key)
+    if cached is not None and cached.items:
+        line_bytes = max(1, sum(map(_line_bytes, cached.items)) // len(cached.items))
+    else:
+        line_bytes = _DEFAULT_LINE_BYTES
+    lines = min(MAX_READ_LINES, delta * 5 // (4 * line_bytes) + 8)
+    while True:
+        items = await _fetch(key, lines)
+        whole = len(items) < lines
+        # A cursor taken on an empty file: everything there is new.
+        start = (0 if whole else None) if not fingerprint else _locate(items, fingerprint, delta)
+        if start is not None:
+            new = items[start:]
+            if cached is not None and cached.size == since:
+                _remember(key, _Window(size, cached.items + new, cached.whole))
+            else:
+                _remember(key, _Window(size, items, whole))
+            return new
+        if whole or lines >= MAX_READ_LINES:
+            return None
+        lines = min(MAX_READ_LINES, lines * 4)
+
+
+async def _tail(key: _Key, size: int, lines: int) -> list[Any]:
+    cached = _windows.get(key)
+    if cached is not None and cached.size == size and (cached.whole or len(cached.items) >= lines):
+        _windows.move_to_end(key)
+        return cached.items[-lines:]
+    items = await _fetch(key, lines)
+    _remember(key, _Window(size, items, len(items) < lines))
+    return items
+
+
+async def read_items(
+    service: str,
+    filename: str,
+    *,
+    structured: bool = False,
+    lines: int = 100,
+    cursor: str | None = None,
+) -> Read | dict[str, Any] | None:
+    """Lines (or entries) after ``cursor``; the last ``lines`` without one.
+
+    Returns None if the service is unreachable and the upstream error
+    dict if the log can't be read.
+    """
+    try:
+        size = int((await log_catalog.lookup(service, filename)).get("size") or 0)
+    except LogUnavailable as exc:
+        return exc.result
+    key = (service, filename, structured)
+    position = decode_cursor(cursor) if cursor else None
+    try:
+        if position is not None:
+            since, fingerprint = position
+            if size == since:
+                return Read([], cursor, False)
+            if size > since:
+                new = await _since(key, since, fingerprint, size)
+                if new is not None:
+                    last = _fingerprint(new[-1]) if new else fingerprint
+                    return Read(new, encode_cursor(size, last), False)
+        items = await _tail(key, size, lines)
+    except _ReadFailed as exc:
+        return exc.result
+    last = _fingerprint(items[-1]) if items else ""
+    # A cursor that was given but couldn't be continued (bad, truncated,
+    # rotated) means the caller must drop what it has.
+    return Read(items, encode_cursor(size, last), bool(cursor))
+
+
+async def read(
+    service: str,
+    filename: str,
+    *,
+    structured: bool = False,
+    lines: int = 100,
+    cursor: str | None = None,
+) -> dict[str, Any] | None:
+    """``read_items`` in the shape of the upstream log reads, plus
+    ``cursor`` and ``reset``."""
+    result = await read_items(service, filename, structured=structured, lines=lines, cursor=cursor)
+    if not isinstance(result, Read):
+        return result
+    body: dict[str, Any] = {"filename": filename, "lines": len(result.items),
+                            "cursor": result.cursor, "reset": result.reset}
+    if structured:
+        body["entries"] = result.items
+    else:
+        body["content"] = "\n".join(result.items)
+    return body
+
+
+def forget(service: str, filename: str) -> None:
+    """Drop a file's cached windows, e.g. after it was deleted."""
+    for structured in (False, True):
+        _windows.pop((service, filename, structured), None)
+
+
+def clear() -> None:
+    _windows.clear()
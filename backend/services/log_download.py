@@ -0,0 +1,228 @@
+"""Byte-range and gzip handling for raw log downloads.
+
+MakeMKV debug logs run to hundreds of MB, and over a slow link an
+interrupted download used to start again from zero. The download route
+forwards ``Range`` upstream; when upstream ignores it (a plain 200), the
+requested slice is cut out of the stream here instead, so a resume
+costs an upstream read but not a second transfer to the client.
+
+Compression is applied chunk by chunk as the bytes pass through, via a
+``zlib`` compressor in gzip mode, so memory stays at one chunk plus the
+compressor's window however large the log is. Byte ranges always refer
+to the uncompressed log: a compressed stream has no stable offsets to
+resume from.
+
+The transcoder has no raw download, only a JSON body with the whole log
+in one string; ``json_string_field`` decodes that string as the body
+streams in, so it can be spooled without first being read into memory.
+"""
+
+from __future__ import annotations
+
+import codecs
+import json
+import re
+import zlib
+from collections.abc import AsyncIterator
+from typing import NamedTuple
+
+# zlib's gzip container; level 6 is gzip's own default and log text
+# compresses well before higher levels start to cost real CPU.
+_GZIP_WBITS = 16 + zlib.MAX_WBITS
+_LEVEL = 6
+
+
+class ByteRange(NamedTuple):
+    start: int
+    end: int  # inclusive, as in Content-Range
+
+    @property
+    def length(self) -> int:
+        return self.end - self.start + 1
+
+    def content_range(self, total: int) -> str:
+        return f"bytes {self.start}-{self.end}/{total}"
+
+
+class RangeNotSatisfiable(ValueError):
+    """The range starts past the end of the log (answered with 416)."""
+
+
+def parse_range(header: str | None, length: int) -> ByteRange | None:
+    """The single byte range ``header`` asks for within ``length`` bytes.
+
+    None means serve the whole log: no header, a malformed one, or a
+    multi-range request (which HTTP lets a server answer in full).
+    """
+    if not header:
+        return None
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+    first, sep, last = spec.strip().partition("-")
+    if not sep:
+        return None
+    try:
+        start = int(first) if first else None
+        end = int(last) if last else None
+    except ValueError:
+        return None
+    if start is None:
+        # bytes=-N: the last N bytes.
+        if end is None or end < 0:
+            return None
+        if end == 0 or length == 0:
+            raise RangeNotSatisfiable(header)
+        return ByteRange(max(0, length - end), length - 1)
+    if end is not None and end < start:
+        return None
+    if start >= length:
+        raise RangeNotSatisfiable(header)
+    return ByteRange(start, length - 1 if end is None else min(end, length - 1))
+
+
+def accepts_gzip(header: str | None) -> bool:
+    """Whether an ``Accept-Encoding`` header allows a gzip response."""
+    for part in (header or "").split(","):
+        coding, _, params = part.strip().partition(";")
+        if coding.strip().lower() not in ("gzip", "*"):
+            continue
+        quality = params.strip().lower()
+        if quality.startswith("q="):
+            try:
+                return float(quality[2:]) > 0
+            except ValueError:
+                return False
+        return True
+    return False
+
+
+async def sliced(chunks: AsyncIterator[bytes], byte_range: ByteRange) -> AsyncIterator[bytes]:
+    """Just the bytes of ``byte_range`` from a stream that starts at 0."""
+    pos = 0
+    async for chunk in chunks:
+        chunk_end = pos + len(chunk)
+        if chunk_end > byte_range.start:
+            piece = chunk[max(0, byte_range.start - pos):byte_range.end + 1 - pos]
+            if piece:
+                yield piece
+        pos = chunk_end
+        if pos > byte_range.end:
+            return
+
+
+async def gzipped(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """``chunks`` compressed into one gzip member as they arrive."""
+    compressor = zlib.compressobj(_LEVEL, zlib.DEFLATED, _GZIP_WBITS)
+    async for chunk in chunks:
+        out = compressor.compress(chunk)
+        if out:
+            yield out
+    yield compressor.flush()
+
+
+# Complete characters and escapes inside a JSON string. A run stops at the
+# closing quote or before an escape the buffer doesn't hold all of yet.
+_STRING_RUN = re.compile(r'(?:[^"\\]+|\\u[0-9a-fA-F]{4}|\\[^u])*')
+# A high surrogate escape whose low half may be in the next chunk.
+_HIGH_SURROGATE = re.compile(r'\\u[dD][89abAB][0-9a-fA-F]{2}$')
+_SCALAR_END = frozenset(",}] \t\r\n")
+
+
+class _JsonText:
+    """Pull reader over a streamed UTF-8 JSON body, one chunk held at a time."""
+
+    def __init__(self, chunks: AsyncIterator[bytes]) -> None:
+        self._chunks = aiter(chunks)
+        self._decoder = codecs.getincrementaldecoder("utf-8")("replace")
+        self.buf = ""
+        self.pos = 0
+
+    async def more(self) -> None:
+        try:
+            text = self._decoder.decode(await anext(self._chunks))
+        except StopAsyncIteration:
+            text = self._decoder.decode(b"", final=True)
+            if not text:
+                raise ValueError("JSON body ended early") from None
+        self.buf = self.buf[self.pos:] + text
+        self.pos = 0
+
+    async def peek(self) -> str:
+        """The next non-whitespace character, left unconsumed."""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in " \t\r\n":
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            await self.more()
+
+    async def expect(self, char: str) -> None:
+        if await self.peek() != char:
+            raise ValueError(f"expected {char!r} in JSON body")
+        self.pos += 1
+
+    async def string(self) -> AsyncIterator[str]:
+        """Decoded pieces of the string starting at the next character."""
+        await self.expect('"')
+        while True:
+            end = _STRING_RUN.match(self.buf, self.pos).end()
+            closed = end < len(self.buf) and self.buf[end] == '"'
+            run = self.buf[self.pos:end]
+            if not closed and (tail := _HIGH_SURROGATE.search(run)):
+                run, end = run[:tail.start()], self.pos + tail.start()
+            if run:
+                yield json.loads(f'"{run}"', strict=False)
+            self.pos = end
+            if closed:
+                self.pos += 1
+                return
+            await self.more()
+
+    async def skip_value(self) -> None:
+        char = await self.peek()
+        if char == '"':
+            async for _ in self.string():
+                pass
+            return
+        depth = 0
+        while True:
+            if char == '"':
+                async for _ in self.string():
+                    pass
+            elif depth == 0 and char in _SCALAR_END:
+                return
+            else:
+                self.pos += 1
+                depth += (char in "{[") - (char in "}]")
+                if depth == 0 and char in "}]":
+                    return
+            while self.pos >= len(self.buf):
+                try:
+                    await self.more()
+                except ValueError:
+                    if depth:
+                        raise
+                    return
+            char = self.buf[self.pos]
+
+
+async def json_string_field(chunks: AsyncIterator[bytes], field: str) -> AsyncIterator[bytes]:
+    """The UTF-8 value of a JSON object body's top-level string ``field``,
+    decoded as ``chunks`` arrive; nothing if the field is absent or null.
+
+    Raises ValueError if the body isn't a JSON object.
+    """
+    text = _JsonText(chunks)
+    await text.expect("{")
+    while await text.peek() != "}":
+        if text.buf[text.pos] == ",":
+            text.pos += 1
+            continue
+        key = "".join([piece async for piece in text.string()])
+        await text.expect(":")
+        if key == field and await text.peek() == '"':
+            async for piece in text.string():
+                yield piece.encode("utf-8", "replace")
+            return
+        await text.skip_value()
@@ -0,0 +1,223 @@
+"""Parsed structured log entries, cached so filters run locally.
+
+Every change of level filter or search term in the log viewer used to
+send a new structured read upstream, which re-read and re-parsed the
+whole log. Here a log's full structured read is fetched once and kept,
+keyed by (service, filename) and checked against the log listing's size
+and mtime (``log_catalog.lookup``), along with each entry's lowercased
+level and search text, the per-level counts and a level histogram over
+the log's time span. Level and search filters are then list scans in
+this process.
+
+A log that is still being written is re-read at most every
+``_MIN_REFRESH`` seconds; in between, filters run against the last copy.
+Entries are weighed by their text size, and the least recently used logs
+are evicted once the total passes ``_MAX_BYTES``.
+
+A single log over the budget can't be kept, and re-reading it whole for
+every filter change would cost more than the upstream filter does. Such
+a log is recognised from its listed size, or from the size it had when
+a parse came out over budget, and its reads go upstream with ``level``
+and ``search`` passed through, as before this cache existed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, NamedTuple
+
+from backend.services import arm_client, log_catalog, transcoder_client
+from backend.services.log_catalog import LogUnavailable
+from backend.services.log_search import MAX_READ_LINES, parse_time
+
+_MAX_BYTES = 32 * 1024 * 1024  # 32 MB
+# Rough per-entry cost of the dict and its strings beyond their text.
+_ENTRY_OVERHEAD = 600
+_MIN_REFRESH = 5.0
+_BUCKETS = 48
+# Listed byte size past which a log can't fit: its text alone, held raw
+# and lowercased, would fill the budget.
+_MAX_LOG_SIZE = _MAX_BYTES // 2
+_MAX_OVERSIZE = 256
+
+_Key = tuple[str, str]  # (service, filename)
+
+
+class _Parsed(NamedTuple):
+    size: int
+    modified: str
+    entries: list[dict[str, Any]]
+    levels: list[str]  # entries[i]'s level, lowercased
+    text: list[str]  # entries[i]'s raw line, lowercased, for search
+    counts: dict[str, int]
+    histogram: list[dict[str, Any]]
+    cost: int
+    read_at: float
+
+
+_cache: OrderedDict[_Key, _Parsed] = OrderedDict()
+# Logs whose parse came out over budget -> listed size at the time; logs
+# only grow, so they stay over until they're rotated or truncated.
+_oversize: OrderedDict[_Key, int] = OrderedDict()
+_locks: dict[_Key, asyncio.Lock] = {}
+
+
+def _histogram(entries: list[dict[str, Any]], levels: list[str]) -> list[dict[str, Any]]:
+    """Level counts in ``_BUCKETS`` equal slices of the log's time span."""
+    times = [parse_time(entry.get("timestamp")) for entry in entries]
+    stamped = [t for t in times if t is not None]
+    if not stamped:
+        return []
+    first = min(stamped)
+    span = max(stamped) - first
+    n = _BUCKETS if span else 1
+    width = span / n
+    buckets: list[dict[str, int]] = [{} for _ in range(n)]
+    for ts, level in zip(times, levels):
+        if ts is None:
+            continue
+        index = min(int((ts - first) / width), n - 1) if span else 0
+        buckets[index][level] = buckets[index].get(level, 0) + 1
+    return [{"start": (first + i * width).isoformat(), "counts": counts} for i, counts in enumerate(buckets)]
+
+
+def _parse(entries: list[dict[str, Any]], size: int, modified: str) -> _Parsed:
+    levels = [str(entry.get("level") or "").lower() for entry in entries]
+    text = [str(entry.get("raw") or entry.get("event") or "").lower() for entry in entries]
+    counts: dict[str, int] = {}
+    for level in levels:
+        counts[level] = counts.get(level, 0) + 1
+    cost = sum(_ENTRY_OVERHEAD + 2 * len(line) for line in text)
+    return _Parsed(size, modified, entries, levels, text, counts,
+                   _histogram(entries, levels), cost, time.monotonic())
+
+
+async def _fetch(service: str, filename: str) -> list[dict[str, Any]]:
+    if service == "transcoder":
+        result = await transcoder_client.read_structured_log(filename, mode="full", lines=MAX_READ_LINES)
+    else:
+        result = await arm_client.read_log_structured(filename, mode="full", lines=MAX_READ_LINES)
+    if result is None:
+        raise LogUnavailable(None)
+    if result.get("success") is False:
+        raise LogUnavailable(result)
+    return result.get("entries") or []
+
+
+class _TooLarge(Exception):
+    """The log is over the cache budget."""
+
+
+def _too_large(key: _Key, size: int) -> bool:
+    if size > _MAX_LOG_SIZE:
+        return True
+    measured = _oversize.get(key)
+    if measured is None:
+        return False
+    if size < measured:
+        del _oversize[key]  # rotated or truncated: measure again
+        return False
+    return True
+
+
+def _remember(key: _Key, parsed: _Parsed) -> None:
+    _cache.pop(key, None)
+    if parsed.cost > _MAX_BYTES:
+        _oversize[key] = parsed.size
+        _oversize.move_to_end(key)
+        while len(_oversize) > _MAX_OVERSIZE:
+            _oversize.popitem(last=False)
+        return
+    _cache[key] = parsed
+    total = sum(p.cost for p in _cache.values())
+    while total > _MAX_BYTES:
+        _, evicted = _cache.popitem(last=False)
+        total -= evicted.cost
+
+
+async def _current(key: _Key, *, oversize_ok: bool = False) -> _Parsed:
+    """The log's parsed entries, cached or freshly read.
+
+    Raises ``_TooLarge`` for a log over the budget unless ``oversize_ok``,
+    in which case it's read whole and parsed without being kept.
+    """
+    lock = _locks.setdefault(key, asyncio.Lock())
+    async with lock:
+        entry = await log_catalog.lookup(*key)
+        size, modified = int(entry.get("size") or 0), str(entry.get("modified") or "")
+        parsed = _cache.get(key)
+        if parsed is not None:
+            unchanged = (parsed.size, parsed.modified) == (size, modified)
+            if unchanged or time.monotonic() - parsed.read_at < _MIN_REFRESH:
+                _cache.move_to_end(key)
+                return parsed
+        if not oversize_ok and _too_large(key, size):
+            raise _TooLarge
+        parsed = _parse(await _fetch(*key), size, modified)
+        _remember(key, parsed)
+        return parsed
+
+
+async def read(
+    service: str,
+    filename: str,
+    *,
+    mode: str = "tail",
+    lines: int = 100,
+    level: str | None = None,
+    search: str | None = None,
+) -> dict[str, Any] | None:
+    """A structured log read answered from the cached entries.
+
+    ``level`` matches an entry's level exactly and ``search`` is a
+    substring of its raw line, both ignoring case; ``tail`` returns the
+    last ``lines`` entries that match. Logs too large to cache are read
+    upstream with the filters passed through. Returns None if the
+    service is unreachable, or a ``success: False`` dict if the log
+    doesn't exist.
+    """
+    try:
+        parsed = await _current((service, filename))
+    except LogUnavailable as exc:
+        return exc.result
+    except _TooLarge:
+        client_read = (transcoder_client.read_structured_log if service == "transcoder"
+                       else arm_client.read_log_structured)
+        return await client_read(filename, mode=mode, lines=lines, level=level, search=search)
+    wanted_level = level.lower() if level else None
+    needle = search.lower() if search else None
+    matched = [
+        entry for entry, entry_level, text in zip(parsed.entries, parsed.levels, parsed.text)
+        if (wanted_level is None or entry_level == wanted_level) and (needle is None or needle in text)
+    ]
+    if mode == "tail":
+        matched = matched[-lines:]
+    return {"filename": filename, "entries": matched, "lines": len(matched)}
+
+
+async def summary(service: str, filename: str) -> dict[str, Any] | None:
+    """Per-level entry counts and a level histogram over time for a log.
+
+    Same None / ``success: False`` results as ``read``; a log too large
+    to cache is read and counted whole each time.
+    """
+    try:
+        parsed = await _current((service, filename), oversize_ok=True)
+    except LogUnavailable as exc:
+        return exc.result
+    return {"filename": filename, "total": len(parsed.entries),
+            "counts": parsed.counts, "histogram": parsed.histogram}
+
+
+def forget(service: str, filename: str) -> None:
+    """Drop a log's cached entries, e.g. after it was deleted upstream."""
+    _cache.pop((service, filename), None)
+    _oversize.pop((service, filename), None)
+
+
+def clear() -> None:
+    _cache.clear()
+    _oversize.clear()
+    _locks.clear()
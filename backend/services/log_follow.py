@@ -0,0 +1,149 @@
+"""Shared tail -f followers behind the log viewer's SSE streams.
+
+The viewer used to re-request the last N lines (raw or structured) on a
+timer, so every open tab re-transferred and re-parsed the same window
+every few seconds. Now one upstream follower runs per (service, file,
+raw|structured) however many viewers are attached. Each tick it reads
+from its log_cursor position, which while the file is idle costs only a
+log listing (shared by all followed files through log_catalog), and
+fans out just the appended lines.
+
+When the cursor can't be continued (the file was rotated or truncated,
+or more than the read cap was written between ticks) subscribers get a
+``reset`` carrying the whole new window instead of an ``append``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import AsyncIterator
+from typing import Any
+
+from backend.services import log_cursor
+
+log = logging.getLogger(__name__)
+
+_POLL_INTERVAL = 2.0
+# Lines kept per follower; also the most a viewer can ask for up front.
+WINDOW = log_cursor.WINDOW
+# Events a slow viewer may fall behind by before it is resynced with a reset.
+_QUEUE_SIZE = 256
+
+_UNREACHABLE = {"arm": "ARM service unreachable", "transcoder": "Transcoder offline"}
+
+_Key = tuple[str, str, bool]  # (service, filename, structured)
+
+_subscribers: dict[_Key, set[asyncio.Queue[dict[str, Any]]]] = {}
+_pollers: dict[_Key, asyncio.Task[None]] = {}
+_windows: dict[_Key, list[Any]] = {}
+_cursors: dict[_Key, str] = {}
+_errors: dict[_Key, str] = {}
+
+
+def _field(structured: bool) -> str:
+    return "entries" if structured else "lines"
+
+
+def _publish(key: _Key, event: dict[str, Any]) -> None:
+    for queue in _subscribers.get(key, ()):
+        if queue.full():
+            # Too far behind to catch up line by line; start it over.
+            while not queue.empty():
+                queue.get_nowait()
+            queue.put_nowait({"type": "reset", _field(key[2]): list(_windows.get(key, []))})
+        else:
+            queue.put_nowait(event)
+
+
+async def _tick(key: _Key) -> None:
+    service, filename, structured = key
+    result = await log_cursor.read_items(
+        service, filename, structured=structured, lines=WINDOW, cursor=_cursors.get(key),
+    )
+    if not isinstance(result, log_cursor.Read):
+        detail = _UNREACHABLE[service] if result is None else "Log file not found"
+        if _errors.get(key) != detail:
+            _errors[key] = detail
+            _publish(key, {"type": "error", "detail": detail})
+        return
+    _errors.pop(key, None)
+    _cursors[key] = result.cursor
+    if key not in _windows:
+        _windows[key] = result.items
+        _publish(key, {"type": "snapshot", _field(structured): result.items})
+    elif result.reset:
+        _windows[key] = result.items
+        _publish(key, {"type": "reset", _field(structured): result.items})
+    elif result.items:
+        _windows[key] = (_windows[key] + result.items)[-WINDOW:]
+        _publish(key, {"type": "append", _field(structured): result.items})
+
+
+async def _poll(key: _Key) -> None:
+    try:
+        while _subscribers.get(key):
+            try:
+                await _tick(key)
+            except Exception:  # keep following across a bad upstream payload
+                log.exception("Log follow poll failed for %s/%s", key[0], key[1])
+            await asyncio.sleep(_POLL_INTERVAL)
+    finally:
+        if _pollers.get(key) is asyncio.current_task():
+            del _pollers[key]
+
+
+def _trim(event: dict[str, Any], field: str, lines: int) -> dict[str, Any]:
+    if event["type"] in ("snapshot", "reset") and len(event[field]) > lines:
+        return {**event, field: event[field][-lines:]}
+    return event
+
+
+async def subscribe(
+    service: str,
+    filename: str,
+    *,
+    structured: bool = False,
+    lines: int = 200,
+    heartbeat: float | None = None,
+) -> AsyncIterator[dict[str, Any] | None]:
+    """Yield follow events for one log file.
+
+    The first event is a ``snapshot`` of the last ``lines`` lines (or
+    entries); after that come ``append`` events with only new lines,
+    ``reset`` when the file was rotated or the viewer fell behind, and
+    ``error`` when the upstream read fails. ``None`` is yielded after
+    ``heartbeat`` idle seconds so the caller can keep the stream warm.
+    """
+    key = (service, filename, structured)
+    field = _field(structured)
+    queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue(maxsize=_QUEUE_SIZE)
+    subs = _subscribers.setdefault(key, set())
+    subs.add(queue)
+    if key in _windows:
+        queue.put_nowait({"type": "snapshot", field: list(_windows[key])})
+    if key in _errors:
+        queue.put_nowait({"type": "error", "detail": _errors[key]})
+    if key not in _pollers:
+        _pollers[key] = asyncio.create_task(_poll(key))
+    try:
+        while True:
+            try:
+                yield _trim(await asyncio.wait_for(queue.get(), heartbeat), field, lines)
+            except TimeoutError:
+                yield None
+    finally:
+        subs.discard(queue)
+        if not subs:
+            _subscribers.pop(key, None)
+            _windows.pop(key, None)
+            _cursors.pop(key, None)
+            _errors.pop(key, None)
+            task = _pollers.pop(key, None)
+            if task is not None:
+                task.cancel()
+
+
+def active_followers() -> dict[_Key, int]:
+    """Subscriber count per followed file (for diagnostics/tests)."""
+    return {key: len(subs) for key, subs in _subscribers.items()}
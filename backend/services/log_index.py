@@ -0,0 +1,301 @@
+"""Line-indexed windowed reads over very large logs.
+
+A multi-hour rip writes a log the viewer could only take whole
+(``mode=full``, one JSON body) or as a tail capped at 10,000 lines. Here
+a log is spooled once into a local file, streaming the ARM download (the
+transcoder has no download, so the string in its full read is decoded
+into the spool as the body streams in), and a sparse index records the
+byte offset of every ``_STRIDE``-th line while it is written. A window is
+then a seek to the nearest checkpoint and at most ``_STRIDE`` skipped
+lines before reading ``limit`` lines, so each request costs the same
+however large the file is.
+
+The spool is checked against the log listing (size and mtime, via
+``log_catalog.lookup``) on every request. A log that is still being
+written is brought up to date at most every ``_MIN_RESPOOL`` seconds; in
+between, windows come from the last copy and ``total_lines`` says how far
+it reaches. An ARM log that only grew is caught up with a ``Range`` read
+of the bytes past the end of the spool, appended and indexed in place;
+anything else (a shorter log, a transcoder log, upstream ignoring the
+range) is spooled again from the start.
+
+Spools are evicted least recently used beyond ``_MAX_SPOOLS`` files or
+``_MAX_SPOOL_BYTES`` on disk, and a log's lock only lives while a
+request for it is in progress.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import os
+import time
+from array import array
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any, BinaryIO, NamedTuple
+
+from backend.config import settings
+from backend.services import arm_client, log_catalog, log_download, transcoder_client
+from backend.services.log_catalog import NOT_FOUND, LogUnavailable
+
+log = logging.getLogger(__name__)
+
+_cache_dir: str = settings.log_cache_path
+
+_STRIDE = 1000
+_MAX_SPOOLS = 16
+_MAX_SPOOL_BYTES = 1 << 30
+_MIN_RESPOOL = 10.0
+# Most lines one window may ask for.
+MAX_WINDOW = 5000
+
+_Key = tuple[str, str]  # (service, filename)
+
+
+class _Indexer:
+    """Counts lines and records checkpoints as bytes stream past."""
+
+    def __init__(self) -> None:
+        self.checkpoints = array("Q", [0])
+        self.lines = 0
+        self._pending = 0  # newlines since the last checkpoint
+        self._pos = 0
+        self._ends_with_newline = True
+
+    def feed(self, chunk: bytes) -> None:
+        start = 0
+        while True:
+            need = _STRIDE - self._pending
+            found = chunk.count(b"\n", start)
+            if found < need:
+                self._pending += found
+                self.lines += found
+                break
+            for _ in range(need):
+                start = chunk.find(b"\n", start) + 1
+            self.lines += need
+            self._pending = 0
+            self.checkpoints.append(self._pos + start)
+        self._pos += len(chunk)
+        if chunk:
+            self._ends_with_newline = chunk.endswith(b"\n")
+
+    @property
+    def total_lines(self) -> int:
+        # A last line still being written has no newline yet.
+        return self.lines + (0 if self._ends_with_newline else 1)
+
+    @property
+    def position(self) -> int:
+        """Bytes fed so far: the spool file's length."""
+        return self._pos
+
+
+class _Spool(NamedTuple):
+    path: Path
+    size: int  # as listed upstream
+    modified: str
+    index: _Indexer  # fed as the file is written, and again as it's appended to
+    spooled_at: float
+
+    @property
+    def total_lines(self) -> int:
+        return self.index.total_lines
+
+    @property
+    def checkpoints(self) -> array:
+        """Byte offset of line k * _STRIDE."""
+        return self.index.checkpoints
+
+
+_spools: OrderedDict[_Key, _Spool] = OrderedDict()
+# key -> (lock, requests holding or waiting on it)
+_locks: dict[_Key, tuple[asyncio.Lock, int]] = {}
+
+
+def _spool_path(key: _Key) -> Path:
+    base = Path(_cache_dir)
+    base.mkdir(parents=True, exist_ok=True)
+    name = hashlib.sha256(f"{key[0]}:{key[1]}".encode()).hexdigest()
+    return base / f"{name}.log"
+
+
+async def _write(chunks: AsyncIterator[bytes], out: BinaryIO, indexer: _Indexer) -> None:
+    async for chunk in chunks:
+        out.write(chunk)
+        indexer.feed(chunk)
+
+
+async def _download(service: str, filename: str, out: BinaryIO, indexer: _Indexer) -> None:
+    if service == "transcoder":
+        resp = await transcoder_client.stream_log(filename)
+    else:
+        resp = await arm_client.stream_log_download(filename)
+    if resp is None:
+        raise LogUnavailable(None)
+    try:
+        if resp.status_code == 404:
+            raise LogUnavailable(dict(NOT_FOUND))
+        if resp.status_code != 200:
+            raise LogUnavailable(None)
+        if service == "transcoder":
+            try:
+                await _write(log_download.json_string_field(resp.aiter_bytes(), "content"), out, indexer)
+            except ValueError as exc:
+                log.warning("Unreadable transcoder log body for %s: %s", filename, exc)
+                raise LogUnavailable(None) from exc
+        else:
+            await _write(resp.aiter_bytes(), out, indexer)
+    finally:
+        await resp.aclose()
+
+
+async def _append(key: _Key, spool: _Spool) -> bool:
+    """Catch an ARM log's spool up with a Range read of what it gained.
+
+    False when the read can't simply be appended (upstream sent the whole
+    log or refused the range); the spool is untouched then.
+    """
+    start = spool.index.position
+    resp = await arm_client.stream_log_download(key[1], headers={"Range": f"bytes={start}-"})
+    if resp is None:
+        raise LogUnavailable(None)
+    try:
+        if resp.status_code == 404:
+            raise LogUnavailable(dict(NOT_FOUND))
+        if resp.status_code != 206 or not resp.headers.get("content-range", "").startswith(f"bytes {start}-"):
+            return False
+        # Bytes written and indexed stay consistent even if the read
+        # breaks off; the next catch-up starts where this one stopped.
+        with open(spool.path, "ab") as out:
+            await _write(resp.aiter_bytes(), out, spool.index)
+    finally:
+        await resp.aclose()
+    return True
+
+
+def _store(key: _Key, spool: _Spool) -> None:
+    _spools[key] = spool
+    _spools.move_to_end(key)
+    while len(_spools) > 1 and (
+        len(_spools) > _MAX_SPOOLS
+        or sum(s.index.position for s in _spools.values()) > _MAX_SPOOL_BYTES
+    ):
+        _, evicted = _spools.popitem(last=False)
+        evicted.path.unlink(missing_ok=True)
+
+
+async def _respool(key: _Key, entry: dict[str, Any]) -> _Spool:
+    size, modified = int(entry.get("size") or 0), str(entry.get("modified") or "")
+    spool = _spools.get(key)
+    if (
+        spool is not None and key[0] == "arm" and size > spool.index.position
+        and await _append(key, spool)
+        # Evicted or forgotten mid-append: its file is gone, start over.
+        and _spools.get(key) is spool
+    ):
+        spool = spool._replace(size=size, modified=modified, spooled_at=time.monotonic())
+        _store(key, spool)
+        return spool
+    path = _spool_path(key)
+    tmp = path.with_suffix(".tmp")
+    indexer = _Indexer()
+    try:
+        with open(tmp, "wb") as out:
+            await _download(key[0], key[1], out, indexer)
+        os.replace(tmp, path)
+    finally:
+        tmp.unlink(missing_ok=True)
+    spool = _Spool(path, size, modified, indexer, time.monotonic())
+    _store(key, spool)
+    return spool
+
+
+@asynccontextmanager
+async def _locked(key: _Key) -> AsyncIterator[None]:
+    """Serialise spooling of one log; the lock is dropped with its last user."""
+    lock, users = _locks.get(key) or (asyncio.Lock(), 0)
+    _locks[key] = (lock, users + 1)
+    try:
+        async with lock:
+            yield
+    finally:
+        held, users = _locks.get(key, (None, 0))
+        if held is lock:
+            if users == 1:
+                del _locks[key]
+            else:
+                _locks[key] = (lock, users - 1)
+
+
+async def _current(key: _Key) -> _Spool:
+    async with _locked(key):
+        entry = await log_catalog.lookup(*key)
+        spool = _spools.get(key)
+        if spool is not None:
+            unchanged = (spool.size, spool.modified) == (int(entry.get("size") or 0), str(entry.get("modified") or ""))
+            if unchanged or time.monotonic() - spool.spooled_at < _MIN_RESPOOL:
+                _spools.move_to_end(key)
+                return spool
+        return await _respool(key, entry)
+
+
+def _read_lines(spool: _Spool, offset: int, limit: int) -> list[str]:
+    if offset >= spool.total_lines:
+        return []
+    lines: list[str] = []
+    with open(spool.path, "rb") as f:
+        f.seek(spool.checkpoints[offset // _STRIDE])
+        for _ in range(offset % _STRIDE):
+            f.readline()
+        for _ in range(min(limit, spool.total_lines - offset)):
+            line = f.readline()
+            if not line:
+                break
+            lines.append(line.rstrip(b"\r\n").decode("utf-8", "replace"))
+    return lines
+
+
+async def read_window(service: str, filename: str, offset: int, limit: int) -> dict[str, Any] | None:
+    """Lines ``offset`` .. ``offset + limit`` of a log plus its line count.
+
+    Returns None if the service is unreachable, or a ``success: False``
+    dict if the log doesn't exist.
+    """
+    key = (service, filename)
+    try:
+        spool = await _current(key)
+    except LogUnavailable as exc:
+        return exc.result
+    lines = _read_lines(spool, offset, min(limit, MAX_WINDOW))
+    return {"filename": filename, "offset": offset, "total_lines": spool.total_lines, "lines": lines}
+
+
+def forget(service: str, filename: str) -> None:
+    """Drop a log's spool, e.g. after it was deleted upstream."""
+    spool = _spools.pop((service, filename), None)
+    if spool is not None:
+        spool.path.unlink(missing_ok=True)
+
+
+def clear() -> None:
+    for spool in _spools.values():
+        spool.path.unlink(missing_ok=True)
+    _spools.clear()
+    _locks.clear()
+
+
+def startup_scan() -> None:
+    """Remove spools left by a previous run; their index was in memory."""
+    d = Path(_cache_dir)
+    if not d.exists():
+        return
+    for path in [*d.glob("*.log"), *d.glob("*.tmp")]:
+        try:
+            path.unlink()
+        except OSError as exc:
+            log.warning("Could not remove stale log spool %s: %s", path.name, exc)
@@ -0,0 +1,113 @@
+"""Search across every ARM and transcoder log at once.
+
+Tracking down why a job failed meant running the structured ``search=``
+read against the ARM job log and the transcoder log one at a time. This
+lists both services' logs, runs the filtered structured read on each
+with at most ``_CONCURRENCY`` in flight, and yields matches file by file
+as the reads finish, so the first hits are on screen while the slow,
+big files are still being read.
+
+Logs last modified before ``since`` are skipped without being read.
+Once ``limit`` matches have been yielded, or the caller stops iterating
+(client disconnected), the reads still queued or in flight are
+cancelled.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from datetime import datetime, timezone
+from typing import Any
+
+from backend.config import settings
+from backend.services import arm_client, transcoder_client
+
+_CONCURRENCY = 4
+MAX_RESULTS = 5000
+# Most lines one upstream read returns, matching the log routes' ``lines``
+# cap. Structured full reads still have to pass it, though full mode
+# ignores the count.
+MAX_READ_LINES = 10000
+
+
+def parse_time(value: Any) -> datetime | None:
+    """Log/listing timestamp as naive UTC, or None if it doesn't parse."""
+    if isinstance(value, datetime):
+        parsed = value
+    else:
+        try:
+            parsed = datetime.fromisoformat(str(value))
+        except ValueError:
+            return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+async def _listings() -> tuple[list[tuple[str, dict[str, Any]]], list[str]]:
+    services = ["arm", "transcoder"] if settings.transcoder_enabled else ["arm"]
+    clients = {"arm": arm_client, "transcoder": transcoder_client}
+    results = await asyncio.gather(*(clients[s].list_logs() for s in services))
+    files: list[tuple[str, dict[str, Any]]] = []
+    unavailable: list[str] = []
+    for service, listing in zip(services, results):
+        if isinstance(listing, list):
+            files.extend((service, entry) for entry in listing)
+        else:
+            unavailable.append(service)
+    return files, unavailable
+
+
+async def _search_file(
+    sem: asyncio.Semaphore, service: str, filename: str, q: str, level: str | None,
+) -> tuple[str, str, dict[str, Any] | None]:
+    async with sem:
+        if service == "transcoder":
+            result = await transcoder_client.read_structured_log(
+                filename, mode="full", lines=MAX_READ_LINES, level=level, search=q,
+            )
+        else:
+            result = await arm_client.read_log_structured(
+                filename, mode="full", lines=MAX_READ_LINES, level=level, search=q,
+            )
+    return service, filename, result
+
+
+async def search(
+    q: str,
+    *,
+    level: str | None = None,
+    since: datetime | None = None,
+    limit: int = 200,
+) -> AsyncIterator[dict[str, Any]]:
+    """Yield ``match`` events, an ``error`` per unreadable log, and a
+    final ``done`` summary."""
+    files, unavailable = await _listings()
+    since = parse_time(since) if since is not None else None
+    if since is not None:
+        files = [(s, e) for s, e in files
+                 if (modified := parse_time(e.get("modified"))) is None or modified >= since]
+    sem = asyncio.Semaphore(_CONCURRENCY)
+    tasks = [asyncio.create_task(_search_file(sem, s, e["filename"], q, level)) for s, e in files]
+    matched = 0
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            service, filename, result = await next_done
+            if result is None or result.get("success") is False:
+                yield {"type": "error", "service": service, "filename": filename}
+                continue
+            for entry in result.get("entries") or []:
+                if since is not None and (ts := parse_time(entry.get("timestamp"))) is not None and ts < since:
+                    continue
+                yield {"type": "match", "service": service, "filename": filename, **entry}
+                matched += 1
+                if matched >= limit:
+                    break
+            if matched >= limit:
+                break
+        yield {"type": "done", "files": len(files), "matched": matched,
+               "limit_reached": matched >= limit, "unavailable": unavailable}
+    finally:
+        for task in tasks:
+            task.cancel()
@@ -0,0 +1,81 @@
+"""One chronological view of a job's ARM and transcoder logs.
+
+Working out what happened to a job meant reading the ARM rip log and
+then the transcoder log side by side. Both logs are already in time
+order, so interleaving them is a k-way merge: ``heapq.merge`` over the
+two entry streams holds one pending entry per log, and a page is just
+``offset``/``limit`` sliced off the merged iterator, so only the entries
+up to the end of the requested page are ever merged.
+
+Upstream serves structured logs as one JSON body (optionally filtered by
+level), so each log still arrives whole; the two reads run concurrently,
+and the merge and the response are what stay lazy. The router finds the
+transcoder's log through ``get_transcoder_job_for_arm``.
+
+Entries whose timestamp doesn't parse keep the time of the entry before
+them in the same log (tracebacks, wrapped lines), so they stay with the
+line that produced them.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+from collections.abc import Iterable, Iterator
+from datetime import datetime
+from itertools import islice
+from typing import Any
+
+from backend.services import arm_client, transcoder_client
+from backend.services.log_search import MAX_READ_LINES, parse_time
+
+
+_Keyed = tuple[datetime, int, int, str, dict[str, Any]]
+
+
+def _keyed(rank: int, source: str, entries: Iterable[dict[str, Any]]) -> Iterator[_Keyed]:
+    last = datetime.min
+    for seq, entry in enumerate(entries):
+        last = parse_time(entry.get("timestamp")) or last
+        # (time, source rank, position): ties keep ARM first and each
+        # log's own order, and the entry dicts are never compared.
+        yield last, rank, seq, source, entry
+
+
+def merge(sources: dict[str, list[dict[str, Any]]]) -> Iterator[tuple[str, dict[str, Any]]]:
+    """(source, entry) pairs from all ``sources`` in timestamp order."""
+    streams = [_keyed(rank, source, entries) for rank, (source, entries) in enumerate(sources.items())]
+    for _ts, _rank, _seq, source, entry in heapq.merge(*streams):
+        yield source, entry
+
+
+async def read_sources(
+    arm_logfile: str, transcoder_logfile: str | None, level: str | None = None,
+) -> tuple[dict[str, Any] | None, dict[str, Any] | None]:
+    """Both structured log reads as the clients returned them, fetched
+    concurrently; the transcoder read is None when there's no logfile."""
+
+    async def transcoder() -> dict[str, Any] | None:
+        if not transcoder_logfile:
+            return None
+        return await transcoder_client.read_structured_log(
+            transcoder_logfile, mode="full", lines=MAX_READ_LINES, level=level,
+        )
+
+    arm, tc = await asyncio.gather(
+        arm_client.read_log_structured(arm_logfile, mode="full", lines=MAX_READ_LINES, level=level),
+        transcoder(),
+    )
+    return arm, tc
+
+
+def page(sources: dict[str, list[dict[str, Any]]], offset: int, limit: int) -> Iterator[dict[str, Any]]:
+    """``entry`` events for one page of the merged timeline, then ``done``."""
+    merged = merge(sources)
+    returned = 0
+    for source, entry in islice(merged, offset, offset + limit):
+        returned += 1
+        yield {"type": "entry", "source": source, **entry}
+    more = next(merged, None) is not None
+    yield {"type": "done", "offset": offset, "returned": returned,
+           "next_offset": offset + returned if more else None, "sources": list(sources)}
@@ -0,0 +1,256 @@
+"""LRU + TTL caches in front of ARM's metadata lookups.
+
+Identifying a disc means repeating the same OMDb/TMDb query, paging
+forward and back, and opening a few candidates to compare, and every one
+of those round-trips through ARM to a third-party API. Search pages are
+cached by (query, year, page) and a full page triggers a speculative
+fetch of the next one, so "next" is usually instant. Title details (by
+IMDb id) and music release details (by MusicBrainz id) are cached here
+and written through to metadata_disk_cache, which survives restarts.
+TVDB episode lists are cached by (series id, season), so every disc of
+a box set shares one upstream fetch per season. CRC64 database lookups
+are cached by hash; a miss is kept for less time than a hit, since a
+disc nobody had submitted can turn up once someone does.
+
+Only successful answers are cached; upstream errors propagate to the
+caller unchanged (and uncached) so the router's error mapping still
+applies. Concurrent requests for the same key share one upstream call,
+which is also how a foreground request picks up an in-flight prefetch;
+the upstream call is cancelled only when its last waiter goes away.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+from backend.services import arm_client, job_detail_cache, job_mirror, metadata_disk_cache
+
+logger = logging.getLogger(__name__)
+
+_SEARCH_TTL = 600.0
+_DETAIL_TTL = 3600.0
+# Episode lists only change when a new episode airs.
+_EPISODES_TTL = 6 * 3600.0
+_MAX_SEARCH_ENTRIES = 256
+_MAX_DETAIL_ENTRIES = 512
+_MAX_EPISODE_ENTRIES = 256
+_CRC_TTL = 24 * 3600.0
+_CRC_MISS_TTL = 600.0
+_MAX_CRC_ENTRIES = 512
+# OMDb pages hold 10 results; anything shorter is the last page, so there
+# is nothing to prefetch.
+_PREFETCH_MIN_RESULTS = 10
+
+_SearchKey = tuple[str, str | None, int]
+
+_search: OrderedDict[_SearchKey, tuple[float, list[dict[str, Any]]]] = OrderedDict()
+# (kind, id) -> (expires_at, detail); kind is "media" or "music".
+_detail: OrderedDict[tuple[str, str], tuple[float, dict[str, Any]]] = OrderedDict()
+# (tvdb series id, season) -> (expires_at, tvdb-episodes response)
+_episodes: OrderedDict[tuple[int, int], tuple[float, dict[str, Any]]] = OrderedDict()
+# crc64 -> (expires_at, lookup response)
+_crc: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+_inflight: dict[Hashable, asyncio.Future[Any]] = {}
+_waiters: dict[asyncio.Future[Any], int] = {}
+_background_tasks: set[asyncio.Task[None]] = set()
+
+
+def _lookup(cache: OrderedDict, key: Hashable) -> Any | None:
+    entry = cache.get(key)
+    if entry is None:
+        return None
+    if time.monotonic() >= entry[0]:
+        del cache[key]
+        return None
+    cache.move_to_end(key)
+    return entry[1]
+
+
+def _store(cache: OrderedDict, key: Hashable, value: Any, ttl: float, max_entries: int) -> None:
+    cache[key] = (time.monotonic() + ttl, value)
+    cache.move_to_end(key)
+    while len(cache) > max_entries:
+        cache.popitem(last=False)
+
+
+async def _coalesced(key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(fetch())
+        _inflight[key] = task
+        task.add_done_callback(lambda t: _forget_inflight(key, t))
+    _waiters[task] = _waiters.get(task, 0) + 1
+    try:
+        # shield: one waiter being cancelled mustn't cancel the fetch for
+        # the others...
+        return await asyncio.shield(task)
+    finally:
+        _waiters[task] -= 1
+        if not _waiters[task]:
+            del _waiters[task]
+            # ...but once nobody is left waiting (superseded typeahead,
+            # client gone), stop the upstream request as well.
+            if not task.done():
+                task.cancel()
+
+
+def _forget_inflight(key: Hashable, task: asyncio.Future[Any]) -> None:
+    if _inflight.get(key) is task:
+        del _inflight[key]
+
+
+def _search_key(query: str, year: str | None, page: int) -> _SearchKey:
+    return (" ".join(query.lower().split()), year or None, page)
+
+
+async def _fetch_search(query: str, year: str | None, page: int) -> list[dict[str, Any]]:
+    results = await arm_client.search_metadata(query, year, page=page)
+    _store(_search, _search_key(query, year, page), results, _SEARCH_TTL, _MAX_SEARCH_ENTRIES)
+    return results
+
+
+async def _prefetch(query: str, year: str | None, page: int) -> None:
+    try:
+        await _coalesced(("search", _search_key(query, year, page)),
+                         lambda: _fetch_search(query, year, page))
+    except Exception as exc:
+        logger.debug("Metadata prefetch of page %d failed: %s", page, exc)
+
+
+def _schedule_prefetch(query: str, year: str | None, page: int) -> None:
+    key = _search_key(query, year, page)
+    if _lookup(_search, key) is not None or ("search", key) in _inflight:
+        return
+    task = asyncio.create_task(_prefetch(query, year, page))
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
+async def search(query: str, year: str | None = None, page: int = 1) -> list[dict[str, Any]]:
+    """Cached ``arm_client.search_metadata``; warms page + 1 on a full page."""
+    key = _search_key(query, year, page)
+    results = _lookup(_search, key)
+    if results is None:
+        results = await _coalesced(("search", key), lambda: _fetch_search(query, year, page))
+    if len(results) >= _PREFETCH_MIN_RESULTS:
+        _schedule_prefetch(query, year, page + 1)
+    return results
+
+
+async def _fetch_detail(
+    kind: str, detail_id: str, fetch: Callable[[str], Awaitable[dict[str, Any] | None]],
+) -> dict[str, Any] | None:
+    result = await fetch(detail_id)
+    if result:
+        _store(_detail, (kind, detail_id), result, _DETAIL_TTL, _MAX_DETAIL_ENTRIES)
+        metadata_disk_cache.store(f"{kind}:{detail_id}", result)
+    return result
+
+
+async def _get_detail(
+    kind: str, detail_id: str, fetch: Callable[[str], Awaitable[dict[str, Any] | None]],
+) -> dict[str, Any] | None:
+    key = (kind, detail_id)
+    cached = _lookup(_detail, key)
+    if cached is not None:
+        return cached
+    cached = metadata_disk_cache.retrieve(f"{kind}:{detail_id}")
+    if cached is not None:
+        _store(_detail, key, cached, _DETAIL_TTL, _MAX_DETAIL_ENTRIES)
+        return cached
+    return await _coalesced(("detail", *key), lambda: _fetch_detail(kind, detail_id, fetch))
+
+
+async def get_media_detail(imdb_id: str) -> dict[str, Any] | None:
+    """Cached ``arm_client.get_media_detail``. Misses (None) aren't cached."""
+    return await _get_detail("media", imdb_id, arm_client.get_media_detail)
+
+
+async def get_music_detail(release_id: str) -> dict[str, Any] | None:
+    """Cached ``arm_client.get_music_detail``. Misses (None) aren't cached."""
+    return await _get_detail("music", release_id, arm_client.get_music_detail)
+
+
+async def _fetch_episodes(job_id: int, season: int) -> dict[str, Any] | None:
+    result = await arm_client.tvdb_episodes(job_id, season)
+    if (
+        isinstance(result, dict)
+        and result.get("success", True)
+        and result.get("tvdb_id")
+        and isinstance(result.get("episodes"), list)
+    ):
+        key = (int(result["tvdb_id"]), int(result.get("season") or season))
+        _store(_episodes, key, result, _EPISODES_TTL, _MAX_EPISODE_ENTRIES)
+    return result
+
+
+def _known_series(job_id: int) -> int | None:
+    """The job's TVDB series id if this process already holds it: a cached
+    job detail (dropped on every job edit) or a warm mirror summary
+    (re-read on every job edit)."""
+    detail = job_detail_cache.peek(job_id)
+    job = (detail or {}).get("job")
+    if job is None and job_mirror.is_warm():
+        job = job_mirror.get(job_id)
+    tvdb_id = (job or {}).get("tvdb_id")
+    return int(tvdb_id) if tvdb_id else None
+
+
+async def tvdb_episodes(job_id: int, season: int) -> dict[str, Any] | None:
+    """Cached ``arm_client.tvdb_episodes``, keyed by the job's series and season.
+
+    The series id is only looked up locally; when it isn't known the
+    request goes upstream, and the answer (which names its series) is
+    still cached for the other discs of the set.
+    """
+    tvdb_id = _known_series(job_id)
+    if tvdb_id:
+        cached = _lookup(_episodes, (tvdb_id, season))
+        if cached is not None:
+            return cached
+        return await _coalesced(("episodes", tvdb_id, season),
+                                lambda: _fetch_episodes(job_id, season))
+    return await _fetch_episodes(job_id, season)
+
+
+async def _fetch_crc(crc64: str) -> dict[str, Any]:
+    result = await arm_client.lookup_crc(crc64)
+    if isinstance(result, dict):
+        if result.get("found"):
+            _store(_crc, crc64, result, _CRC_TTL, _MAX_CRC_ENTRIES)
+        elif not result.get("error") and result.get("has_api_key") is not False:
+            # A real not-found. Missing-key and error answers aren't
+            # cached, so adding a key or a recovered database shows at once.
+            _store(_crc, crc64, result, _CRC_MISS_TTL, _MAX_CRC_ENTRIES)
+    return result
+
+
+async def lookup_crc(crc64: str) -> dict[str, Any]:
+    """Cached ``arm_client.lookup_crc``; not-found answers expire sooner,
+    and answers carrying an error or a missing API key aren't cached."""
+    cached = _lookup(_crc, crc64)
+    if cached is not None:
+        return cached
+    return await _coalesced(("crc", crc64), lambda: _fetch_crc(crc64))
+
+
+def forget_crc(crc64: str) -> None:
+    """Drop a cached CRC lookup, e.g. after the disc was submitted."""
+    _crc.pop(crc64, None)
+
+
+def clear() -> None:
+    _search.clear()
+    _detail.clear()
+    _episodes.clear()
+    _crc.clear()
+    _inflight.clear()
+    _waiters.clear()
+    for task in _background_tasks:
+        task.cancel()
+    _background_tasks.clear()
@@ -0,0 +1,176 @@
+"""Disk-backed cache for metadata detail payloads, with LRU eviction and TTL.
+
+OMDb/TMDb title details (by IMDb id) and MusicBrainz release details (by
+release id) are effectively immutable, so they are kept on disk next to
+the image cache and survive restarts. metadata_cache's in-memory LRU sits
+in front of this; a disk hit is promoted there.
+
+Loading is lazy: ``startup_scan()`` only stats the entry files to build
+the size/age index, and a payload is read and parsed the first time it
+is asked for. Entries are keyed by a hash of "<kind>:<id>", so no file
+has to be opened to find one.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+from backend.config import settings
+
+log = logging.getLogger(__name__)
+
+_cache_dir: str = settings.metadata_cache_path
+# filename -> {"cached_at", "accessed_at", "size"}
+_index: dict[str, dict[str, Any]] = {}
+
+_MAX_ENTRIES = 5000
+_MAX_BYTES = 64 * 1024 * 1024  # 64 MB
+_TTL_SECONDS = 90 * 24 * 3600  # 90 days
+
+
+def _key_to_filename(key: str) -> str:
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+def _ensure_dir() -> Path:
+    p = Path(_cache_dir)
+    p.mkdir(parents=True, exist_ok=True)
+    return p
+
+
+def _safe_path(base: Path, filename: str) -> Path:
+    """Build a path within base and verify containment (prevents path traversal)."""
+    target = (base / f"{filename}.json").resolve()
+    if not target.is_relative_to(base.resolve()):
+        raise ValueError(f"Path traversal blocked: {target}")
+    return target
+
+
+def _total_bytes() -> int:
+    return sum(e["size"] for e in _index.values())
+
+
+def store(key: str, data: dict[str, Any]) -> bool:
+    """Store a detail payload. Returns False if it could not be written."""
+    body = json.dumps({"key": key, "data": data}).encode()
+    if len(body) > _MAX_BYTES:
+        return False
+    filename = _key_to_filename(key)
+    _remove(filename)
+
+    # Evict LRU until the new entry fits
+    while _index and (len(_index) >= _MAX_ENTRIES or _total_bytes() + len(body) > _MAX_BYTES):
+        _remove(min(_index, key=lambda f: _index[f]["accessed_at"]))
+
+    try:
+        d = _ensure_dir()
+        path = _safe_path(d, filename)
+        # Write-then-rename so a crash mid-write never leaves a torn entry.
+        tmp = path.with_suffix(".tmp")
+        tmp.write_bytes(body)
+        os.replace(tmp, path)
+    except OSError as exc:
+        log.warning("Metadata cache write failed for %s: %s", key, exc)
+        return False
+
+    now = time.time()
+    _index[filename] = {"cached_at": now, "accessed_at": now, "size": len(body)}
+    return True
+
+
+def retrieve(key: str) -> dict[str, Any] | None:
+    """Retrieve a cached detail payload, or None."""
+    filename = _key_to_filename(key)
+    entry = _index.get(filename)
+    if entry is None:
+        return None
+
+    # Check TTL
+    if time.time() - entry["cached_at"] > _TTL_SECONDS:
+        _remove(filename)
+        return None
+
+    path = _safe_path(Path(_cache_dir), filename)
+    try:
+        payload = json.loads(path.read_bytes())
+    except (OSError, json.JSONDecodeError) as exc:
+        log.debug("Dropping unreadable metadata cache entry %s: %s", filename, exc)
+        _remove(filename)
+        return None
+    if not isinstance(payload, dict) or payload.get("key") != key:
+        _remove(filename)
+        return None
+
+    # Update access time
+    entry["accessed_at"] = time.time()
+    return payload.get("data")
+
+
+def _remove(filename: str) -> int:
+    """Remove an entry from cache. Returns freed bytes."""
+    entry = _index.pop(filename, None)
+    if entry is None:
+        return 0
+    p = _safe_path(Path(_cache_dir), filename)
+    try:
+        p.unlink()
+    except FileNotFoundError:
+        return 0
+    except OSError as exc:
+        log.warning("Could not remove metadata cache entry %s: %s", filename, exc)
+        return 0
+    return entry["size"]
+
+
+def clear() -> dict[str, Any]:
+    """Remove all cached detail payloads. Returns stats about what was cleared."""
+    count = len(_index)
+    freed = 0
+    for filename in list(_index):
+        freed += _remove(filename)
+    return {"success": True, "cleared": count, "freed_bytes": freed}
+
+
+def stats() -> dict[str, Any]:
+    """Return cache statistics."""
+    total_bytes = _total_bytes()
+    oldest = min((e["cached_at"] for e in _index.values()), default=None)
+    return {
+        "count": len(_index),
+        "size_bytes": total_bytes,
+        "size_mb": round(total_bytes / 1048576, 1),
+        "oldest": oldest,
+        "path": _cache_dir,
+    }
+
+
+def startup_scan() -> None:
+    """Rebuild the in-memory index from file stats on startup (no parsing)."""
+    _index.clear()
+    d = Path(_cache_dir)
+    if not d.exists():
+        return
+    now = time.time()
+    for path in d.glob("*.tmp"):
+        path.unlink(missing_ok=True)
+    for path in d.glob("*.json"):
+        try:
+            st = path.stat()
+            if now - st.st_mtime > _TTL_SECONDS:
+                path.unlink()
+                log.debug("Removed expired metadata cache entry: %s", path.name)
+                continue
+            _index[path.stem] = {
+                "cached_at": st.st_mtime,
+                "accessed_at": st.st_atime,
+                "size": st.st_size,
+            }
+        except OSError as exc:
+            log.warning("Skipping metadata cache entry %s: %s", path.name, exc)
+    log.info("Metadata cache indexed: %d entries from %s", len(_index), _cache_dir)
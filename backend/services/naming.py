@@ -0,0 +1,192 @@
+"""Local naming-pattern validation and preview rendering.
+
+The pattern editor used to round-trip to ARM on every keystroke for
+validation and previews. Patterns are plain ``{token}`` templates over
+the vocabulary in ``arm_contracts.PATTERN_TOKENS`` (alias -> (field,
+description, accessor)), so the BFF can check and render them itself
+against job/track data it already holds. Saving a pattern still goes to
+ARM, which stays the authority on the final filenames.
+
+Compiled patterns are cached, so rendering one pattern across a whole
+track list parses it once, and the job's saved patterns stay compiled
+between previews.
+"""
+
+from __future__ import annotations
+
+import difflib
+import inspect
+import re
+from functools import lru_cache
+from typing import Any, NamedTuple
+
+from arm_contracts import PATTERN_TOKENS
+
+_TOKEN_RE = re.compile(r"\{(\w+)\}")
+# Characters that can't appear in a path component on the filesystems ARM
+# writes to. Stripped from token values only; literal "/" in a folder
+# pattern is structure.
+_UNSAFE_CHARS = re.compile(r'[\\/:*?"<>|]')
+_PADDED_TOKENS = frozenset({"season", "episode"})
+
+# Fallbacks when the job's config snapshot lacks a pattern key; matches
+# the defaults RipSettings.svelte shows.
+_DEFAULT_PATTERNS = {
+    "MUSIC_TITLE_PATTERN": "{artist} - {album}",
+    "MUSIC_FOLDER_PATTERN": "{artist}/{album} ({year})",
+    "TV_TITLE_PATTERN": "{show} S{season}E{episode}",
+    "TV_FOLDER_PATTERN": "{show}/Season {season}",
+    "MOVIE_TITLE_PATTERN": "{title} ({year})",
+    "MOVIE_FOLDER_PATTERN": "{title} ({year})",
+}
+
+
+class CompiledPattern(NamedTuple):
+    # Alternating literal text and token aliases: (literal, alias | None).
+    segments: tuple[tuple[str, str | None], ...]
+    invalid: tuple[str, ...]
+
+
+class _Record(dict):
+    """dict with attribute access, so contract accessors can read job/track
+    payloads the same way they read model instances. Missing keys are None."""
+
+    def __getattr__(self, name: str) -> Any:
+        return self.get(name)
+
+
+@lru_cache(maxsize=None)
+def _takes_track(alias: str) -> bool:
+    """Whether a token's accessor is ``(job, track)`` rather than ``(job)``,
+    worked out once per token from its signature."""
+    accessor = PATTERN_TOKENS[alias][2]
+    try:
+        params = inspect.signature(accessor).parameters.values()
+    except (TypeError, ValueError):
+        return False
+    positional = [p for p in params if p.kind in (p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD)]
+    return len(positional) >= 2 or any(p.kind is p.VAR_POSITIONAL for p in params)
+
+
+@lru_cache(maxsize=512)
+def compile_pattern(pattern: str) -> CompiledPattern:
+    segments: list[tuple[str, str | None]] = []
+    invalid: list[str] = []
+    pos = 0
+    for match in _TOKEN_RE.finditer(pattern):
+        alias = match.group(1)
+        segments.append((pattern[pos:match.start()], alias))
+        if alias not in PATTERN_TOKENS and alias not in invalid:
+            invalid.append(alias)
+        pos = match.end()
+    segments.append((pattern[pos:], None))
+    return CompiledPattern(tuple(segments), tuple(invalid))
+
+
+def validate(pattern: str) -> dict[str, Any]:
+    """Validate a pattern in the shape of ARM's /naming/validate."""
+    invalid = list(compile_pattern(pattern).invalid)
+    suggestions: dict[str, str] = {}
+    for alias in invalid:
+        close = difflib.get_close_matches(alias, PATTERN_TOKENS, n=1)
+        if close:
+            suggestions[alias] = close[0]
+    return {"valid": not invalid, "invalid_vars": invalid, "suggestions": suggestions}
+
+
+def _clean(value: Any) -> str:
+    if value is None:
+        return ""
+    return _UNSAFE_CHARS.sub("", str(value)).strip()
+
+
+def _resolve(alias: str, job: _Record, track: _Record | None) -> Any:
+    field, _desc, accessor = PATTERN_TOKENS[alias]
+    if callable(accessor):
+        try:
+            return accessor(job, track) if _takes_track(alias) else accessor(job)
+        except Exception:
+            # Accessors are written against complete models; a payload
+            # missing a field they use renders the token empty.
+            return None
+    value = track.get(field) if track is not None else None
+    if value in (None, ""):
+        value = job.get(field)
+    if alias in _PADDED_TOKENS and str(value or "").isdigit():
+        value = str(value).zfill(2)
+    return value
+
+
+def render(
+    pattern: str,
+    job: dict[str, Any] | None = None,
+    track: dict[str, Any] | None = None,
+    values: dict[str, Any] | None = None,
+) -> str:
+    """Render ``pattern``. Unknown tokens are left as written.
+
+    Token values come from ``values`` when given (the editor's free-form
+    preview), otherwise from the job and, for per-track tokens, the track.
+    """
+    compiled = compile_pattern(pattern)
+    job_rec = _Record(job or {})
+    track_rec = _Record(track) if track is not None else None
+    out: list[str] = []
+    for literal, alias in compiled.segments:
+        out.append(literal)
+        if alias is None:
+            continue
+        if alias not in PATTERN_TOKENS:
+            out.append(f"{{{alias}}}")
+        elif values is not None:
+            out.append(_clean(values.get(alias)))
+        else:
+            out.append(_clean(_resolve(alias, job_rec, track_rec)))
+    return " ".join("".join(out).split())
+
+
+def job_patterns(detail: dict[str, Any]) -> tuple[str, str]:
+    """Title and folder patterns in effect for a job: override, else config."""
+    job = detail.get("job") or {}
+    config = detail.get("config") or {}
+    if str(job.get("disctype") or "").lower() == "music" or str(job.get("video_type") or "").lower() == "music":
+        prefix = "MUSIC"
+    elif str(job.get("video_type") or "").lower() == "series":
+        prefix = "TV"
+    else:
+        prefix = "MOVIE"
+    title_key, folder_key = f"{prefix}_TITLE_PATTERN", f"{prefix}_FOLDER_PATTERN"
+    return (
+        job.get("title_pattern_override") or config.get(title_key) or _DEFAULT_PATTERNS[title_key],
+        job.get("folder_pattern_override") or config.get(folder_key) or _DEFAULT_PATTERNS[folder_key],
+    )
+
+
+def preview_job(
+    detail: dict[str, Any],
+    title_pattern: str | None = None,
+    folder_pattern: str | None = None,
+) -> dict[str, Any]:
+    """Render a job's track names in the shape of ARM's /jobs/{id}/naming-preview.
+
+    Draft patterns override whatever the job would otherwise use.
+    """
+    default_title, default_folder = job_patterns(detail)
+    title_pattern = title_pattern or default_title
+    folder_pattern = folder_pattern or default_folder
+    invalid = sorted(set(compile_pattern(title_pattern).invalid) | set(compile_pattern(folder_pattern).invalid))
+    job = detail.get("job") or {}
+    return {
+        "success": not invalid,
+        "invalid_vars": invalid,
+        "job_title": render(title_pattern, job),
+        "job_folder": render(folder_pattern, job),
+        "tracks": [
+            {
+                "track_number": "" if track.get("track_number") is None else str(track["track_number"]),
+                "rendered_title": render(title_pattern, job, track),
+                "rendered_folder": render(folder_pattern, job, track),
+            }
+            for track in detail.get("tracks") or []
+        ],
+    }
@@ -0,0 +1,161 @@
+"""Shared per-job progress feed behind the job detail SSE stream.
+
+One upstream poller runs per job no matter how many browser tabs are
+subscribed. Each tick merges the ripper's progress-state with the
+transcoder's record for the same job, and the merged snapshot is fanned
+out to subscribers only when it differs from the previous one. The
+poller exits as soon as the last subscriber disconnects.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import AsyncIterator
+from typing import Any
+
+from backend.config import settings
+from backend.services import arm_client, transcoder_client
+
+log = logging.getLogger(__name__)
+
+# Matches the job detail page's old polling cadence, so switching to the
+# stream never costs arm-neu more than one tab used to.
+_POLL_INTERVAL = 2.0
+
+_subscribers: dict[int, set[asyncio.Queue[dict[str, Any]]]] = {}
+_pollers: dict[int, asyncio.Task[None]] = {}
+_latest: dict[int, dict[str, Any]] = {}
+
+
+def shape_rip_progress(state: dict[str, Any]) -> dict[str, Any]:
+    """Map the ripper's progress-state dict to the UI's progress shape."""
+    counts_raw = state.get("track_counts") or {}
+    # Ripper returns {total, ripped}; UI's progress shape uses tracks_total/tracks_ripped.
+    counts = {
+        "tracks_total": counts_raw.get("total", 0),
+        "tracks_ripped": counts_raw.get("ripped", 0),
+    }
+    if state.get("disctype") == "music":
+        progress_value = state.get("music_progress")
+        stage_value = state.get("music_stage")
+    else:
+        progress_value = state.get("rip_progress")
+        stage_value = state.get("rip_stage")
+    realtime_ripped = state.get("tracks_ripped_realtime")
+
+    # Merge DB counts with the real-time ripped count from PRGC/encoding
+    # messages. During ripping the realtime count leads; after
+    # completion the DB count is authoritative, so take the max.
+    db_ripped = counts["tracks_ripped"] or 0
+    realtime = realtime_ripped or 0
+    return {
+        "progress": progress_value,
+        "stage": stage_value,
+        "tracks_total": counts["tracks_total"],
+        "tracks_ripped": max(realtime, db_ripped),
+        "no_of_titles": state.get("no_of_titles"),
+        "copy_progress": state.get("copy_progress"),
+        "copy_stage": state.get("copy_stage"),
+    }
+
+
+async def _fetch_transcoder_progress(job_id: int) -> dict[str, Any] | None:
+    """Transcoder-side progress for an ARM job; None when disabled or offline."""
+    if not settings.transcoder_enabled:
+        return None
+    data = await transcoder_client.get_jobs(job_id=job_id, limit=1)
+    if data is None:
+        return None
+    jobs = data.get("jobs") or []
+    if not jobs:
+        return {"found": False}
+    job = jobs[0]
+    return {
+        "found": True,
+        "status": job.get("status"),
+        "phase": job.get("phase"),
+        "progress": job.get("progress"),
+        "current_fps": job.get("current_fps"),
+    }
+
+
+async def snapshot(job_id: int) -> dict[str, Any]:
+    """Fetch rip and transcode progress concurrently and merge them."""
+    state, transcoder = await asyncio.gather(
+        arm_client.get_job_progress_state(job_id),
+        _fetch_transcoder_progress(job_id),
+    )
+    rip: dict[str, Any] | None = None
+    error: str | None = None
+    if state is None:
+        error = "ARM service unreachable"
+    elif state.get("success") is False:
+        error = "Job not found"
+    else:
+        rip = shape_rip_progress(state)
+    return {"job_id": job_id, "rip": rip, "transcoder": transcoder, "error": error}
+
+
+def _publish(job_id: int, snap: dict[str, Any]) -> None:
+    for queue in _subscribers.get(job_id, ()):
+        # Latest wins: a slow consumer only ever needs the newest snapshot.
+        if queue.full():
+            queue.get_nowait()
+        queue.put_nowait(snap)
+
+
+async def _poll(job_id: int) -> None:
+    try:
+        while _subscribers.get(job_id):
+            try:
+                snap = await snapshot(job_id)
+            except Exception:  # keep the feed alive across a bad upstream payload
+                log.exception("Progress poll failed for job %d", job_id)
+            else:
+                if snap != _latest.get(job_id):
+                    _latest[job_id] = snap
+                    _publish(job_id, snap)
+            await asyncio.sleep(_POLL_INTERVAL)
+    finally:
+        if _pollers.get(job_id) is asyncio.current_task():
+            del _pollers[job_id]
+        if not _subscribers.get(job_id):
+            _latest.pop(job_id, None)
+
+
+async def subscribe(
+    job_id: int, heartbeat: float | None = None,
+) -> AsyncIterator[dict[str, Any] | None]:
+    """Yield merged progress snapshots for a job as they change.
+
+    The last known snapshot (if any) is delivered immediately. When
+    ``heartbeat`` is set, ``None`` is yielded after that many idle seconds
+    so the caller can keep the connection warm.
+    """
+    queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue(maxsize=1)
+    subs = _subscribers.setdefault(job_id, set())
+    subs.add(queue)
+    if job_id in _latest:
+        queue.put_nowait(_latest[job_id])
+    if job_id not in _pollers:
+        _pollers[job_id] = asyncio.create_task(_poll(job_id))
+    try:
+        while True:
+            try:
+                yield await asyncio.wait_for(queue.get(), heartbeat)
+            except TimeoutError:
+                yield None
+    finally:
+        subs.discard(queue)
+        if not subs:
+            _subscribers.pop(job_id, None)
+            _latest.pop(job_id, None)
+            task = _pollers.pop(job_id, None)
+            if task is not None:
+                task.cancel()
+
+
+def active_feeds() -> dict[int, int]:
+    """Subscriber count per job with a live poller (for diagnostics/tests)."""
+    return {job_id: len(subs) for job_id, subs in _subscribers.items()}
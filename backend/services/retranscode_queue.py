@@ -0,0 +1,215 @@
+"""BFF-side dispatch queue for bulk re-transcodes.
+
+Re-encoding a batch after a preset change used to mean one webhook per
+job, and firing them all at once just moves the pile-up into the
+transcoder's own queue. Batches queued here are fed to the transcoder
+only as it has room: each pass reads ``max_concurrent`` and
+``active_count`` from /workers and submits that many more webhooks,
+concurrently.
+
+A job we have submitted but the transcoder hasn't picked up yet isn't
+in ``active_count``, so it keeps holding a slot until a worker reports
+it (or its transcoder job has moved past pending), otherwise one pass
+would hand the whole batch over before the first webhook was processed.
+
+While the transcoder is unreachable the dispatcher backs off (up to
+``_MAX_BACKOFF`` between checks) and batch progress carries an error
+saying so; after ``_OFFLINE_TIMEOUT`` whatever is still queued is failed
+rather than left waiting indefinitely.
+
+Progress is kept per batch in memory for the UI to poll; the last few
+finished batches are retained so a page reload can still show them.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+import uuid
+from collections import deque
+from typing import Any
+
+from backend.services import arm_client, transcoder_client
+
+log = logging.getLogger(__name__)
+
+_POLL_INTERVAL = 5.0
+# A submitted job that hasn't been seen starting within this long stops
+# holding a slot (the webhook may have been ignored upstream).
+_START_GRACE = 120.0
+_MAX_FINISHED_BATCHES = 20
+_MAX_BACKOFF = 60.0
+_OFFLINE_TIMEOUT = 600.0
+_OFFLINE_ERROR = "Transcoder unreachable"
+_PENDING_STATUSES = frozenset({"pending", "queued"})
+
+# batch_id -> {"batch_id", "created_at", "jobs": {job_id: {"status", "error"}}}
+_batches: dict[str, dict[str, Any]] = {}
+_queue: deque[tuple[str, int]] = deque()
+# job_id -> monotonic time the webhook was accepted
+_awaiting_start: dict[int, float] = {}
+_task: asyncio.Task[None] | None = None
+# monotonic time the transcoder was first found unreachable, while it is
+_offline_since: float | None = None
+
+
+def _summary(batch: dict[str, Any]) -> dict[str, Any]:
+    jobs = batch["jobs"]
+    counts = {s: 0 for s in ("queued", "submitted", "failed", "cancelled")}
+    for entry in jobs.values():
+        counts[entry["status"]] += 1
+    return {
+        "batch_id": batch["batch_id"],
+        "created_at": batch["created_at"],
+        "total": len(jobs),
+        **counts,
+        "done": not counts["queued"],
+        "error": f"{_OFFLINE_ERROR}; retrying" if counts["queued"] and _offline_since is not None else None,
+        "jobs": [{"job_id": job_id, **entry} for job_id, entry in jobs.items()],
+    }
+
+
+def _prune() -> None:
+    finished = [b for b in _batches.values()
+                if all(e["status"] != "queued" for e in b["jobs"].values())]
+    for batch in finished[:max(0, len(finished) - _MAX_FINISHED_BATCHES)]:
+        del _batches[batch["batch_id"]]
+
+
+def enqueue(job_ids: list[int]) -> dict[str, Any]:
+    """Queue ARM jobs for re-transcoding and return the new batch's progress."""
+    _prune()
+    batch_id = uuid.uuid4().hex[:12]
+    jobs = {job_id: {"status": "queued", "error": None} for job_id in dict.fromkeys(job_ids)}
+    _batches[batch_id] = {"batch_id": batch_id, "created_at": time.time(), "jobs": jobs}
+    _queue.extend((batch_id, job_id) for job_id in jobs)
+    _start()
+    return _summary(_batches[batch_id])
+
+
+def progress(batch_id: str) -> dict[str, Any] | None:
+    batch = _batches.get(batch_id)
+    return _summary(batch) if batch is not None else None
+
+
+def cancel(batch_id: str) -> dict[str, Any] | None:
+    """Drop a batch's not-yet-submitted jobs. Submitted ones keep running."""
+    batch = _batches.get(batch_id)
+    if batch is None:
+        return None
+    for entry in batch["jobs"].values():
+        if entry["status"] == "queued":
+            entry["status"] = "cancelled"
+    remaining = [item for item in _queue if item[0] != batch_id]
+    _queue.clear()
+    _queue.extend(remaining)
+    return _summary(batch)
+
+
+async def _still_pending(job_id: int) -> bool:
+    job = await transcoder_client.get_job(job_id)
+    # Not created yet (webhook still being handled) counts as pending.
+    return job is None or str(job.get("status") or "").lower() in _PENDING_STATUSES
+
+
+async def _free_slots() -> int | None:
+    """Slots the transcoder can take right now, or None if it's offline."""
+    workers = await transcoder_client.get_workers()
+    if workers is None:
+        return None
+    running = {w.get("current_job_id") for w in workers.get("workers") or []}
+    now = time.monotonic()
+    for job_id, submitted_at in list(_awaiting_start.items()):
+        if job_id in running or now - submitted_at > _START_GRACE:
+            del _awaiting_start[job_id]
+    unstarted = list(_awaiting_start)
+    for job_id, pending in zip(unstarted, await asyncio.gather(*map(_still_pending, unstarted))):
+        if not pending:
+            _awaiting_start.pop(job_id, None)
+    capacity = max(1, int(workers.get("max_concurrent") or 0))
+    return max(0, capacity - int(workers.get("active_count") or 0) - len(_awaiting_start))
+
+
+async def _submit(batch_id: str, job_id: int) -> None:
+    entry = _batches[batch_id]["jobs"][job_id]
+    payload = await arm_client.get_job_retranscode_info(job_id)
+    if payload is None:
+        entry.update(status="failed", error="ARM service unreachable")
+        return
+    if isinstance(payload, dict) and payload.get("success") is False:
+        entry.update(status="failed", error="Job not found or not a video disc")
+        return
+    result = await transcoder_client.send_webhook(payload)
+    if not result.get("success"):
+        entry.update(status="failed", error=result.get("error", "Transcoder unavailable"))
+        return
+    entry["status"] = "submitted"
+    _awaiting_start[job_id] = time.monotonic()
+
+
+def _fail_queued(error: str) -> None:
+    for batch_id, job_id in _queue:
+        _batches[batch_id]["jobs"][job_id].update(status="failed", error=error)
+    _queue.clear()
+
+
+async def _run() -> None:
+    global _offline_since
+    delay = _POLL_INTERVAL
+    while _queue:
+        try:
+            free = await _free_slots()
+        except Exception:
+            log.exception("Re-transcode capacity check failed")
+            free = None
+        if free is None:
+            now = time.monotonic()
+            if _offline_since is None:
+                _offline_since = now
+            if now - _offline_since >= _OFFLINE_TIMEOUT:
+                log.warning("Transcoder unreachable for %.0fs; failing %d queued re-transcodes",
+                            now - _offline_since, len(_queue))
+                _fail_queued(_OFFLINE_ERROR)
+                break
+            delay = min(delay * 2, _MAX_BACKOFF)
+        else:
+            _offline_since = None
+            delay = _POLL_INTERVAL
+        picked = [_queue.popleft() for _ in range(min(free or 0, len(_queue)))]
+        outcomes = await asyncio.gather(*(_submit(b, j) for b, j in picked), return_exceptions=True)
+        for (batch_id, job_id), outcome in zip(picked, outcomes):
+            if isinstance(outcome, Exception):
+                log.error("Re-transcode of job %d failed: %s", job_id, outcome)
+                _batches[batch_id]["jobs"][job_id].update(status="failed", error=str(outcome))
+        if _queue:
+            await asyncio.sleep(delay)
+    _offline_since = None
+
+
+def _start() -> None:
+    global _task
+    if _task is None or _task.done():
+        _task = asyncio.create_task(_run())
+
+
+async def stop() -> None:
+    global _task
+    if _task is not None:
+        _task.cancel()
+        try:
+            await _task
+        except asyncio.CancelledError:
+            pass
+        _task = None
+
+
+def clear() -> None:
+    global _task, _offline_since
+    _offline_since = None
+    if _task is not None:
+        _task.cancel()
+        _task = None
+    _batches.clear()
+    _queue.clear()
+    _awaiting_start.clear()
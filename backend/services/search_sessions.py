@@ -0,0 +1,90 @@
+"""Supersede-and-cancel tracking for typeahead metadata searches.
+
+The identify panels fire a search per (debounced) keystroke. Without
+tracking, every superseded query still runs to completion against ARM
+and the external provider behind it. Each client tab sends a session id;
+a new search for the same (session, kind) cancels the one still
+outstanding, and a search whose client disconnects is cancelled too.
+Cancelling the wrapping task aborts the in-flight httpx request.
+
+An optional debounce delays the upstream call so a burst of keystrokes
+only reaches ARM once: the superseded searches are cancelled while still
+sleeping.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+class SearchSuperseded(Exception):
+    """A newer search from the same session replaced this one, or its client left."""
+
+
+_active: dict[tuple[str, str], asyncio.Future[Any]] = {}
+
+
+async def _debounced(fetch: Callable[[], Awaitable[T]], delay: float) -> T:
+    if delay > 0:
+        await asyncio.sleep(delay)
+    return await fetch()
+
+
+async def run(
+    fetch: Callable[[], Awaitable[T]],
+    *,
+    kind: str,
+    session: str | None = None,
+    debounce: float = 0.0,
+    disconnected: Callable[[], Awaitable[Any]] | None = None,
+) -> T:
+    """Run one search, superseding the session's previous search of ``kind``.
+
+    ``disconnected`` resolves when the client goes away. Without a
+    ``session`` there is nothing to supersede, but disconnects still
+    cancel. Raises SearchSuperseded if the search was cancelled for
+    either reason; upstream errors propagate unchanged.
+    """
+    key = (session, kind) if session else None
+    if key is not None:
+        previous = _active.get(key)
+        if previous is not None:
+            previous.cancel()
+
+    task = asyncio.ensure_future(_debounced(fetch, debounce))
+    if key is not None:
+        _active[key] = task
+    watcher = asyncio.ensure_future(disconnected()) if disconnected else None
+    try:
+        if watcher is not None:
+            await asyncio.wait({task, watcher}, return_when=asyncio.FIRST_COMPLETED)
+            if not task.done():
+                task.cancel()
+        try:
+            return await task
+        except asyncio.CancelledError:
+            current = asyncio.current_task()
+            if current is not None and current.cancelling():
+                raise
+            raise SearchSuperseded from None
+    finally:
+        if watcher is not None:
+            watcher.cancel()
+        if not task.done():
+            task.cancel()
+        if key is not None and _active.get(key) is task:
+            del _active[key]
+
+
+def active_count() -> int:
+    return len(_active)
+
+
+def clear() -> None:
+    for task in _active.values():
+        task.cancel()
+    _active.clear()
@@ -0,0 +1,285 @@
+"""Rolling history of ARM and transcoder system stats.
+
+The dashboard showed CPU, memory, storage and GPU as of its last poll,
+with nothing to chart. A background sampler reads both services' stats
+every ``settings.system_history_interval`` seconds (the dashboard's own
+fetches are recorded too), and each reading is folded into three
+resolutions per metric: 1-second slots for the last hour, 1-minute
+slots for the last day and 1-hour slots for the last 30 days. History
+queries are answered from these buffers and never reach upstream.
+
+Each resolution is a fixed-size ring of parallel ``array`` columns
+(slot number, sum, count) indexed by ``slot % capacity``: recording a
+sample is a few array writes per resolution, a slot still holding an
+older slot number is simply overwritten, and memory never grows. A
+slot's value is the mean of the samples that landed in it.
+
+With ``settings.system_history_path`` set, the buffers are written to
+that file every ``_SAVE_INTERVAL`` seconds and on shutdown, and loaded
+back at startup, so a restart doesn't blank the charts.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import math
+import os
+import sys
+import time
+from array import array
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from backend.config import settings
+from backend.services import arm_client, transcoder_client
+
+log = logging.getLogger(__name__)
+
+# (seconds per slot, slots kept), finest first.
+_TIERS: tuple[tuple[int, int], ...] = ((1, 3600), (60, 1440), (3600, 720))
+MAX_RANGE = _TIERS[-1][0] * _TIERS[-1][1]
+_SAVE_INTERVAL = 300.0
+_FORMAT_VERSION = 1
+# slot ('q'), sum ('d') and count ('q') columns, 8 bytes each.
+_SLOT_BYTES = 24
+
+
+def _number(value: Any) -> float | None:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    return float(value) if math.isfinite(value) else None
+
+
+def _storage_percent(stats: dict[str, Any]) -> float | None:
+    # The fullest path: the one that stops a rip.
+    values = [_number(path.get("percent")) for path in stats.get("storage") or [] if isinstance(path, dict)]
+    return max((v for v in values if v is not None), default=None)
+
+
+_FIELDS: dict[str, Callable[[dict[str, Any]], Any]] = {
+    "cpu_percent": lambda s: s.get("cpu_percent"),
+    "cpu_temp": lambda s: s.get("cpu_temp"),
+    "memory_percent": lambda s: (s.get("memory") or {}).get("percent"),
+    "storage_percent": _storage_percent,
+    "gpu_percent": lambda s: (s.get("gpu") or {}).get("utilization_percent"),
+    "gpu_temp": lambda s: (s.get("gpu") or {}).get("temperature_c"),
+}
+SERVICES = ("arm", "transcoder")
+METRICS = tuple(f"{service}.{field}" for service in SERVICES for field in _FIELDS)
+
+
+class _Ring:
+    """One resolution of one metric."""
+
+    __slots__ = ("step", "capacity", "slots", "sums", "counts")
+
+    def __init__(self, step: int, capacity: int):
+        self.step = step
+        self.capacity = capacity
+        self.slots = array("q", [-1]) * capacity
+        self.sums = array("d", [0.0]) * capacity
+        self.counts = array("q", [0]) * capacity
+
+    def add(self, slot: int, value: float) -> None:
+        i = slot % self.capacity
+        held = self.slots[i]
+        if held > slot:
+            return  # a late sample for a slot that's already been reused
+        if held != slot:
+            self.slots[i] = slot
+            self.sums[i] = 0.0
+            self.counts[i] = 0
+        self.sums[i] += value
+        self.counts[i] += 1
+
+    def points(self, first: int, last: int) -> tuple[list[int], list[float]]:
+        """(slot start times, means) of the filled slots in [first, last]."""
+        timestamps: list[int] = []
+        values: list[float] = []
+        for slot in range(max(first, last - self.capacity + 1), last + 1):
+            i = slot % self.capacity
+            if self.slots[i] == slot and self.counts[i]:
+                timestamps.append(slot * self.step)
+                values.append(round(self.sums[i] / self.counts[i], 2))
+        return timestamps, values
+
+
+_series: dict[str, list[_Ring]] = {}
+_task: asyncio.Task[None] | None = None
+
+
+def _rings() -> list[_Ring]:
+    return [_Ring(step, capacity) for step, capacity in _TIERS]
+
+
+def record(service: str, stats: dict[str, Any] | None, now: float | None = None) -> None:
+    """Fold one ``get_system_stats()`` reading for ``service`` into the history."""
+    if not isinstance(stats, dict):
+        return
+    t = time.time() if now is None else now
+    for field, extract in _FIELDS.items():
+        value = _number(extract(stats))
+        if value is None:
+            continue
+        name = f"{service}.{field}"
+        rings = _series.get(name)
+        if rings is None:
+            rings = _series[name] = _rings()
+        for ring in rings:
+            ring.add(int(t // ring.step), value)
+
+
+def parse_range(text: str) -> int:
+    """Seconds in a range like ``90s``, ``15m``, ``6h`` or ``7d``."""
+    units = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+    number, unit = text[:-1], text[-1:].lower()
+    if unit not in units or not number.isdigit() or int(number) == 0:
+        raise ValueError(f"Invalid range {text!r}; use e.g. 15m, 6h or 7d")
+    seconds = int(number) * units[unit]
+    if seconds > MAX_RANGE:
+        raise ValueError(f"Range {text!r} exceeds the {MAX_RANGE // 86400}d of history kept")
+    return seconds
+
+
+def history(metric: str, range_seconds: int, now: float | None = None) -> dict[str, Any]:
+    """A metric's values over the last ``range_seconds``, at the finest
+    resolution that covers the whole range.
+
+    Slots with no samples are left out, so gaps in ``timestamps`` are
+    periods when the service was unreachable or not sampled.
+    """
+    if metric not in METRICS:
+        raise ValueError(f"Unknown metric {metric!r}")
+    tier = next(i for i, (step, capacity) in enumerate(_TIERS) if step * capacity >= range_seconds)
+    step = _TIERS[tier][0]
+    t = time.time() if now is None else now
+    last = int(t // step)
+    first = int((t - range_seconds) // step) + 1
+    rings = _series.get(metric)
+    timestamps, values = rings[tier].points(first, last) if rings else ([], [])
+    return {"metric": metric, "step": step, "start": first * step, "end": int(t),
+            "timestamps": timestamps, "values": values}
+
+
+# --- Persistence ---
+
+
+def _dump() -> bytes:
+    names = sorted(_series)
+    header = {"version": _FORMAT_VERSION, "byteorder": sys.byteorder,
+              "tiers": [list(tier) for tier in _TIERS], "metrics": names}
+    parts = [json.dumps(header).encode(), b"\n"]
+    for name in names:
+        for ring in _series[name]:
+            parts += [ring.slots.tobytes(), ring.sums.tobytes(), ring.counts.tobytes()]
+    return b"".join(parts)
+
+
+def _restore(data: bytes) -> None:
+    head, sep, body = data.partition(b"\n")
+    header = json.loads(head)
+    if (not sep or header.get("version") != _FORMAT_VERSION or header.get("byteorder") != sys.byteorder
+            or [tuple(tier) for tier in header.get("tiers", [])] != list(_TIERS)):
+        raise ValueError("incompatible history file")
+    names = header.get("metrics") or []
+    per_metric = sum(capacity for _, capacity in _TIERS) * _SLOT_BYTES
+    if len(body) != len(names) * per_metric:
+        raise ValueError("truncated history file")
+    series: dict[str, list[_Ring]] = {}
+    pos = 0
+    for name in names:
+        rings = _rings()
+        for ring in rings:
+            for column in (ring.slots, ring.sums, ring.counts):
+                size = ring.capacity * 8
+                column[:] = array(column.typecode, body[pos:pos + size])
+                pos += size
+        if name in METRICS:
+            series[name] = rings
+    _series.clear()
+    _series.update(series)
+
+
+def load() -> None:
+    """Reload saved history, if persistence is configured."""
+    if not settings.system_history_path:
+        return
+    try:
+        _restore(Path(settings.system_history_path).read_bytes())
+    except FileNotFoundError:
+        return
+    except (OSError, ValueError) as exc:
+        log.warning("Ignoring saved system history %s: %s", settings.system_history_path, exc)
+
+
+def _write(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Write-then-rename so a crash mid-write never leaves a torn file.
+    tmp = path.with_suffix(".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+async def save() -> None:
+    """Write the history out, if persistence is configured."""
+    if not settings.system_history_path:
+        return
+    # Snapshot on the loop so the sampler can't change it mid-write.
+    data = _dump()
+    try:
+        await asyncio.to_thread(_write, Path(settings.system_history_path), data)
+    except OSError as exc:
+        log.warning("System history save failed: %s", exc)
+
+
+# --- Sampler ---
+
+
+async def sample() -> None:
+    """Read both services' stats once and record them."""
+    fetches = [arm_client.get_system_stats()]
+    if settings.transcoder_enabled:
+        fetches.append(transcoder_client.get_system_stats())
+    for service, stats in zip(SERVICES, await asyncio.gather(*fetches)):
+        record(service, stats)
+
+
+async def _run() -> None:
+    saved_at = time.monotonic()
+    while True:
+        started = time.monotonic()
+        try:
+            await sample()
+        except Exception:
+            log.exception("System stats sample failed")
+        if started - saved_at >= _SAVE_INTERVAL:
+            await save()
+            saved_at = started
+        await asyncio.sleep(max(0.0, settings.system_history_interval - (time.monotonic() - started)))
+
+
+def start() -> None:
+    """Load saved history and start the sampler (idempotent)."""
+    global _task
+    if _task is None or _task.done():
+        load()
+        _task = asyncio.create_task(_run())
+
+
+async def stop() -> None:
+    global _task
+    if _task is not None:
+        _task.cancel()
+        try:
+            await _task
+        except asyncio.CancelledError:
+            pass
+        _task = None
+        await save()
+
+
+def clear() -> None:
+    _series.clear()
@@ -50,6 +50,7 @@ log = logging.getLogger(__name__)
 
 _CONFIG_ENDPOINT = "/config"
 _client: httpx.AsyncClient | None = None
+_webhook_client: httpx.AsyncClient | None = None
 
 
 def get_client() -> httpx.AsyncClient:
@@ -82,11 +83,32 @@ def get_client() -> httpx.AsyncClient:
     return _client
 
 
+def _get_webhook_client() -> httpx.AsyncClient:
+    """Pooled client for /webhook/arm.
+
+    Kept apart from ``get_client()`` because webhook calls authenticate
+    with X-Webhook-Secret (passed per request) rather than the shared
+    X-API-Key. Bulk re-transcodes dispatch several webhooks at once, so
+    the pool allows that many connections.
+    """
+    global _webhook_client
+    if _webhook_client is None or _webhook_client.is_closed:
+        _webhook_client = httpx.AsyncClient(
+            base_url=settings.transcoder_url,
+            timeout=httpx.Timeout(10.0, connect=3.0),
+            limits=httpx.Limits(max_connections=16, keepalive_expiry=30.0),
+        )
+    return _webhook_client
+
+
 async def close_client() -> None:
-    global _client
+    global _client, _webhook_client
     if _client and not _client.is_closed:
         await _client.aclose()
         _client = None
+    if _webhook_client and not _webhook_client.is_closed:
+        await _webhook_client.aclose()
+        _webhook_client = None
 
 
 async def health() -> dict[str, Any] | None:
@@ -165,16 +187,11 @@ async def test_webhook(webhook_secret: str) -> dict[str, Any]:
     headers = {"X-Webhook-Secret": webhook_secret}
 
     try:
-        # Use a fresh client without the shared X-API-Key header
-        async with httpx.AsyncClient(
-            base_url=settings.transcoder_url,
-            timeout=httpx.Timeout(10.0, connect=3.0),
-        ) as client:
-            resp = await client.post(
-                "/webhook/arm",
-                json={"title": "ARM UI connection test", "body": "test", "type": "info"},
-                headers=headers,
-            )
+        resp = await _get_webhook_client().post(
+            "/webhook/arm",
+            json={"title": "ARM UI connection test", "body": "test", "type": "info"},
+            headers=headers,
+        )
         result["reachable"] = True
         if resp.status_code in (401, 403):
             result["secret_ok"] = False
@@ -207,11 +224,7 @@ async def send_webhook(payload: dict) -> dict[str, Any]:
         headers["X-Webhook-Secret"] = webhook_secret
 
     try:
-        async with httpx.AsyncClient(
-            base_url=settings.transcoder_url,
-            timeout=httpx.Timeout(10.0, connect=3.0),
-        ) as client:
-            resp = await client.post("/webhook/arm", json=payload, headers=headers)
+        resp = await _get_webhook_client().post("/webhook/arm", json=payload, headers=headers)
         if resp.status_code in (401, 403):
             return {"success": False, "error": "Webhook secret rejected"}
         resp.raise_for_status()
@@ -452,6 +465,22 @@ async def read_log(
         return None
 
 
+async def stream_log(filename: str) -> httpx.Response | None:
+    """Open the full read of a transcoder log as a streamed response.
+
+    The transcoder has no raw download, so this is the same JSON body as
+    ``read_log(mode="full")``, left unread for the caller to consume
+    incrementally and close. Returns None if offline.
+    """
+    try:
+        client = get_client()
+        req = client.build_request("GET", f"/logs/{filename}", params={"mode": "full"})
+        return await client.send(req, stream=True)
+    except (httpx.HTTPError, RuntimeError, OSError) as exc:
+        log.debug("Transcoder unreachable for log read (%s): %s", filename, exc)
+        return None
+
+
 async def read_structured_log(
     filename: str,
     mode: str = "tail",
@@ -7,7 +7,7 @@ function jsonResponse(data: unknown, ok = true) {
 	return { ok, status: ok ? 200 : 500, statusText: ok ? 'OK' : 'Error', json: () => Promise.resolve(data) };
 }
 
-import { toggleMultiTitle, updateTrackTitle, clearTrackTitle, tvdbMatch, fetchTvdbEpisodes, updateTrack, fetchNamingPreview, updateJobNaming, validatePattern, fetchNamingVariables } from '../api/jobs';
+import { toggleMultiTitle, updateTrackTitle, clearTrackTitle, tvdbMatch, fetchTvdbEpisodes, updateTrack, updateTracks, fetchNamingPreview, previewJobNaming, updateJobNaming, validatePattern, fetchNamingVariables } from '../api/jobs';
 
 beforeEach(() => mockFetch.mockReset());
 
@@ -81,6 +81,34 @@ describe('updateTrack', () => {
 	});
 });
 
+describe('updateTracks', () => {
+	it('POSTs all updates to /api/jobs/:jobId/tracks/batch', async () => {
+		mockFetch.mockResolvedValue(jsonResponse({ updated: 2, failed: 0, results: [] }));
+		const updates = [
+			{ track_id: 1, fields: { enabled: true } },
+			{ track_id: 2, fields: { enabled: true } }
+		];
+		const result = await updateTracks(3, updates);
+		expect(mockFetch).toHaveBeenCalledWith('/api/jobs/3/tracks/batch', expect.objectContaining({
+			method: 'POST',
+			body: JSON.stringify({ updates })
+		}));
+		expect(result.updated).toBe(2);
+	});
+
+	it('throws when any track failed', async () => {
+		mockFetch.mockResolvedValue(jsonResponse({
+			updated: 1,
+			failed: 1,
+			results: [
+				{ track_id: 1, success: true, error: null },
+				{ track_id: 2, success: false, error: 'Track not found' }
+			]
+		}));
+		await expect(updateTracks(3, [{ track_id: 1 }, { track_id: 2 }])).rejects.toThrow('Track not found');
+	});
+});
+
 describe('fetchNamingPreview', () => {
 	it('GETs /api/jobs/:id/naming-preview', async () => {
 		const preview = {
@@ -103,6 +131,18 @@ describe('fetchNamingPreview', () => {
 	});
 });
 
+describe('previewJobNaming', () => {
+	it('POSTs draft patterns to /api/jobs/:id/naming-preview', async () => {
+		mockFetch.mockResolvedValue(jsonResponse({ success: true, job_title: 'Alien (1979)', job_folder: 'Alien', tracks: [] }));
+		const result = await previewJobNaming(7, { title_pattern: '{title} ({year})', folder_pattern: null });
+		expect(mockFetch).toHaveBeenCalledWith('/api/jobs/7/naming-preview', expect.objectContaining({
+			method: 'POST',
+			body: JSON.stringify({ title_pattern: '{title} ({year})', folder_pattern: null })
+		}));
+		expect(result.job_title).toBe('Alien (1979)');
+	});
+});
+
 describe('updateJobNaming', () => {
 	it('PATCHes /api/jobs/:id/naming with pattern overrides', async () => {
 		mockFetch.mockResolvedValue(jsonResponse({ success: true, title_pattern_override: '{title} - E{episode}', folder_pattern_override: null }));
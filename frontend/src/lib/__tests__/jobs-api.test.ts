@@ -10,7 +10,8 @@ import {
 	pauseWaitingJob, deleteJob, fixJobPermissions, searchMetadata,
 	fetchMediaDetail, searchMusicMetadata, fetchMusicDetail, setJobTracks,
 	updateJobTitle, updateJobConfig, fetchCrcLookup, submitToCrcDb,
-	fetchJobProgress, updateJobTranscodeConfig, retranscodeJob
+	fetchJobProgress, updateJobTranscodeConfig, retranscodeJob,
+	bulkRetranscodeJobs, fetchRetranscodeBatch, cancelRetranscodeBatch
 } from '../api/jobs';
 
 const mockApiFetch = vi.mocked(apiFetch);
@@ -211,3 +212,22 @@ describe('mutation endpoints with bodies', () => {
 		});
 	});
 });
+
+describe('bulk re-transcode', () => {
+	it('bulkRetranscodeJobs POSTs the selection', async () => {
+		await bulkRetranscodeJobs({ job_ids: [1, 2] });
+		expect(mockApiFetch).toHaveBeenCalledWith('/api/jobs/bulk-retranscode', {
+			method: 'POST', body: JSON.stringify({ job_ids: [1, 2] })
+		});
+	});
+
+	it('fetchRetranscodeBatch GETs progress', async () => {
+		await fetchRetranscodeBatch('abc123');
+		expect(mockApiFetch).toHaveBeenCalledWith('/api/jobs/bulk-retranscode/abc123');
+	});
+
+	it('cancelRetranscodeBatch DELETEs', async () => {
+		await cancelRetranscodeBatch('abc123');
+		expect(mockApiFetch).toHaveBeenCalledWith('/api/jobs/bulk-retranscode/abc123', { method: 'DELETE' });
+	});
+});
@@ -6,8 +6,10 @@ vi.mock('$lib/api/client', () => ({
 
 import { apiFetch } from '$lib/api/client';
 import {
-	fetchLogs, fetchLogContent, fetchStructuredLogContent,
-	fetchTranscoderLogs, fetchTranscoderLogContent, fetchStructuredTranscoderLogContent
+	fetchLogs, fetchLogCatalog, fetchLogContent, fetchStructuredLogContent,
+	fetchTranscoderLogs, fetchTranscoderLogContent, fetchStructuredTranscoderLogContent,
+	logFollowUrl, transcoderLogFollowUrl, fetchLogWindow, fetchTranscoderLogWindow,
+	logArchiveUrl, supportBundleUrl
 } from '../api/logs';
 
 const mockApiFetch = vi.mocked(apiFetch);
@@ -23,6 +25,18 @@ describe('fetchLogs', () => {
 	});
 });
 
+describe('fetchLogCatalog', () => {
+	it('calls /api/logs/catalog without params by default', async () => {
+		await fetchLogCatalog();
+		expect(mockApiFetch).toHaveBeenCalledWith('/api/logs/catalog');
+	});
+
+	it('passes service, filter and paging', async () => {
+		await fetchLogCatalog({ service: 'transcoder', q: 'job 1', offset: 50, limit: 50 });
+		expect(mockApiFetch).toHaveBeenCalledWith('/api/logs/catalog?service=transcoder&q=job+1&offset=50&limit=50');
+	});
+});
+
 describe('fetchLogContent', () => {
 	it('encodes filename with spaces', async () => {
 		await fetchLogContent('my log.txt');
@@ -39,6 +53,11 @@ describe('fetchLogContent', () => {
 		await fetchLogContent('test.log', 'full', 500);
 		expect(mockApiFetch).toHaveBeenCalledWith('/api/logs/test.log?mode=full&lines=500');
 	});
+
+	it('passes a cursor through when given', async () => {
+		await fetchLogContent('test.log', 'tail', 100, 'a1.ff');
+		expect(mockApiFetch).toHaveBeenCalledWith('/api/logs/test.log?mode=tail&lines=100&cursor=a1.ff');
+	});
 });
 
 describe('fetchStructuredLogContent', () => {
@@ -113,3 +132,39 @@ describe('fetchStructuredTranscoderLogContent', () => {
 		expect(url).not.toContain('search=');
 	});
 });
+
+describe('log follow URLs', () => {
+	it('builds the ARM follow stream URL', () => {
+		expect(logFollowUrl('my log.txt', 50)).toBe('/api/logs/my%20log.txt/follow?structured=true&lines=50');
+	});
+
+	it('builds the transcoder follow stream URL', () => {
+		expect(transcoderLogFollowUrl('tc.log')).toBe('/api/transcoder/logs/tc.log/follow?structured=true&lines=200');
+	});
+});
+
+describe('log windows', () => {
+	it('requests an ARM log window', async () => {
+		await fetchLogWindow('rip log.txt', 1500, 500);
+		expect(mockApiFetch).toHaveBeenCalledWith('/api/logs/rip%20log.txt/window?offset=1500&limit=500');
+	});
+
+	it('requests a transcoder log window with the default size', async () => {
+		await fetchTranscoderLogWindow('tc.log', 0);
+		expect(mockApiFetch).toHaveBeenCalledWith('/api/transcoder/logs/tc.log/window?offset=0&limit=500');
+	});
+});
+
+describe('logArchiveUrl', () => {
+	it('repeats a parameter per selected log', () => {
+		expect(logArchiveUrl({ arm: ['job 1.log', 'job_2.log'], transcoder: ['tc.log'] })).toBe(
+			'/api/logs/archive?arm=job+1.log&arm=job_2.log&transcoder=tc.log'
+		);
+	});
+});
+
+describe('supportBundleUrl', () => {
+	it('points at the job support bundle', () => {
+		expect(supportBundleUrl(42)).toBe('/api/jobs/42/support-bundle.zip');
+	});
+});
@@ -72,11 +72,20 @@ export function forceComplete(jobId: number): Promise<{ success: boolean; messag
 	);
 }
 
+// Per-tab id so the BFF can cancel a search superseded by a newer one.
+// Not crypto.randomUUID(): that is missing outside secure contexts (plain
+// http on a LAN address).
+const searchSession = Math.random().toString(36).slice(2);
+const searchInit: RequestInit = { headers: { 'X-Search-Session': searchSession } };
+
+/** Error message for a search the BFF cancelled because a newer one replaced it. */
+export const SEARCH_SUPERSEDED = 'Search superseded';
+
 export function searchMetadata(query: string, year?: string, page = 1): Promise<SearchResult[]> {
 	const params = new URLSearchParams({ q: query });
 	if (year) params.set('year', year);
 	if (page > 1) params.set('page', String(page));
-	return apiFetch<SearchResult[]>(`/api/metadata/search?${params}`);
+	return apiFetch<SearchResult[]>(`/api/metadata/search?${params}`, searchInit);
 }
 
 export function fetchMediaDetail(imdbId: string): Promise<MediaDetail> {
@@ -101,7 +110,7 @@ export function searchMusicMetadata(
 	if (filters?.status) params.set('status', filters.status);
 	if (filters?.tracks) params.set('tracks', String(filters.tracks));
 	if (offset > 0) params.set('offset', String(offset));
-	return apiFetch<MusicSearchResponse>(`/api/metadata/music/search?${params}`);
+	return apiFetch<MusicSearchResponse>(`/api/metadata/music/search?${params}`, searchInit);
 }
 
 export function fetchMusicDetail(releaseId: string): Promise<MusicDetail> {
@@ -299,6 +308,35 @@ export function updateTrack(
 	});
 }
 
+export interface TrackBatchUpdate {
+	track_id: number;
+	fields?: TrackFieldUpdate;
+	title?: Partial<TrackTitleUpdate>;
+	clear_title?: boolean;
+}
+
+export interface TrackBatchResponse {
+	updated: number;
+	failed: number;
+	results: { track_id: number; success: boolean; error: string | null }[];
+}
+
+/** Apply edits to many tracks in one request. Throws if any track failed. */
+export async function updateTracks(
+	jobId: number,
+	updates: TrackBatchUpdate[]
+): Promise<TrackBatchResponse> {
+	const result = await apiFetch<TrackBatchResponse>(`/api/jobs/${jobId}/tracks/batch`, {
+		method: 'POST',
+		body: JSON.stringify({ updates })
+	});
+	if (result.failed) {
+		const first = result.results.find((r) => !r.success);
+		throw new Error(`${result.failed} track update(s) failed${first?.error ? `: ${first.error}` : ''}`);
+	}
+	return result;
+}
+
 export function namingPreview(
 	pattern: string,
 	variables: Record<string, string>
@@ -328,6 +366,17 @@ export function fetchNamingPreview(jobId: number): Promise<NamingPreviewResponse
 	});
 }
 
+/** Render draft patterns against a job locally in the BFF (no ARM round trip). */
+export function previewJobNaming(
+	jobId: number,
+	patterns: { title_pattern?: string | null; folder_pattern?: string | null }
+): Promise<NamingPreviewResponse> {
+	return apiFetch<NamingPreviewResponse>(`/api/jobs/${jobId}/naming-preview`, {
+		method: 'POST',
+		body: JSON.stringify(patterns)
+	});
+}
+
 export interface NamingOverrideUpdate {
 	title_pattern_override?: string | null;
 	folder_pattern_override?: string | null;
@@ -398,3 +447,28 @@ export function bulkDeleteJobs(params: { job_ids?: number[]; status?: string }):
 export function bulkPurgeJobs(params: { job_ids?: number[]; status?: string }): Promise<{ purged: number; errors: string[] }> {
 	return apiFetch('/api/jobs/bulk-purge', { method: 'POST', body: JSON.stringify(params) });
 }
+
+export interface RetranscodeBatch {
+	batch_id: string;
+	created_at: number;
+	total: number;
+	queued: number;
+	submitted: number;
+	failed: number;
+	cancelled: number;
+	done: boolean;
+	error: string | null;
+	jobs: { job_id: number; status: 'queued' | 'submitted' | 'failed' | 'cancelled'; error: string | null }[];
+}
+
+export function bulkRetranscodeJobs(params: { job_ids?: number[]; status?: string }): Promise<RetranscodeBatch> {
+	return apiFetch('/api/jobs/bulk-retranscode', { method: 'POST', body: JSON.stringify(params) });
+}
+
+export function fetchRetranscodeBatch(batchId: string): Promise<RetranscodeBatch> {
+	return apiFetch(`/api/jobs/bulk-retranscode/${encodeURIComponent(batchId)}`);
+}
+
+export function cancelRetranscodeBatch(batchId: string): Promise<RetranscodeBatch> {
+	return apiFetch(`/api/jobs/bulk-retranscode/${encodeURIComponent(batchId)}`, { method: 'DELETE' });
+}
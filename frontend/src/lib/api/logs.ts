@@ -1,16 +1,34 @@
-import type { LogContentResponse as LogContent, LogFileSchema as LogFile, StructuredLogResponse as StructuredLogContent } from '$lib/types/api.gen';
+import type { LogCatalogResponse as LogCatalog, LogContentResponse as LogContent, LogEntrySchema as LogEntry, LogFileSchema as LogFile, LogWindowResponse as LogWindow, StructuredLogResponse as StructuredLogContent } from '$lib/types/api.gen';
 import { apiFetch } from './client';
 
 export function fetchLogs(): Promise<LogFile[]> {
 	return apiFetch<LogFile[]>('/api/logs');
 }
 
+export function fetchLogCatalog(params: {
+	service?: 'arm' | 'transcoder';
+	q?: string;
+	offset?: number;
+	limit?: number;
+} = {}): Promise<LogCatalog> {
+	const query = new URLSearchParams();
+	if (params.service) query.set('service', params.service);
+	if (params.q) query.set('q', params.q);
+	if (params.offset) query.set('offset', String(params.offset));
+	if (params.limit) query.set('limit', String(params.limit));
+	const qs = query.toString();
+	return apiFetch<LogCatalog>(`/api/logs/catalog${qs ? `?${qs}` : ''}`);
+}
+
+/** Pass `cursor` ('' on the first read) to get only lines written since then. */
 export function fetchLogContent(
 	filename: string,
 	mode: 'tail' | 'full' = 'tail',
-	lines: number = 100
+	lines: number = 100,
+	cursor?: string
 ): Promise<LogContent> {
-	return apiFetch<LogContent>(`/api/logs/${encodeURIComponent(filename)}?mode=${mode}&lines=${lines}`);
+	const since = cursor === undefined ? '' : `&cursor=${encodeURIComponent(cursor)}`;
+	return apiFetch<LogContent>(`/api/logs/${encodeURIComponent(filename)}?mode=${mode}&lines=${lines}${since}`);
 }
 
 export function fetchStructuredLogContent(
@@ -28,6 +46,11 @@ export function fetchStructuredLogContent(
 	);
 }
 
+/** Lines `offset`..`offset + limit` (0-based) of a log, plus its total line count. */
+export function fetchLogWindow(filename: string, offset: number, limit: number = 500): Promise<LogWindow> {
+	return apiFetch<LogWindow>(`/api/logs/${encodeURIComponent(filename)}/window?offset=${offset}&limit=${limit}`);
+}
+
 export function fetchTranscoderLogs(): Promise<LogFile[]> {
 	return apiFetch<LogFile[]>('/api/transcoder/logs');
 }
@@ -35,10 +58,22 @@ export function fetchTranscoderLogs(): Promise<LogFile[]> {
 export function fetchTranscoderLogContent(
 	filename: string,
 	mode: 'tail' | 'full' = 'tail',
-	lines: number = 100
+	lines: number = 100,
+	cursor?: string
 ): Promise<LogContent> {
+	const since = cursor === undefined ? '' : `&cursor=${encodeURIComponent(cursor)}`;
 	return apiFetch<LogContent>(
-		`/api/transcoder/logs/${encodeURIComponent(filename)}?mode=${mode}&lines=${lines}`
+		`/api/transcoder/logs/${encodeURIComponent(filename)}?mode=${mode}&lines=${lines}${since}`
+	);
+}
+
+export function fetchTranscoderLogWindow(
+	filename: string,
+	offset: number,
+	limit: number = 500
+): Promise<LogWindow> {
+	return apiFetch<LogWindow>(
+		`/api/transcoder/logs/${encodeURIComponent(filename)}/window?offset=${offset}&limit=${limit}`
 	);
 }
 
@@ -57,14 +92,66 @@ export function fetchStructuredTranscoderLogContent(
 	);
 }
 
+export type LogSearchEvent =
+	| ({ type: 'match'; service: 'arm' | 'transcoder'; filename: string } & LogEntry)
+	| { type: 'error'; service: 'arm' | 'transcoder'; filename: string }
+	| { type: 'done'; files: number; matched: number; limit_reached: boolean; unavailable: string[] };
+
+/**
+ * Search every ARM and transcoder log. Results stream in as NDJSON and are
+ * handed to `onEvent` as each log finishes; abort `signal` to stop early.
+ */
+export async function searchLogs(
+	params: { q: string; level?: string; since?: string; limit?: number },
+	onEvent: (event: LogSearchEvent) => void,
+	signal?: AbortSignal
+): Promise<void> {
+	const query = new URLSearchParams({ q: params.q });
+	if (params.level) query.set('level', params.level);
+	if (params.since) query.set('since', params.since);
+	if (params.limit) query.set('limit', String(params.limit));
+	const res = await fetch(`/api/logs/search?${query}`, { signal });
+	if (!res.ok || !res.body) throw new Error(`API ${res.status}: ${res.statusText}`);
+	const reader = res.body.pipeThrough(new TextDecoderStream()).getReader();
+	let buffered = '';
+	for (;;) {
+		const { value, done } = await reader.read();
+		if (done) break;
+		buffered += value;
+		const lines = buffered.split('\n');
+		buffered = lines.pop() ?? '';
+		for (const line of lines) if (line) onEvent(JSON.parse(line));
+	}
+	if (buffered) onEvent(JSON.parse(buffered));
+}
+
 export function deleteLog(filename: string): Promise<{ success: boolean; filename: string }> {
 	return apiFetch(`/api/logs/${encodeURIComponent(filename)}`, { method: 'DELETE' });
 }
 
+export function logFollowUrl(filename: string, lines: number = 200): string {
+	return `/api/logs/${encodeURIComponent(filename)}/follow?structured=true&lines=${lines}`;
+}
+
+export function transcoderLogFollowUrl(filename: string, lines: number = 200): string {
+	return `/api/transcoder/logs/${encodeURIComponent(filename)}/follow?structured=true&lines=${lines}`;
+}
+
 export function logDownloadUrl(filename: string): string {
 	return `/api/logs/${encodeURIComponent(filename)}/download`;
 }
 
+export function logArchiveUrl(selected: { arm?: string[]; transcoder?: string[] }): string {
+	const query = new URLSearchParams();
+	for (const name of selected.arm ?? []) query.append('arm', name);
+	for (const name of selected.transcoder ?? []) query.append('transcoder', name);
+	return `/api/logs/archive?${query}`;
+}
+
+export function supportBundleUrl(jobId: number): string {
+	return `/api/jobs/${jobId}/support-bundle.zip`;
+}
+
 export async function fetchTranscoderLogForArmJob(
 	armJobId: number
 ): Promise<{
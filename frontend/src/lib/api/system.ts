@@ -10,6 +10,21 @@ export function fetchJobStats(): Promise<JobStats> {
 	return apiFetch<JobStats>('/api/system/job-stats');
 }
 
+export interface SystemHistory {
+	metric: string;
+	step: number;
+	start: number;
+	end: number;
+	timestamps: number[];
+	values: number[];
+}
+
+/** Sampled history of one metric, e.g. `arm.cpu_percent` over `6h`. */
+export function fetchSystemHistory(metric: string, range = '1h'): Promise<SystemHistory> {
+	const params = new URLSearchParams({ metric, range });
+	return apiFetch<SystemHistory>(`/api/system/history?${params}`);
+}
+
 export function restartArm(): Promise<{ success: boolean }> {
 	return apiFetch('/api/system/restart', { method: 'POST' });
 }
@@ -15,7 +15,9 @@ vi.mock('$lib/api/jobs', () => ({
 	updateJobTitle: vi.fn(() => Promise.resolve()),
 	toggleMultiTitle: vi.fn(() => Promise.resolve()),
 	updateTrack: vi.fn(() => Promise.resolve()),
+	updateTracks: vi.fn(() => Promise.resolve({ updated: 0, failed: 0, results: [] })),
 	searchMetadata: vi.fn(),
+	SEARCH_SUPERSEDED: 'Search superseded',
 	fetchMediaDetail: vi.fn(),
 	searchMusicMetadata: vi.fn(),
 	fetchMusicDetail: vi.fn(),
@@ -14,7 +14,7 @@ vi.mock('$lib/api/jobs', () => ({
 		alternatives: []
 	})),
 	fetchTvdbEpisodes: vi.fn(() => Promise.resolve({ episodes: [], tvdb_id: 12345, season: 1 })),
-	updateTrack: vi.fn(() => Promise.resolve({ success: true, updated: {} })),
+	updateTracks: vi.fn(() => Promise.resolve({ updated: 0, failed: 0, results: [] })),
 	fetchNamingPreview: vi.fn(() => Promise.resolve({ success: true, tracks: [] }))
 }));
 
@@ -0,0 +1,47 @@
+import { describe, it, expect, vi, afterEach } from 'vitest';
+import { renderComponent, screen, fireEvent, cleanup, waitFor } from '$lib/test-utils';
+import LogSearch from './LogSearch.svelte';
+
+vi.mock('$lib/api/logs', () => ({
+	searchLogs: vi.fn()
+}));
+
+import { searchLogs } from '$lib/api/logs';
+
+const mockSearch = vi.mocked(searchLogs);
+
+describe('LogSearch', () => {
+	afterEach(() => {
+		cleanup();
+		mockSearch.mockReset();
+	});
+
+	it('streams matches into the list and links to their logs', async () => {
+		mockSearch.mockImplementation(async (_params, onEvent) => {
+			onEvent({ type: 'match', service: 'arm', filename: 'job_1.log', timestamp: '2026-03-01 10:00:00', level: 'ERROR', logger: 'arm', event: 'rip failed', raw: '' });
+			onEvent({ type: 'match', service: 'transcoder', filename: 'tc.log', timestamp: '2026-03-01 11:00:00', level: 'ERROR', logger: 'tc', event: 'encode failed', raw: '' });
+			onEvent({ type: 'done', files: 4, matched: 2, limit_reached: false, unavailable: [] });
+		});
+		renderComponent(LogSearch);
+		await fireEvent.input(screen.getByPlaceholderText('Search all logs...'), { target: { value: 'failed' } });
+		await fireEvent.click(screen.getByText('Search'));
+		await waitFor(() => expect(screen.getByText('2 matches in 4 logs')).toBeInTheDocument());
+		expect(screen.getByText('rip failed')).toBeInTheDocument();
+		expect(screen.getByText('tc.log').closest('a')).toHaveAttribute('href', '/logs/transcoder/tc.log');
+		expect(mockSearch.mock.calls[0][0]).toEqual({ q: 'failed', level: undefined, since: undefined, limit: 200 });
+	});
+
+	it('does not search for an empty query', async () => {
+		renderComponent(LogSearch);
+		await fireEvent.click(screen.getByText('Search'));
+		expect(mockSearch).not.toHaveBeenCalled();
+	});
+
+	it('shows an error when the search fails', async () => {
+		mockSearch.mockRejectedValue(new Error('API 502: Bad Gateway'));
+		renderComponent(LogSearch);
+		await fireEvent.input(screen.getByPlaceholderText('Search all logs...'), { target: { value: 'x' } });
+		await fireEvent.click(screen.getByText('Search'));
+		await waitFor(() => expect(screen.getByText('API 502: Bad Gateway')).toBeInTheDocument());
+	});
+});
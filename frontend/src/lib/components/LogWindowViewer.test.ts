@@ -0,0 +1,41 @@
+import { describe, it, expect, vi, afterEach } from 'vitest';
+import { renderComponent, screen, cleanup, waitFor } from '$lib/test-utils';
+import LogWindowViewer from './LogWindowViewer.svelte';
+
+function windowOf(total: number) {
+	return vi.fn((filename: string, offset: number, limit: number) =>
+		Promise.resolve({
+			filename,
+			offset,
+			total_lines: total,
+			lines: Array.from({ length: Math.max(0, Math.min(limit, total - offset)) }, (_, i) => `line ${offset + i}`)
+		})
+	);
+}
+
+describe('LogWindowViewer', () => {
+	afterEach(() => cleanup());
+
+	it('loads the first page and shows the line count', async () => {
+		const fetchFn = windowOf(120000);
+		renderComponent(LogWindowViewer, { props: { filename: 'rip.log', fetchFn } });
+		await waitFor(() => {
+			expect(screen.getByText('120,000 lines')).toBeInTheDocument();
+			expect(screen.getByText('line 0')).toBeInTheDocument();
+		});
+		expect(fetchFn).toHaveBeenCalledWith('rip.log', 0, 500);
+	});
+
+	it('renders only the rows in view', async () => {
+		const fetchFn = windowOf(120000);
+		const { container } = renderComponent(LogWindowViewer, { props: { filename: 'rip.log', fetchFn } });
+		await waitFor(() => expect(screen.getByText('line 0')).toBeInTheDocument());
+		expect(container.querySelectorAll('.absolute').length).toBeLessThan(100);
+	});
+
+	it('shows an error when the first page fails', async () => {
+		const fetchFn = vi.fn(() => Promise.reject(new Error('Log file not found')));
+		renderComponent(LogWindowViewer, { props: { filename: 'gone.log', fetchFn } });
+		await waitFor(() => expect(screen.getByText('Log file not found')).toBeInTheDocument());
+	});
+});
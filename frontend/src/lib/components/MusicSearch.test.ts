@@ -5,6 +5,7 @@ import { createJob } from './__fixtures__/job';
 
 vi.mock('$lib/api/jobs', () => ({
 	searchMusicMetadata: vi.fn(),
+	SEARCH_SUPERSEDED: 'Search superseded',
 	fetchMusicDetail: vi.fn(),
 	updateJobTitle: vi.fn(() => Promise.resolve()),
 	setJobTracks: vi.fn(() => Promise.resolve())
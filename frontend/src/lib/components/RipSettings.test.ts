@@ -7,7 +7,7 @@ vi.mock('$lib/api/jobs', () => ({
 	updateJobConfig: vi.fn(() => Promise.resolve()),
 	updateJobNaming: vi.fn(() => Promise.resolve({ success: true, title_pattern_override: null, folder_pattern_override: null })),
 	fetchNamingVariables: vi.fn(() => Promise.resolve({ variables: ['title', 'year', 'season', 'episode', 'label', 'video_type', 'artist', 'album'], descriptions: {} })),
-	fetchNamingPreview: vi.fn(() => Promise.resolve({ success: true, tracks: [{ track_number: '0', rendered_title: 'Preview', rendered_folder: 'Folder' }] }))
+	previewJobNaming: vi.fn(() => Promise.resolve({ success: true, tracks: [{ track_number: '0', rendered_title: 'Preview', rendered_folder: 'Folder' }] }))
 }));
 
 const defaultConfig: Record<string, string | null> = {
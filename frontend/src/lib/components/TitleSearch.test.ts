@@ -5,6 +5,7 @@ import { createJob } from './__fixtures__/job';
 
 vi.mock('$lib/api/jobs', () => ({
 	searchMetadata: vi.fn(),
+	SEARCH_SUPERSEDED: 'Search superseded',
 	fetchMediaDetail: vi.fn(),
 	updateJobTitle: vi.fn(() => Promise.resolve())
 }));
@@ -88,6 +89,40 @@ describe('TitleSearch', () => {
 			});
 		});
 
+		it('ignores searches superseded by a newer one', async () => {
+			mockSearchMetadata.mockRejectedValue(new Error('Search superseded'));
+			renderComponent(TitleSearch, {
+				props: { job: createJob({ title: 'Test' }) }
+			});
+			await fireEvent.click(screen.getByText('Search'));
+			await waitFor(() => {
+				expect(mockSearchMetadata).toHaveBeenCalled();
+			});
+			expect(screen.queryByText('Search superseded')).not.toBeInTheDocument();
+		});
+
+		it('keeps the spinner while a newer search is in flight', async () => {
+			let rejectFirst: (e: Error) => void = () => {};
+			let resolveSecond: (value: ReturnType<typeof createSearchResult>[]) => void = () => {};
+			mockSearchMetadata
+				.mockImplementationOnce(() => new Promise((_, reject) => { rejectFirst = reject; }))
+				.mockImplementationOnce(() => new Promise((resolve) => { resolveSecond = resolve; }));
+			renderComponent(TitleSearch, {
+				props: { job: createJob({ title: 'Test' }) }
+			});
+			const input = screen.getByDisplayValue('Test');
+			await fireEvent.keyDown(input, { key: 'Enter' });
+			await fireEvent.keyDown(input, { key: 'Enter' });
+			expect(mockSearchMetadata).toHaveBeenCalledTimes(2);
+			rejectFirst(new Error('Search superseded'));
+			await new Promise((resolve) => setTimeout(resolve, 0));
+			expect(screen.getByText('Searching...')).toBeInTheDocument();
+			resolveSecond([createSearchResult({ title: 'Newest' })]);
+			await waitFor(() => {
+				expect(screen.getByText('Search')).toBeInTheDocument();
+			});
+		});
+
 		it('renders IMDb ID input field', () => {
 			renderComponent(TitleSearch, {
 				props: { job: createJob() }
@@ -14,6 +14,7 @@ vi.mock('$lib/api/jobs', () => ({
 	updateJobTitle: vi.fn(() => Promise.resolve()),
 	toggleMultiTitle: vi.fn(() => Promise.resolve()),
 	updateTrack: vi.fn(() => Promise.resolve()),
+	updateTracks: vi.fn(() => Promise.resolve({ updated: 0, failed: 0, results: [] })),
 	fetchNamingPreview: vi.fn(() => Promise.resolve({
 		success: true, job_title: 'Test Movie (2025)',
 		job_folder: 'Test Movie (2025)', tracks: []
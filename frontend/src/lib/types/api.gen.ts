@@ -1678,6 +1678,54 @@ export type JobTranscodeOverridesUpdate = {
     [key: string]: unknown;
 };
 
+/**
+ * LogCatalogEntry
+ */
+export type LogCatalogEntry = {
+    /**
+     * Filename
+     */
+    filename: string;
+    /**
+     * Size
+     */
+    size: number;
+    /**
+     * Modified
+     */
+    modified: string;
+    /**
+     * Service
+     */
+    service: string;
+};
+
+/**
+ * LogCatalogResponse
+ */
+export type LogCatalogResponse = {
+    /**
+     * Total
+     */
+    total: number;
+    /**
+     * Offset
+     */
+    offset: number;
+    /**
+     * Limit
+     */
+    limit: number;
+    /**
+     * Files
+     */
+    files: Array<LogCatalogEntry>;
+    /**
+     * Unavailable
+     */
+    unavailable: Array<string>;
+};
+
 /**
  * LogContentResponse
  */
@@ -1694,6 +1742,14 @@ export type LogContentResponse = {
      * Lines
      */
     lines: number;
+    /**
+     * Cursor
+     */
+    cursor?: string | null;
+    /**
+     * Reset
+     */
+    reset?: boolean;
 };
 
 /**
@@ -1748,6 +1804,68 @@ export type LogFileSchema = {
     modified: string;
 };
 
+/**
+ * LogLevelBucket
+ */
+export type LogLevelBucket = {
+    /**
+     * Start
+     */
+    start: string;
+    /**
+     * Counts
+     */
+    counts: {
+        [key: string]: number;
+    };
+};
+
+/**
+ * LogLevelSummaryResponse
+ */
+export type LogLevelSummaryResponse = {
+    /**
+     * Filename
+     */
+    filename: string;
+    /**
+     * Total
+     */
+    total: number;
+    /**
+     * Counts
+     */
+    counts: {
+        [key: string]: number;
+    };
+    /**
+     * Histogram
+     */
+    histogram: Array<LogLevelBucket>;
+};
+
+/**
+ * LogWindowResponse
+ */
+export type LogWindowResponse = {
+    /**
+     * Filename
+     */
+    filename: string;
+    /**
+     * Offset
+     */
+    offset: number;
+    /**
+     * Total Lines
+     */
+    total_lines: number;
+    /**
+     * Lines
+     */
+    lines: Array<string>;
+};
+
 /**
  * MaintenanceBulkDeleteResult
  *
@@ -2717,6 +2835,47 @@ export type StructuredLogResponse = {
      * Lines
      */
     lines: number;
+    /**
+     * Cursor
+     */
+    cursor?: string | null;
+    /**
+     * Reset
+     */
+    reset?: boolean;
+};
+
+/**
+ * SystemHistoryResponse
+ *
+ * A metric's sampled history; ``values[i]`` is the mean over the
+ * ``step`` seconds starting at ``timestamps[i]`` (Unix seconds).
+ */
+export type SystemHistoryResponse = {
+    /**
+     * Metric
+     */
+    metric: string;
+    /**
+     * Step
+     */
+    step: number;
+    /**
+     * Start
+     */
+    start: number;
+    /**
+     * End
+     */
+    end: number;
+    /**
+     * Timestamps
+     */
+    timestamps?: Array<number>;
+    /**
+     * Values
+     */
+    values?: Array<number>;
 };
 
 /**
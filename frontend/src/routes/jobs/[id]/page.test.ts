@@ -88,6 +88,7 @@ vi.mock('$lib/api/jobs', () => ({
 	fetchMusicDetail: vi.fn(),
 	toggleMultiTitle: vi.fn(),
 	updateTrack: vi.fn(),
+	updateTracks: vi.fn(),
 	fetchNamingPreview: vi.fn(() => Promise.resolve({ success: true, job_title: '', job_folder: '', tracks: [] })),
 	searchMetadata: vi.fn(),
 	fetchMediaDetail: vi.fn(),
@@ -104,7 +105,8 @@ vi.mock('$lib/api/logs', () => ({
 	fetchStructuredLogContent: vi.fn(() => Promise.resolve({ entries: [] })),
 	fetchStructuredTranscoderLogContent: vi.fn(() => Promise.resolve({ entries: [] })),
 	fetchTranscoderLogForArmJob: vi.fn(() => Promise.resolve({ found: false })),
-	fetchLogContent: vi.fn(() => Promise.resolve({ content: '' }))
+	fetchLogContent: vi.fn(() => Promise.resolve({ content: '' })),
+	supportBundleUrl: vi.fn((id: number) => `/api/jobs/${id}/support-bundle.zip`)
 }));
 
 vi.mock('$lib/api/settings', () => ({
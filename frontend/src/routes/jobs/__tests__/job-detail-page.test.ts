@@ -35,6 +35,7 @@ vi.mock('$lib/api/jobs', () => ({
 	fetchMusicDetail: vi.fn(),
 	toggleMultiTitle: vi.fn(() => Promise.resolve()),
 	updateTrack: vi.fn(() => Promise.resolve()),
+	updateTracks: vi.fn(() => Promise.resolve({ updated: 0, failed: 0, results: [] })),
 	abandonJob: vi.fn(),
 	deleteJob: vi.fn(),
 	fixJobPermissions: vi.fn(),
@@ -57,7 +58,8 @@ vi.mock('$lib/api/jobs', () => ({
 vi.mock('$lib/api/logs', () => ({
 	fetchStructuredLogContent: vi.fn(() => Promise.resolve({ entries: [] })),
 	fetchStructuredTranscoderLogContent: vi.fn(() => Promise.resolve({ entries: [] })),
-	fetchTranscoderLogForArmJob: vi.fn(() => Promise.resolve(null))
+	fetchTranscoderLogForArmJob: vi.fn(() => Promise.resolve(null)),
+	supportBundleUrl: vi.fn((id: number) => `/api/jobs/${id}/support-bundle.zip`)
 }));
 
 vi.mock('$lib/api/settings', () => ({
@@ -10,7 +10,9 @@ vi.mock('$app/stores', async () => {
 });
 
 vi.mock('$lib/api/logs', () => ({
-	fetchStructuredLogContent: vi.fn(() => Promise.resolve({ entries: [] }))
+	fetchStructuredLogContent: vi.fn(() => Promise.resolve({ entries: [] })),
+	logFollowUrl: vi.fn((filename: string) => `/api/logs/${filename}/follow`),
+	fetchLogWindow: vi.fn(() => Promise.resolve({ filename: 'job_001.log', offset: 0, total_lines: 0, lines: [] }))
 }));
 
 describe('Log Detail Page', () => {
@@ -21,10 +23,11 @@ describe('Log Detail Page', () => {
 		expect(screen.getByText('job_001.log')).toBeInTheDocument();
 	});
 
-	it('renders Tail and Full mode buttons', () => {
+	it('renders Tail, Full and Browse mode buttons', () => {
 		renderComponent(LogDetailPage);
 		expect(screen.getByText('Tail')).toBeInTheDocument();
 		expect(screen.getByText('Full')).toBeInTheDocument();
+		expect(screen.getByText('Browse')).toBeInTheDocument();
 	});
 
 	it('renders back link to /logs', () => {
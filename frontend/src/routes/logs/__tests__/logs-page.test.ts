@@ -9,15 +9,20 @@ vi.mock('$lib/api/maintenance', () => ({
 }));
 
 vi.mock('$lib/api/logs', () => ({
-	fetchLogs: vi.fn(() => Promise.resolve([
-		{ filename: 'job_001.log', size: 1024, modified: '2025-06-15T12:00:00Z' },
-		{ filename: 'job_002.log', size: 2048, modified: '2025-06-14T10:00:00Z' }
-	])),
-	fetchTranscoderLogs: vi.fn(() => Promise.resolve([
-		{ filename: 'transcode_001.log', size: 512, modified: '2025-06-15T11:00:00Z' }
-	])),
+	fetchLogCatalog: vi.fn((params: { service?: string; q?: string }) => {
+		const files = (params.service === 'transcoder'
+			? [{ filename: 'transcode_001.log', size: 512, modified: '2025-06-15T11:00:00Z', service: 'transcoder' }]
+			: [
+				{ filename: 'job_001.log', size: 1024, modified: '2025-06-15T12:00:00Z', service: 'arm' },
+				{ filename: 'job_002.log', size: 2048, modified: '2025-06-14T10:00:00Z', service: 'arm' }
+			]).filter((f) => !params.q || f.filename.includes(params.q));
+		return Promise.resolve({ total: files.length, offset: 0, limit: 50, files, unavailable: [] });
+	}),
 	deleteLog: vi.fn(() => Promise.resolve({ success: true, filename: 'test.log' })),
 	logDownloadUrl: vi.fn((f: string) => `/api/logs/${f}/download`),
+	logArchiveUrl: vi.fn((s: { arm?: string[]; transcoder?: string[] }) =>
+		`/api/logs/archive?${(s.arm ?? []).map((f) => `arm=${f}`).join('&')}`),
+	searchLogs: vi.fn(() => Promise.resolve()),
 }));
 
 describe('Logs Page', () => {
@@ -72,6 +77,35 @@ describe('Logs Page', () => {
 				expect(screen.getByText('transcode_001.log')).toBeInTheDocument();
 			});
 		});
+
+		it('filters the catalog by filename on the server', async () => {
+			const { fetchLogCatalog } = await import('$lib/api/logs');
+			renderComponent(LogsPage);
+			await waitFor(() => {
+				expect(screen.getByText('job_002.log')).toBeInTheDocument();
+			});
+			await fireEvent.input(screen.getByLabelText('Filter logs by filename'), { target: { value: '001' } });
+			await waitFor(() => {
+				expect(vi.mocked(fetchLogCatalog)).toHaveBeenLastCalledWith(
+					expect.objectContaining({ service: 'arm', q: '001', offset: 0 })
+				);
+				expect(screen.queryByText('job_002.log')).not.toBeInTheDocument();
+			});
+		});
+
+		it('downloads selected logs as one ZIP', async () => {
+			renderComponent(LogsPage);
+			await waitFor(() => {
+				expect(screen.getByText('job_001.log')).toBeInTheDocument();
+			});
+			expect(screen.queryByText(/selected as ZIP/)).not.toBeInTheDocument();
+			await fireEvent.click(screen.getByLabelText('Select job_001.log'));
+			await fireEvent.click(screen.getByLabelText('Select job_002.log'));
+			const link = screen.getByText('Download 2 selected as ZIP');
+			expect(link).toHaveAttribute('href', '/api/logs/archive?arm=job_001.log&arm=job_002.log');
+			await fireEvent.click(screen.getByText('Clear'));
+			expect(screen.queryByText(/selected as ZIP/)).not.toBeInTheDocument();
+		});
 	});
 
 	describe('orphan logs modal', () => {
@@ -11,7 +11,9 @@ vi.mock('$app/stores', async () => {
 
 vi.mock('$lib/api/logs', () => ({
 	fetchStructuredTranscoderLogContent: vi.fn(() => Promise.resolve({ entries: [] })),
-	fetchStructuredLogContent: vi.fn(() => Promise.resolve({ entries: [] }))
+	fetchStructuredLogContent: vi.fn(() => Promise.resolve({ entries: [] })),
+	transcoderLogFollowUrl: vi.fn((filename: string) => `/api/transcoder/logs/${filename}/follow`),
+	fetchTranscoderLogWindow: vi.fn(() => Promise.resolve({ filename: 'transcode_001.log', offset: 0, total_lines: 0, lines: [] }))
 }));
 
 describe('Transcoder Log Detail Page', () => {
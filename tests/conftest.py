@@ -13,20 +13,54 @@ from unittest.mock import AsyncMock, patch  # noqa: E402
 import httpx  # noqa: E402
 import pytest  # noqa: E402
 
-from backend.services import arm_client, system_cache, transcoder_client  # noqa: E402
+from backend.services import (  # noqa: E402
+    arm_client,
+    job_detail_cache,
+    job_mirror,
+    log_cursor,
+    log_catalog,
+    log_entries,
+    log_index,
+    metadata_cache,
+    metadata_disk_cache,
+    retranscode_queue,
+    search_sessions,
+    system_cache,
+    system_history,
+    transcoder_client,
+)
 
 
 @pytest.fixture(autouse=True)
-def _reset_singletons():
+def _reset_singletons(tmp_path, monkeypatch):
     """Reset all module-level singletons after each test."""
+    # Keep the on-disk metadata cache out of the real /data volume.
+    monkeypatch.setattr(metadata_disk_cache, "_cache_dir", str(tmp_path / "metadata-cache"))
+    monkeypatch.setattr(log_index, "_cache_dir", str(tmp_path / "log-cache"))
     yield
     # arm_client
     arm_client._client = None
     # transcoder_client
     transcoder_client._client = None
+    transcoder_client._webhook_client = None
     # system_cache
     system_cache._arm_info = None
     system_cache._transcoder_info = None
+    system_history.clear()
+    # job_mirror / job_detail_cache
+    job_mirror.reset()
+    job_detail_cache.clear()
+    # metadata_cache / search_sessions
+    metadata_cache.clear()
+    metadata_disk_cache._index.clear()
+    search_sessions.clear()
+    # retranscode_queue
+    retranscode_queue.clear()
+    # log_cursor
+    log_cursor.clear()
+    log_catalog.clear()
+    log_entries.clear()
+    log_index.clear()
 
 
 @pytest.fixture
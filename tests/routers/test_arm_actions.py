@@ -9,6 +9,7 @@ import pytest
 from fastapi import HTTPException
 
 from backend.routers.arm_actions import _check_result
+from tests.factories import make_job_dict
 
 
 # --- _check_result unit tests ---
@@ -82,6 +83,30 @@ async def test_delete_job_endpoint(app_client):
     assert resp.status_code == 200
 
 
+async def test_crc_submit_drops_cached_lookup(app_client):
+    """POST /api/jobs/{id}/crc-submit forgets the cached lookup for the job's hash."""
+    detail = {"job": make_job_dict(job_id=1, crc_id="abc123"), "tracks": [], "config": None}
+    with _patch_arm_client("get_job_detail", detail), \
+         _patch_arm_client("lookup_crc", {"found": False, "results": []}) as lookup, \
+         _patch_arm_client("send_to_crc_db", {"success": True}):
+        await app_client.get("/api/jobs/1/crc-lookup")
+        resp = await app_client.post("/api/jobs/1/crc-submit")
+        assert resp.status_code == 200
+        await app_client.get("/api/jobs/1/crc-lookup")
+    assert lookup.await_count == 2
+
+
+async def test_crc_submit_reads_hash_when_nothing_cached(app_client):
+    """Without a cached detail or mirrored hash, crc-submit reads the detail for it."""
+    detail = {"job": make_job_dict(job_id=1, crc_id="abc123"), "tracks": [], "config": None}
+    with _patch_arm_client("get_job_detail", detail), \
+         _patch_arm_client("send_to_crc_db", {"success": True}), \
+         patch("backend.routers.arm_actions.metadata_cache.forget_crc") as forget:
+        resp = await app_client.post("/api/jobs/1/crc-submit")
+    assert resp.status_code == 200
+    forget.assert_called_once_with("abc123")
+
+
 async def test_set_ripping_enabled_endpoint(app_client):
     """POST /api/system/ripping-enabled toggles ripping."""
     with _patch_arm_client("set_ripping_enabled", {"success": True}):
@@ -0,0 +1,94 @@
+"""Tests for GET /api/jobs/{id}/bundle (concurrent job page fan-out)."""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import ExitStack
+from unittest.mock import AsyncMock, patch
+
+from backend.routers.jobs import _BUNDLE_DEADLINES
+from tests.factories import make_job_dict
+
+_DETAIL = {"job": make_job_dict(job_id=1, crc_id="abc123"), "tracks": [], "config": None}
+_PROGRESS = {"progress": 50, "stage": "ripping", "tracks_total": 2, "tracks_ripped": 1}
+_METADATA = {"title": "Serial Mom", "year": "1994"}
+_NAMING = {"success": True, "tracks": []}
+_CRC = {"found": True, "results": [], "has_api_key": True}
+_TRANSCODER = {"jobs": [{"id": 1, "status": "processing", "progress": 10.0}]}
+
+
+def _patch_upstreams(**overrides):
+    mocks = {
+        "backend.routers.jobs.arm_client.get_job_detail": _DETAIL,
+        "backend.routers.jobs.arm_client.get_job_progress_state": _PROGRESS,
+        "backend.routers.jobs.arm_client.get_job_metadata": _METADATA,
+        "backend.routers.jobs.arm_client.naming_preview_for_job": _NAMING,
+        "backend.routers.jobs.arm_client.lookup_crc": _CRC,
+        "backend.routers.transcoder.transcoder_client.get_jobs": _TRANSCODER,
+    }
+    stack = ExitStack()
+    for target, value in mocks.items():
+        name = target.rsplit(".", 1)[1]
+        mock = overrides.get(name) or AsyncMock(return_value=value)
+        stack.enter_context(patch(target, mock))
+    return stack
+
+
+async def test_bundle_returns_every_section(app_client):
+    with _patch_upstreams():
+        resp = await app_client.get("/api/jobs/1/bundle")
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["errors"] == {}
+    assert data["detail"]["job_id"] == 1
+    assert data["metadata"] == _METADATA
+    assert data["naming_preview"] == _NAMING
+    assert data["crc"] == _CRC
+    assert data["transcoder"]["found"] is True
+
+
+async def test_bundle_detail_fetched_once_for_detail_and_crc(app_client):
+    detail = AsyncMock(return_value=_DETAIL)
+    with _patch_upstreams(get_job_detail=detail):
+        await app_client.get("/api/jobs/1/bundle")
+    assert detail.await_count == 1
+
+
+async def test_slow_section_times_out_without_blocking_others(app_client, monkeypatch):
+    async def slow(job_id):
+        await asyncio.sleep(5)
+
+    monkeypatch.setitem(_BUNDLE_DEADLINES, "metadata", 0.01)
+    with _patch_upstreams(get_job_metadata=AsyncMock(side_effect=slow)):
+        resp = await app_client.get("/api/jobs/1/bundle")
+    data = resp.json()
+    assert resp.status_code == 200
+    assert data["metadata"] is None
+    assert data["errors"]["metadata"]["status"] == 504
+    assert data["detail"]["job_id"] == 1
+
+
+async def test_failed_section_reported_per_section(app_client):
+    with _patch_upstreams(naming_preview_for_job=AsyncMock(return_value=None)):
+        resp = await app_client.get("/api/jobs/1/bundle")
+    data = resp.json()
+    assert resp.status_code == 200
+    assert data["naming_preview"] is None
+    assert data["errors"] == {"naming_preview": {"status": 502, "detail": "ARM service unreachable"}}
+
+
+async def test_missing_job_is_404(app_client):
+    missing = AsyncMock(return_value={"success": False, "error": "Job not found"})
+    with _patch_upstreams(get_job_detail=missing):
+        resp = await app_client.get("/api/jobs/999/bundle")
+    assert resp.status_code == 404
+
+
+async def test_transcoder_section_skipped_when_disabled(ripper_only_app_client):
+    transcoder = AsyncMock()
+    with _patch_upstreams(get_jobs=transcoder):
+        resp = await ripper_only_app_client.get("/api/jobs/1/bundle")
+    assert resp.status_code == 200
+    assert resp.json()["transcoder"] is None
+    assert "transcoder" not in resp.json()["errors"]
+    transcoder.assert_not_called()
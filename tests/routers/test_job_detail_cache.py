@@ -0,0 +1,45 @@
+"""Read-after-write behaviour of the cached GET /api/jobs/{id}."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, patch
+
+from tests.factories import make_job_dict
+
+
+def _detail(**job_overrides) -> dict:
+    return {"job": make_job_dict(job_id=1, status="success", **job_overrides),
+            "tracks": [], "config": None}
+
+
+async def test_repeat_reads_hit_cache(app_client):
+    with patch("backend.routers.jobs.arm_client.get_job_detail",
+               new_callable=AsyncMock, return_value=_detail()) as mock, \
+         patch("backend.routers.jobs.arm_client.lookup_crc",
+               new_callable=AsyncMock, return_value={"found": False, "results": []}):
+        assert (await app_client.get("/api/jobs/1")).status_code == 200
+        assert (await app_client.get("/api/jobs/1/crc-lookup")).status_code == 200
+    assert mock.await_count == 1
+
+
+async def test_write_invalidates_cached_detail(app_client):
+    mock = AsyncMock(side_effect=[_detail(title="Old"), _detail(title="New")])
+    with patch("backend.routers.jobs.arm_client.get_job_detail", mock), \
+         patch("backend.routers.arm_actions.arm_client.update_title",
+               new_callable=AsyncMock, return_value={"success": True}):
+        assert (await app_client.get("/api/jobs/1")).json()["title"] == "Old"
+        resp = await app_client.put("/api/jobs/1/title", json={"title": "New"})
+        assert resp.status_code == 200
+        assert (await app_client.get("/api/jobs/1")).json()["title"] == "New"
+    assert mock.await_count == 2
+
+
+async def test_failed_write_keeps_cached_detail(app_client):
+    with patch("backend.routers.jobs.arm_client.get_job_detail",
+               new_callable=AsyncMock, return_value=_detail()) as mock, \
+         patch("backend.routers.arm_actions.arm_client.abandon_job",
+               new_callable=AsyncMock, return_value=None):
+        await app_client.get("/api/jobs/1")
+        assert (await app_client.post("/api/jobs/1/abandon")).status_code == 503
+        await app_client.get("/api/jobs/1")
+    assert mock.await_count == 1
@@ -0,0 +1,82 @@
+"""Tests for GET /api/jobs/{id}/support-bundle.zip."""
+
+from __future__ import annotations
+
+import io
+import json
+import zipfile
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from tests.factories import make_job_dict
+
+
+def _download(body: bytes):
+    resp = MagicMock()
+    resp.status_code = 200
+
+    async def aiter_bytes():
+        yield body
+
+    resp.aiter_bytes = aiter_bytes
+    resp.aclose = AsyncMock()
+    return resp
+
+
+async def test_support_bundle_contains_job_logs_and_json(app_client):
+    detail = {"job": make_job_dict(job_id=5, logfile="job_5.log"), "tracks": [], "config": {"RIPMETHOD": "mkv"}}
+    with patch("backend.routers.jobs.job_detail_cache.get", new_callable=AsyncMock, return_value=detail), \
+         patch("backend.routers.jobs.arm_client.get_job_metadata", new_callable=AsyncMock,
+               return_value={"title": "Film"}), \
+         patch("backend.routers.transcoder.transcoder_client.get_jobs", new_callable=AsyncMock,
+               return_value={"jobs": [{"id": 5, "logfile": "tc_5.log"}]}), \
+         patch("backend.services.log_archive.arm_client.stream_log_download",
+               AsyncMock(return_value=_download(b"rip log\n"))), \
+         patch("backend.services.log_archive.transcoder_client.read_log", new_callable=AsyncMock,
+               return_value={"content": "encode log\n"}):
+        resp = await app_client.get("/api/jobs/5/support-bundle.zip")
+    assert resp.status_code == 200
+    assert resp.headers["content-disposition"] == 'attachment; filename="job-5-support-bundle.zip"'
+    archive = zipfile.ZipFile(io.BytesIO(resp.content))
+    assert archive.namelist() == [
+        "job.json", "config.json", "metadata.json", "logs/arm/job_5.log", "logs/transcoder/tc_5.log",
+    ]
+    assert json.loads(archive.read("job.json"))["job_id"] == 5
+    assert "config" not in json.loads(archive.read("job.json"))
+    assert json.loads(archive.read("config.json")) == {"RIPMETHOD": "mkv"}
+    assert json.loads(archive.read("metadata.json")) == {"title": "Film"}
+    assert archive.read("logs/arm/job_5.log") == b"rip log\n"
+    assert archive.read("logs/transcoder/tc_5.log") == b"encode log\n"
+
+
+async def test_support_bundle_without_transcoder(ripper_only_app_client):
+    detail = {"job": make_job_dict(job_id=5, logfile=None), "tracks": []}
+    with patch("backend.routers.jobs.job_detail_cache.get", new_callable=AsyncMock, return_value=detail), \
+         patch("backend.routers.jobs.arm_client.get_job_metadata", new_callable=AsyncMock, return_value=None):
+        resp = await ripper_only_app_client.get("/api/jobs/5/support-bundle.zip")
+    archive = zipfile.ZipFile(io.BytesIO(resp.content))
+    assert archive.namelist() == ["job.json", "MISSING.txt"]
+    assert archive.read("MISSING.txt").decode().splitlines()[1:] == ["config.json", "metadata.json"]
+
+
+async def test_support_bundle_errors(app_client):
+    with patch("backend.routers.jobs.job_detail_cache.get", new_callable=AsyncMock, return_value=None):
+        assert (await app_client.get("/api/jobs/5/support-bundle.zip")).status_code == 502
+    with patch("backend.routers.jobs.job_detail_cache.get", new_callable=AsyncMock,
+               return_value={"success": False}):
+        assert (await app_client.get("/api/jobs/5/support-bundle.zip")).status_code == 404
+
+
+async def test_support_bundle_job_fetch_failure_is_listed_missing(ripper_only_app_client):
+    """get_job raising after the response started must not corrupt the ZIP."""
+    from fastapi import HTTPException
+
+    detail = {"job": make_job_dict(job_id=5, logfile=None), "tracks": [], "config": {}}
+    with patch("backend.routers.jobs.job_detail_cache.get", new_callable=AsyncMock, return_value=detail), \
+         patch("backend.routers.jobs.get_job", new_callable=AsyncMock,
+               side_effect=HTTPException(status_code=502, detail="ARM unreachable")), \
+         patch("backend.routers.jobs.arm_client.get_job_metadata", new_callable=AsyncMock, return_value={}):
+        resp = await ripper_only_app_client.get("/api/jobs/5/support-bundle.zip")
+    archive = zipfile.ZipFile(io.BytesIO(resp.content))
+    assert archive.testzip() is None
+    assert archive.namelist() == ["config.json", "metadata.json", "MISSING.txt"]
+    assert archive.read("MISSING.txt").decode().splitlines()[1:] == ["job.json"]
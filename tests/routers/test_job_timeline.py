@@ -0,0 +1,61 @@
+"""Tests for GET /api/jobs/{id}/timeline (merged ARM + transcoder log)."""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import AsyncMock, patch
+
+from tests.factories import make_job_dict
+
+
+def _e(ts: str, event: str) -> dict:
+    return {"timestamp": ts, "level": "INFO", "logger": "x", "event": event, "raw": event}
+
+
+async def test_timeline_streams_merged_page(app_client):
+    detail = {"job": make_job_dict(job_id=5, logfile="job_5.log"), "tracks": []}
+    arm = {"entries": [_e("2026-03-01T10:00:00", "rip"), _e("2026-03-01T10:02:00", "eject")]}
+    tc = {"entries": [_e("2026-03-01T10:01:00", "encode")]}
+    with patch("backend.routers.jobs.job_detail_cache.get", new_callable=AsyncMock, return_value=detail), \
+         patch("backend.routers.transcoder.transcoder_client.get_jobs", new_callable=AsyncMock,
+               return_value={"jobs": [{"id": 5, "logfile": "tc_5.log"}]}), \
+         patch("backend.routers.jobs.log_timeline.read_sources", new_callable=AsyncMock,
+               return_value=(arm, tc)) as read:
+        resp = await app_client.get("/api/jobs/5/timeline?level=info&limit=2")
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+    events = [json.loads(line) for line in resp.text.splitlines()]
+    assert [(e["source"], e["event"]) for e in events[:-1]] == [("arm", "rip"), ("transcoder", "encode")]
+    assert events[-1]["next_offset"] == 2
+    read.assert_awaited_once_with("job_5.log", "tc_5.log", "info")
+
+
+async def test_timeline_errors(app_client):
+    with patch("backend.routers.jobs.job_detail_cache.get", new_callable=AsyncMock, return_value=None):
+        assert (await app_client.get("/api/jobs/5/timeline")).status_code == 502
+    with patch("backend.routers.jobs.job_detail_cache.get", new_callable=AsyncMock,
+               return_value={"success": False}):
+        assert (await app_client.get("/api/jobs/5/timeline")).status_code == 404
+    detail = {"job": make_job_dict(job_id=5, logfile=None), "tracks": []}
+    with patch("backend.routers.jobs.job_detail_cache.get", new_callable=AsyncMock, return_value=detail):
+        assert (await app_client.get("/api/jobs/5/timeline")).status_code == 404
+
+
+async def test_timeline_arm_only_when_transcoder_disabled(ripper_only_app_client):
+    detail = {"job": make_job_dict(job_id=5, logfile="job_5.log"), "tracks": []}
+    with patch("backend.routers.jobs.job_detail_cache.get", new_callable=AsyncMock, return_value=detail), \
+         patch("backend.routers.jobs.log_timeline.read_sources", new_callable=AsyncMock,
+               return_value=({"entries": [_e("2026-03-01T10:00:00", "rip")]}, None)) as read:
+        resp = await ripper_only_app_client.get("/api/jobs/5/timeline")
+    events = [json.loads(line) for line in resp.text.splitlines()]
+    assert events[-1]["sources"] == ["arm"]
+    read.assert_awaited_once_with("job_5.log", None, None)
+
+
+async def test_timeline_missing_arm_log_is_404(app_client):
+    detail = {"job": make_job_dict(job_id=5, logfile="job_5.log"), "tracks": []}
+    with patch("backend.routers.jobs.job_detail_cache.get", new_callable=AsyncMock, return_value=detail), \
+         patch("backend.routers.jobs.log_timeline.read_sources", new_callable=AsyncMock,
+               return_value=({"success": False, "error": "Log file not found"}, None)):
+        resp = await app_client.get("/api/jobs/5/timeline")
+    assert resp.status_code == 404
@@ -331,20 +331,45 @@ async def test_update_job_naming_arm_unreachable(app_client):
 
 
 async def test_validate_naming_pattern(app_client):
-    """POST /api/naming/validate returns validation result."""
-    result = {"valid": False, "invalid_vars": ["episde"], "suggestions": {"episde": "episode"}}
-    with patch("backend.routers.jobs.arm_client.validate_naming_pattern", new_callable=AsyncMock, return_value=result):
-        resp = await app_client.post("/api/naming/validate", json={"pattern": "{title} {episde}"})
+    """POST /api/naming/validate flags unknown tokens and suggests fixes."""
+    resp = await app_client.post("/api/naming/validate", json={"pattern": "{title} {episde}"})
     assert resp.status_code == 200
     assert resp.json()["valid"] is False
     assert "episde" in resp.json()["invalid_vars"]
+    assert resp.json()["suggestions"]["episde"] == "episode"
 
 
-async def test_validate_naming_arm_unreachable(app_client):
-    """POST /api/naming/validate returns 503 when ARM is down."""
-    with patch("backend.routers.jobs.arm_client.validate_naming_pattern", new_callable=AsyncMock, return_value=None):
+async def test_validate_naming_is_local(app_client):
+    """POST /api/naming/validate answers without calling ARM."""
+    with patch("backend.routers.jobs.arm_client.validate_naming_pattern", new_callable=AsyncMock) as mock:
         resp = await app_client.post("/api/naming/validate", json={"pattern": "{title}"})
-    assert resp.status_code == 503
+    assert resp.status_code == 200
+    assert resp.json()["valid"] is True
+    mock.assert_not_called()
+
+
+async def test_naming_preview_draft_rendered_locally(app_client):
+    """POST /api/jobs/{id}/naming-preview renders draft patterns from the job detail."""
+    detail = {
+        "job": {"job_id": 1, "status": "waiting", "title": "Serial Mom", "year": "1994",
+                "video_type": "movie", "disctype": "bluray"},
+        "tracks": [{"track_number": "0"}],
+        "config": {"MOVIE_TITLE_PATTERN": "{title} ({year})"},
+    }
+    with patch("backend.routers.jobs.arm_client.get_job_detail", new_callable=AsyncMock, return_value=detail), \
+         patch("backend.routers.jobs.arm_client.naming_preview_for_job", new_callable=AsyncMock) as arm_preview:
+        resp = await app_client.post("/api/jobs/1/naming-preview", json={"title_pattern": "{year} - {title}"})
+    assert resp.status_code == 200
+    assert resp.json()["tracks"][0]["rendered_title"] == "1994 - Serial Mom"
+    assert resp.json()["job_folder"] == "Serial Mom (1994)"
+    arm_preview.assert_not_called()
+
+
+async def test_naming_preview_draft_job_not_found(app_client):
+    with patch("backend.routers.jobs.arm_client.get_job_detail", new_callable=AsyncMock,
+               return_value={"success": False, "error": "Job not found"}):
+        resp = await app_client.post("/api/jobs/999/naming-preview", json={})
+    assert resp.status_code == 404
 
 
 async def test_get_naming_variables(app_client):
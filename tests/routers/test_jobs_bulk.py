@@ -1,4 +1,4 @@
-"""Tests for POST /api/jobs/bulk-delete and /api/jobs/bulk-purge."""
+"""Tests for POST /api/jobs/bulk-delete, /bulk-purge and /bulk-retranscode."""
 from __future__ import annotations
 from unittest.mock import AsyncMock, patch
 from tests.factories import make_job_dict
@@ -136,3 +136,32 @@ async def test_bulk_delete_strips_crlf_from_logged_user_input(app_client, caplog
     # And the sanitized values still appear, just without the CRLF.
     assert "failinjected" in combined
     assert "boomFAKE LOG LINEmore" in combined
+
+
+async def test_bulk_retranscode_queues_batch(app_client):
+    with patch("backend.routers.jobs.retranscode_queue._start") as start:
+        resp = await app_client.post("/api/jobs/bulk-retranscode", json={"job_ids": [4, 5]})
+        assert resp.status_code == 200
+        batch = resp.json()
+        assert batch["total"] == 2 and batch["queued"] == 2 and not batch["done"]
+        start.assert_called_once()
+
+        resp = await app_client.get(f"/api/jobs/bulk-retranscode/{batch['batch_id']}")
+        assert resp.json()["batch_id"] == batch["batch_id"]
+        resp = await app_client.delete(f"/api/jobs/bulk-retranscode/{batch['batch_id']}")
+        assert resp.json()["cancelled"] == 2
+
+
+async def test_bulk_retranscode_empty_selection(app_client):
+    resp = await app_client.post("/api/jobs/bulk-retranscode", json={"job_ids": []})
+    assert resp.status_code == 400
+
+
+async def test_bulk_retranscode_unknown_batch(app_client):
+    resp = await app_client.get("/api/jobs/bulk-retranscode/nope")
+    assert resp.status_code == 404
+
+
+async def test_bulk_retranscode_requires_transcoder(ripper_only_app_client):
+    resp = await ripper_only_app_client.post("/api/jobs/bulk-retranscode", json={"job_ids": [1]})
+    assert resp.status_code == 503
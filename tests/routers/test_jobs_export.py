@@ -0,0 +1,87 @@
+"""Tests for GET /api/jobs/export (streamed NDJSON / CSV job history)."""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+from unittest.mock import AsyncMock, patch
+
+from tests.factories import make_job_dict
+
+
+def _page(job_ids: range, page: int, pages: int) -> dict:
+    return {
+        "jobs": [make_job_dict(job_id=i, title=f"Job {i}") for i in job_ids],
+        "total": 150, "page": page, "per_page": 100, "pages": pages,
+    }
+
+
+async def test_export_ndjson_pages_through_history(app_client):
+    pages = [_page(range(1, 101), 1, 2), _page(range(101, 151), 2, 2)]
+    with patch(
+        "backend.routers.jobs.arm_client.get_jobs_paginated",
+        new_callable=AsyncMock, side_effect=pages,
+    ) as mock_fn:
+        resp = await app_client.get("/api/jobs/export?format=ndjson&disctype=dvd")
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+    assert 'filename="arm-jobs.ndjson"' in resp.headers["content-disposition"]
+    rows = [json.loads(line) for line in resp.text.splitlines()]
+    assert [r["job_id"] for r in rows] == list(range(1, 151))
+    assert mock_fn.await_count == 2
+    second_call = mock_fn.await_args_list[1].kwargs
+    assert second_call["page"] == 2
+    assert second_call["per_page"] == 100
+    assert second_call["disctype"] == "dvd"
+
+
+async def test_export_csv_has_header_and_rows(app_client):
+    with patch(
+        "backend.routers.jobs.arm_client.get_jobs_paginated",
+        new_callable=AsyncMock, return_value=_page(range(1, 3), 1, 1),
+    ):
+        resp = await app_client.get("/api/jobs/export?format=csv")
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/csv")
+    rows = list(csv.reader(io.StringIO(resp.text)))
+    assert rows[0][:3] == ["job_id", "title", "year"]
+    assert [r[0] for r in rows[1:]] == ["1", "2"]
+
+
+async def test_export_ndjson_ends_with_error_record_when_page_2_fails(app_client):
+    with patch(
+        "backend.routers.jobs.arm_client.get_jobs_paginated",
+        new_callable=AsyncMock, side_effect=[_page(range(1, 101), 1, 3), None],
+    ):
+        resp = await app_client.get("/api/jobs/export")
+    assert resp.status_code == 200
+    rows = [json.loads(line) for line in resp.text.splitlines()]
+    assert [r["job_id"] for r in rows[:-1]] == list(range(1, 101))
+    assert rows[-1]["type"] == "error" and rows[-1]["page"] == 2
+    assert "incomplete" in rows[-1]["error"]
+
+
+async def test_export_csv_ends_with_error_row_when_page_2_fails(app_client):
+    with patch(
+        "backend.routers.jobs.arm_client.get_jobs_paginated",
+        new_callable=AsyncMock, side_effect=[_page(range(1, 101), 1, 2), {"success": False}],
+    ):
+        resp = await app_client.get("/api/jobs/export?format=csv")
+    rows = list(csv.reader(io.StringIO(resp.text)))
+    assert len(rows) == 102
+    assert rows[-1][0].startswith("# ") and "page 2" in rows[-1][0]
+
+
+async def test_export_first_page_unreachable_returns_502(app_client):
+    with patch(
+        "backend.routers.jobs.arm_client.get_jobs_paginated",
+        new_callable=AsyncMock, return_value=None,
+    ):
+        resp = await app_client.get("/api/jobs/export")
+    assert resp.status_code == 502
+
+
+async def test_export_rejects_unknown_format(app_client):
+    resp = await app_client.get("/api/jobs/export?format=xml")
+    assert resp.status_code == 422
@@ -207,6 +207,65 @@ async def test_update_track_fields_not_found(app_client):
     assert resp.status_code == 404
 
 
+# --- POST /api/jobs/{id}/tracks/batch ---
+
+
+async def test_batch_update_tracks_aggregates_results(app_client):
+    def fields(job_id, track_id, body):
+        if track_id == 2:
+            return {"success": False, "error": "Track not found"}
+        return {"success": True, "updated": body}
+
+    with patch(
+        "backend.routers.jobs.arm_client.update_track_fields",
+        new_callable=AsyncMock, side_effect=fields,
+    ) as mock_fields, patch(
+        "backend.routers.jobs.arm_client.update_track_title",
+        new_callable=AsyncMock, return_value={"success": True},
+    ) as mock_title, patch(
+        "backend.routers.jobs.job_detail_cache.invalidate",
+    ) as mock_invalidate:
+        resp = await app_client.post("/api/jobs/1/tracks/batch", json={"updates": [
+            {"track_id": 1, "fields": {"enabled": False}, "title": {"title": "Pilot"}},
+            {"track_id": 2, "fields": {"enabled": False}, "title": {"title": "Skipped"}},
+            {"track_id": 3, "fields": {"enabled": False}},
+        ]})
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["updated"] == 2
+    assert data["failed"] == 1
+    assert data["results"][1] == {"track_id": 2, "success": False, "error": "Track not found"}
+    assert mock_fields.await_count == 3
+    # Track 2's title isn't attempted once its field update failed
+    mock_title.assert_awaited_once_with(1, 1, {"title": "Pilot"})
+    mock_invalidate.assert_called_once_with(1)
+
+
+async def test_batch_update_tracks_clear_title(app_client):
+    with patch(
+        "backend.routers.jobs.arm_client.clear_track_title",
+        new_callable=AsyncMock, return_value={"success": True},
+    ) as mock_clear:
+        resp = await app_client.post("/api/jobs/1/tracks/batch", json={"updates": [
+            {"track_id": 4, "clear_title": True},
+        ]})
+    assert resp.status_code == 200
+    assert resp.json()["updated"] == 1
+    mock_clear.assert_awaited_once_with(1, 4)
+
+
+async def test_batch_update_tracks_arm_unreachable(app_client):
+    with patch(
+        "backend.routers.jobs.arm_client.update_track_fields",
+        new_callable=AsyncMock, return_value=None,
+    ):
+        resp = await app_client.post("/api/jobs/1/tracks/batch", json={"updates": [
+            {"track_id": 1, "fields": {"enabled": True}},
+            {"track_id": 2, "fields": {"enabled": True}},
+        ]})
+    assert resp.status_code == 502
+
+
 # --- POST /api/jobs/{id}/retranscode ---
 
 
@@ -0,0 +1,123 @@
+"""Tests for /api/jobs and /api/jobs/stats answering from the job mirror."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, patch
+
+from backend.services import job_mirror
+from tests.factories import make_job_dict
+
+
+async def _warm_mirror() -> None:
+    jobs = [
+        make_job_dict(job_id=1, title="Alien", status="success",
+                      start_time="2024-01-01T10:00:00+00:00"),
+        make_job_dict(job_id=2, title="Heat", status="fail",
+                      start_time="2024-01-02T10:00:00+00:00"),
+    ]
+    page = {"jobs": jobs, "total": 2, "page": 1, "per_page": 100, "pages": 1}
+    with patch.object(job_mirror.arm_client, "get_jobs_paginated",
+                      new_callable=AsyncMock, return_value=page):
+        assert await job_mirror.full_sync()
+
+
+async def test_list_jobs_served_from_warm_mirror(app_client):
+    await _warm_mirror()
+    with patch(
+        "backend.routers.jobs.arm_client.get_jobs_paginated", new_callable=AsyncMock,
+    ) as upstream:
+        resp = await app_client.get("/api/jobs?sort_by=title&sort_dir=asc")
+    assert resp.status_code == 200
+    assert [j["title"] for j in resp.json()["jobs"]] == ["Alien", "Heat"]
+    upstream.assert_not_awaited()
+
+
+async def test_job_stats_served_from_warm_mirror(app_client):
+    await _warm_mirror()
+    with patch(
+        "backend.routers.jobs.arm_client.get_jobs_stats", new_callable=AsyncMock,
+    ) as upstream:
+        resp = await app_client.get("/api/jobs/stats")
+    assert resp.json() == {"total": 2, "active": 0, "success": 1, "fail": 1, "waiting": 0}
+    upstream.assert_not_awaited()
+
+
+async def test_delete_job_drops_mirror_entry(app_client):
+    await _warm_mirror()
+    with patch(
+        "backend.routers.arm_actions.arm_client.delete_job",
+        new_callable=AsyncMock, return_value={"success": True},
+    ):
+        resp = await app_client.delete("/api/jobs/2")
+    assert resp.status_code == 200
+    assert job_mirror.stats()["total"] == 1
+
+
+async def test_title_update_patches_mirror_entry(app_client):
+    await _warm_mirror()
+    detail = {"job": make_job_dict(job_id=2, title="Heat (1995)", status="fail",
+                                   start_time="2024-01-02T10:00:00+00:00", tracks=[])}
+    with patch(
+        "backend.routers.arm_actions.arm_client.update_title",
+        new_callable=AsyncMock, return_value={"success": True},
+    ), patch.object(job_mirror.job_detail_cache.arm_client, "get_job_detail",
+                    new_callable=AsyncMock, return_value=detail):
+        resp = await app_client.put("/api/jobs/2/title", json={"title": "Heat (1995)"})
+    assert resp.status_code == 200
+    assert job_mirror.get(2)["title"] == "Heat (1995)"
+    assert "tracks" not in job_mirror.get(2)
+    assert job_mirror.query(search="1995")["total"] == 1
+
+
+async def test_failed_edit_leaves_mirror_entry(app_client):
+    await _warm_mirror()
+    with patch(
+        "backend.routers.jobs.arm_client.toggle_multi_title",
+        new_callable=AsyncMock, return_value={"success": False, "error": "nope"},
+    ), patch.object(job_mirror.job_detail_cache.arm_client, "get_job_detail",
+                    new_callable=AsyncMock) as fetch:
+        resp = await app_client.post("/api/jobs/1/multi-title", json={"multi_title": True})
+    assert resp.status_code == 400
+    fetch.assert_not_awaited()
+    assert job_mirror.get(1)["title"] == "Alien"
+
+
+async def test_tvdb_rematch_is_seen_by_episode_lookups(app_client):
+    await _warm_mirror()
+    for job_id, tvdb_id in ((1, 111), (3, 222)):
+        job_mirror._upsert(make_job_dict(job_id=job_id, tvdb_id=tvdb_id, video_type="series",
+                                         start_time="2024-01-03T10:00:00+00:00"))
+
+    def episodes(job_id, season):
+        tvdb_id = job_mirror.get(job_id)["tvdb_id"]
+        return {"episodes": [], "tvdb_id": tvdb_id, "season": season}
+
+    rematched = {"job": {**job_mirror.get(1), "tvdb_id": 222}}
+    with patch("backend.routers.jobs.arm_client.tvdb_episodes",
+               new_callable=AsyncMock, side_effect=episodes), \
+         patch("backend.routers.jobs.arm_client.tvdb_match",
+               new_callable=AsyncMock, return_value={"success": True}), \
+         patch.object(job_mirror.job_detail_cache.arm_client, "get_job_detail",
+                      new_callable=AsyncMock, return_value=rematched):
+        await app_client.get("/api/jobs/1/tvdb-episodes?season=1")
+        await app_client.get("/api/jobs/3/tvdb-episodes?season=1")
+        resp = await app_client.post("/api/jobs/1/tvdb-match", json={"tvdb_id": 222})
+        assert resp.status_code == 200
+        # Only the mirror knows the new series now, and it must not be the old one.
+        job_mirror.job_detail_cache.clear()
+        resp = await app_client.get("/api/jobs/1/tvdb-episodes?season=1")
+    assert resp.json()["tvdb_id"] == 222
+
+
+async def test_crc_lookup_only_trusts_a_set_hash_in_a_warm_mirror(app_client, monkeypatch):
+    await _warm_mirror()
+    job_mirror._upsert(make_job_dict(job_id=1, crc_id=None, start_time="2024-01-01T10:00:00+00:00"))
+    job_mirror._upsert(make_job_dict(job_id=2, crc_id="old", start_time="2024-01-02T10:00:00+00:00"))
+    details = AsyncMock(side_effect=lambda job_id: {"job": make_job_dict(job_id=job_id, crc_id=f"new{job_id}")})
+    with patch.object(job_mirror.job_detail_cache.arm_client, "get_job_detail", details), \
+         patch("backend.routers.jobs.arm_client.lookup_crc", new_callable=AsyncMock,
+               return_value={"found": False, "results": []}) as lookup:
+        await app_client.get("/api/jobs/1/crc-lookup")  # hash not in the summary yet
+        monkeypatch.setattr(job_mirror, "_synced_at", 0.0)  # mirror gone stale
+        await app_client.get("/api/jobs/2/crc-lookup")
+    assert [c.args[0] for c in lookup.await_args_list] == ["new1", "new2"]
@@ -0,0 +1,59 @@
+"""Tests for GET /api/jobs/search (BFF trigram index with upstream fallback)."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, patch
+
+from backend.services import job_mirror
+from tests.factories import make_job_dict
+
+
+async def test_search_uses_index_when_mirror_warm(app_client):
+    jobs = [
+        make_job_dict(job_id=1, title="Blade Runner", label="BLADE_RUNNER"),
+        make_job_dict(job_id=2, title="The Office", label="OFFICE_S01"),
+    ]
+    page = {"jobs": jobs, "total": 2, "page": 1, "per_page": 100, "pages": 1}
+    with patch.object(job_mirror.arm_client, "get_jobs_paginated",
+                      new_callable=AsyncMock, return_value=page):
+        assert await job_mirror.full_sync()
+
+    with patch(
+        "backend.routers.jobs.arm_client.get_jobs_paginated", new_callable=AsyncMock,
+    ) as upstream:
+        resp = await app_client.get("/api/jobs/search?q=blade%20runr")
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["indexed"] is True
+    assert [h["job"]["job_id"] for h in data["hits"]] == [1]
+    assert data["hits"][0]["score"] > 0
+    upstream.assert_not_awaited()
+
+
+async def test_search_falls_back_to_upstream_when_cold(app_client):
+    paginated = {"jobs": [make_job_dict(job_id=3, title="Heat")], "total": 1,
+                 "page": 1, "per_page": 5, "pages": 1}
+    with patch(
+        "backend.routers.jobs.arm_client.get_jobs_paginated",
+        new_callable=AsyncMock, return_value=paginated,
+    ) as upstream:
+        resp = await app_client.get("/api/jobs/search?q=heat&limit=5")
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["indexed"] is False
+    assert data["hits"][0]["score"] is None
+    upstream.assert_awaited_once_with(page=1, per_page=5, search="heat")
+
+
+async def test_search_upstream_unreachable_returns_502(app_client):
+    with patch(
+        "backend.routers.jobs.arm_client.get_jobs_paginated",
+        new_callable=AsyncMock, return_value=None,
+    ):
+        resp = await app_client.get("/api/jobs/search?q=heat")
+    assert resp.status_code == 502
+
+
+async def test_search_requires_query(app_client):
+    resp = await app_client.get("/api/jobs/search")
+    assert resp.status_code == 422
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import io
+import json
+import zipfile
 from datetime import datetime, timezone
 from unittest.mock import AsyncMock, patch
 
@@ -47,6 +50,36 @@ async def test_read_log(app_client):
     mock.assert_awaited_once_with("arm.log", mode="tail", lines=100)
 
 
+async def test_read_log_with_cursor_returns_only_new_lines(app_client, monkeypatch):
+    """GET /api/logs/{filename}?cursor= pages forward through log_cursor."""
+    from backend.services import log_catalog
+
+    monkeypatch.setattr(log_catalog, "_LOOKUP_MAX_AGE", 0.0)
+    lines = ["line1", "line2"]
+
+    async def list_logs():
+        return [{"filename": "arm.log", "size": sum(len(x) + 1 for x in lines), "modified": "2024-01-01T00:00:00"}]
+
+    async def read_log(filename, mode="tail", **kwargs):
+        tail = lines[-kwargs["lines"]:]
+        return {"filename": filename, "content": "\n".join(tail), "lines": len(tail)}
+
+    with patch("backend.services.log_cursor.arm_client.list_logs", side_effect=list_logs), \
+         patch("backend.services.log_cursor.arm_client.read_log", side_effect=read_log):
+        first = (await app_client.get("/api/logs/arm.log?cursor=")).json()
+        lines.append("line3")
+        second = (await app_client.get(f"/api/logs/arm.log?cursor={first['cursor']}")).json()
+    assert first["content"] == "line1\nline2" and first["reset"] is False
+    assert second["content"] == "line3" and second["lines"] == 1
+    assert second["cursor"] != first["cursor"]
+
+
+async def test_structured_cursor_rejects_filters(app_client):
+    """Cursor reads are unfiltered."""
+    resp = await app_client.get("/api/logs/arm.log/structured?cursor=&level=error")
+    assert resp.status_code == 400
+
+
 async def test_read_log_404(app_client):
     """GET /api/logs/{filename} returns 404 when upstream signals missing file."""
     err = {"success": False, "error": "Log file not found"}
@@ -104,16 +137,180 @@ async def test_read_structured_log_404(app_client):
 
 
 async def test_read_structured_log_with_filters(app_client):
-    """GET .../structured forwards level + search params to arm_client."""
+    """Filtered reads are answered from log_entries' cached parse."""
     structured_data = {"filename": "job.log", "entries": [], "lines": 0}
     with patch(
-        "backend.routers.logs.arm_client.read_log_structured",
-        AsyncMock(return_value=structured_data),
-    ) as mock:
+        "backend.routers.logs.log_entries.read", AsyncMock(return_value=structured_data),
+    ) as mock, patch("backend.routers.logs.arm_client.read_log_structured") as upstream:
         resp = await app_client.get(
             "/api/logs/job.log/structured?level=error&search=failed"
         )
     assert resp.status_code == 200
     mock.assert_awaited_once_with(
-        "job.log", mode="tail", lines=100, level="error", search="failed"
+        "arm", "job.log", mode="tail", lines=100, level="error", search="failed"
     )
+    upstream.assert_not_called()
+
+
+async def test_log_levels(app_client):
+    summary = {"filename": "job.log", "total": 3, "counts": {"info": 2, "error": 1},
+               "histogram": [{"start": "2026-03-01T10:00:00", "counts": {"info": 2, "error": 1}}]}
+    with patch("backend.routers.logs.log_entries.summary", AsyncMock(return_value=summary)):
+        resp = await app_client.get("/api/logs/job.log/levels")
+    assert resp.status_code == 200
+    assert resp.json()["counts"] == {"info": 2, "error": 1}
+
+
+async def test_log_levels_404(app_client):
+    with patch("backend.routers.logs.log_entries.summary",
+               AsyncMock(return_value={"success": False, "error": "Log file not found"})):
+        resp = await app_client.get("/api/logs/missing.log/levels")
+    assert resp.status_code == 404
+
+
+# --- GET /api/logs/search ---
+
+
+async def test_search_logs_streams_ndjson(app_client):
+    """GET /api/logs/search streams log_search events as NDJSON."""
+    events = [
+        {"type": "match", "service": "arm", "filename": "job_1.log", "event": "rip failed"},
+        {"type": "done", "files": 1, "matched": 1, "limit_reached": False, "unavailable": []},
+    ]
+    calls = []
+
+    async def fake_search(q, level=None, since=None, limit=200):
+        calls.append((q, level, since, limit))
+        for event in events:
+            yield event
+
+    with patch("backend.routers.logs.log_search.search", fake_search):
+        resp = await app_client.get("/api/logs/search?q=failed&level=error&since=2026-03-01T00:00:00&limit=50")
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+    assert [json.loads(line) for line in resp.text.splitlines()] == events
+    assert calls == [("failed", "error", datetime(2026, 3, 1), 50)]
+
+
+async def test_search_logs_requires_query(app_client):
+    """An empty query is rejected rather than matching everything."""
+    assert (await app_client.get("/api/logs/search?q=")).status_code == 422
+
+
+# --- GET /api/logs/{filename}/window ---
+
+
+async def test_read_log_window(app_client):
+    """GET /api/logs/{filename}/window returns a line window and the line count."""
+    window = {"filename": "rip.log", "offset": 10, "total_lines": 50000, "lines": ["a", "b"]}
+    with patch("backend.routers.logs.log_index.read_window", AsyncMock(return_value=window)) as mock:
+        resp = await app_client.get("/api/logs/rip.log/window?offset=10&limit=2")
+    assert resp.status_code == 200
+    assert resp.json() == window
+    mock.assert_awaited_once_with("arm", "rip.log", 10, 2)
+
+
+async def test_read_log_window_errors(app_client):
+    """Unreachable is 502, a missing log 404, an oversized window 422."""
+    with patch("backend.routers.logs.log_index.read_window", AsyncMock(return_value=None)):
+        assert (await app_client.get("/api/logs/rip.log/window")).status_code == 502
+    with patch("backend.routers.logs.log_index.read_window",
+               AsyncMock(return_value={"success": False, "error": "Log file not found"})):
+        assert (await app_client.get("/api/logs/rip.log/window")).status_code == 404
+    assert (await app_client.get("/api/logs/rip.log/window?limit=100000")).status_code == 422
+
+
+# --- GET /api/logs/{filename}/follow ---
+
+
+async def test_follow_log_frames_events_as_sse(app_client):
+    """Follow events become named SSE frames; heartbeats become comments."""
+    snapshot = {"type": "snapshot", "entries": [{"raw": "a"}]}
+    append = {"type": "append", "entries": [{"raw": "b"}]}
+    calls = []
+
+    async def fake_subscribe(service, filename, structured=False, lines=200, heartbeat=None):
+        calls.append((service, filename, structured, lines))
+        yield snapshot
+        yield None
+        yield append
+
+    with patch("backend.routers.logs.log_follow.subscribe", fake_subscribe):
+        resp = await app_client.get("/api/logs/arm.log/follow?structured=true&lines=50")
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/event-stream")
+    assert calls == [("arm", "arm.log", True, 50)]
+    frames = [f for f in resp.text.split("\n\n") if f]
+    assert frames == [
+        f"event: snapshot\ndata: {json.dumps(snapshot)}",
+        ": keepalive",
+        f"event: append\ndata: {json.dumps(append)}",
+    ]
+
+
+async def test_follow_log_rejects_oversized_window(app_client):
+    """lines is capped at the follower's window."""
+    resp = await app_client.get("/api/logs/arm.log/follow?lines=5000")
+    assert resp.status_code == 422
+
+
+# --- GET /api/logs/archive ---
+
+
+async def test_archive_logs_streams_selected_logs(app_client):
+    arm_log = AsyncMock(return_value=None)
+    with patch("backend.routers.logs.log_archive.arm_client.stream_log_download", arm_log), \
+         patch("backend.routers.logs.log_archive.transcoder_client.read_log", new_callable=AsyncMock,
+               return_value={"content": "encode\n"}):
+        resp = await app_client.get("/api/logs/archive?arm=job_1.log&arm=job_2.log&transcoder=tc.log")
+    assert resp.status_code == 200
+    assert resp.headers["content-type"] == "application/zip"
+    assert resp.headers["content-disposition"].startswith('attachment; filename="logs-')
+    archive = zipfile.ZipFile(io.BytesIO(resp.content))
+    assert archive.read("transcoder/tc.log") == b"encode\n"
+    assert "arm/job_1.log" in archive.read("MISSING.txt").decode()
+    assert [c.args[0] for c in arm_log.await_args_list] == ["job_1.log", "job_2.log"]
+
+
+async def test_archive_logs_dedupes_selection_and_suffixes_collisions(app_client):
+    tc_log = AsyncMock(side_effect=lambda name, mode: {"content": name})
+    with patch("backend.routers.logs.log_archive.transcoder_client.read_log", tc_log):
+        resp = await app_client.get(
+            "/api/logs/archive?transcoder=a/tc.log&transcoder=a/tc.log&transcoder=b/tc.log")
+    archive = zipfile.ZipFile(io.BytesIO(resp.content))
+    assert archive.namelist() == ["transcoder/tc.log", "transcoder/tc (2).log"]
+    assert archive.read("transcoder/tc (2).log") == b"b/tc.log"
+    assert tc_log.await_count == 2
+
+
+async def test_archive_logs_requires_a_selection(app_client):
+    resp = await app_client.get("/api/logs/archive")
+    assert resp.status_code == 400
+
+
+# --- GET /api/logs/catalog ---
+
+
+async def test_log_catalog(app_client):
+    arm = [{"filename": "job_1.log", "size": 1, "modified": "2026-03-01T10:00:00"}]
+    tc = [{"filename": "tc_1.log", "size": 2, "modified": "2026-03-02T10:00:00"}]
+    with patch("backend.services.log_catalog.arm_client.list_logs", AsyncMock(return_value=arm)), \
+         patch("backend.services.log_catalog.transcoder_client.list_logs", AsyncMock(return_value=tc)):
+        resp = await app_client.get("/api/logs/catalog?limit=1")
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["total"] == 2
+    assert [(f["service"], f["filename"]) for f in data["files"]] == [("transcoder", "tc_1.log")]
+
+
+async def test_log_catalog_rejects_unknown_service(app_client):
+    resp = await app_client.get("/api/logs/catalog?service=nas")
+    assert resp.status_code == 422
+
+
+async def test_delete_log_invalidates_catalog(app_client):
+    with patch("backend.routers.logs.arm_client.delete_log", AsyncMock(return_value={"success": True})), \
+         patch("backend.routers.logs.log_catalog.invalidate") as invalidate:
+        resp = await app_client.delete("/api/logs/job_1.log")
+    assert resp.status_code == 200
+    invalidate.assert_called_once_with("arm")
@@ -3,6 +3,7 @@ pass-through to arm-neu."""
 
 from __future__ import annotations
 
+import gzip
 from unittest.mock import AsyncMock, MagicMock, patch
 
 
@@ -118,6 +119,91 @@ async def test_download_log_502_when_upstream_500(app_client):
     upstream.aclose.assert_awaited()
 
 
+def _log_upstream(body: bytes, **headers):
+    upstream = _mock_streaming_response(status_code=200)
+    upstream.headers = {"content-type": "text/plain", "content-length": str(len(body)), **headers}
+
+    async def aiter_bytes():
+        for i in range(0, len(body), 4):
+            yield body[i:i + 4]
+
+    upstream.aiter_bytes = aiter_bytes
+    return upstream
+
+
+async def test_download_log_gzip_param_sends_gz_file(app_client):
+    body = b"line\n" * 100
+    with patch("backend.routers.logs.arm_client.stream_log_download",
+               AsyncMock(return_value=_log_upstream(body))):
+        resp = await app_client.get("/api/logs/arm.log/download?gzip=1",
+                                    headers={"Accept-Encoding": "identity"})
+    assert resp.status_code == 200
+    assert resp.headers["content-type"] == "application/gzip"
+    assert resp.headers["content-disposition"] == 'attachment; filename="arm.log.gz"'
+    assert gzip.decompress(resp.content) == body
+
+
+async def test_download_log_negotiates_gzip_encoding(app_client):
+    body = b"line\n" * 100
+    with patch("backend.routers.logs.arm_client.stream_log_download",
+               AsyncMock(return_value=_log_upstream(body, etag='"v1"'))):
+        resp = await app_client.get("/api/logs/arm.log/download", headers={"Accept-Encoding": "gzip"})
+    assert resp.headers["content-encoding"] == "gzip"
+    assert "etag" not in resp.headers
+    assert resp.content == body  # httpx decodes the content-encoding
+
+
+async def test_download_log_identity_advertises_ranges(app_client):
+    with patch("backend.routers.logs.arm_client.stream_log_download",
+               AsyncMock(return_value=_log_upstream(b"0123456789"))):
+        resp = await app_client.get("/api/logs/arm.log/download", headers={"Accept-Encoding": "identity"})
+    assert resp.headers["accept-ranges"] == "bytes"
+    assert resp.headers["content-length"] == "10"
+    assert "content-encoding" not in resp.headers
+
+
+async def test_download_log_relays_upstream_partial_content(app_client):
+    upstream = _log_upstream(b"6789", **{"content-range": "bytes 6-9/10"})
+    upstream.status_code = 206
+    stream = AsyncMock(return_value=upstream)
+    with patch("backend.routers.logs.arm_client.stream_log_download", stream):
+        resp = await app_client.get("/api/logs/arm.log/download",
+                                    headers={"Range": "bytes=6-", "If-Range": '"v1"'})
+    assert resp.status_code == 206
+    assert resp.content == b"6789"
+    assert resp.headers["content-range"] == "bytes 6-9/10"
+    assert "content-encoding" not in resp.headers
+    stream.assert_awaited_once_with("arm.log", {"Range": "bytes=6-", "If-Range": '"v1"'})
+
+
+async def test_download_log_slices_when_upstream_ignores_range(app_client):
+    with patch("backend.routers.logs.arm_client.stream_log_download",
+               AsyncMock(return_value=_log_upstream(b"0123456789"))):
+        resp = await app_client.get("/api/logs/arm.log/download", headers={"Range": "bytes=3-6"})
+    assert resp.status_code == 206
+    assert resp.content == b"3456"
+    assert resp.headers["content-range"] == "bytes 3-6/10"
+    assert resp.headers["content-length"] == "4"
+
+
+async def test_download_log_stale_if_range_gets_whole_log(app_client):
+    with patch("backend.routers.logs.arm_client.stream_log_download",
+               AsyncMock(return_value=_log_upstream(b"0123456789", etag='"v2"'))):
+        resp = await app_client.get("/api/logs/arm.log/download",
+                                    headers={"Range": "bytes=3-", "If-Range": '"v1"'})
+    assert resp.status_code == 200
+    assert resp.content == b"0123456789"
+
+
+async def test_download_log_range_past_end_is_416(app_client):
+    upstream = _log_upstream(b"0123456789")
+    with patch("backend.routers.logs.arm_client.stream_log_download", AsyncMock(return_value=upstream)):
+        resp = await app_client.get("/api/logs/arm.log/download", headers={"Range": "bytes=10-"})
+    assert resp.status_code == 416
+    assert resp.headers["content-range"] == "bytes */10"
+    upstream.aclose.assert_awaited()
+
+
 async def test_list_logs_502_when_unreachable(app_client):
     with patch("backend.routers.logs.arm_client.list_logs", AsyncMock(return_value=None)):
         resp = await app_client.get("/api/logs")
@@ -402,6 +402,24 @@ async def test_clear_image_cache(app_client):
     assert resp.json()["cleared"] == 5
 
 
+async def test_metadata_cache_stats(app_client):
+    with patch("backend.routers.maintenance.metadata_disk_cache.stats", return_value={
+        "count": 3, "size_bytes": 4096, "size_mb": 0.0, "oldest": None, "path": "/tmp/m"
+    }):
+        resp = await app_client.get("/api/maintenance/metadata-cache-stats")
+    assert resp.status_code == 200
+    assert resp.json()["count"] == 3
+
+
+async def test_clear_metadata_cache(app_client):
+    with patch("backend.routers.maintenance.metadata_disk_cache.clear", return_value={
+        "success": True, "cleared": 3, "freed_bytes": 4096
+    }):
+        resp = await app_client.post("/api/maintenance/clear-metadata-cache")
+    assert resp.status_code == 200
+    assert resp.json()["cleared"] == 3
+
+
 # --- Clear raw directory ---
 
 
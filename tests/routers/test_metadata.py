@@ -7,11 +7,13 @@ ConnectError, and other network failures.
 
 from __future__ import annotations
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
 import pytest
 
+from backend.services import job_mirror
 from tests.factories import make_job_dict
 
 
@@ -49,6 +51,31 @@ class TestMetadataSearch:
         assert resp.status_code == 200
         mock_fn.assert_called_once_with("matrix", "1999", page=1)
 
+    async def test_newer_search_from_same_tab_supersedes(self, app_client):
+        async def fake(q, year, page):
+            if q == "mat":
+                await asyncio.sleep(10)
+            return []
+
+        headers = {"X-Search-Session": "tab-1"}
+        with patch("backend.routers.jobs.arm_client.search_metadata",
+                   new_callable=AsyncMock, side_effect=fake):
+            old = asyncio.create_task(
+                app_client.get("/api/metadata/search?q=mat", headers=headers))
+            await asyncio.sleep(0.05)
+            new = await app_client.get("/api/metadata/search?q=matrix", headers=headers)
+            old = await old
+        assert new.status_code == 200
+        assert old.status_code == 499
+
+    async def test_repeat_query_served_from_cache(self, app_client):
+        with patch("backend.routers.jobs.arm_client.search_metadata",
+                   new_callable=AsyncMock, return_value=[]) as mock_fn:
+            await app_client.get("/api/metadata/search?q=matrix&year=1999")
+            resp = await app_client.get("/api/metadata/search?q=Matrix&year=1999")
+        assert resp.status_code == 200
+        mock_fn.assert_awaited_once()
+
     async def test_http_status_error_passthrough(self, app_client):
         with patch("backend.routers.jobs.arm_client.search_metadata",
                    new_callable=AsyncMock, side_effect=_make_status_error(503)):
@@ -268,6 +295,32 @@ class TestCrcLookup:
             resp = await app_client.get("/api/jobs/1/crc-lookup")
         assert resp.status_code == 502
 
+    async def test_repeat_views_served_from_cache(self, app_client):
+        crc_result = {"found": True, "results": [{"title": "Matrix"}], "has_api_key": True}
+        with patch("backend.routers.jobs.arm_client.get_job_detail",
+                   new_callable=AsyncMock, return_value=_detail("abc123")) as detail, \
+             patch("backend.routers.jobs.arm_client.lookup_crc",
+                   new_callable=AsyncMock, return_value=crc_result) as lookup:
+            for _ in range(3):
+                assert (await app_client.get("/api/jobs/1/crc-lookup")).json() == crc_result
+        assert detail.await_count == 1
+        assert lookup.await_count == 1
+
+    async def test_crc_id_from_mirrored_summary(self, app_client):
+        page = {"jobs": [make_job_dict(job_id=1, crc_id="abc123")], "total": 1,
+                "page": 1, "per_page": 100, "pages": 1}
+        with patch.object(job_mirror.arm_client, "get_jobs_paginated",
+                          new_callable=AsyncMock, return_value=page):
+            assert await job_mirror.full_sync()
+        with patch("backend.routers.jobs.arm_client.get_job_detail",
+                   new_callable=AsyncMock) as detail, \
+             patch("backend.routers.jobs.arm_client.lookup_crc",
+                   new_callable=AsyncMock, return_value={"found": False, "results": []}) as lookup:
+            resp = await app_client.get("/api/jobs/1/crc-lookup")
+        assert resp.status_code == 200
+        detail.assert_not_awaited()
+        lookup.assert_awaited_once_with("abc123")
+
 
 # ---------------------------------------------------------------------------
 # GET /api/settings/test-metadata
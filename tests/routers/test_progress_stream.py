@@ -0,0 +1,25 @@
+"""Tests for GET /api/jobs/{id}/progress/stream (SSE over progress_feed)."""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import patch
+
+
+async def test_progress_stream_frames_snapshots_as_sse(app_client):
+    """Snapshots become `data:` frames; heartbeats become comment frames."""
+    snap = {"job_id": 42, "rip": {"progress": 12.5}, "transcoder": None, "error": None}
+
+    async def fake_subscribe(job_id, heartbeat=None):
+        assert job_id == 42
+        yield snap
+        yield None
+
+    with patch("backend.routers.jobs.progress_feed.subscribe", fake_subscribe):
+        resp = await app_client.get("/api/jobs/42/progress/stream")
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/event-stream")
+    assert resp.headers["cache-control"] == "no-cache"
+    frames = [f for f in resp.text.split("\n\n") if f]
+    assert frames[0] == f"data: {json.dumps(snap)}"
+    assert frames[1] == ": keepalive"
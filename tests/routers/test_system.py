@@ -56,3 +56,22 @@ async def test_eject_drive_unreachable(app_client):
     with patch("backend.routers.drives.arm_client.eject_drive", new_callable=AsyncMock, return_value=None):
         resp = await app_client.post("/api/drives/1/eject?method=toggle")
     assert resp.status_code == 502
+
+
+async def test_system_history_served_from_samples(app_client):
+    from backend.services import system_history
+
+    system_history.record("arm", {"cpu_percent": 12.5})
+    with patch("backend.routers.system.arm_client.get_system_stats", new_callable=AsyncMock) as upstream:
+        resp = await app_client.get("/api/system/history", params={"metric": "arm.cpu_percent", "range": "15m"})
+    upstream.assert_not_called()
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["step"] == 1 and body["values"] == [12.5]
+
+
+async def test_system_history_rejects_bad_params(app_client):
+    resp = await app_client.get("/api/system/history", params={"metric": "arm.nope"})
+    assert resp.status_code == 400
+    resp = await app_client.get("/api/system/history", params={"metric": "arm.cpu_percent", "range": "90d"})
+    assert resp.status_code == 400
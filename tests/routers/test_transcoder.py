@@ -186,6 +186,35 @@ async def test_list_logs_offline(app_client):
     assert resp.json() == []
 
 
+# --- GET /api/transcoder/logs/{filename}/follow ---
+
+
+async def test_follow_log_uses_transcoder_follower(app_client):
+    """The transcoder follow stream subscribes to the transcoder's log."""
+    calls = []
+
+    async def fake_subscribe(service, filename, structured=False, lines=200, heartbeat=None):
+        calls.append((service, filename, structured, lines))
+        yield {"type": "snapshot", "lines": ["x"]}
+
+    with patch("backend.routers.logs.log_follow.subscribe", fake_subscribe):
+        resp = await app_client.get("/api/transcoder/logs/transcoder.log/follow")
+    assert resp.status_code == 200
+    assert calls == [("transcoder", "transcoder.log", False, 200)]
+    assert resp.text.startswith("event: snapshot\n")
+
+
+async def test_get_log_cursor_missing_file_404(app_client):
+    """A cursor read of a file the transcoder doesn't list is a 404."""
+    with patch(
+        "backend.services.log_cursor.transcoder_client.list_logs",
+        new_callable=AsyncMock,
+        return_value=[],
+    ):
+        resp = await app_client.get("/api/transcoder/logs/gone.log?cursor=")
+    assert resp.status_code == 404
+
+
 # --- GET /api/transcoder/logs/{filename}/structured ---
 
 
@@ -213,6 +242,29 @@ async def test_get_structured_log_not_found(app_client):
     assert resp.status_code == 404
 
 
+async def test_get_structured_log_filters_locally(app_client):
+    """level/search reads come from log_entries, not the transcoder."""
+    with patch(
+        "backend.routers.transcoder.log_entries.read",
+        new_callable=AsyncMock,
+        return_value={"filename": "tc.log", "entries": [], "lines": 0},
+    ) as read:
+        resp = await app_client.get("/api/transcoder/logs/tc.log/structured?level=error")
+    assert resp.status_code == 200
+    read.assert_awaited_once_with("transcoder", "tc.log", mode="tail", lines=100, level="error", search=None)
+
+
+async def test_get_log_levels(app_client):
+    summary = {"filename": "tc.log", "total": 1, "counts": {"info": 1}, "histogram": []}
+    with patch("backend.routers.transcoder.log_entries.summary", new_callable=AsyncMock, return_value=summary):
+        resp = await app_client.get("/api/transcoder/logs/tc.log/levels")
+    assert resp.status_code == 200
+    assert resp.json()["total"] == 1
+    with patch("backend.routers.transcoder.log_entries.summary", new_callable=AsyncMock, return_value=None):
+        resp = await app_client.get("/api/transcoder/logs/tc.log/levels")
+    assert resp.status_code == 404
+
+
 # --- GET /api/transcoder/logs/{filename} ---
 
 
@@ -283,6 +283,17 @@ async def test_stream_log_download_returns_response():
     assert resp.status_code == 200
     args, kwargs = mock_client.build_request.call_args
     assert args == ("GET", "/api/v1/logs/a.log/download")
+    assert kwargs["headers"] == {"Accept-Encoding": "identity"}
+
+
+async def test_stream_log_download_forwards_range():
+    mock_client = AsyncMock(spec=httpx.AsyncClient)
+    mock_client.build_request = MagicMock(return_value=MagicMock())
+    mock_client.send = AsyncMock(return_value=MagicMock(spec=httpx.Response))
+    with patch.object(arm_client, "get_client", return_value=mock_client):
+        await arm_client.stream_log_download("a.log", {"Range": "bytes=10-"})
+    _, kwargs = mock_client.build_request.call_args
+    assert kwargs["headers"] == {"Range": "bytes=10-", "Accept-Encoding": "identity"}
 
 
 async def test_stream_log_download_handles_unreachable():
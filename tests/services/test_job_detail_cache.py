@@ -0,0 +1,110 @@
+"""Tests for backend.services.job_detail_cache - keyed job detail cache."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from backend.services import job_detail_cache
+
+
+def _detail(job_id: int = 1, status: str = "success") -> dict:
+    return {"job": {"job_id": job_id, "status": status}, "tracks": [], "config": None}
+
+
+def _patch_detail(**kwargs):
+    return patch.object(job_detail_cache.arm_client, "get_job_detail",
+                        new_callable=AsyncMock, **kwargs)
+
+
+async def test_terminal_job_served_from_cache():
+    with _patch_detail(return_value=_detail()) as mock:
+        assert await job_detail_cache.get(1) == _detail()
+        assert await job_detail_cache.get(1) == _detail()
+    assert mock.await_count == 1
+
+
+async def test_active_job_expires_quickly(monkeypatch):
+    with _patch_detail(return_value=_detail(status="video_ripping")) as mock:
+        await job_detail_cache.get(1)
+        monkeypatch.setattr(job_detail_cache, "_ACTIVE_TTL", 0.0)
+        job_detail_cache._cache[1] = (0.0, job_detail_cache._cache[1][1])
+        await job_detail_cache.get(1)
+    assert mock.await_count == 2
+
+
+@pytest.mark.parametrize("result", [None, {"success": False, "error": "Job not found"}, {}])
+async def test_failures_are_not_cached(result):
+    with _patch_detail(return_value=result) as mock:
+        assert await job_detail_cache.get(1) == result
+        assert await job_detail_cache.get(1) == result
+    assert mock.await_count == 2
+
+
+async def test_concurrent_misses_share_one_request():
+    gate = asyncio.Event()
+
+    async def slow(job_id):
+        await gate.wait()
+        return _detail(job_id)
+
+    with _patch_detail(side_effect=slow) as mock:
+        tasks = [asyncio.create_task(job_detail_cache.get(1)) for _ in range(5)]
+        await asyncio.sleep(0)
+        gate.set()
+        results = await asyncio.gather(*tasks)
+    assert mock.await_count == 1
+    assert all(r == _detail() for r in results)
+
+
+async def test_invalidate_forces_refetch():
+    with _patch_detail(return_value=_detail()) as mock:
+        await job_detail_cache.get(1)
+        job_detail_cache.invalidate(1)
+        await job_detail_cache.get(1)
+    assert mock.await_count == 2
+
+
+async def test_invalidate_during_fetch_discards_stale_payload():
+    """A write that lands mid-fetch must not be shadowed by the old payload."""
+    gate = asyncio.Event()
+
+    async def slow(job_id):
+        await gate.wait()
+        return _detail(job_id, status="fail")
+
+    with _patch_detail(side_effect=slow):
+        task = asyncio.create_task(job_detail_cache.get(1))
+        await asyncio.sleep(0)
+        job_detail_cache.invalidate(1)
+        gate.set()
+        await task
+    assert job_detail_cache.peek(1) is None
+
+
+async def test_invalidate_leaves_no_per_job_state():
+    with _patch_detail(side_effect=lambda job_id: _detail(job_id)):
+        for job_id in range(1, 50):
+            await job_detail_cache.get(job_id)
+            job_detail_cache.invalidate(job_id)
+    assert not job_detail_cache._cache and not job_detail_cache._inflight
+
+
+async def test_cancelled_caller_does_not_cancel_shared_fetch():
+    gate = asyncio.Event()
+
+    async def slow(job_id):
+        await gate.wait()
+        return _detail(job_id)
+
+    with _patch_detail(side_effect=slow) as mock:
+        first = asyncio.create_task(job_detail_cache.get(1))
+        second = asyncio.create_task(job_detail_cache.get(1))
+        await asyncio.sleep(0)
+        first.cancel()
+        gate.set()
+        assert await second == _detail()
+    assert mock.await_count == 1
+    assert job_detail_cache.peek(1) == _detail()
@@ -0,0 +1,177 @@
+"""Tests for backend.services.job_mirror - local jobs list/stats mirror."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from backend.services import job_mirror
+
+
+def _job(job_id: int, days_ago: int = 0, **overrides) -> dict:
+    start = datetime.now(timezone.utc) - timedelta(days=days_ago)
+    job = {
+        "job_id": job_id,
+        "title": f"Movie {job_id}",
+        "label": f"DISC_{job_id}",
+        "status": "success",
+        "video_type": "movie",
+        "disctype": "bluray",
+        "year": "2020",
+        "devpath": "/dev/sr0",
+        "start_time": start.isoformat(),
+    }
+    job.update(overrides)
+    return job
+
+
+def _page(jobs: list[dict], page: int = 1, pages: int = 1) -> dict:
+    return {"jobs": jobs, "total": len(jobs), "page": page, "per_page": 100, "pages": pages}
+
+
+_JOBS = [
+    _job(1, days_ago=40, title="Alien", status="success", disctype="dvd"),
+    _job(2, days_ago=10, title="Aliens", status="fail"),
+    _job(3, days_ago=2, title="Blade Runner", status="video_ripping", video_type="movie"),
+    _job(4, days_ago=1, title="The Office", status="manual_paused", video_type="series", disctype="dvd"),
+    _job(5, days_ago=0, title="Abbey Road", status="success", video_type="music", disctype="music"),
+]
+
+
+async def _warm(jobs: list[dict] = _JOBS) -> None:
+    with patch.object(
+        job_mirror.arm_client, "get_jobs_paginated",
+        new_callable=AsyncMock, return_value=_page(list(jobs)),
+    ):
+        assert await job_mirror.full_sync() is True
+
+
+def test_cold_mirror_defers_to_upstream():
+    assert job_mirror.is_warm() is False
+    assert job_mirror.query() is None
+    assert job_mirror.stats() is None
+
+
+async def test_full_sync_pages_until_exhausted():
+    first = _page([_job(i) for i in range(1, 101)], page=1, pages=2)
+    second = _page([_job(101)], page=2, pages=2)
+    mock = AsyncMock(side_effect=[first, second])
+    with patch.object(job_mirror.arm_client, "get_jobs_paginated", mock):
+        assert await job_mirror.full_sync() is True
+    assert mock.await_count == 2
+    assert job_mirror.query(per_page=100)["total"] == 101
+
+
+async def test_full_sync_dedupes_job_that_moves_pages():
+    # Job 100 is pushed onto page 2 by a new job between the two fetches.
+    first = _page([_job(i) for i in range(1, 101)], page=1, pages=2)
+    second = _page([_job(100, status="fail"), _job(101)], page=2, pages=2)
+    with patch.object(job_mirror.arm_client, "get_jobs_paginated",
+                      new_callable=AsyncMock, side_effect=[first, second]):
+        assert await job_mirror.full_sync() is True
+    data = job_mirror.query(per_page=200)
+    assert data["total"] == 101
+    assert sorted(j["job_id"] for j in data["jobs"]) == list(range(1, 102))
+    assert job_mirror.get(100)["status"] == "fail"
+    assert job_mirror.stats()["fail"] == 1
+
+
+async def test_full_sync_failure_keeps_mirror_cold():
+    with patch.object(job_mirror.arm_client, "get_jobs_paginated",
+                      new_callable=AsyncMock, return_value=None):
+        assert await job_mirror.full_sync() is False
+    assert job_mirror.is_warm() is False
+
+
+async def test_default_order_is_start_time_desc():
+    await _warm()
+    data = job_mirror.query()
+    assert [j["job_id"] for j in data["jobs"]] == [5, 4, 3, 2, 1]
+    assert data["pages"] == 1
+
+
+async def test_filters_use_indexes():
+    await _warm()
+    assert [j["job_id"] for j in job_mirror.query(disctype="dvd")["jobs"]] == [4, 1]
+    assert [j["job_id"] for j in job_mirror.query(video_type="series")["jobs"]] == [4]
+    assert [j["job_id"] for j in job_mirror.query(days=7)["jobs"]] == [5, 4, 3]
+    assert [j["job_id"] for j in job_mirror.query(search="alien")["jobs"]] == [2, 1]
+    assert [j["job_id"] for j in job_mirror.query(search="disc_3")["jobs"]] == [3]
+
+
+async def test_status_bucket_and_exact_status():
+    await _warm()
+    assert [j["job_id"] for j in job_mirror.query(status="active")["jobs"]] == [3]
+    assert [j["job_id"] for j in job_mirror.query(status="waiting")["jobs"]] == [4]
+    assert [j["job_id"] for j in job_mirror.query(status="manual_paused")["jobs"]] == [4]
+
+
+async def test_sort_and_paginate():
+    await _warm()
+    data = job_mirror.query(page=2, per_page=2, sort_by="title", sort_dir="asc")
+    assert [j["title"] for j in data["jobs"]] == ["Aliens", "Blade Runner"]
+    assert data["total"] == 5
+    assert data["pages"] == 3
+
+
+async def test_unknown_sort_field_defers_to_upstream():
+    await _warm()
+    assert job_mirror.query(sort_by="crc_id") is None
+
+
+async def test_stats_buckets_respect_filters():
+    await _warm()
+    assert job_mirror.stats() == {"total": 5, "active": 1, "success": 2, "fail": 1, "waiting": 1}
+    assert job_mirror.stats(disctype="dvd") == {
+        "total": 2, "active": 0, "success": 1, "fail": 0, "waiting": 1,
+    }
+
+
+async def test_refresh_upserts_changed_and_new_jobs():
+    await _warm()
+    recent = _page([_job(6, title="New Disc", status="identifying"),
+                    {**_JOBS[2], "status": "success"}])
+    with (
+        patch.object(job_mirror.arm_client, "get_jobs_paginated",
+                     new_callable=AsyncMock, return_value=recent),
+        patch.object(job_mirror.arm_client, "get_active_jobs",
+                     new_callable=AsyncMock, return_value={"jobs": [recent["jobs"][0]]}),
+    ):
+        assert await job_mirror.refresh() is True
+    assert job_mirror.query()["jobs"][0]["job_id"] == 6
+    assert job_mirror.stats()["success"] == 3
+    assert job_mirror.stats()["active"] == 1
+
+
+async def test_refresh_failure_reports_false():
+    await _warm()
+    with (
+        patch.object(job_mirror.arm_client, "get_jobs_paginated",
+                     new_callable=AsyncMock, return_value=None),
+        patch.object(job_mirror.arm_client, "get_active_jobs",
+                     new_callable=AsyncMock, return_value={"jobs": []}),
+    ):
+        assert await job_mirror.refresh() is False
+
+
+async def test_discard_removes_from_every_index():
+    await _warm()
+    job_mirror.query(sort_by="title", sort_dir="asc")  # populate sort cache
+    job_mirror.discard(4)
+    assert job_mirror.query(disctype="dvd")["total"] == 1
+    assert job_mirror.query(status="waiting")["total"] == 0
+    assert 4 not in [j["job_id"] for j in job_mirror.query(sort_by="title", sort_dir="asc")["jobs"]]
+
+
+async def test_stale_mirror_defers_to_upstream(monkeypatch):
+    await _warm()
+    monkeypatch.setattr(job_mirror, "_synced_at", job_mirror._synced_at - job_mirror._STALE_AFTER - 1)
+    assert job_mirror.query() is None
+
+
+@pytest.mark.parametrize("value", [None, "", "not-a-date"])
+async def test_missing_start_time_sorts_last_desc(value):
+    await _warm([_job(1), _job(2, start_time=value)])
+    assert [j["job_id"] for j in job_mirror.query()["jobs"]] == [1, 2]
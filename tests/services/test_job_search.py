@@ -0,0 +1,84 @@
+"""Tests for backend.services.job_search - trigram job title index."""
+
+from __future__ import annotations
+
+import pytest
+
+from backend.services import job_search
+
+
+def _job(job_id: int, title: str, **overrides) -> dict:
+    job = {"job_id": job_id, "title": title, "label": None, "year": None, "imdb_id": None}
+    job.update(overrides)
+    return job
+
+
+@pytest.fixture(autouse=True)
+def _index():
+    job_search.clear()
+    for job in (
+        _job(1, "Blade Runner", label="BLADE_RUNNER", year="1982", imdb_id="tt0083658"),
+        _job(2, "Blade Runner 2049", year="2017", imdb_id="tt1856101"),
+        _job(3, "Blade", year="1998"),
+        _job(4, "The Office", label="OFFICE_S01D1"),
+        _job(5, "Abbey Road", year="1969"),
+    ):
+        job_search.add(job)
+    yield
+    job_search.clear()
+
+
+def _ids(query: str, limit: int = 20) -> list[int]:
+    return [job_id for job_id, _ in job_search.search(query, limit=limit)]
+
+
+def test_exact_title_ranks_first():
+    assert _ids("blade runner")[:2] == [1, 2]
+
+
+def test_typo_still_matches():
+    assert _ids("blade runnr")[0] == 1
+
+
+def test_prefix_typeahead_on_short_input():
+    assert set(_ids("bl")) == {1, 2, 3}
+    assert _ids("abb") == [5]
+
+
+def test_matches_label_year_and_imdb_id():
+    assert _ids("s01d1") == [4]
+    assert _ids("2017")[0] == 2
+    assert _ids("tt1856101")[0] == 2
+
+
+def test_no_match_and_empty_query():
+    assert _ids("zzzz") == []
+    assert _ids("   ") == []
+
+
+def test_limit_is_applied():
+    assert len(_ids("blade", limit=2)) == 2
+
+
+def test_reindex_replaces_old_text():
+    job_search.add(_job(3, "Heat", year="1995"))
+    assert 3 not in _ids("blade")
+    assert _ids("heat") == [3]
+
+
+def test_discard_removes_postings():
+    job_search.discard(5)
+    assert _ids("abbey") == []
+    assert job_search.size() == 4
+    job_search.discard(999)  # unknown ids are a no-op
+
+
+def test_mirror_feeds_index():
+    from backend.services import job_mirror
+
+    job_mirror.reset()
+    job_mirror._insert({"job_id": 9, "title": "Heat", "start_time": None})
+    assert job_search.size() == 1
+    assert _ids("heat") == [9]
+    job_mirror.discard(9)
+    assert job_search.size() == 0
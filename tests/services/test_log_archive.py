@@ -0,0 +1,119 @@
+"""Tests for backend.services.log_archive - streamed ZIP archives."""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import zipfile
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+
+from backend.services import log_archive
+
+
+def _download(*chunks: bytes, status_code: int = 200):
+    resp = MagicMock()
+    resp.status_code = status_code
+
+    async def aiter_bytes():
+        for chunk in chunks:
+            yield chunk
+
+    resp.aiter_bytes = aiter_bytes
+    resp.aclose = AsyncMock()
+    return resp
+
+
+async def _zip(members) -> tuple[zipfile.ZipFile, list[bytes]]:
+    parts = [part async for part in log_archive.stream(members)]
+    return zipfile.ZipFile(io.BytesIO(b"".join(parts))), parts
+
+
+async def test_archive_streams_logs_and_json():
+    arm = _download(b"rip ", b"log\n" * 1000)
+    with patch.object(log_archive.arm_client, "stream_log_download", AsyncMock(return_value=arm)), \
+         patch.object(log_archive.transcoder_client, "read_log", new_callable=AsyncMock,
+                      return_value={"content": "encode log\n"}):
+        archive, parts = await _zip([
+            ("arm/job_1.log", log_archive.arm_log("job_1.log")),
+            ("transcoder/tc.log", log_archive.transcoder_log("tc.log")),
+            ("job.json", log_archive.json_member(AsyncMock(return_value={"job_id": 1}))),
+        ])
+    assert archive.testzip() is None
+    assert archive.namelist() == ["arm/job_1.log", "transcoder/tc.log", "job.json"]
+    assert archive.read("arm/job_1.log") == b"rip " + b"log\n" * 1000
+    assert archive.read("transcoder/tc.log") == b"encode log\n"
+    assert archive.read("job.json") == b'{\n  "job_id": 1\n}'
+    assert len(parts) > 1
+    arm.aclose.assert_awaited()
+
+
+async def test_unavailable_members_are_listed_in_missing_txt():
+    with patch.object(log_archive.arm_client, "stream_log_download",
+                      AsyncMock(side_effect=[None, _download(status_code=404), _download(b"ok")])), \
+         patch.object(log_archive.transcoder_client, "read_log", new_callable=AsyncMock,
+                      side_effect=httpx.ConnectError("offline")):
+        archive, _ = await _zip([
+            ("arm/a.log", log_archive.arm_log("a.log")),
+            ("arm/b.log", log_archive.arm_log("b.log")),
+            ("arm/c.log", log_archive.arm_log("c.log")),
+            ("transcoder/t.log", log_archive.transcoder_log("t.log")),
+        ])
+    assert archive.namelist() == ["arm/c.log", "MISSING.txt"]
+    assert archive.read("MISSING.txt").decode().splitlines()[1:] == ["arm/a.log", "arm/b.log", "transcoder/t.log"]
+
+
+async def test_read_error_mid_stream_keeps_archive_valid():
+    resp = _download()
+
+    async def failing():
+        yield b"partial"
+        raise httpx.ReadError("reset")
+
+    resp.aiter_bytes = failing
+    with patch.object(log_archive.arm_client, "stream_log_download", AsyncMock(return_value=resp)):
+        archive, _ = await _zip([("arm/a.log", log_archive.arm_log("a.log"))])
+    assert archive.read("arm/a.log") == b"partial"
+    assert "arm/a.log (truncated)" in archive.read("MISSING.txt").decode()
+
+
+async def test_sources_are_opened_ahead_and_closed_when_abandoned(monkeypatch):
+    monkeypatch.setattr(log_archive, "_PREFETCH", 3)
+    opened: list[str] = []
+    responses = {}
+
+    async def download(name):
+        opened.append(name)
+        responses[name] = _download(b"x" * 10)
+        return responses[name]
+
+    with patch.object(log_archive.arm_client, "stream_log_download", side_effect=download):
+        stream = log_archive.stream([(f"{i}.log", log_archive.arm_log(f"{i}.log")) for i in range(6)])
+        await stream.__anext__()
+        await asyncio.sleep(0)
+        await stream.aclose()
+    assert opened == ["0.log", "1.log", "2.log"]
+    assert all(resp.aclose.await_count for resp in responses.values())
+
+
+async def test_colliding_names_get_a_suffix():
+    json_of = lambda n: log_archive.json_member(AsyncMock(return_value=n))  # noqa: E731
+    archive, _ = await _zip([
+        ("arm/job.log", json_of(1)),
+        ("arm/job.log", json_of(2)),
+        ("arm/job (2).log", json_of(3)),
+        ("arm/job.log", json_of(4)),
+        ("arm/README", json_of(5)),
+        ("arm/README", json_of(6)),
+    ])
+    assert archive.namelist() == [
+        "arm/job.log", "arm/job (2).log", "arm/job (2) (2).log", "arm/job (3).log",
+        "arm/README", "arm/README (2)",
+    ]
+    assert archive.read("arm/job (3).log") == b"4"
+
+
+def test_entry_name_drops_upstream_directories():
+    assert log_archive.entry_name("arm", "../../etc/passwd") == "arm/passwd"
+    assert log_archive.entry_name("logs/arm", "a\\b.log") == "logs/arm/b.log"
@@ -0,0 +1,123 @@
+"""Tests for backend.services.log_catalog - merged, cached log listing."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from backend.services import log_catalog
+
+ARM = [
+    {"filename": "job_1.log", "size": 10, "modified": "2026-03-01T10:00:00"},
+    {"filename": "job_2.log", "size": 20, "modified": "2026-03-03T10:00:00"},
+    {"filename": "arm.log", "size": 30, "modified": "2026-03-05T10:00:00+00:00"},
+]
+TC = [{"filename": "transcode_2.log", "size": 5, "modified": "2026-03-04T10:00:00"}]
+
+
+def _patches(arm=ARM, tc=TC):
+    return (
+        patch.object(log_catalog.arm_client, "list_logs", new_callable=AsyncMock, return_value=arm),
+        patch.object(log_catalog.transcoder_client, "list_logs", new_callable=AsyncMock, return_value=tc),
+    )
+
+
+async def test_merges_both_services_newest_first():
+    arm, tc = _patches()
+    with arm, tc:
+        result = await log_catalog.page()
+    assert [(f["service"], f["filename"]) for f in result["files"]] == [
+        ("arm", "arm.log"), ("transcoder", "transcode_2.log"), ("arm", "job_2.log"), ("arm", "job_1.log"),
+    ]
+    assert result["total"] == 4 and result["unavailable"] == []
+
+
+async def test_pages_and_filters_by_name():
+    arm, tc = _patches()
+    with arm, tc:
+        filtered = await log_catalog.page(q="_2", limit=1)
+        second = await log_catalog.page(q="_2", offset=1, limit=1)
+        arm_only = await log_catalog.page(service="arm", q="JOB")
+    assert filtered["total"] == 2
+    assert [f["filename"] for f in filtered["files"]] == ["transcode_2.log"]
+    assert [f["filename"] for f in second["files"]] == ["job_2.log"]
+    assert [f["filename"] for f in arm_only["files"]] == ["job_2.log", "job_1.log"]
+
+
+async def test_listings_are_cached_until_invalidated():
+    arm, tc = _patches()
+    with arm as arm_list, tc as tc_list:
+        await log_catalog.page()
+        await log_catalog.page(q="job")
+        assert (arm_list.await_count, tc_list.await_count) == (1, 1)
+        log_catalog.invalidate("arm")
+        await log_catalog.page()
+    assert (arm_list.await_count, tc_list.await_count) == (2, 1)
+
+
+async def test_concurrent_misses_share_one_fetch():
+    release = asyncio.Event()
+
+    async def slow():
+        await release.wait()
+        return ARM
+
+    with patch.object(log_catalog.arm_client, "list_logs", side_effect=slow) as arm_list:
+        waiters = [asyncio.ensure_future(log_catalog.listing("arm")) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*waiters)
+    assert arm_list.await_count == 1
+    assert all(r == ARM for r in results)
+
+
+async def test_fetch_started_before_invalidate_is_not_cached():
+    release = asyncio.Event()
+
+    async def slow():
+        await release.wait()
+        return ARM
+
+    with patch.object(log_catalog.arm_client, "list_logs", side_effect=slow):
+        pending = asyncio.ensure_future(log_catalog.listing("arm"))
+        await asyncio.sleep(0)
+        log_catalog.invalidate("arm")
+        release.set()
+        await pending
+    assert "arm" not in log_catalog._cache
+
+
+async def test_unreachable_service_is_reported_and_not_cached():
+    arm, tc = _patches(tc=None)
+    with arm, tc as tc_list:
+        result = await log_catalog.page()
+        await log_catalog.page()
+    assert result["unavailable"] == ["transcoder"]
+    assert result["total"] == 3
+    assert tc_list.await_count == 2
+
+
+async def test_transcoder_disabled(monkeypatch):
+    monkeypatch.setattr(log_catalog.settings, "transcoder_enabled", False)
+    arm, tc = _patches()
+    with arm, tc as tc_list:
+        result = await log_catalog.page()
+    assert {f["service"] for f in result["files"]} == {"arm"}
+    tc_list.assert_not_awaited()
+
+
+async def test_lookup_shares_a_recent_listing():
+    with patch.object(log_catalog.arm_client, "list_logs", new_callable=AsyncMock, return_value=ARM) as arm_list:
+        assert (await log_catalog.lookup("arm", "job_1.log"))["size"] == 10
+        assert (await log_catalog.lookup("arm", "job_2.log"))["size"] == 20
+        with pytest.raises(log_catalog.LogUnavailable) as missing:
+            await log_catalog.lookup("arm", "gone.log")
+    assert arm_list.await_count == 1
+    assert missing.value.result == log_catalog.NOT_FOUND
+    with patch.object(log_catalog.arm_client, "list_logs", new_callable=AsyncMock, return_value=None):
+        log_catalog.invalidate("arm")
+        with pytest.raises(log_catalog.LogUnavailable) as offline:
+            await log_catalog.lookup("arm", "job_1.log")
+    assert offline.value.result is None
@@ -0,0 +1,127 @@
+"""Tests for backend.services.log_cursor - incremental reads by cursor."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from backend.services import log_catalog, log_cursor
+
+
+@pytest.fixture(autouse=True)
+def _fresh_listings(monkeypatch):
+    # These tests change the listing between back-to-back reads.
+    monkeypatch.setattr(log_catalog, "_LOOKUP_MAX_AGE", 0.0)
+
+
+class FakeLog:
+    """A growing log behind arm_client.list_logs/read_log."""
+
+    def __init__(self, *lines: str):
+        self.lines = list(lines)
+        self.reads: list[int] = []
+
+    @property
+    def size(self) -> int:
+        return sum(len(line) + 1 for line in self.lines)
+
+    async def list_logs(self):
+        return [{"filename": "job.log", "size": self.size, "modified": "2026-01-01T00:00:00"}]
+
+    async def read_log(self, filename, mode="tail", lines=100):
+        self.reads.append(lines)
+        tail = self.lines[-lines:]
+        return {"filename": filename, "content": "\n".join(tail), "lines": len(tail)}
+
+
+@pytest.fixture
+def fake_log():
+    log = FakeLog("one", "two", "three")
+    with patch.object(log_cursor.arm_client, "list_logs", side_effect=log.list_logs), \
+         patch.object(log_cursor.arm_client, "read_log", side_effect=log.read_log):
+        yield log
+
+
+async def _read(cursor=None, lines=100):
+    return await log_cursor.read_items("arm", "job.log", lines=lines, cursor=cursor)
+
+
+async def test_cursor_returns_only_appended_lines(fake_log):
+    first = await _read()
+    assert first.items == ["one", "two", "three"] and not first.reset
+    fake_log.lines += ["four", "five"]
+    second = await _read(first.cursor)
+    assert second.items == ["four", "five"] and not second.reset
+    third = await _read(second.cursor)
+    assert third.items == [] and third.cursor == second.cursor
+
+
+async def test_idle_file_is_answered_from_the_listing(fake_log):
+    first = await _read()
+    await _read(first.cursor)
+    # A fresh tail of an unchanged file comes from the cached window too.
+    await _read(lines=2)
+    assert fake_log.reads == [100]
+
+
+async def test_repeated_lines_are_told_apart_by_size(fake_log):
+    fake_log.lines = ["tick", "tick"]
+    first = await _read()
+    fake_log.lines += ["tick"]
+    assert (await _read(first.cursor)).items == ["tick"]
+
+
+async def test_delta_read_is_sized_from_line_length(fake_log):
+    fake_log.lines = [f"line {i:04d}" for i in range(5000)]
+    first = await _read()
+    fake_log.lines += [f"line {i:04d}" for i in range(5000, 5003)]
+    second = await _read(first.cursor)
+    assert second.items == ["line 5000", "line 5001", "line 5002"]
+    assert fake_log.reads[-1] < 20
+
+
+async def test_truncation_resets(fake_log):
+    first = await _read()
+    fake_log.lines = ["fresh"]
+    result = await _read(first.cursor)
+    assert result.reset and result.items == ["fresh"]
+
+
+async def test_rotation_to_a_larger_file_resets(fake_log):
+    first = await _read()
+    fake_log.lines = [f"rotated {i}" for i in range(10)]
+    result = await _read(first.cursor)
+    assert result.reset and result.items[-1] == "rotated 9"
+
+
+async def test_unknown_cursor_resets(fake_log):
+    result = await _read("not-a-cursor")
+    assert result.reset and result.items == ["one", "two", "three"]
+
+
+async def test_cursor_on_empty_file_picks_up_everything(fake_log):
+    fake_log.lines = []
+    first = await _read()
+    fake_log.lines = ["a", "b"]
+    result = await _read(first.cursor)
+    assert result.items == ["a", "b"] and not result.reset
+
+
+async def test_missing_and_unreachable():
+    with patch.object(log_cursor.arm_client, "list_logs", new_callable=AsyncMock, return_value=[]):
+        assert (await _read())["success"] is False
+    with patch.object(log_cursor.transcoder_client, "list_logs", new_callable=AsyncMock, return_value=None):
+        assert await log_cursor.read_items("transcoder", "tc.log") is None
+
+
+async def test_structured_read_shape():
+    entries = [{"raw": "2026 INFO a", "event": "a"}]
+    with patch.object(log_cursor.transcoder_client, "list_logs", new_callable=AsyncMock,
+                      return_value=[{"filename": "tc.log", "size": 12}]), \
+         patch.object(log_cursor.transcoder_client, "read_structured_log", new_callable=AsyncMock,
+                      return_value={"filename": "tc.log", "entries": entries, "lines": 1}):
+        body = await log_cursor.read("transcoder", "tc.log", structured=True, cursor="")
+    assert body["entries"] == entries
+    assert body["lines"] == 1 and body["reset"] is False
+    assert log_cursor.decode_cursor(body["cursor"])[0] == 12
@@ -0,0 +1,106 @@
+"""Tests for backend.services.log_download - ranges and gzip for log downloads."""
+
+from __future__ import annotations
+
+import gzip
+import json
+
+import pytest
+
+from backend.services import log_download
+from backend.services.log_download import ByteRange, RangeNotSatisfiable
+
+
+async def _chunks(*parts: bytes):
+    for part in parts:
+        yield part
+
+
+async def _join(stream) -> bytes:
+    return b"".join([chunk async for chunk in stream])
+
+
+@pytest.mark.parametrize(("header", "expected"), [
+    ("bytes=0-9", ByteRange(0, 9)),
+    ("bytes=90-", ByteRange(90, 99)),
+    ("bytes=90-500", ByteRange(90, 99)),
+    ("bytes=-10", ByteRange(90, 99)),
+    ("bytes=-500", ByteRange(0, 99)),
+    (None, None),
+    ("bytes=0-1,5-6", None),
+    ("items=0-1", None),
+    ("bytes=9-2", None),
+    ("bytes=abc-", None),
+])
+def test_parse_range(header, expected):
+    assert log_download.parse_range(header, 100) == expected
+
+
+@pytest.mark.parametrize("header", ["bytes=100-", "bytes=-0"])
+def test_parse_range_unsatisfiable(header):
+    with pytest.raises(RangeNotSatisfiable):
+        log_download.parse_range(header, 100)
+
+
+def test_content_range():
+    assert ByteRange(90, 99).content_range(100) == "bytes 90-99/100"
+    assert ByteRange(90, 99).length == 10
+
+
+@pytest.mark.parametrize(("header", "expected"), [
+    ("gzip, deflate, br", True),
+    ("br;q=1.0, gzip;q=0.5", True),
+    ("*", True),
+    ("gzip;q=0", False),
+    ("identity", False),
+    (None, False),
+])
+def test_accepts_gzip(header, expected):
+    assert log_download.accepts_gzip(header) is expected
+
+
+async def test_sliced_spans_chunk_boundaries():
+    stream = _chunks(b"0123", b"4567", b"89ab")
+    assert await _join(log_download.sliced(stream, ByteRange(3, 9))) == b"3456789"
+
+
+async def test_sliced_stops_reading_after_the_range():
+    read: list[bytes] = []
+
+    async def chunks():
+        for part in (b"0123", b"4567", b"89ab"):
+            read.append(part)
+            yield part
+
+    assert await _join(log_download.sliced(chunks(), ByteRange(0, 1))) == b"01"
+    assert read == [b"0123"]
+
+
+async def test_gzipped_round_trips():
+    parts = [f"line {i}\n".encode() * 50 for i in range(20)]
+    compressed = await _join(log_download.gzipped(_chunks(*parts)))
+    assert gzip.decompress(compressed) == b"".join(parts)
+    assert len(compressed) < len(b"".join(parts))
+
+
+_CONTENT = 'rip \u00e9 \U0001f600 "quoted" \\ tab\there\n\x01ctl\nend'
+
+
+@pytest.mark.parametrize("ensure_ascii", [True, False])
+@pytest.mark.parametrize("size", [1, 3, 64])
+async def test_json_string_field_decodes_across_chunk_boundaries(ensure_ascii, size):
+    body = json.dumps({"filename": 'a{"b"}', "meta": {"x": [1, "]", None]}, "n": -1.5e3,
+                       "content": _CONTENT, "lines": 2}, ensure_ascii=ensure_ascii).encode()
+    parts = [body[i:i + size] for i in range(0, len(body), size)]
+    assert await _join(log_download.json_string_field(_chunks(*parts), "content")) == _CONTENT.encode()
+
+
+@pytest.mark.parametrize("body", [b'{"lines": 2}', b'{"content": null}', b"{}"])
+async def test_json_string_field_absent_is_empty(body):
+    assert await _join(log_download.json_string_field(_chunks(body), "content")) == b""
+
+
+@pytest.mark.parametrize("body", [b"[1]", b'{"content": "cut', b""])
+async def test_json_string_field_rejects_malformed_body(body):
+    with pytest.raises(ValueError):
+        await _join(log_download.json_string_field(_chunks(body), "content"))
@@ -0,0 +1,152 @@
+"""Tests for backend.services.log_entries - cached structured log entries."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from backend.services import log_catalog, log_entries
+
+
+@pytest.fixture(autouse=True)
+def _fresh_listings(monkeypatch):
+    # These tests change the listing between back-to-back reads.
+    monkeypatch.setattr(log_catalog, "_LOOKUP_MAX_AGE", 0.0)
+
+
+def _e(ts: str, level: str, event: str) -> dict:
+    return {"timestamp": ts, "level": level, "logger": "arm", "event": event, "raw": f"{ts} {level} {event}"}
+
+
+ENTRIES = [
+    _e("2026-03-01T10:00:00", "INFO", "Starting rip"),
+    _e("2026-03-01T10:30:00", "ERROR", "MakeMKV failed"),
+    _e("2026-03-01T11:00:00", "INFO", "Retrying"),
+    _e("2026-03-01T12:00:00", "ERROR", "Rip failed again"),
+]
+LISTING = [{"filename": "job.log", "size": 100, "modified": "2026-03-01T12:00:00"}]
+
+
+def _patches(listing=LISTING, entries=ENTRIES):
+    return (
+        patch.object(log_entries.arm_client, "list_logs", new_callable=AsyncMock, return_value=listing),
+        patch.object(log_entries.arm_client, "read_log_structured", new_callable=AsyncMock,
+                     return_value={"filename": "job.log", "entries": entries, "lines": len(entries)}),
+    )
+
+
+async def test_filters_run_against_one_upstream_read():
+    listing, read = _patches()
+    with listing, read as upstream:
+        errors = await log_entries.read("arm", "job.log", level="error")
+        searched = await log_entries.read("arm", "job.log", search="RETRY")
+        both = await log_entries.read("arm", "job.log", level="ERROR", search="again")
+    upstream.assert_awaited_once_with("job.log", mode="full", lines=log_entries.MAX_READ_LINES)
+    assert [e["event"] for e in errors["entries"]] == ["MakeMKV failed", "Rip failed again"]
+    assert [e["event"] for e in searched["entries"]] == ["Retrying"]
+    assert both["lines"] == 1
+
+
+async def test_tail_keeps_the_last_matches():
+    listing, read = _patches()
+    with listing, read:
+        tail = await log_entries.read("arm", "job.log", mode="tail", lines=1, level="info")
+        full = await log_entries.read("arm", "job.log", mode="full", lines=1, level="info")
+    assert [e["event"] for e in tail["entries"]] == ["Retrying"]
+    assert full["lines"] == 2
+
+
+async def test_changed_log_is_reread(monkeypatch):
+    monkeypatch.setattr(log_entries, "_MIN_REFRESH", 0)
+    listing, read = _patches()
+    with listing as list_logs, read as upstream:
+        await log_entries.read("arm", "job.log", level="info")
+        list_logs.return_value = [{**LISTING[0], "size": 200}]
+        await log_entries.read("arm", "job.log", level="info")
+        await log_entries.read("arm", "job.log", level="info")
+    assert upstream.await_count == 2
+
+
+async def test_missing_and_unreachable():
+    listing, read = _patches(listing=[])
+    with listing, read:
+        assert await log_entries.read("arm", "job.log") == {"success": False, "error": "Log file not found"}
+    listing, read = _patches(listing=None)
+    with listing, read:
+        assert await log_entries.read("arm", "job.log") is None
+
+
+async def test_transcoder_logs_use_the_transcoder_client():
+    with patch.object(log_entries.transcoder_client, "list_logs", new_callable=AsyncMock,
+                      return_value=[{"filename": "tc.log", "size": 1, "modified": "x"}]), \
+         patch.object(log_entries.transcoder_client, "read_structured_log", new_callable=AsyncMock,
+                      return_value={"entries": ENTRIES}):
+        result = await log_entries.read("transcoder", "tc.log", level="error")
+    assert result["lines"] == 2
+
+
+async def test_summary_counts_and_histogram():
+    listing, read = _patches()
+    with listing, read:
+        summary = await log_entries.summary("arm", "job.log")
+    assert summary["total"] == 4
+    assert summary["counts"] == {"info": 2, "error": 2}
+    histogram = summary["histogram"]
+    assert len(histogram) == log_entries._BUCKETS
+    assert histogram[0] == {"start": "2026-03-01T10:00:00", "counts": {"info": 1}}
+    assert histogram[-1]["counts"] == {"error": 1}
+    assert sum(sum(b["counts"].values()) for b in histogram) == 4
+
+
+async def test_histogram_with_a_single_timestamp():
+    listing, read = _patches(entries=[_e("2026-03-01T10:00:00", "INFO", "a"), _e("bad", "INFO", "b")])
+    with listing, read:
+        summary = await log_entries.summary("arm", "job.log")
+    assert summary["histogram"] == [{"start": "2026-03-01T10:00:00", "counts": {"info": 1}}]
+
+
+async def test_evicts_least_recently_used_over_budget(monkeypatch):
+    one_log = sum(log_entries._ENTRY_OVERHEAD + 2 * len(e["raw"]) for e in ENTRIES)
+    monkeypatch.setattr(log_entries, "_MAX_BYTES", 2 * one_log)
+    listing = [{"filename": name, "size": 1, "modified": "x"} for name in ("a.log", "b.log", "c.log")]
+    with patch.object(log_entries.arm_client, "list_logs", new_callable=AsyncMock, return_value=listing), \
+         patch.object(log_entries.arm_client, "read_log_structured", new_callable=AsyncMock,
+                      return_value={"entries": ENTRIES}):
+        for name in ("a.log", "b.log", "a.log", "c.log"):
+            await log_entries.read("arm", name)
+    assert list(log_entries._cache) == [("arm", "a.log"), ("arm", "c.log")]
+
+
+async def test_forget_drops_the_cached_parse():
+    listing, read = _patches()
+    with listing, read as upstream:
+        await log_entries.read("arm", "job.log")
+        log_entries.forget("arm", "job.log")
+        await log_entries.read("arm", "job.log")
+    assert upstream.await_count == 2
+
+
+async def test_large_listed_log_is_filtered_upstream():
+    listing, read = _patches(listing=[{**LISTING[0], "size": log_entries._MAX_LOG_SIZE + 1}])
+    with listing, read as upstream:
+        await log_entries.read("arm", "job.log", level="error", lines=50)
+    upstream.assert_awaited_once_with("job.log", mode="tail", lines=50, level="error", search=None)
+    assert not log_entries._cache
+
+
+async def test_log_parsed_over_budget_is_not_reread_whole(monkeypatch):
+    monkeypatch.setattr(log_entries, "_MAX_BYTES", 100)
+    listing, read = _patches()
+    with listing as list_logs, read as upstream:
+        first = await log_entries.read("arm", "job.log", level="error")
+        await log_entries.read("arm", "job.log", search="retry")
+        # The log shrank (rotated): it's measured again with a full read.
+        list_logs.return_value = [{**LISTING[0], "size": 50}]
+        await log_entries.read("arm", "job.log", search="retry")
+    assert first["lines"] == 2  # served from the read that measured it
+    assert [c.kwargs for c in upstream.await_args_list] == [
+        {"mode": "full", "lines": log_entries.MAX_READ_LINES},
+        {"mode": "tail", "lines": 100, "level": None, "search": "retry"},
+        {"mode": "full", "lines": log_entries.MAX_READ_LINES},
+    ]
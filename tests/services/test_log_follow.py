@@ -0,0 +1,94 @@
+"""Tests for backend.services.log_follow - shared tail -f followers."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from backend.services import log_cursor, log_follow
+
+
+@pytest.fixture(autouse=True)
+def _fast_poll(monkeypatch):
+    monkeypatch.setattr(log_follow, "_POLL_INTERVAL", 0.01)
+    yield
+    for task in list(log_follow._pollers.values()):
+        task.cancel()
+    log_follow._pollers.clear()
+    log_follow._subscribers.clear()
+    log_follow._windows.clear()
+    log_follow._cursors.clear()
+    log_follow._errors.clear()
+
+
+def _read(items: list, cursor: str = "c", reset: bool = False) -> log_cursor.Read:
+    return log_cursor.Read(items, cursor, reset)
+
+
+async def _take(agen, n: int) -> list:
+    return [await agen.__anext__() for _ in range(n)]
+
+
+async def test_followers_share_one_poller_and_get_only_new_lines():
+    reads = [_read(["a", "b"], "c1"), _read([], "c1"), _read(["c"], "c2"), _read(["q"], "c3", reset=True)]
+    mock = AsyncMock(side_effect=lambda *a, **k: reads.pop(0) if reads else _read([], "c3"))
+    with patch.object(log_follow.log_cursor, "read_items", mock):
+        first = log_follow.subscribe("arm", "job.log", lines=1)
+        second = log_follow.subscribe("arm", "job.log")
+        assert await first.__anext__() == {"type": "snapshot", "lines": ["b"]}
+        assert await second.__anext__() == {"type": "snapshot", "lines": ["a", "b"]}
+        assert log_follow.active_followers() == {("arm", "job.log", False): 2}
+        assert await _take(first, 2) == [{"type": "append", "lines": ["c"]},
+                                          {"type": "reset", "lines": ["q"]}]
+        assert await _take(second, 2) == [{"type": "append", "lines": ["c"]},
+                                           {"type": "reset", "lines": ["q"]}]
+        await first.aclose()
+        await second.aclose()
+    # Each tick continues from the cursor the previous one returned.
+    assert [c.kwargs["cursor"] for c in mock.await_args_list[:4]] == [None, "c1", "c1", "c2"]
+    assert log_follow.active_followers() == {}
+    assert log_follow._pollers == {}
+
+
+async def test_transcoder_structured_follow_and_errors():
+    entries = [{"raw": "1", "event": "one"}]
+    mock = AsyncMock(side_effect=[None, None, _read(entries)])
+    with patch.object(log_follow.log_cursor, "read_items", mock):
+        stream = log_follow.subscribe("transcoder", "tc.log", structured=True)
+        assert await stream.__anext__() == {"type": "error", "detail": "Transcoder offline"}
+        # The repeated failure isn't re-sent; recovery arrives as a snapshot.
+        assert await stream.__anext__() == {"type": "snapshot", "entries": entries}
+        await stream.aclose()
+    assert mock.await_args.args == ("transcoder", "tc.log")
+    assert mock.await_args.kwargs == {"structured": True, "lines": log_follow.WINDOW, "cursor": None}
+
+
+async def test_heartbeat_when_idle():
+    reads = [_read(["a"])]
+    with patch.object(log_follow.log_cursor, "read_items",
+                      side_effect=lambda *a, **k: reads.pop() if reads else _read([])):
+        stream = log_follow.subscribe("arm", "job.log", heartbeat=0.05)
+        assert (await stream.__anext__())["type"] == "snapshot"
+        assert await stream.__anext__() is None
+        await stream.aclose()
+
+
+async def test_slow_subscriber_is_reset(monkeypatch):
+    monkeypatch.setattr(log_follow, "_QUEUE_SIZE", 1)
+    count = 0
+
+    async def grow(*args, **kwargs):
+        nonlocal count
+        count += 1
+        return _read([str(count)])
+
+    with patch.object(log_follow.log_cursor, "read_items", side_effect=grow):
+        stream = log_follow.subscribe("arm", "job.log")
+        await stream.__anext__()
+        await asyncio.sleep(0.1)
+        event = await stream.__anext__()
+        await stream.aclose()
+    assert event["type"] == "reset"
+    assert len(event["lines"]) > 2
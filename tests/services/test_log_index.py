@@ -0,0 +1,161 @@
+"""Tests for backend.services.log_index - windowed reads over spooled logs."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from backend.services import log_catalog, log_index
+
+
+@pytest.fixture(autouse=True)
+def _fresh_listings(monkeypatch):
+    # These tests change the listing between back-to-back reads.
+    monkeypatch.setattr(log_catalog, "_LOOKUP_MAX_AGE", 0.0)
+
+
+def _download(body: bytes, status: int = 200, chunk: int = 37, headers: dict | None = None):
+    resp = MagicMock()
+    resp.status_code = status
+    resp.headers = headers or {}
+
+    async def aiter_bytes():
+        for i in range(0, len(body), chunk):
+            yield body[i:i + chunk]
+
+    resp.aiter_bytes = aiter_bytes
+    resp.aclose = AsyncMock()
+    return resp
+
+
+def _listing(size: int, modified: str = "2026-01-01T00:00:00"):
+    return [{"filename": "rip.log", "size": size, "modified": modified}]
+
+
+@pytest.fixture(autouse=True)
+def _small_stride(monkeypatch):
+    monkeypatch.setattr(log_index, "_STRIDE", 10)
+
+
+@pytest.mark.parametrize("chunk", [1, 7, 4096])
+def test_indexer_checkpoints_every_stride_lines(chunk):
+    body = b"".join(f"line {i}\n".encode() for i in range(35))
+    indexer = log_index._Indexer()
+    for i in range(0, len(body), chunk):
+        indexer.feed(body[i:i + chunk])
+    assert indexer.total_lines == 35
+    assert list(indexer.checkpoints) == [body.index(f"line {n}\n".encode()) for n in (0, 10, 20, 30)]
+
+
+def test_indexer_counts_unterminated_last_line():
+    indexer = log_index._Indexer()
+    indexer.feed(b"a\nb\npartial")
+    assert indexer.total_lines == 3
+
+
+async def test_window_reads_any_offset_and_reuses_spool():
+    body = "".join(f"line {i}\r\n" for i in range(95)).encode()
+    stream = AsyncMock(side_effect=lambda name, headers=None: _download(body))
+    with patch.object(log_index.arm_client, "list_logs", new_callable=AsyncMock, return_value=_listing(len(body))), \
+         patch.object(log_index.arm_client, "stream_log_download", stream):
+        first = await log_index.read_window("arm", "rip.log", 23, 4)
+        last = await log_index.read_window("arm", "rip.log", 90, 50)
+        past = await log_index.read_window("arm", "rip.log", 500, 10)
+    assert first == {"filename": "rip.log", "offset": 23, "total_lines": 95,
+                     "lines": ["line 23", "line 24", "line 25", "line 26"]}
+    assert last["lines"] == [f"line {i}" for i in range(90, 95)]
+    assert past["lines"] == []
+    stream.assert_awaited_once()
+    assert log_index._locks == {}
+
+
+async def test_grown_log_is_appended_after_grace(monkeypatch):
+    body = b"".join(f"line {i}\n".encode() for i in range(25))
+    grown = body + b"".join(f"line {i}\n".encode() for i in range(25, 42))
+    stream = AsyncMock(side_effect=[
+        _download(body[:-3]),  # spooled mid-line
+        _download(grown[len(body) - 3:], status=206,
+                  headers={"content-range": f"bytes {len(body) - 3}-{len(grown) - 1}/{len(grown)}"}),
+    ])
+    listing = AsyncMock(side_effect=[_listing(len(body) - 3), _listing(len(grown), "later"),
+                                     _listing(len(grown), "later")])
+    with patch.object(log_index.arm_client, "list_logs", listing), \
+         patch.object(log_index.arm_client, "stream_log_download", stream):
+        assert (await log_index.read_window("arm", "rip.log", 0, 10))["total_lines"] == 25
+        # Within the grace period the existing copy is served.
+        assert (await log_index.read_window("arm", "rip.log", 0, 10))["total_lines"] == 25
+        monkeypatch.setattr(log_index, "_MIN_RESPOOL", 0.0)
+        result = await log_index.read_window("arm", "rip.log", 24, 50)
+    assert result["total_lines"] == 42
+    assert result["lines"] == [f"line {i}" for i in range(24, 42)]
+    assert stream.await_args_list[1].kwargs == {"headers": {"Range": f"bytes={len(body) - 3}-"}}
+    assert log_index._spools[("arm", "rip.log")].path.read_bytes() == grown
+
+
+@pytest.mark.parametrize("reply", [
+    lambda: _download(b"b\nb\nc\n"),  # Range ignored
+    lambda: _download(b"", status=416),
+])
+async def test_log_is_respooled_when_range_cannot_be_appended(monkeypatch, reply):
+    monkeypatch.setattr(log_index, "_MIN_RESPOOL", 0.0)
+    stream = AsyncMock(side_effect=[_download(b"a\n"), reply(), _download(b"b\nb\nc\n")])
+    listing = AsyncMock(side_effect=[_listing(2), _listing(6, "later")])
+    with patch.object(log_index.arm_client, "list_logs", listing), \
+         patch.object(log_index.arm_client, "stream_log_download", stream):
+        await log_index.read_window("arm", "rip.log", 0, 10)
+        assert (await log_index.read_window("arm", "rip.log", 0, 10))["lines"] == ["b", "b", "c"]
+    assert stream.await_args_list[2].kwargs == {}
+
+
+async def test_shrunk_log_is_respooled_without_range(monkeypatch):
+    monkeypatch.setattr(log_index, "_MIN_RESPOOL", 0.0)
+    stream = AsyncMock(side_effect=[_download(b"a\nb\n"), _download(b"c\n")])
+    listing = AsyncMock(side_effect=[_listing(4), _listing(2, "rotated")])
+    with patch.object(log_index.arm_client, "list_logs", listing), \
+         patch.object(log_index.arm_client, "stream_log_download", stream):
+        await log_index.read_window("arm", "rip.log", 0, 10)
+        assert (await log_index.read_window("arm", "rip.log", 0, 10))["lines"] == ["c"]
+    assert stream.await_args_list[1].kwargs == {}
+
+
+async def test_spools_are_evicted_past_the_byte_cap(monkeypatch):
+    monkeypatch.setattr(log_index, "_MAX_SPOOL_BYTES", 10)
+    logs = [{"filename": name, "size": 6, "modified": "x"} for name in ("a.log", "b.log")]
+    with patch.object(log_index.arm_client, "list_logs", new_callable=AsyncMock, return_value=logs), \
+         patch.object(log_index.arm_client, "stream_log_download",
+                      AsyncMock(side_effect=lambda name: _download(b"1\n2\n3\n"))):
+        await log_index.read_window("arm", "a.log", 0, 1)
+        first = log_index._spools[("arm", "a.log")].path
+        await log_index.read_window("arm", "b.log", 0, 1)
+    assert list(log_index._spools) == [("arm", "b.log")]
+    assert not first.exists()
+
+
+async def test_transcoder_log_is_spooled_from_streamed_full_read():
+    body = b'{"filename": "tc.log", "content": "x\\ny\\n", "lines": 2}'
+    with patch.object(log_index.transcoder_client, "list_logs", new_callable=AsyncMock,
+                      return_value=[{"filename": "tc.log", "size": 4, "modified": "x"}]), \
+         patch.object(log_index.transcoder_client, "stream_log", new_callable=AsyncMock,
+                      return_value=_download(body, chunk=5)) as read:
+        result = await log_index.read_window("transcoder", "tc.log", 1, 5)
+    assert result["lines"] == ["y"]
+    read.assert_awaited_once_with("tc.log")
+
+
+async def test_missing_and_unreachable():
+    with patch.object(log_index.arm_client, "list_logs", new_callable=AsyncMock, return_value=[]):
+        assert (await log_index.read_window("arm", "rip.log", 0, 10))["success"] is False
+    with patch.object(log_index.arm_client, "list_logs", new_callable=AsyncMock, return_value=_listing(2)), \
+         patch.object(log_index.arm_client, "stream_log_download", new_callable=AsyncMock, return_value=None):
+        assert await log_index.read_window("arm", "rip.log", 0, 10) is None
+
+
+async def test_forget_removes_spool_file():
+    with patch.object(log_index.arm_client, "list_logs", new_callable=AsyncMock, return_value=_listing(2)), \
+         patch.object(log_index.arm_client, "stream_log_download", AsyncMock(side_effect=lambda n: _download(b"a\n"))):
+        await log_index.read_window("arm", "rip.log", 0, 1)
+    path = log_index._spools[("arm", "rip.log")].path
+    assert path.exists()
+    log_index.forget("arm", "rip.log")
+    assert not path.exists()
@@ -0,0 +1,92 @@
+"""Tests for backend.services.log_search - cross-service log search."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime
+from unittest.mock import AsyncMock, patch
+
+from backend.services import log_search
+
+
+def _entry(ts: str, event: str) -> dict:
+    return {"timestamp": ts, "level": "ERROR", "logger": "arm", "event": event, "raw": f"{ts} {event}"}
+
+
+ARM_LOGS = [
+    {"filename": "job_1.log", "size": 10, "modified": "2026-03-01T10:00:00"},
+    {"filename": "job_2.log", "size": 10, "modified": "2026-03-10T10:00:00"},
+]
+TC_LOGS = [{"filename": "tc.log", "size": 10, "modified": "2026-03-10T12:00:00"}]
+
+
+async def _collect(**kwargs) -> list[dict]:
+    return [event async for event in log_search.search("fail", **kwargs)]
+
+
+async def test_searches_both_services_and_reports_errors():
+    arm_reads = {
+        "job_1.log": {"entries": [_entry("2026-03-01T09:00:00", "rip failed")]},
+        "job_2.log": {"success": False, "error": "Log file not found"},
+    }
+    tc_read = {"entries": [_entry("2026-03-10T11:00:00", "encode failed")]}
+    with patch.object(log_search.arm_client, "list_logs", new_callable=AsyncMock, return_value=ARM_LOGS), \
+         patch.object(log_search.transcoder_client, "list_logs", new_callable=AsyncMock, return_value=TC_LOGS), \
+         patch.object(log_search.arm_client, "read_log_structured",
+                      AsyncMock(side_effect=lambda name, **kw: arm_reads[name])) as arm_read, \
+         patch.object(log_search.transcoder_client, "read_structured_log",
+                      new_callable=AsyncMock, return_value=tc_read):
+        events = await _collect(level="error")
+    matches = {(e["service"], e["event"]) for e in events if e["type"] == "match"}
+    assert matches == {("arm", "rip failed"), ("transcoder", "encode failed")}
+    assert {"type": "error", "service": "arm", "filename": "job_2.log"} in events
+    assert events[-1] == {"type": "done", "files": 3, "matched": 2,
+                          "limit_reached": False, "unavailable": []}
+    assert arm_read.await_args.kwargs["level"] == "error"
+    assert arm_read.await_args.kwargs["search"] == "fail"
+
+
+async def test_since_skips_old_files_and_entries():
+    read = AsyncMock(return_value={"entries": [
+        _entry("2026-03-05T00:00:00", "old failure"), _entry("2026-03-09T00:00:00", "new failure"),
+    ]})
+    with patch.object(log_search.arm_client, "list_logs", new_callable=AsyncMock, return_value=ARM_LOGS), \
+         patch.object(log_search.transcoder_client, "list_logs", new_callable=AsyncMock, return_value=None), \
+         patch.object(log_search.arm_client, "read_log_structured", read):
+        events = await _collect(since=datetime(2026, 3, 8))
+    read.assert_awaited_once()
+    assert read.await_args.args == ("job_2.log",)
+    assert [e["event"] for e in events if e["type"] == "match"] == ["new failure"]
+    assert events[-1]["unavailable"] == ["transcoder"]
+
+
+async def test_limit_cancels_remaining_reads(monkeypatch):
+    monkeypatch.setattr(log_search, "_CONCURRENCY", 1)
+    logs = [{"filename": f"job_{i}.log", "size": 1, "modified": "2026-03-01T00:00:00"} for i in range(5)]
+    started: list[str] = []
+
+    async def read(name, **kwargs):
+        started.append(name)
+        if name != "job_0.log":
+            await asyncio.sleep(10)
+        return {"entries": [_entry("2026-03-01T00:00:00", "a"), _entry("2026-03-01T00:00:01", "b")]}
+
+    with patch.object(log_search.arm_client, "list_logs", new_callable=AsyncMock, return_value=logs), \
+         patch.object(log_search.transcoder_client, "list_logs", new_callable=AsyncMock, return_value=[]), \
+         patch.object(log_search.arm_client, "read_log_structured", side_effect=read):
+        stream = log_search.search("x", limit=1)
+        first = await stream.__anext__()
+        done = await stream.__anext__()
+        await stream.aclose()
+        await asyncio.sleep(0)
+    assert first["event"] == "a"
+    assert done["type"] == "done" and done["limit_reached"] is True
+    # The slot freed by job_0 may have let one more read start; the rest
+    # were cancelled while still queued.
+    assert started[0] == "job_0.log" and len(started) <= 2
+
+
+def test_parse_time_normalises_zones():
+    assert log_search.parse_time("2026-03-01T10:00:00+02:00") == datetime(2026, 3, 1, 8)
+    assert log_search.parse_time("2026-03-01 10:00:00") == datetime(2026, 3, 1, 10)
+    assert log_search.parse_time("garbage") is None
@@ -0,0 +1,60 @@
+"""Tests for backend.services.log_timeline - merged per-job log timeline."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, patch
+
+from backend.services import log_timeline
+
+
+def _e(ts: str | None, event: str) -> dict:
+    return {"timestamp": ts, "level": "INFO", "logger": "x", "event": event, "raw": event}
+
+
+def test_merge_interleaves_by_time_and_keeps_arm_first_on_ties():
+    arm = [_e("2026-03-01T10:00:00", "rip start"), _e("2026-03-01T10:05:00", "rip done")]
+    tc = [_e("2026-03-01 10:05:00", "queued"), _e("2026-03-01T10:06:00+00:00", "encoding")]
+    merged = [(source, entry["event"]) for source, entry in log_timeline.merge({"arm": arm, "transcoder": tc})]
+    assert merged == [("arm", "rip start"), ("arm", "rip done"),
+                      ("transcoder", "queued"), ("transcoder", "encoding")]
+
+
+def test_untimed_entries_stay_with_the_line_before():
+    arm = [_e("2026-03-01T10:00:00", "error"), _e("garbage", "Traceback"), _e("2026-03-01T10:02:00", "next")]
+    tc = [_e("2026-03-01T10:01:00", "tc")]
+    events = [entry["event"] for _, entry in log_timeline.merge({"arm": arm, "transcoder": tc})]
+    assert events == ["error", "Traceback", "tc", "next"]
+
+
+def test_page_slices_merged_stream_and_reports_next_offset():
+    arm = [_e(f"2026-03-01T10:00:{i:02d}", f"a{i}") for i in range(0, 10, 2)]
+    tc = [_e(f"2026-03-01T10:00:{i:02d}", f"t{i}") for i in range(1, 10, 2)]
+    events = list(log_timeline.page({"arm": arm, "transcoder": tc}, 3, 4))
+    assert [e["event"] for e in events[:-1]] == ["t3", "a4", "t5", "a6"]
+    assert events[0]["source"] == "transcoder"
+    assert events[-1] == {"type": "done", "offset": 3, "returned": 4, "next_offset": 7,
+                          "sources": ["arm", "transcoder"]}
+    last = list(log_timeline.page({"arm": arm, "transcoder": tc}, 8, 4))
+    assert last[-1]["next_offset"] is None and last[-1]["returned"] == 2
+
+
+async def test_read_sources_reads_both_logs_with_the_level():
+    with patch.object(log_timeline.arm_client, "read_log_structured", new_callable=AsyncMock,
+                      return_value={"entries": []}) as arm_read, \
+         patch.object(log_timeline.transcoder_client, "read_structured_log", new_callable=AsyncMock,
+                      return_value={"entries": [_e("2026-03-01T10:00:00", "tc")]}) as tc_read:
+        arm, tc = await log_timeline.read_sources("job_7.log", "transcode_7.log", "error")
+    assert arm == {"entries": []}
+    assert [e["event"] for e in tc["entries"]] == ["tc"]
+    assert tc_read.await_args.args == ("transcode_7.log",)
+    assert arm_read.await_args.kwargs["level"] == "error"
+    assert tc_read.await_args.kwargs["level"] == "error"
+
+
+async def test_read_sources_without_transcoder_log():
+    with patch.object(log_timeline.arm_client, "read_log_structured", new_callable=AsyncMock,
+                      return_value={"entries": []}), \
+         patch.object(log_timeline.transcoder_client, "read_structured_log", new_callable=AsyncMock) as tc_read:
+        _arm, tc = await log_timeline.read_sources("job_7.log", None)
+    assert tc is None
+    tc_read.assert_not_awaited()
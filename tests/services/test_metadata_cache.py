@@ -0,0 +1,249 @@
+"""Tests for backend.services.metadata_cache - search/detail LRU+TTL caches."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from backend.services import job_detail_cache, metadata_cache
+
+
+def _page(n: int, page: int = 1) -> list[dict]:
+    return [{"title": f"Result {page}-{i}", "imdb_id": f"tt{page:03d}{i:04d}"} for i in range(n)]
+
+
+def _patch_search(**kwargs):
+    return patch.object(metadata_cache.arm_client, "search_metadata",
+                        new_callable=AsyncMock, **kwargs)
+
+
+async def _drain() -> None:
+    await asyncio.gather(*metadata_cache._background_tasks)
+
+
+async def test_repeat_search_served_from_cache():
+    with _patch_search(return_value=_page(3)) as mock:
+        await metadata_cache.search("Serial Mom", "1994")
+        assert await metadata_cache.search("  serial   MOM ", "1994") == _page(3)
+    mock.assert_awaited_once_with("Serial Mom", "1994", page=1)
+
+
+async def test_year_and_page_are_part_of_the_key():
+    with _patch_search(return_value=_page(3)) as mock:
+        await metadata_cache.search("alien")
+        await metadata_cache.search("alien", "1979")
+        await metadata_cache.search("alien", page=2)
+    assert mock.await_count == 3
+
+
+async def test_full_page_prefetches_next_page():
+    mock = AsyncMock(side_effect=lambda q, year, page: _page(10 if page == 1 else 4, page))
+    with patch.object(metadata_cache.arm_client, "search_metadata", mock):
+        await metadata_cache.search("alien")
+        await _drain()
+        assert await metadata_cache.search("alien", page=2) == _page(4, 2)
+    assert [c.kwargs["page"] for c in mock.await_args_list] == [1, 2]
+
+
+async def test_short_page_does_not_prefetch():
+    with _patch_search(return_value=_page(4)) as mock:
+        await metadata_cache.search("alien")
+        await _drain()
+    assert mock.await_count == 1
+
+
+async def test_foreground_request_joins_inflight_prefetch():
+    gate = asyncio.Event()
+
+    async def fake(q, year, page):
+        if page == 2:
+            await gate.wait()
+        return _page(10, page)
+
+    mock = AsyncMock(side_effect=fake)
+    with patch.object(metadata_cache.arm_client, "search_metadata", mock):
+        await metadata_cache.search("alien")
+        await asyncio.sleep(0)
+        pending = asyncio.create_task(metadata_cache.search("alien", page=2))
+        await asyncio.sleep(0)
+        gate.set()
+        assert await pending == _page(10, 2)
+        await _drain()
+    assert [c.kwargs["page"] for c in mock.await_args_list].count(2) == 1
+
+
+async def test_prefetch_failure_is_swallowed_and_not_cached():
+    mock = AsyncMock(side_effect=[_page(10), httpx.ConnectError("offline"), _page(2, 2)])
+    with patch.object(metadata_cache.arm_client, "search_metadata", mock):
+        await metadata_cache.search("alien")
+        await _drain()
+        assert await metadata_cache.search("alien", page=2) == _page(2, 2)
+
+
+async def test_search_errors_propagate_uncached():
+    with _patch_search(side_effect=httpx.ConnectError("offline")):
+        with pytest.raises(httpx.ConnectError):
+            await metadata_cache.search("alien")
+    with _patch_search(return_value=_page(1)) as mock:
+        assert await metadata_cache.search("alien") == _page(1)
+    assert mock.await_count == 1
+
+
+async def test_expired_entry_refetched(monkeypatch):
+    with _patch_search(return_value=_page(1)) as mock:
+        await metadata_cache.search("alien")
+        monkeypatch.setattr(metadata_cache, "_SEARCH_TTL", -1.0)
+        metadata_cache._search.clear()
+        await metadata_cache.search("alien")
+        await metadata_cache.search("alien")
+    assert mock.await_count == 3
+
+
+async def test_lru_evicts_least_recently_used(monkeypatch):
+    monkeypatch.setattr(metadata_cache, "_MAX_SEARCH_ENTRIES", 2)
+    with _patch_search(return_value=_page(1)) as mock:
+        await metadata_cache.search("a")
+        await metadata_cache.search("b")
+        await metadata_cache.search("a")
+        await metadata_cache.search("c")  # evicts "b"
+        await metadata_cache.search("a")
+        await metadata_cache.search("b")
+    assert mock.await_count == 4
+
+
+async def test_media_detail_cached_by_imdb_id():
+    detail = {"title": "Alien", "imdb_id": "tt0078748"}
+    with patch.object(metadata_cache.arm_client, "get_media_detail",
+                      new_callable=AsyncMock, return_value=detail) as mock:
+        await metadata_cache.get_media_detail("tt0078748")
+        assert await metadata_cache.get_media_detail("tt0078748") == detail
+    assert mock.await_count == 1
+
+
+async def test_media_detail_miss_not_cached():
+    with patch.object(metadata_cache.arm_client, "get_media_detail",
+                      new_callable=AsyncMock, return_value=None) as mock:
+        assert await metadata_cache.get_media_detail("tt0000000") is None
+        assert await metadata_cache.get_media_detail("tt0000000") is None
+    assert mock.await_count == 2
+
+
+async def test_last_waiter_leaving_cancels_upstream():
+    cancelled = asyncio.Event()
+
+    async def slow(q, year, page):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    with _patch_search(side_effect=slow):
+        first = asyncio.create_task(metadata_cache.search("alien"))
+        second = asyncio.create_task(metadata_cache.search("alien"))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        await asyncio.sleep(0.01)
+        assert not cancelled.is_set()
+        second.cancel()
+        await asyncio.sleep(0.01)
+    assert cancelled.is_set()
+
+
+def _job_detail(job_id: int, tvdb_id: int | None) -> dict:
+    return {"job": {"job_id": job_id, "status": "waiting", "tvdb_id": tvdb_id}, "tracks": []}
+
+
+def _episodes(tvdb_id: int, season: int) -> dict:
+    return {"episodes": [{"number": 1, "name": "Pilot", "runtime": 22, "aired": "2005-03-24"}],
+            "tvdb_id": tvdb_id, "season": season}
+
+
+async def test_tvdb_episodes_shared_across_discs_of_a_series():
+    details = AsyncMock(side_effect=lambda job_id: _job_detail(job_id, 73244))
+    episodes = AsyncMock(side_effect=lambda job_id, season: _episodes(73244, season))
+    with patch.object(job_detail_cache.arm_client, "get_job_detail", details), \
+         patch.object(metadata_cache.arm_client, "tvdb_episodes", episodes):
+        for job_id in (1, 2, 3):
+            await job_detail_cache.get(job_id)  # the job page loaded it
+            assert (await metadata_cache.tvdb_episodes(job_id, 1))["season"] == 1
+        await metadata_cache.tvdb_episodes(2, 2)
+    assert [c.args for c in episodes.await_args_list] == [(1, 1), (2, 2)]
+    assert details.await_count == 3
+
+
+async def test_tvdb_episodes_never_fetch_job_detail():
+    with patch.object(job_detail_cache.arm_client, "get_job_detail", new_callable=AsyncMock) as details, \
+         patch.object(metadata_cache.arm_client, "tvdb_episodes",
+                      new_callable=AsyncMock, return_value=_episodes(73244, 1)) as episodes:
+        await metadata_cache.tvdb_episodes(1, 1)
+        # The first answer named the series; a mirrored disc of it is served locally.
+        with patch.object(metadata_cache.job_mirror, "is_warm", return_value=True), \
+             patch.object(metadata_cache.job_mirror, "get", return_value={"job_id": 2, "tvdb_id": 73244}):
+            await metadata_cache.tvdb_episodes(2, 1)
+    details.assert_not_called()
+    assert episodes.await_count == 1
+
+
+async def test_tvdb_episodes_uncached_without_series_id():
+    with patch.object(job_detail_cache.arm_client, "get_job_detail",
+                      new_callable=AsyncMock, return_value=_job_detail(1, None)), \
+         patch.object(metadata_cache.arm_client, "tvdb_episodes",
+                      new_callable=AsyncMock, return_value=_episodes(73244, 1)) as mock:
+        await job_detail_cache.get(1)
+        await metadata_cache.tvdb_episodes(1, 1)
+        await metadata_cache.tvdb_episodes(1, 1)
+    assert mock.await_count == 2
+
+
+@pytest.mark.parametrize("result", [None, {"success": False, "error": "No TVDB match"}])
+async def test_tvdb_episode_failures_not_cached(result):
+    with patch.object(job_detail_cache.arm_client, "get_job_detail",
+                      new_callable=AsyncMock, return_value=_job_detail(1, 73244)), \
+         patch.object(metadata_cache.arm_client, "tvdb_episodes",
+                      new_callable=AsyncMock, return_value=result) as mock:
+        await job_detail_cache.get(1)
+        assert await metadata_cache.tvdb_episodes(1, 1) == result
+        assert await metadata_cache.tvdb_episodes(1, 1) == result
+    assert mock.await_count == 2
+
+
+async def test_crc_hit_outlives_miss(monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr(metadata_cache.time, "monotonic", lambda: clock[0])
+    answers = {"aaa": {"found": True, "results": [{"title": "Alien"}]},
+               "bbb": {"found": False, "results": []}}
+    with patch.object(metadata_cache.arm_client, "lookup_crc",
+                      new_callable=AsyncMock, side_effect=answers.get) as mock:
+        for _ in range(2):
+            await metadata_cache.lookup_crc("aaa")
+            await metadata_cache.lookup_crc("bbb")
+        assert mock.await_count == 2
+        clock[0] += metadata_cache._CRC_MISS_TTL + 1
+        await metadata_cache.lookup_crc("aaa")
+        await metadata_cache.lookup_crc("bbb")
+    assert [c.args for c in mock.await_args_list] == [("aaa",), ("bbb",), ("bbb",)]
+
+
+@pytest.mark.parametrize("result", [
+    {"found": False, "results": [], "has_api_key": False},
+    {"found": False, "results": [], "error": "CRC database unavailable"},
+])
+async def test_crc_keyless_and_error_answers_not_cached(result):
+    with patch.object(metadata_cache.arm_client, "lookup_crc",
+                      new_callable=AsyncMock, return_value=result) as mock:
+        await metadata_cache.lookup_crc("aaa")
+        await metadata_cache.lookup_crc("aaa")
+    assert mock.await_count == 2
+
+
+async def test_forget_crc_refetches():
+    with patch.object(metadata_cache.arm_client, "lookup_crc",
+                      new_callable=AsyncMock, return_value={"found": False, "results": []}) as mock:
+        await metadata_cache.lookup_crc("aaa")
+        metadata_cache.forget_crc("aaa")
+        await metadata_cache.lookup_crc("aaa")
+    assert mock.await_count == 2
@@ -0,0 +1,94 @@
+"""Tests for backend.services.metadata_disk_cache — disk-backed detail cache."""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from backend.services import metadata_cache, metadata_disk_cache
+
+_DETAIL = {"title": "Serial Mom", "year": "1994", "imdb_id": "tt0111127"}
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path):
+    """Provide a temp cache dir and reset the service."""
+    d = tmp_path / "metadata"
+    metadata_disk_cache._index.clear()
+    metadata_disk_cache._cache_dir = str(d)
+    yield d
+
+
+def test_store_and_retrieve():
+    assert metadata_disk_cache.store("media:tt0111127", _DETAIL) is True
+    assert metadata_disk_cache.retrieve("media:tt0111127") == _DETAIL
+
+
+def test_retrieve_miss():
+    assert metadata_disk_cache.retrieve("media:tt0000000") is None
+
+
+def test_startup_scan_is_lazy_and_survives_restart(cache_dir):
+    metadata_disk_cache.store("music:abc", {"title": "Abbey Road"})
+    metadata_disk_cache._index.clear()
+    metadata_disk_cache.startup_scan()
+    assert metadata_disk_cache.stats()["count"] == 1
+    assert metadata_disk_cache.retrieve("music:abc") == {"title": "Abbey Road"}
+
+
+def test_ttl_expiry_on_scan(cache_dir):
+    metadata_disk_cache.store("media:old", _DETAIL)
+    path = next(cache_dir.glob("*.json"))
+    old = time.time() - metadata_disk_cache._TTL_SECONDS - 60
+    os.utime(path, (old, old))
+    metadata_disk_cache.startup_scan()
+    assert metadata_disk_cache.retrieve("media:old") is None
+    assert not path.exists()
+
+
+def test_size_bound_evicts_lru(monkeypatch):
+    entry_size = len(json.dumps({"key": "media:0", "data": _DETAIL}))
+    monkeypatch.setattr(metadata_disk_cache, "_MAX_BYTES", entry_size * 2 + 10)
+    metadata_disk_cache.store("media:0", _DETAIL)
+    metadata_disk_cache.store("media:1", _DETAIL)
+    metadata_disk_cache.retrieve("media:0")  # 1 is now least recently used
+    metadata_disk_cache.store("media:2", _DETAIL)
+    assert metadata_disk_cache.retrieve("media:1") is None
+    assert metadata_disk_cache.retrieve("media:0") == _DETAIL
+    assert metadata_disk_cache.stats()["size_bytes"] <= metadata_disk_cache._MAX_BYTES
+
+
+def test_corrupt_entry_dropped(cache_dir):
+    metadata_disk_cache.store("media:x", _DETAIL)
+    next(cache_dir.glob("*.json")).write_text("{not json")
+    assert metadata_disk_cache.retrieve("media:x") is None
+    assert metadata_disk_cache.stats()["count"] == 0
+
+
+def test_unwritable_dir_returns_false(tmp_path):
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+    metadata_disk_cache._cache_dir = str(blocker / "sub")
+    assert metadata_disk_cache.store("media:x", _DETAIL) is False
+
+
+def test_clear():
+    metadata_disk_cache.store("media:a", _DETAIL)
+    metadata_disk_cache.store("music:b", _DETAIL)
+    result = metadata_disk_cache.clear()
+    assert result["cleared"] == 2
+    assert metadata_disk_cache.stats()["count"] == 0
+
+
+async def test_detail_lookups_read_through_disk():
+    """A restart (memory cache cleared) still serves details from disk."""
+    with patch.object(metadata_cache.arm_client, "get_music_detail",
+                      new_callable=AsyncMock, return_value={"title": "Abbey Road"}) as mock:
+        await metadata_cache.get_music_detail("rel-1")
+        metadata_cache.clear()
+        assert await metadata_cache.get_music_detail("rel-1") == {"title": "Abbey Road"}
+    assert mock.await_count == 1
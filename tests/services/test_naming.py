@@ -0,0 +1,99 @@
+"""Tests for backend.services.naming - local pattern validation and preview."""
+
+from __future__ import annotations
+
+import pytest
+
+from backend.services import naming
+
+# Stand-in vocabulary so these tests pin the renderer, not the contract's
+# current token list.
+_TOKENS = {
+    "title": ("title", "Title", None),
+    "year": ("year", "Release year", None),
+    "show": ("title", "Series title", None),
+    "season": ("season", "Season number", None),
+    "episode": ("episode_number", "Episode number", None),
+    "label": ("label", "Disc label", lambda job, track: (job.label or "").lower()),
+    "upper": ("title", "Upper-case title", lambda job: job.title.upper()),
+    "runtime": ("runtime", "Track minutes", lambda job, track: f"{track.length // 60}m"),
+}
+
+
+@pytest.fixture(autouse=True)
+def tokens(monkeypatch):
+    monkeypatch.setattr(naming, "PATTERN_TOKENS", _TOKENS)
+    naming.compile_pattern.cache_clear()
+    naming._takes_track.cache_clear()
+    yield
+    naming.compile_pattern.cache_clear()
+    naming._takes_track.cache_clear()
+
+
+def test_validate_reports_unknown_tokens_with_suggestions():
+    assert naming.validate("{title} ({year})") == {"valid": True, "invalid_vars": [], "suggestions": {}}
+    result = naming.validate("{title} {yeer} {zzz}")
+    assert result["valid"] is False
+    assert result["invalid_vars"] == ["yeer", "zzz"]
+    assert result["suggestions"] == {"yeer": "year"}
+
+
+def test_compiled_patterns_are_cached():
+    naming.compile_pattern("{title} ({year})")
+    naming.compile_pattern("{title} ({year})")
+    assert naming.compile_pattern.cache_info().hits == 1
+
+
+def test_render_from_job_and_track():
+    job = {"title": "The Office", "season": "2", "year": "2005"}
+    track = {"episode_number": "7"}
+    assert naming.render("{show} S{season}E{episode}", job, track) == "The Office S02E07"
+
+
+def test_render_uses_callable_accessor():
+    assert naming.render("{label}", {"label": "SERIAL_MOM"}) == "serial_mom"
+
+
+def test_render_calls_accessors_with_their_own_arity():
+    assert naming.render("{upper}", {"title": "Alien"}) == "ALIEN"
+    assert naming.render("{runtime}", {}, {"length": 5400}) == "90m"
+
+
+def test_failing_accessor_renders_empty():
+    # length is None: the accessor's own TypeError must not trigger a retry.
+    assert naming.render("{title} [{runtime}]", {"title": "Alien"}, {}) == "Alien []"
+    assert naming.render("{upper}", {}) == ""
+
+
+def test_render_strips_unsafe_value_chars_but_keeps_folder_slashes():
+    job = {"title": 'AC/DC: "Live"', "year": "1992"}
+    assert naming.render("{title}/{year}", job) == "ACDC Live/1992"
+
+
+def test_render_with_explicit_values_and_unknown_tokens():
+    assert naming.render("{title} {nope}", values={"title": "Alien"}) == "Alien {nope}"
+
+
+def test_preview_job_uses_override_then_config_then_default():
+    detail = {
+        "job": {"title": "Alien", "year": "1979", "video_type": "movie",
+                "title_pattern_override": "{year} {title}"},
+        "config": {"MOVIE_FOLDER_PATTERN": "{title}"},
+        "tracks": [{"track_number": 1}, {"track_number": 2}],
+    }
+    preview = naming.preview_job(detail)
+    assert preview["job_title"] == "1979 Alien"
+    assert preview["job_folder"] == "Alien"
+    assert [t["track_number"] for t in preview["tracks"]] == ["1", "2"]
+
+    tv = {"job": {"title": "The Office", "season": "1", "video_type": "series"},
+          "tracks": [{"track_number": 0, "episode_number": "3"}]}
+    assert naming.preview_job(tv)["tracks"][0]["rendered_title"] == "The Office S01E03"
+
+
+def test_preview_job_draft_patterns_and_invalid_vars():
+    detail = {"job": {"title": "Alien", "year": "1979"}, "tracks": []}
+    preview = naming.preview_job(detail, title_pattern="{title} [{yr}]")
+    assert preview["success"] is False
+    assert preview["invalid_vars"] == ["yr"]
+    assert preview["job_title"] == "Alien [{yr}]"
@@ -0,0 +1,151 @@
+"""Tests for backend.services.progress_feed - shared per-job progress poller."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from backend.services import progress_feed
+
+
+def _state(progress: float | None = 10.0, **overrides) -> dict:
+    state = {
+        "track_counts": {"total": 3, "ripped": 1},
+        "disctype": "bluray",
+        "no_of_titles": 3,
+        "rip_progress": progress,
+        "rip_stage": "Saving to MKV file",
+        "tracks_ripped_realtime": 2,
+        "copy_progress": None,
+        "copy_stage": None,
+    }
+    state.update(overrides)
+    return state
+
+
+@pytest.fixture(autouse=True)
+def _fast_poll(monkeypatch):
+    monkeypatch.setattr(progress_feed, "_POLL_INTERVAL", 0.01)
+    yield
+    for task in list(progress_feed._pollers.values()):
+        task.cancel()
+    progress_feed._pollers.clear()
+    progress_feed._subscribers.clear()
+    progress_feed._latest.clear()
+
+
+def test_shape_rip_progress_takes_max_of_realtime_and_db():
+    shaped = progress_feed.shape_rip_progress(_state())
+    assert shaped["tracks_total"] == 3
+    assert shaped["tracks_ripped"] == 2
+    assert shaped["progress"] == pytest.approx(10.0)
+
+
+def test_shape_rip_progress_music_uses_music_fields():
+    shaped = progress_feed.shape_rip_progress(
+        _state(disctype="music", music_progress=55.0, music_stage="Track 4"),
+    )
+    assert shaped["progress"] == pytest.approx(55.0)
+    assert shaped["stage"] == "Track 4"
+
+
+async def test_snapshot_merges_transcoder_progress():
+    tc_jobs = {"jobs": [{"id": 7, "status": "processing", "phase": "encoding",
+                         "progress": 42.0, "current_fps": 88.5}]}
+    with (
+        patch.object(progress_feed.arm_client, "get_job_progress_state",
+                     new_callable=AsyncMock, return_value=_state()),
+        patch.object(progress_feed.transcoder_client, "get_jobs",
+                     new_callable=AsyncMock, return_value=tc_jobs),
+    ):
+        snap = await progress_feed.snapshot(7)
+    assert snap["error"] is None
+    assert snap["rip"]["tracks_ripped"] == 2
+    assert snap["transcoder"] == {
+        "found": True, "status": "processing", "phase": "encoding",
+        "progress": 42.0, "current_fps": 88.5,
+    }
+
+
+async def test_snapshot_reports_unreachable_and_missing_job():
+    with (
+        patch.object(progress_feed.arm_client, "get_job_progress_state",
+                     new_callable=AsyncMock, side_effect=[None, {"success": False}]),
+        patch.object(progress_feed.transcoder_client, "get_jobs",
+                     new_callable=AsyncMock, return_value={"jobs": []}),
+    ):
+        unreachable = await progress_feed.snapshot(1)
+        missing = await progress_feed.snapshot(1)
+    assert unreachable["error"] == "ARM service unreachable"
+    assert missing["error"] == "Job not found"
+    assert missing["transcoder"] == {"found": False}
+
+
+async def test_snapshot_skips_transcoder_when_disabled(monkeypatch):
+    monkeypatch.setattr(progress_feed.settings, "transcoder_enabled", False)
+    tc = AsyncMock()
+    with (
+        patch.object(progress_feed.arm_client, "get_job_progress_state",
+                     new_callable=AsyncMock, return_value=_state()),
+        patch.object(progress_feed.transcoder_client, "get_jobs", tc),
+    ):
+        snap = await progress_feed.snapshot(1)
+    assert snap["transcoder"] is None
+    tc.assert_not_called()
+
+
+async def test_subscribers_share_one_poller_and_stop_it_on_exit():
+    arm = AsyncMock(return_value=_state())
+    with (
+        patch.object(progress_feed.arm_client, "get_job_progress_state", arm),
+        patch.object(progress_feed.transcoder_client, "get_jobs",
+                     new_callable=AsyncMock, return_value={"jobs": []}),
+    ):
+        first = progress_feed.subscribe(5)
+        second = progress_feed.subscribe(5)
+        snap_a = await anext(first)
+        snap_b = await anext(second)
+        assert snap_a == snap_b
+        assert progress_feed.active_feeds() == {5: 2}
+        assert len(progress_feed._pollers) == 1
+
+        await first.aclose()
+        assert progress_feed.active_feeds() == {5: 1}
+        poller = progress_feed._pollers[5]
+        await second.aclose()
+        await asyncio.sleep(0)
+    assert progress_feed.active_feeds() == {}
+    assert progress_feed._pollers == {}
+    assert poller.cancelled() or poller.done()
+
+
+async def test_only_changed_snapshots_are_emitted():
+    states = [_state(10.0), _state(10.0), _state(10.0), _state(20.0)]
+    arm = AsyncMock(side_effect=lambda _job_id: states.pop(0) if len(states) > 1 else states[0])
+    with (
+        patch.object(progress_feed.arm_client, "get_job_progress_state", arm),
+        patch.object(progress_feed.transcoder_client, "get_jobs",
+                     new_callable=AsyncMock, return_value={"jobs": []}),
+    ):
+        feed = progress_feed.subscribe(9)
+        first = await anext(feed)
+        second = await anext(feed)
+        await feed.aclose()
+    assert first["rip"]["progress"] == pytest.approx(10.0)
+    assert second["rip"]["progress"] == pytest.approx(20.0)
+    assert arm.await_count >= 4
+
+
+async def test_heartbeat_yields_none_when_idle():
+    with (
+        patch.object(progress_feed.arm_client, "get_job_progress_state",
+                     new_callable=AsyncMock, return_value=_state()),
+        patch.object(progress_feed.transcoder_client, "get_jobs",
+                     new_callable=AsyncMock, return_value={"jobs": []}),
+    ):
+        feed = progress_feed.subscribe(3, heartbeat=0.05)
+        assert (await anext(feed)) is not None
+        assert (await anext(feed)) is None
+        await feed.aclose()
@@ -0,0 +1,109 @@
+"""Tests for the capacity-aware bulk re-transcode dispatcher."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from backend.services import retranscode_queue
+
+
+def _workers(max_concurrent: int, active: int, running: list[int] | None = None) -> dict:
+    workers = [{"worker_id": i, "status": "processing", "current_job_id": j}
+               for i, j in enumerate(running or [])]
+    return {"max_concurrent": max_concurrent, "active_count": active, "workers": workers}
+
+
+@pytest.fixture
+def fast_poll(monkeypatch):
+    monkeypatch.setattr(retranscode_queue, "_POLL_INTERVAL", 0.01)
+
+
+async def _drain() -> None:
+    while retranscode_queue._task is not None and not retranscode_queue._task.done():
+        await asyncio.sleep(0.01)
+
+
+async def test_submits_only_free_slots_per_pass(fast_poll):
+    # Two slots, one busy: one webhook per pass until the batch is through.
+    sent: list[int] = []
+
+    async def webhook(payload):
+        sent.append(payload["job_id"])
+        return {"success": True}
+
+    with patch.object(retranscode_queue.transcoder_client, "get_workers",
+                      new_callable=AsyncMock, side_effect=lambda: _workers(2, 1, sent[-1:])) as workers, \
+         patch.object(retranscode_queue.transcoder_client, "get_job",
+                      new_callable=AsyncMock, return_value={"status": "processing"}), \
+         patch.object(retranscode_queue.arm_client, "get_job_retranscode_info",
+                      new_callable=AsyncMock, side_effect=lambda job_id: {"job_id": job_id}), \
+         patch.object(retranscode_queue.transcoder_client, "send_webhook", side_effect=webhook):
+        batch = retranscode_queue.enqueue([1, 2, 3, 2])
+        assert batch["total"] == 3
+        await _drain()
+    assert sent == [1, 2, 3]
+    assert workers.await_count == 3
+    done = retranscode_queue.progress(batch["batch_id"])
+    assert done["done"] and done["submitted"] == 3
+
+
+async def test_unstarted_submission_holds_its_slot(fast_poll):
+    with patch.object(retranscode_queue.transcoder_client, "get_workers",
+                      new_callable=AsyncMock, return_value=_workers(1, 0)), \
+         patch.object(retranscode_queue.transcoder_client, "get_job",
+                      new_callable=AsyncMock, return_value={"status": "pending"}), \
+         patch.object(retranscode_queue.arm_client, "get_job_retranscode_info",
+                      new_callable=AsyncMock, side_effect=lambda job_id: {"job_id": job_id}), \
+         patch.object(retranscode_queue.transcoder_client, "send_webhook",
+                      new_callable=AsyncMock, return_value={"success": True}) as webhook:
+        batch = retranscode_queue.enqueue([1, 2])
+        await asyncio.sleep(0.05)
+        # Job 1 is still pending upstream, so job 2 waits.
+        assert webhook.await_count == 1
+        assert retranscode_queue.progress(batch["batch_id"])["queued"] == 1
+        retranscode_queue.cancel(batch["batch_id"])
+        await _drain()
+    progress = retranscode_queue.progress(batch["batch_id"])
+    assert progress["cancelled"] == 1 and progress["done"]
+
+
+async def test_failures_are_reported_per_job(fast_poll):
+    info = {1: None, 2: {"success": False, "error": "Job not found"}, 3: {"job_id": 3}}
+    with patch.object(retranscode_queue.transcoder_client, "get_workers",
+                      new_callable=AsyncMock, return_value=_workers(4, 0)), \
+         patch.object(retranscode_queue.arm_client, "get_job_retranscode_info",
+                      new_callable=AsyncMock, side_effect=info.get), \
+         patch.object(retranscode_queue.transcoder_client, "send_webhook",
+                      new_callable=AsyncMock, return_value={"success": False, "error": "Transcoder offline"}):
+        batch = retranscode_queue.enqueue([1, 2, 3])
+        await _drain()
+    errors = {j["job_id"]: j["error"] for j in retranscode_queue.progress(batch["batch_id"])["jobs"]}
+    assert errors == {1: "ARM service unreachable", 2: "Job not found or not a video disc",
+                      3: "Transcoder offline"}
+
+
+async def test_offline_transcoder_keeps_jobs_queued(fast_poll):
+    with patch.object(retranscode_queue.transcoder_client, "get_workers",
+                      new_callable=AsyncMock, return_value=None), \
+         patch.object(retranscode_queue.transcoder_client, "send_webhook",
+                      new_callable=AsyncMock) as webhook:
+        batch = retranscode_queue.enqueue([1])
+        await asyncio.sleep(0.05)
+    webhook.assert_not_awaited()
+    progress = retranscode_queue.progress(batch["batch_id"])
+    assert progress["queued"] == 1
+    assert progress["error"] == "Transcoder unreachable; retrying"
+
+
+async def test_offline_transcoder_fails_queued_jobs_after_timeout(fast_poll, monkeypatch):
+    monkeypatch.setattr(retranscode_queue, "_OFFLINE_TIMEOUT", 0.03)
+    with patch.object(retranscode_queue.transcoder_client, "get_workers",
+                      new_callable=AsyncMock, return_value=None):
+        batch = retranscode_queue.enqueue([1, 2])
+        await _drain()
+    progress = retranscode_queue.progress(batch["batch_id"])
+    assert progress["done"] and progress["failed"] == 2 and progress["error"] is None
+    assert {j["error"] for j in progress["jobs"]} == {"Transcoder unreachable"}
@@ -0,0 +1,112 @@
+"""Tests for backend.services.search_sessions - typeahead supersede/cancel."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from backend.services import search_sessions
+
+
+def _slow(result, started: list | None = None, cancelled: list | None = None):
+    async def fetch():
+        if started is not None:
+            started.append(result)
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            if cancelled is not None:
+                cancelled.append(result)
+            raise
+        return result
+    return fetch
+
+
+async def _fast(result):
+    return result
+
+
+async def test_returns_fetch_result():
+    assert await search_sessions.run(lambda: _fast([1]), kind="title", session="tab") == [1]
+    assert search_sessions.active_count() == 0
+
+
+async def test_newer_search_cancels_outstanding_one():
+    cancelled: list = []
+    old = asyncio.create_task(search_sessions.run(
+        _slow("old", cancelled=cancelled), kind="title", session="tab",
+    ))
+    await asyncio.sleep(0.01)
+    assert await search_sessions.run(lambda: _fast("new"), kind="title", session="tab") == "new"
+    with pytest.raises(search_sessions.SearchSuperseded):
+        await old
+    assert cancelled == ["old"]
+
+
+async def test_sessions_and_kinds_are_independent():
+    other_tab = asyncio.create_task(search_sessions.run(_slow("a"), kind="title", session="a"))
+    music = asyncio.create_task(search_sessions.run(_slow("m"), kind="music", session="b"))
+    await asyncio.sleep(0)
+    await search_sessions.run(lambda: _fast("b"), kind="title", session="b")
+    assert not other_tab.done() and not music.done()
+    other_tab.cancel()
+    music.cancel()
+
+
+async def test_without_session_nothing_is_superseded():
+    first = asyncio.create_task(search_sessions.run(_slow("x"), kind="title"))
+    await asyncio.sleep(0)
+    await search_sessions.run(lambda: _fast("y"), kind="title")
+    assert not first.done()
+    first.cancel()
+
+
+async def test_disconnect_cancels_upstream():
+    cancelled: list = []
+    gone = asyncio.Event()
+    task = asyncio.create_task(search_sessions.run(
+        _slow("q", cancelled=cancelled), kind="title", session="tab", disconnected=gone.wait,
+    ))
+    await asyncio.sleep(0.01)
+    gone.set()
+    with pytest.raises(search_sessions.SearchSuperseded):
+        await task
+    assert cancelled == ["q"]
+
+
+async def test_debounce_drops_burst_before_upstream():
+    started: list = []
+    searches = []
+    for q in ("a", "al", "ali"):
+        searches.append(asyncio.create_task(search_sessions.run(
+            _slow(q, started=started), kind="title", session="tab", debounce=0.05,
+        )))
+        await asyncio.sleep(0)
+    await asyncio.sleep(0.1)
+    assert started == ["ali"]
+    searches[-1].cancel()
+    results = await asyncio.gather(*searches, return_exceptions=True)
+    assert all(isinstance(r, (search_sessions.SearchSuperseded, asyncio.CancelledError)) for r in results)
+
+
+async def test_caller_cancellation_propagates_as_cancelled():
+    cancelled: list = []
+    task = asyncio.create_task(search_sessions.run(
+        _slow("q", cancelled=cancelled), kind="title", session="tab",
+    ))
+    await asyncio.sleep(0.01)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    await asyncio.sleep(0)
+    assert cancelled == ["q"]
+    assert search_sessions.active_count() == 0
+
+
+async def test_upstream_errors_propagate():
+    async def boom():
+        raise RuntimeError("client closed")
+
+    with pytest.raises(RuntimeError):
+        await search_sessions.run(boom, kind="title", session="tab")
@@ -0,0 +1,82 @@
+"""Tests for backend.services.system_history - sampled stats ring buffers."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from backend.services import system_history
+
+T0 = 1_800_000_000.0  # a whole hour
+
+STATS = {
+    "cpu_percent": 40.0,
+    "cpu_temp": 55.0,
+    "memory": {"total_gb": 16, "used_gb": 8, "free_gb": 8, "percent": 50.0},
+    "storage": [{"name": "raw", "percent": 20.0}, {"name": "media", "percent": 90.0}],
+    "gpu": {"vendor": "nvidia", "utilization_percent": 10.0, "temperature_c": None},
+}
+
+
+def test_records_each_metric_and_skips_missing_values():
+    system_history.record("arm", STATS, now=T0)
+    assert system_history.history("arm.storage_percent", 60, now=T0)["values"] == [90.0]
+    assert system_history.history("arm.memory_percent", 60, now=T0)["values"] == [50.0]
+    assert system_history.history("arm.gpu_temp", 60, now=T0)["values"] == []
+    system_history.record("arm", None, now=T0)  # unreachable: nothing recorded
+
+
+def test_rollups_average_samples_within_a_slot():
+    for i in range(120):
+        system_history.record("arm", {"cpu_percent": float(i % 60 < 30) * 100}, now=T0 + i)
+    fine = system_history.history("arm.cpu_percent", 3600, now=T0 + 119)
+    assert fine["step"] == 1 and len(fine["values"]) == 120
+    minutes = system_history.history("arm.cpu_percent", 6 * 3600, now=T0 + 119)
+    assert minutes["step"] == 60
+    assert minutes["timestamps"] == [int(T0), int(T0) + 60] and minutes["values"] == [50.0, 50.0]
+    hours = system_history.history("arm.cpu_percent", 7 * 86400, now=T0 + 119)
+    assert hours["step"] == 3600 and hours["values"] == [50.0]
+
+
+def test_ring_overwrites_slots_older_than_its_span():
+    system_history.record("arm", {"cpu_percent": 1.0}, now=T0)
+    system_history.record("arm", {"cpu_percent": 2.0}, now=T0 + 3600)  # same index, next lap
+    assert system_history.history("arm.cpu_percent", 3600, now=T0 + 3600)["values"] == [2.0]
+    # A late sample for the overwritten slot is dropped, not mixed in.
+    system_history.record("arm", {"cpu_percent": 9.0}, now=T0)
+    assert system_history.history("arm.cpu_percent", 3600, now=T0 + 3600)["values"] == [2.0]
+
+
+def test_parse_range_and_unknown_metric():
+    assert system_history.parse_range("15m") == 900
+    assert system_history.parse_range("7d") == 7 * 86400
+    for bad in ("", "h", "0m", "-1h", "1w", "31d"):
+        with pytest.raises(ValueError):
+            system_history.parse_range(bad)
+    with pytest.raises(ValueError):
+        system_history.history("arm.disk", 60)
+
+
+async def test_sample_skips_transcoder_when_disabled(monkeypatch):
+    monkeypatch.setattr(system_history.settings, "transcoder_enabled", False)
+    with patch.object(system_history.arm_client, "get_system_stats", new_callable=AsyncMock, return_value=STATS), \
+         patch.object(system_history.transcoder_client, "get_system_stats", new_callable=AsyncMock) as tc:
+        await system_history.sample()
+    tc.assert_not_called()
+    assert system_history.history("arm.cpu_percent", 60)["values"] == [40.0]
+
+
+async def test_save_and_load_round_trip(tmp_path, monkeypatch):
+    path = tmp_path / "history.bin"
+    monkeypatch.setattr(system_history.settings, "system_history_path", str(path))
+    system_history.record("transcoder", STATS, now=T0)
+    await system_history.save()
+    system_history.clear()
+    system_history.load()
+    assert system_history.history("transcoder.cpu_percent", 60, now=T0)["values"] == [40.0]
+
+    path.write_bytes(path.read_bytes()[:-8])  # truncated: ignored, not half-loaded
+    system_history.clear()
+    system_history.load()
+    assert system_history.history("transcoder.cpu_percent", 60, now=T0)["values"] == []
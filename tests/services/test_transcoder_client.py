@@ -91,11 +91,9 @@ async def test_test_webhook_success():
     """test_webhook returns secret_ok=True on 200 response."""
     mock_resp = _mock_response({"status": "ignored"})
 
-    with patch("backend.services.transcoder_client.httpx.AsyncClient") as MockClient:
-        ctx = AsyncMock()
-        ctx.post.return_value = mock_resp
-        MockClient.return_value.__aenter__ = AsyncMock(return_value=ctx)
-        MockClient.return_value.__aexit__ = AsyncMock(return_value=False)
+    ctx = AsyncMock()
+    ctx.post.return_value = mock_resp
+    with patch.object(transcoder_client, "_get_webhook_client", return_value=ctx):
         result = await transcoder_client.test_webhook("my-secret")
 
     assert result["reachable"] is True
@@ -106,11 +104,9 @@ async def test_test_webhook_bad_secret():
     """test_webhook returns secret_ok=False on 403 response."""
     mock_resp = _mock_response({}, status_code=403)
 
-    with patch("backend.services.transcoder_client.httpx.AsyncClient") as MockClient:
-        ctx = AsyncMock()
-        ctx.post.return_value = mock_resp
-        MockClient.return_value.__aenter__ = AsyncMock(return_value=ctx)
-        MockClient.return_value.__aexit__ = AsyncMock(return_value=False)
+    ctx = AsyncMock()
+    ctx.post.return_value = mock_resp
+    with patch.object(transcoder_client, "_get_webhook_client", return_value=ctx):
         result = await transcoder_client.test_webhook("wrong-secret")
 
     assert result["reachable"] is True
@@ -120,11 +116,9 @@ async def test_test_webhook_bad_secret():
 
 async def test_test_webhook_unreachable():
     """test_webhook returns reachable=False on ConnectError."""
-    with patch("backend.services.transcoder_client.httpx.AsyncClient") as MockClient:
-        ctx = AsyncMock()
-        ctx.post.side_effect = httpx.ConnectError("refused")
-        MockClient.return_value.__aenter__ = AsyncMock(return_value=ctx)
-        MockClient.return_value.__aexit__ = AsyncMock(return_value=False)
+    ctx = AsyncMock()
+    ctx.post.side_effect = httpx.ConnectError("refused")
+    with patch.object(transcoder_client, "_get_webhook_client", return_value=ctx):
         result = await transcoder_client.test_webhook("secret")
 
     assert result["reachable"] is False
@@ -135,11 +129,9 @@ async def test_test_webhook_uses_caller_secret_in_header():
     """Caller-supplied secret is sent in X-Webhook-Secret. No env fallback."""
     mock_resp = _mock_response({"status": "ignored"})
 
-    with patch("backend.services.transcoder_client.httpx.AsyncClient") as MockClient:
-        ctx = AsyncMock()
-        ctx.post.return_value = mock_resp
-        MockClient.return_value.__aenter__ = AsyncMock(return_value=ctx)
-        MockClient.return_value.__aexit__ = AsyncMock(return_value=False)
+    ctx = AsyncMock()
+    ctx.post.return_value = mock_resp
+    with patch.object(transcoder_client, "_get_webhook_client", return_value=ctx):
         result = await transcoder_client.test_webhook("candidate-secret")
 
     _, kwargs = ctx.post.call_args
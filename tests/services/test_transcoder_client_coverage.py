@@ -570,14 +570,12 @@ async def test_test_connection_config_lost_connection():
 
 async def test_test_webhook_http_error():
     """test_webhook handles generic HTTP errors."""
-    with patch("backend.services.transcoder_client.httpx.AsyncClient") as MockClient:
-        ctx = AsyncMock()
-        mock_resp = MagicMock(spec=httpx.Response)
-        mock_resp.status_code = 500
-        mock_resp.raise_for_status.side_effect = httpx.HTTPError("server error")
-        ctx.post.side_effect = httpx.HTTPError("server error")
-        MockClient.return_value.__aenter__ = AsyncMock(return_value=ctx)
-        MockClient.return_value.__aexit__ = AsyncMock(return_value=False)
+    ctx = AsyncMock()
+    mock_resp = MagicMock(spec=httpx.Response)
+    mock_resp.status_code = 500
+    mock_resp.raise_for_status.side_effect = httpx.HTTPError("server error")
+    ctx.post.side_effect = httpx.HTTPError("server error")
+    with patch.object(transcoder_client, "_get_webhook_client", return_value=ctx):
         result = await transcoder_client.test_webhook("secret")
 
     assert result["reachable"] is True
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
@@ -28,12 +29,10 @@ async def test_send_webhook_success():
     """send_webhook returns success when transcoder accepts the payload."""
     mock_resp = _mock_response({"queued": True})
 
+    ctx = AsyncMock()
+    ctx.post.return_value = mock_resp
     with patch("asyncio.to_thread", new_callable=AsyncMock, return_value="my-secret"), \
-         patch("backend.services.transcoder_client.httpx.AsyncClient") as MockClient:
-        ctx = AsyncMock()
-        ctx.post.return_value = mock_resp
-        MockClient.return_value.__aenter__ = AsyncMock(return_value=ctx)
-        MockClient.return_value.__aexit__ = AsyncMock(return_value=False)
+         patch.object(transcoder_client, "_get_webhook_client", return_value=ctx):
         result = await transcoder_client.send_webhook({"title": "Test"})
 
     assert result["success"] is True
@@ -43,12 +42,10 @@ async def test_send_webhook_auth_rejected():
     """send_webhook returns error when secret is rejected (401/403)."""
     mock_resp = _mock_response({}, status_code=403)
 
+    ctx = AsyncMock()
+    ctx.post.return_value = mock_resp
     with patch("asyncio.to_thread", new_callable=AsyncMock, return_value="bad-secret"), \
-         patch("backend.services.transcoder_client.httpx.AsyncClient") as MockClient:
-        ctx = AsyncMock()
-        ctx.post.return_value = mock_resp
-        MockClient.return_value.__aenter__ = AsyncMock(return_value=ctx)
-        MockClient.return_value.__aexit__ = AsyncMock(return_value=False)
+         patch.object(transcoder_client, "_get_webhook_client", return_value=ctx):
         result = await transcoder_client.send_webhook({"title": "Test"})
 
     assert result["success"] is False
@@ -57,12 +54,10 @@ async def test_send_webhook_auth_rejected():
 
 async def test_send_webhook_connect_error():
     """send_webhook returns error when transcoder is offline."""
+    ctx = AsyncMock()
+    ctx.post.side_effect = httpx.ConnectError("refused")
     with patch("asyncio.to_thread", new_callable=AsyncMock, return_value=""), \
-         patch("backend.services.transcoder_client.httpx.AsyncClient") as MockClient:
-        ctx = AsyncMock()
-        ctx.post.side_effect = httpx.ConnectError("refused")
-        MockClient.return_value.__aenter__ = AsyncMock(return_value=ctx)
-        MockClient.return_value.__aexit__ = AsyncMock(return_value=False)
+         patch.object(transcoder_client, "_get_webhook_client", return_value=ctx):
         result = await transcoder_client.send_webhook({"title": "Test"})
 
     assert result["success"] is False
@@ -73,12 +68,10 @@ async def test_send_webhook_http_error():
     """send_webhook returns error on unexpected HTTP failure."""
     mock_resp = _mock_response({}, status_code=500)
 
+    ctx = AsyncMock()
+    ctx.post.return_value = mock_resp
     with patch("asyncio.to_thread", new_callable=AsyncMock, return_value="secret"), \
-         patch("backend.services.transcoder_client.httpx.AsyncClient") as MockClient:
-        ctx = AsyncMock()
-        ctx.post.return_value = mock_resp
-        MockClient.return_value.__aenter__ = AsyncMock(return_value=ctx)
-        MockClient.return_value.__aexit__ = AsyncMock(return_value=False)
+         patch.object(transcoder_client, "_get_webhook_client", return_value=ctx):
         result = await transcoder_client.send_webhook({"title": "Test"})
 
     assert result["success"] is False
@@ -89,12 +82,10 @@ async def test_send_webhook_no_secret():
     """send_webhook works without a webhook secret (empty string)."""
     mock_resp = _mock_response({"queued": True})
 
+    ctx = AsyncMock()
+    ctx.post.return_value = mock_resp
     with patch("asyncio.to_thread", new_callable=AsyncMock, return_value=""), \
-         patch("backend.services.transcoder_client.httpx.AsyncClient") as MockClient:
-        ctx = AsyncMock()
-        ctx.post.return_value = mock_resp
-        MockClient.return_value.__aenter__ = AsyncMock(return_value=ctx)
-        MockClient.return_value.__aexit__ = AsyncMock(return_value=False)
+         patch.object(transcoder_client, "_get_webhook_client", return_value=ctx):
         result = await transcoder_client.send_webhook({"title": "Test"})
 
     assert result["success"] is True
@@ -102,3 +93,21 @@ async def test_send_webhook_no_secret():
     call_kwargs = ctx.post.call_args
     headers = call_kwargs[1].get("headers", {})
     assert "X-Webhook-Secret" not in headers
+
+
+async def test_webhooks_share_one_pooled_client():
+    """Repeated and concurrent webhooks reuse one client; close_client closes it."""
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, json={"queued": True}))
+    real_client = httpx.AsyncClient
+
+    with patch("backend.services.transcoder_client.httpx.AsyncClient",
+               side_effect=lambda **kw: real_client(transport=transport, **kw)) as factory:
+        results = await asyncio.gather(*(transcoder_client.send_webhook({"job_id": i}) for i in range(5)))
+        await transcoder_client.test_webhook("secret")
+        client = transcoder_client._webhook_client
+        await transcoder_client.close_client()
+
+    assert all(r["success"] for r in results)
+    assert factory.call_count == 1
+    assert client.is_closed
+    assert transcoder_client._webhook_client is None